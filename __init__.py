@@ -22,6 +22,10 @@
     If not, see: http://www.gnu.org/licenses/
 """
 
+# library release version
+
+__version__ = "1.5"
+
 # set i18n support by default
 
 from .core import i18n
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import os.path as OP
+
+from xml.sax.saxutils import quoteattr
+
+
+
+# synthetic widget tags - cycled through
+
+WIDGET_TAGS = (
+
+    "label", "button", "entry", "checkbutton", "ttklabel", "ttkbutton",
+
+    "ttkentry", "radiobutton",
+)
+
+
+
+# synthetic XML attributes - first N are used along density
+
+WIDGET_ATTRS = (
+
+    ("relief", "groove"),
+
+    ("borderwidth", "2"),
+
+    ("width", "12"),
+
+    ("font", "sans 10"),
+
+    ("foreground", "navy"),
+
+    ("background", "white"),
+
+    ("padx", "2"),
+
+    ("pady", "2"),
+
+    ("anchor", "w"),
+
+    ("justify", "left"),
+
+    ("takefocus", "1"),
+
+    ("cursor", "hand2"),
+
+    ("highlightthickness", "1"),
+
+    ("wraplength", "200"),
+)
+
+
+
+def get_attrs (index, density):
+    r"""
+        returns XML attributes string of chars for widget @index
+        with @density synthetic attributes;
+    """
+
+    _attrs = [("text", "Item #{}".format(index))]
+
+    _attrs.extend(WIDGET_ATTRS[:max(0, density)])
+
+    return " ".join(
+
+        "{}={}".format(_name, quoteattr(_value)) for _name, _value in _attrs
+    )
+
+# end def
+
+
+
+def get_easy_xml (widgets = 100, depth = 1, density = 4):
+    r"""
+        generates an easy.builder XML document;
+
+        returns (XML source string of chars, number of widgets)
+        tuple;
+    """
+
+    # easy builder only knows about tkinter native widgets
+
+    _tags = ("label", "button", "checkbutton", "radiobutton")
+
+    _attrs = (
+
+        ("relief", "groove"), ("borderwidth", "2"), ("width", "12"),
+
+        ("font", "sans 10"), ("fg", "navy"), ("bg", "white"),
+
+        ("padx", "2"), ("pady", "2"), ("anchor", "w"),
+    )
+
+    _lines = ["<root>"]
+
+    _count = 0
+
+    _depth = max(1, depth)
+
+    _per_level = max(1, widgets // _depth)
+
+    for _level in range(_depth):
+
+        for _i in range(_per_level):
+
+            _lines.append(
+
+                '<{tag} text="Item #{index}" {attrs}/>'.format(
+
+                    tag = _tags[_count % len(_tags)],
+
+                    index = _count,
+
+                    attrs = " ".join(
+
+                        "{}={}".format(_n, quoteattr(_v))
+
+                        for _n, _v in _attrs[:max(0, density)]
+                    ),
+                )
+            )
+
+            _count += 1
+
+        # end for
+
+        # next nesting level
+
+        if _level < _depth - 1:
+
+            _lines.append("<frame>")
+
+            _count += 1
+
+        # end if
+
+    # end for
+
+    _lines.extend(["</frame>"] * (_depth - 1))
+
+    _lines.append("</root>")
+
+    return ("\n".join(_lines), _count)
+
+# end def
+
+
+
+def get_menu_xml (menus = 5, items = 20):
+    r"""
+        generates a <tkmenu> XML document with @menus cascading
+        menus of @items items each (commands, checkbuttons,
+        radiobuttons and separators);
+
+        returns (XML source string of chars, number of menu items)
+        tuple;
+    """
+
+    _lines = ['<tkmenu id="topmenu">']
+
+    _count = 0
+
+    for _m in range(menus):
+
+        _lines.append('<menu label="Menu {}">'.format(_m))
+
+        _count += 1
+
+        for _i in range(items):
+
+            _kind = _i % 8
+
+            if _kind == 7:
+
+                _lines.append("<separator/>")
+
+            elif _kind == 6:
+
+                _lines.append(
+
+                    '<checkbutton label="Check {m}.{i}"/>'
+
+                    .format(m = _m, i = _i)
+                )
+
+            elif _kind == 5:
+
+                _lines.append(
+
+                    '<radiobutton label="Radio {m}.{i}" value="{i}"/>'
+
+                    .format(m = _m, i = _i)
+                )
+
+            else:
+
+                _lines.append(
+
+                    '<command label="Command {m}.{i}" underline="0"/>'
+
+                    .format(m = _m, i = _i)
+                )
+
+            # end if
+
+            _count += 1
+
+        # end for
+
+        _lines.append("</menu>")
+
+    # end for
+
+    _lines.append("</tkmenu>")
+
+    return ("\n".join(_lines), _count)
+
+# end def
+
+
+
+def get_widget_xml (widgets = 100, depth = 1, density = 4, includes = 0,
+styles = 0, include_dir = None):
+    r"""
+        generates a <tkwidget> XML document;
+
+        @widgets: total number of synthetic widgets;
+
+        @depth: nesting levels of ttkframe containers;
+
+        @density: number of synthetic XML attributes per widget;
+
+        @includes: number of widget chunks moved to external XML
+        files in @include_dir directory (mandatory if @includes);
+
+        @styles: number of <style> and <ttkstyle> defs, used in
+        turn by widgets;
+
+        returns (XML source string of chars, number of widgets)
+        tuple;
+    """
+
+    # inits
+
+    _depth = max(1, depth)
+
+    _includes = max(0, includes) if include_dir else 0
+
+    _styles = max(0, styles)
+
+    _lines = ["<tkwidget>"]
+
+    _count = 0
+
+    # style defs
+
+    for _s in range(_styles):
+
+        _lines.append(
+
+            '<style id="style{s}" relief="ridge" borderwidth="{b}"/>'
+
+            .format(s = _s, b = 1 + _s % 3)
+        )
+
+        _lines.append(
+
+            '<ttkstyle apply="Bench{s}.TLabel" foreground="navy"/>'
+
+            .format(s = _s)
+        )
+
+    # end for
+
+    # widget chunks
+
+    _chunks = _includes + _depth
+
+    _per_chunk = max(1, widgets // _chunks)
+
+    # included files
+
+    for _n in range(_includes):
+
+        _path = OP.join(include_dir, "bench_include_{}.xml".format(_n))
+
+        _inner = ["<tkwidget>"]
+
+        for _i in range(_per_chunk):
+
+            _inner.append(
+
+                get_widget_line(_count, density, _styles)
+            )
+
+            _count += 1
+
+        # end for
+
+        _inner.append("</tkwidget>")
+
+        with open(_path, "w", encoding = "utf-8") as _file:
+
+            _file.write("\n".join(_inner))
+
+        # end with
+
+        _lines.append("<include src={}/>".format(quoteattr(_path)))
+
+    # end for
+
+    # nested levels
+
+    for _level in range(_depth):
+
+        for _i in range(_per_chunk):
+
+            _lines.append(get_widget_line(_count, density, _styles))
+
+            _count += 1
+
+        # end for
+
+        if _level < _depth - 1:
+
+            _lines.append(
+
+                '<ttkframe layout="pack" resizable="yes">'
+            )
+
+            _count += 1
+
+        # end if
+
+    # end for
+
+    _lines.extend(["</ttkframe>"] * (_depth - 1))
+
+    _lines.append("</tkwidget>")
+
+    return ("\n".join(_lines), _count)
+
+# end def
+
+
+
+def get_widget_line (index, density, styles = 0):
+    r"""
+        returns XML element line for synthetic widget @index;
+    """
+
+    _tag = WIDGET_TAGS[index % len(WIDGET_TAGS)]
+
+    _style = ""
+
+    if styles and not _tag.startswith("ttk"):
+
+        _style = ' style="style{}"'.format(index % styles)
+
+    # end if
+
+    return '<{tag} {attrs}{style} layout="pack"/>'.format(
+
+        tag = _tag, attrs = get_attrs(index, density), style = _style
+    )
+
+# end def
@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+import gc
+
+import sys
+
+import json
+
+import time
+
+import argparse
+
+import tempfile
+
+import tracemalloc
+
+import os.path as OP
+
+import tkinter as TK
+
+from ..easy import builder as EB
+
+from ..xml import rad_xml_frame as XF
+
+from ..xml import rad_xml_menu as XM
+
+from . import generator as G
+
+
+
+# default scenarios: name --> (builder kind, generator keywords)
+
+SCENARIOS = {
+
+    "flat": ("widget", dict(widgets = 500, density = 4)),
+
+    "nested": ("widget", dict(widgets = 500, depth = 8, density = 4)),
+
+    "dense": ("widget", dict(widgets = 300, density = 14)),
+
+    "includes": ("widget", dict(widgets = 300, includes = 10)),
+
+    "styles": ("widget", dict(widgets = 300, styles = 10)),
+
+    "menus": ("menu", dict(menus = 10, items = 30)),
+
+    "easy": ("easy", dict(widgets = 500, depth = 4, density = 6)),
+
+} # end of SCENARIOS
+
+
+
+# default regression tolerance (ratio)
+
+TOLERANCE = 0.25
+
+
+
+# default baseline results file (see save_baseline())
+
+BASELINE = OP.join(OP.dirname(OP.abspath(__file__)), "baseline.json")
+
+
+
+# leak check: synthetic form and max memory growth per build/destroy
+# cycle (bytes)
+
+LEAK_FORM = dict(widgets = 100, depth = 2, density = 6, styles = 2)
+
+LEAK_TOLERANCE = 256
+
+
+
+def build_easy (root, xml):
+    r"""
+        builds @xml with easy.builder into a new container of
+        @root;
+
+        returns built container;
+    """
+
+    _container = TK.Frame(root)
+
+    EB.build(xml, _container)
+
+    return _container
+
+# end def
+
+
+
+def build_menu (root, xml):
+    r"""
+        builds @xml <tkmenu> document with RADXMLMenu into a new
+        toplevel window of @root;
+
+        returns built toplevel window;
+    """
+
+    _toplevel = TK.Toplevel(root)
+
+    _toplevel.withdraw()
+
+    XM.RADXMLMenu(tk_owner = _toplevel).xml_build(xml)
+
+    return _toplevel
+
+# end def
+
+
+
+def build_widget (root, xml):
+    r"""
+        builds @xml <tkwidget> document with RADXMLFrame into
+        @root;
+
+        returns built RADXMLFrame object;
+    """
+
+    _frame = XF.RADXMLFrame(root)
+
+    _frame.xml_build(xml)
+
+    return _frame
+
+# end def
+
+
+
+# builder kind --> builder function
+
+BUILDERS = {
+
+    "easy": build_easy,
+
+    "menu": build_menu,
+
+    "widget": build_widget,
+
+} # end of BUILDERS
+
+
+
+def check_leaks (root, cycles = 1000, warmup = 50):
+    r"""
+        builds and destroys the same LEAK_FORM <tkwidget> form
+        @cycles times with RADXMLFrame into @root, after @warmup
+        cycles filling up process-wide caches;
+
+        returns (traced memory growth per cycle in bytes, total
+        growth in bytes) tuple;
+    """
+
+    # inits
+
+    _xml = G.get_widget_xml(**LEAK_FORM)[0]
+
+    def _cycle ():
+
+        _frame = build_widget(root, _xml)
+
+        root.update_idletasks()
+
+        _frame.destroy()
+
+    # end def
+
+    for _run in range(max(0, warmup)):
+
+        _cycle()
+
+    # end for
+
+    # traced run
+
+    gc.collect()
+
+    tracemalloc.start()
+
+    try:
+
+        _start = tracemalloc.get_traced_memory()[0]
+
+        for _run in range(max(1, cycles)):
+
+            _cycle()
+
+        # end for
+
+        gc.collect()
+
+        _growth = tracemalloc.get_traced_memory()[0] - _start
+
+    finally:
+
+        tracemalloc.stop()
+
+    # end try
+
+    return (_growth / max(1, cycles), _growth)
+
+# end def
+
+
+
+def compare (results, baseline, tolerance = TOLERANCE):
+    r"""
+        compares @results with @baseline results (see run());
+
+        a regression is a throughput lower or a peak memory
+        higher than baseline by more than @tolerance ratio;
+
+        returns list of regression messages (empty if none);
+    """
+
+    _regressions = list()
+
+    for _name, _result in sorted(results.items()):
+
+        _base = baseline.get(_name)
+
+        if not _base:
+
+            continue
+
+        # end if
+
+        if _result["widgets_per_sec"] < \
+                        _base["widgets_per_sec"] * (1.0 - tolerance):
+
+            _regressions.append(
+
+                "{name}: {value:.0f} widgets/s < baseline {base:.0f}"
+
+                .format(
+
+                    name = _name,
+
+                    value = _result["widgets_per_sec"],
+
+                    base = _base["widgets_per_sec"],
+                )
+            )
+
+        # end if
+
+        if _result["peak_kb"] > _base["peak_kb"] * (1.0 + tolerance):
+
+            _regressions.append(
+
+                "{name}: peak {value:.0f} KiB > baseline {base:.0f} KiB"
+
+                .format(
+
+                    name = _name,
+
+                    value = _result["peak_kb"],
+
+                    base = _base["peak_kb"],
+                )
+            )
+
+        # end if
+
+    # end for
+
+    return _regressions
+
+# end def
+
+
+
+def get_report (results):
+    r"""
+        returns text table report of @results (see run());
+    """
+
+    _lines = [
+
+        "{:<12} {:>8} {:>10} {:>14} {:>10}".format(
+
+            "scenario", "widgets", "best_ms", "widgets/s", "peak_KiB"
+        )
+    ]
+
+    for _name, _result in sorted(results.items()):
+
+        _lines.append(
+
+            "{:<12} {:>8} {:>10.2f} {:>14.0f} {:>10.0f}".format(
+
+                _name, _result["widgets"], _result["best_ms"],
+
+                _result["widgets_per_sec"], _result["peak_kb"],
+            )
+        )
+
+    # end for
+
+    return "\n".join(_lines)
+
+# end def
+
+
+
+def get_root ():
+    r"""
+        returns a withdrawn tkinter root window;
+
+        raises RuntimeError if no display is available (run under
+        Xvfb e.g. 'xvfb-run python3 -m tkRAD.bench' on headless
+        hosts);
+    """
+
+    try:
+
+        _root = TK.Tk()
+
+    except TK.TclError as _error:
+
+        raise RuntimeError(
+
+            _(
+                "No display available ({error}): "
+
+                "try 'xvfb-run python3 -m tkRAD.bench'."
+
+            ).format(error = _error)
+
+        ) from None
+
+    # end try
+
+    _root.withdraw()
+
+    return _root
+
+# end def
+
+
+
+def load_baseline (path):
+    r"""
+        returns baseline results dict from JSON file @path;
+    """
+
+    with open(path, encoding = "utf-8") as _file:
+
+        return json.load(_file).get("results", dict())
+
+    # end with
+
+# end def
+
+
+
+def main (argv = None):
+    r"""
+        command line entry point:
+
+        python3 -m tkRAD.bench [-s SCENARIO...] [-b BASELINE.json]
+            [-o RESULTS.json] [-r REPEAT] [-t TOLERANCE]
+            [-l CYCLES]
+
+        results get compared with bench/baseline.json by default
+        (see BASELINE); an empty -b value skips comparison;
+
+        returns exit status code: 1 on regression or memory leak,
+        0 otherwise;
+    """
+
+    # command line parser
+
+    _parser = argparse.ArgumentParser(
+
+        prog = "python3 -m tkRAD.bench",
+
+        description = _("tkRAD XML build pipeline benchmarks."),
+    )
+
+    _parser.add_argument(
+
+        "-s", "--scenario", action = "append", dest = "scenarios",
+
+        choices = sorted(SCENARIOS.keys()),
+
+        help = _("scenario to run (default: all)"),
+    )
+
+    _parser.add_argument(
+
+        "-r", "--repeat", type = int, default = 5,
+
+        help = _("timed runs per scenario (default: 5)"),
+    )
+
+    _parser.add_argument(
+
+        "-b", "--baseline", default = BASELINE,
+
+        help = _(
+            "JSON baseline file to compare results with "
+            "(default: bench/baseline.json, empty: no comparison)"
+        ),
+    )
+
+    _parser.add_argument(
+
+        "-o", "--output", default = None,
+
+        help = _("JSON file to save results into (new baseline)"),
+    )
+
+    _parser.add_argument(
+
+        "-t", "--tolerance", type = float, default = TOLERANCE,
+
+        help = _("regression tolerance ratio (default: 0.25)"),
+    )
+
+    _parser.add_argument(
+
+        "-l", "--leaks", type = int, default = 0, metavar = "CYCLES",
+
+        help = _(
+            "only check memory leaks over CYCLES form build/destroy "
+            "cycles"
+        ),
+    )
+
+    _args = _parser.parse_args(argv)
+
+    # leak check only
+
+    if _args.leaks:
+
+        _root = get_root()
+
+        try:
+
+            _per_cycle, _growth = check_leaks(_root, _args.leaks)
+
+        finally:
+
+            _root.destroy()
+
+        # end try
+
+        print(
+
+            _("leak check: {cycles} cycles, {growth:.0f} KiB growth, "
+              "{per_cycle:.1f} bytes/cycle")
+
+            .format(
+
+                cycles = _args.leaks, growth = _growth / 1024.0,
+
+                per_cycle = _per_cycle,
+            )
+        )
+
+        if _per_cycle > LEAK_TOLERANCE:
+
+            print(
+
+                "MEMORY LEAK: {:.1f} bytes/cycle".format(_per_cycle),
+
+                file = sys.stderr
+            )
+
+            return 1
+
+        # end if
+
+        return 0
+
+    # end if
+
+    # run benchmarks
+
+    _results = run(_args.scenarios, _args.repeat)
+
+    print(get_report(_results))
+
+    # compare with baseline - before it gets overwritten
+
+    _regressions = list()
+
+    if _args.baseline:
+
+        _regressions = compare(
+
+            _results, load_baseline(_args.baseline), _args.tolerance
+        )
+
+        for _message in _regressions:
+
+            print("REGRESSION:", _message, file = sys.stderr)
+
+        # end for
+
+    # end if
+
+    # save results
+
+    if _args.output:
+
+        save_baseline(_args.output, _results)
+
+    # end if
+
+    return 1 if _regressions else 0
+
+# end def
+
+
+
+def measure (root, kind, xml, repeat = 5):
+    r"""
+        builds @xml with @kind builder into @root @repeat times;
+
+        returns (best time in seconds, peak traced memory in bytes)
+        tuple;
+    """
+
+    _build = BUILDERS[kind]
+
+    _best = None
+
+    # timed runs - no memory tracing overhead
+
+    for _run in range(max(1, repeat)):
+
+        gc.collect()
+
+        _start = time.perf_counter()
+
+        _built = _build(root, xml)
+
+        root.update_idletasks()
+
+        _elapsed = time.perf_counter() - _start
+
+        _built.destroy()
+
+        _best = _elapsed if _best is None else min(_best, _elapsed)
+
+    # end for
+
+    # memory run
+
+    gc.collect()
+
+    tracemalloc.start()
+
+    try:
+
+        _build(root, xml).destroy()
+
+        _peak = tracemalloc.get_traced_memory()[1]
+
+    finally:
+
+        tracemalloc.stop()
+
+    # end try
+
+    return (_best, _peak)
+
+# end def
+
+
+
+def run (names = None, repeat = 5, root = None):
+    r"""
+        runs benchmark scenarios @names (default: all
+        SCENARIOS) into @root tkinter window (default: new
+        withdrawn root window);
+
+        returns results dict: scenario name --> dict(widgets,
+        best_ms, widgets_per_sec, peak_kb);
+    """
+
+    # inits
+
+    _results = dict()
+
+    _root = root or get_root()
+
+    try:
+
+        with tempfile.TemporaryDirectory() as _dir:
+
+            for _name in (names or sorted(SCENARIOS.keys())):
+
+                _kind, _kw = SCENARIOS[_name]
+
+                # generate synthetic XML document
+
+                if _kind == "menu":
+
+                    _xml, _count = G.get_menu_xml(**_kw)
+
+                elif _kind == "easy":
+
+                    _xml, _count = G.get_easy_xml(**_kw)
+
+                else:
+
+                    _xml, _count = G.get_widget_xml(
+
+                        include_dir = _dir, **_kw
+                    )
+
+                # end if
+
+                _best, _peak = measure(_root, _kind, _xml, repeat)
+
+                _results[_name] = {
+
+                    "widgets": _count,
+
+                    "best_ms": _best * 1000.0,
+
+                    "widgets_per_sec": _count / max(_best, 1e-9),
+
+                    "peak_kb": _peak / 1024.0,
+                }
+
+            # end for
+
+        # end with
+
+    finally:
+
+        if not root:
+
+            _root.destroy()
+
+        # end if
+
+    # end try
+
+    return _results
+
+# end def
+
+
+
+def save_baseline (path, results):
+    r"""
+        saves @results (see run()) as JSON baseline file @path;
+
+        no return value (void);
+    """
+
+    with open(path, "w", encoding = "utf-8") as _file:
+
+        json.dump(
+
+            {
+                "python": sys.version.split()[0],
+
+                "tk": TK.TkVersion,
+
+                "results": results,
+            },
+
+            _file, indent = 4, sort_keys = True,
+        )
+
+    # end with
+
+# end def
@@ -70,6 +70,11 @@ class DeferQueue:
 
         Generic queue for deferred actions;
 
+        actions get called by section, in descending priority order
+        and in insertion order for equal priorities;
+
+        counters keep track of deferred and called actions per
+        section, until reset_stats() gets called;
     """
 
     def __init__ (self):
@@ -81,6 +86,63 @@ class DeferQueue:
 
         self.__queue = dict()
 
+        self.__deferred = dict()    # section --> deferred actions
+
+        self.__called = dict()      # section --> called actions
+
+    # end def
+
+
+
+    def _insert (self, section, item):
+        r"""
+            protected method def;
+
+            inserts @item into @section buffer along its priority;
+
+            no return value (void);
+        """
+
+        # get section buffer
+
+        _buffer = self.__queue.setdefault(section, [])
+
+        # most common case: same or lower priority than last item
+
+        if not _buffer or _buffer[-1].priority >= item.priority:
+
+            _buffer.append(item)
+
+        else:
+
+            # binary search - insert after equal priorities
+
+            _lo, _hi = 0, len(_buffer)
+
+            while _lo < _hi:
+
+                _mid = (_lo + _hi) // 2
+
+                if _buffer[_mid].priority >= item.priority:
+
+                    _lo = _mid + 1
+
+                else:
+
+                    _hi = _mid
+
+                # end if
+
+            # end while
+
+            _buffer.insert(_lo, item)
+
+        # end if
+
+        # update counters
+
+        self.__deferred[section] = self.__deferred.get(section, 0) + 1
+
     # end def
 
 
@@ -123,17 +185,64 @@ class DeferQueue:
             no return value (void);
         """
 
-        # get section buffer
+        self._insert(section, QueueItem(callback, *args, **kw))
+
+    # end def
+
+
+
+    def defer_many (self, section, callbacks, priority = 0):
+        r"""
+            registers many callables at once into @section with
+            @priority;
+
+            @callbacks is an iterable of either callables or
+            (callback, args) or (callback, args, kw) tuples;
 
-        _buffer = self.__queue.setdefault(section, list())
+            no return value (void);
+        """
+
+        for _callback in callbacks:
+
+            if isinstance(_callback, tuple):
+
+                _item = QueueItem(
 
-        # register new callable into buffer
+                    _callback[0], *_callback[1],
 
-        _buffer.append(QueueItem(callback, *args, **kw))
+                    **(_callback[2] if len(_callback) > 2 else {})
+                )
 
-        # update section data
+            else:
 
-        self.__queue[section] = _buffer
+                _item = QueueItem(_callback)
+
+            # end if
+
+            _item.priority = priority
+
+            self._insert(section, _item)
+
+        # end for
+
+    # end def
+
+
+
+    def defer_priority (self, section, priority, callback, *args, **kw):
+        r"""
+            same as defer() but with @priority (default is 0)
+            e.g. @priority > 0 gets called before default priority
+            actions of same section, @priority < 0 after them;
+
+            no return value (void);
+        """
+
+        _item = QueueItem(callback, *args, **kw)
+
+        _item.priority = priority
+
+        self._insert(section, _item)
 
     # end def
 
@@ -144,26 +253,64 @@ class DeferQueue:
             calls each callback stored into @section buffer with
             additional new @args and @kw;
 
+            callbacks deferred into @section while flushing get
+            called too;
+
+            if a callback raises an exception, callbacks not called
+            yet remain pending in @section;
+
             no return value (void);
         """
 
-        # get section buffer
+        # detach section buffer - O(1)
 
-        _buffer = self.__queue.setdefault(section, list())
+        _buffer = self.__queue.pop(section, None)
 
-        # browse buffer items
+        while _buffer:
 
-        for _item in _buffer:
+            _called = 0
 
-            # call item with extra args and keywords
+            try:
 
-            _item.call(*args, **kw)
+                # browse buffer items
 
-        # end for
+                for _item in _buffer:
 
-        # clear section by now
+                    _called += 1
 
-        self.clear(section)
+                    # call item with extra args and keywords
+
+                    _item.call(*args, **kw)
+
+                # end for
+
+            finally:
+
+                # update counters
+
+                self.__called[section] = \
+                                    self.__called.get(section, 0) + _called
+
+                # failed call? keep remaining items along priority
+
+                if _called < len(_buffer):
+
+                    self.__queue[section] = sorted(
+
+                        _buffer[_called:] + self.__queue.get(section, []),
+
+                        key = lambda item: -item.priority
+                    )
+
+                # end if
+
+            # end try
+
+            # deferred while flushing?
+
+            _buffer = self.__queue.pop(section, None)
+
+        # end while
 
     # end def
 
@@ -179,17 +326,29 @@ class DeferQueue:
 
         # browse queue sections (shallow copy of keys)
 
-        for _section in list(self.__queue.keys()):
+        self.flush_many(list(self.__queue.keys()), *args, **kw)
 
-            # call items with extra args and keywords
+        # clear all by now (safe)
 
-            self.flush(_section, *args, **kw)
+        self.clear()
 
-        # end for
+    # end def
 
-        # clear all by now (safe)
 
-        self.clear()
+
+    def flush_many (self, sections, *args, **kw):
+        r"""
+            flushes each section of @sections iterable in turn, with
+            additional new @args and @kw;
+
+            no return value (void);
+        """
+
+        for _section in sections:
+
+            self.flush(_section, *args, **kw)
+
+        # end for
 
     # end def
 
@@ -206,6 +365,45 @@ class DeferQueue:
 
     # end def
 
+
+
+    def get_stats (self):
+        r"""
+            returns dict() of section --> dict(deferred, called,
+            pending) counters since last reset_stats();
+        """
+
+        return {
+
+            _section: {
+
+                "deferred": _count,
+
+                "called": self.__called.get(_section, 0),
+
+                "pending": len(self.__queue.get(_section) or ()),
+            }
+
+            for _section, _count in self.__deferred.items()
+        }
+
+    # end def
+
+
+
+    def reset_stats (self):
+        r"""
+            resets all counters;
+
+            no return value (void);
+        """
+
+        self.__deferred.clear()
+
+        self.__called.clear()
+
+    # end def
+
 # end class DeferQueue
 
 
@@ -219,6 +417,10 @@ class QueueItem:
         Stores callback with its additional *args and **kw;
     """
 
+    # lightweight instances
+
+    __slots__ = ("callback", "arguments", "keywords", "priority")
+
     def __init__ (self, callback, *args, **kw):
         r"""
             class constructor inits;
@@ -232,6 +434,8 @@ class QueueItem:
 
         self.keywords = kw
 
+        self.priority = 0
+
     # end def
 
 
@@ -250,17 +454,35 @@ class QueueItem:
 
             # update extra arguments
 
-            _args = self.arguments + args
+            if args:
+
+                args = self.arguments + args
+
+            else:
+
+                args = self.arguments
+
+            # end if
+
+            # update extra keywords - copy only if needed
+
+            if not kw:
+
+                kw = self.keywords
+
+            elif self.keywords:
+
+                _kw = self.keywords.copy()
 
-            # update extra keywords
+                _kw.update(kw)
 
-            _kw = self.keywords.copy()
+                kw = _kw
 
-            _kw.update(kw)
+            # end if
 
             # call callback with new arguments and keywords
 
-            return self.callback(*_args, **_kw)
+            return self.callback(*args, **kw)
 
         # end if
 
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+# tkRAD test suite - run from the source tree root:
+#
+#   xvfb-run pytest tests
+#
+# notice: 'python3 -m pytest' would put source tree root on sys.path
+# and tkRAD.xml package would shadow python's own xml package /!\
+#
+# tests needing a display get skipped when none is available
+
+
+
+# lib imports
+
+import sys
+
+import os.path as OP
+
+import importlib.util
+
+import tkinter as TK
+
+import tkinter.messagebox as MB
+
+import pytest
+
+
+
+# source tree root i.e. tkRAD package directory
+
+ROOT = OP.dirname(OP.dirname(OP.abspath(__file__)))
+
+
+
+def _import_tkRAD ():
+    r"""
+        imports tkRAD package from source tree root, whatever the
+        name of its checkout directory is;
+
+        returns tkRAD package;
+    """
+
+    # already imported?
+
+    if "tkRAD" in sys.modules:
+
+        return sys.modules["tkRAD"]
+
+    # end if
+
+    _spec = importlib.util.spec_from_file_location(
+
+        "tkRAD", OP.join(ROOT, "__init__.py"),
+
+        submodule_search_locations = [ROOT],
+    )
+
+    _module = importlib.util.module_from_spec(_spec)
+
+    sys.modules["tkRAD"] = _module
+
+    _spec.loader.exec_module(_module)
+
+    return _module
+
+# end def
+
+
+
+_import_tkRAD()
+
+
+
+@pytest.fixture(autouse = True)
+def no_message_box (monkeypatch):
+    r"""
+        turns modal message boxes (e.g. XML build error reports)
+        into exceptions, so that tests fail instead of hanging;
+    """
+
+    def _raise (title = None, message = None, **kw):
+
+        raise AssertionError("{}: {}".format(title, message))
+
+    # end def
+
+    for _name in ("showerror", "showwarning", "showinfo"):
+
+        monkeypatch.setattr(MB, _name, _raise)
+
+    # end for
+
+# end def
+
+
+
+@pytest.fixture(scope = "session")
+def tk_root ():
+    r"""
+        withdrawn tkinter root window shared by the whole session;
+
+        skips test if no display is available;
+    """
+
+    try:
+
+        _root = TK.Tk()
+
+    except TK.TclError as _error:
+
+        pytest.skip("no display available: {}".format(_error))
+
+    # end try
+
+    _root.withdraw()
+
+    yield _root
+
+    _root.destroy()
+
+# end def
+
+
+
+@pytest.fixture
+def tk_parent (tk_root):
+    r"""
+        fresh frame to build into, destroyed after test;
+    """
+
+    _frame = TK.Frame(tk_root)
+
+    yield _frame
+
+    _frame.destroy()
+
+# end def
+
+
+
+def get_widget_tree (widget, skip = ()):
+    r"""
+        returns comparable (class, manager, options, children)
+        nested tuple of @widget and all its children;
+
+        callback and control variable options get skipped as
+        their Tcl names differ from one build to another, along
+        with any @skip option names;
+    """
+
+    # inits
+
+    _options = list()
+
+    for _key, _value in sorted(widget.configure().items()):
+
+        if len(_value) < 5 or _key in skip or _key.endswith("command") \
+                                            or _key.endswith("variable"):
+
+            continue
+
+        # end if
+
+        _options.append((_key, str(_value[4])))
+
+    # end for
+
+    return (
+
+        widget.winfo_class(),
+
+        widget.winfo_manager(),
+
+        tuple(_options),
+
+        tuple(
+
+            get_widget_tree(_child, skip)
+
+            for _child in widget.winfo_children()
+        ),
+    )
+
+# end def
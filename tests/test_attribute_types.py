@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from tkRAD.xml import rad_xml_attribute as XA
+
+from tkRAD.xml import rad_xml_widget as XW
+
+
+
+class TableWidget (XW.RADXMLWidget):
+    r"""
+        XML processor with its own declarative attribute parsers
+        and one explicit parser method;
+    """
+
+    ATTRIBUTE_TYPES = {
+
+        "bordersize": ("dimension", None),
+
+        "padded": ("boolean", dict(no_tk_config = True)),
+
+        "strange": ("no_such_type", None),
+    }
+
+    def _parse_attr_relief (self, attribute, **kw):
+
+        attribute.value = "custom"
+
+    # end def
+
+# end class TableWidget
+
+
+
+def parse (processor, name, value):
+    r"""
+        parses @name XML attribute of @value raw value along
+        @processor's parser for <label> elements;
+
+        returns parsed attribute;
+    """
+
+    _attribute = XA.RADXMLAttribute(ET.Element("label"), name, value)
+
+    processor._get_handler(
+
+        processor.ATTRIBUTE_PARSER, "label", name
+
+    )(attribute = _attribute)
+
+    return _attribute
+
+# end def
+
+
+
+def test_attribute_types_dispatch ():
+    r"""
+        table entries resolve to attribute type parsers, parent
+        tables get inherited and explicit methods always win;
+    """
+
+    # inits
+
+    _processor = TableWidget(None)
+
+    _get = lambda name: _processor._get_handler(
+
+        _processor.ATTRIBUTE_PARSER, "label", name
+    )
+
+    # entries without keywords bind type parsers directly
+
+    assert _get("bordersize").__func__ is \
+                            XW.RADXMLWidget._tkRAD_dimension_support
+
+    assert _get("font").__func__ is XW.RADXMLWidget._tkRAD_font_support
+
+    # explicit method overrides parent table entry
+
+    assert parse(_processor, "relief", "flat").value == "custom"
+
+    # unknown attribute type
+
+    with pytest.raises(TypeError, match = "no_such_type"):
+
+        _get("strange")
+
+    # end with
+
+# end def
+
+
+
+def test_attribute_types_keywords ():
+    r"""
+        table entry keywords get passed to attribute type parsers;
+    """
+
+    # inits
+
+    _processor = TableWidget(None)
+
+    _processor._before_building_element()
+
+    assert parse(_processor, "bordersize", "2").value == "2"
+
+    assert _processor.TK_CONFIG == {"bordersize": "2"}
+
+    assert parse(_processor, "padded", "yes").value is True
+
+    # no_tk_config keyword
+
+    assert "padded" not in _processor.TK_CONFIG
+
+# end def
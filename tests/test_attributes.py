@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from tkRAD.xml import rad_xml_attribute as XA
+
+from tkRAD.xml import rad_xml_attributes_dict as XD
+
+
+
+def test_attribute_slots ():
+    r"""
+        RADXMLAttribute objects are compact and check their names;
+    """
+
+    # inits
+
+    _element = ET.Element("label", text = "Hello")
+
+    _attribute = XA.RADXMLAttribute(_element, "text", "Hello")
+
+    assert not hasattr(_attribute, "__dict__")
+
+    assert not _attribute.parsed
+
+    with pytest.raises(AttributeError):
+
+        _attribute.other = 1
+
+    # end with
+
+    with pytest.raises(TypeError):
+
+        XA.RADXMLAttribute(_element, "", "Hello")
+
+    # end with
+
+    _attribute.update_xml_element("World")
+
+    assert _element.get("text") == "World"
+
+# end def
+
+
+
+def test_attributes_dict_values ():
+    r"""
+        RADXMLAttributesDict reads and writes item values, keeps
+        plain items as is and flattens to plain values;
+    """
+
+    # inits
+
+    _element = ET.Element("label", text = "Hello", width = "10")
+
+    _attrs = XD.RADXMLAttributesDict(XA.reset_attributes(_element))
+
+    _text = dict.__getitem__(_attrs, "text")
+
+    assert _text.xml_element is _element
+
+    assert _attrs["text"] == _attrs.get("text") == "Hello"
+
+    assert _attrs.get("missing", "default") == "default"
+
+    # existing attribute item gets its value updated
+
+    _attrs["text"] = "World"
+
+    assert dict.__getitem__(_attrs, "text") is _text
+
+    assert _text.value == "World"
+
+    # new keys get plain values
+
+    _attrs["extra"] = 1
+
+    assert dict.__getitem__(_attrs, "extra") == 1
+
+    assert _attrs.flatten() == {
+
+        "text": "World", "width": "10", "extra": 1,
+    }
+
+    # reset_attributes() keeps existing RADXMLAttribute items
+
+    assert XA.reset_attributes(_attrs)["text"] is _text
+
+# end def
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import tkinter as TK
+
+import pytest
+
+from tkRAD.xml import rad_xml_batch as XT
+
+
+
+def test_batch_flush_error_names_element (tk_parent):
+    r"""
+        a faulty batched command raises with its XML element name,
+        commands before it get evaluated, commands after it do not;
+    """
+
+    # inits
+
+    _label = TK.Label(tk_parent)
+
+    _batch = XT.RADXMLBatch(tk_parent.tk)
+
+    _batch.element = "label"
+
+    _batch.add(_label, "configure", "-text", "first")
+
+    _batch.element = "button"
+
+    _batch.add("no_such_command", "-oops")
+
+    _batch.element = "label"
+
+    _batch.add(_label, "configure", "-text", "never")
+
+    with pytest.raises(TK.TclError) as _error:
+
+        _batch.flush()
+
+    # end with
+
+    assert "in XML element: <button>" in str(_error.value)
+
+    assert "while executing: no_such_command -oops" in str(_error.value)
+
+    assert _label.cget("text") == "first"
+
+    assert not _batch.get_size()
+
+# end def
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import re
+
+from tkRAD.xml import compile as XCC
+
+from tkRAD.xml import rad_xml_compiler as XC
+
+from tkRAD.xml import rad_xml_frame as XF
+
+from tkRAD.xml import rad_xml_widget as XW
+
+from conftest import get_widget_tree
+
+
+
+XML_SOURCE = """\
+<tkwidget>
+    <label id="title" text="Hello" relief="groove" layout="pack"/>
+    <frame id="form" layout="pack" layout_options="fill='x'">
+        <label text="Name:" layout="grid"
+            layout_options="row=0, column=0"/>
+        <entry id="name" width="20" layout="grid"
+            layout_options="row=0, column=1"/>
+        <checkbutton id="check" text="Check me" layout="grid"
+            layout_options="row=1, column=0, columnspan=2"/>
+    </frame>
+    <ttkbutton id="ok" text="OK" command="@TestCompilerOK"
+        layout="pack" layout_options="side='right'"/>
+    <listbox id="choices" choices="'a', 'b', 'c'" start="@1"
+        height="3" exportselection="no" layout="pack"/>
+    <event signal="TestCompilerSignal" slot="@TestCompilerOther"/>
+</tkwidget>
+"""
+
+
+
+def get_build (source):
+    r"""
+        returns build() function of @source generated python
+        module;
+    """
+
+    _namespace = dict()
+
+    exec(compile(source, "<compiled>", "exec"), _namespace)
+
+    return _namespace["build"]
+
+# end def
+
+
+
+def test_compiled_source ():
+    r"""
+        generated module compiles, connects events through
+        tracked owner.connect_event() and only calls owner's public
+        runtime API;
+    """
+
+    _source = XCC.compile_xml(XML_SOURCE)
+
+    compile(_source, "<compiled>", "exec")
+
+    assert "owner.connect_event(" in _source
+
+    assert "events.connect(" not in _source
+
+    assert not re.search(r"owner\._", _source)
+
+# end def
+
+
+
+def test_compiled_image ():
+    r"""
+        compile-time images keep RADXMLBase.set_image() signature;
+    """
+
+    _compiler = XC.RADXMLCompiler()
+
+    assert _compiler.set_image("a.png").get_expr() == \
+                                            "owner.set_image('a.png')"
+
+    assert _compiler.set_image("a.png", zoom = (2, 1)).get_expr() == \
+                                "owner.set_image('a.png', zoom=(2, 1))"
+
+# end def
+
+
+
+def test_compiled_events_disconnected ():
+    r"""
+        destroy_component() disconnects events connected by
+        compiled code;
+    """
+
+    _build = get_build(
+
+        XCC.compile_xml(
+
+            '<tkwidget><event signal="TestCompilerEvent" '
+
+            'slot="@TestCompilerOther"/></tkwidget>'
+        )
+    )
+
+    _owner = XW.RADXMLWidget(None)
+
+    _build(_owner)
+
+    assert _owner.events.connections.get("TestCompilerEvent")
+
+    _owner.destroy_component()
+
+    assert not _owner.events.connections.get("TestCompilerEvent")
+
+# end def
+
+
+
+def test_compiled_tree_matches_interpreter (tk_parent):
+    r"""
+        widget trees built by XML interpreter and by generated
+        code are identical;
+    """
+
+    # interpreted build
+
+    _interpreted = XF.RADXMLFrame(tk_parent)
+
+    assert _interpreted.xml_build(XML_SOURCE)
+
+    # compiled build
+
+    _compiled = XF.RADXMLFrame(tk_parent)
+
+    assert get_build(XCC.compile_xml(XML_SOURCE))(_compiled)
+
+    # same widgets, options and layouts
+
+    assert get_widget_tree(_interpreted) == get_widget_tree(_compiled)
+
+    # same object ids
+
+    assert sorted(_interpreted.get_objects()) == \
+                                        sorted(_compiled.get_objects())
+
+    # same listbox state
+
+    for _frame in (_interpreted, _compiled):
+
+        _listbox = _frame.get_object_by_id("choices")
+
+        assert _listbox.get(0, "end") == ("a", "b", "c")
+
+        assert _listbox.curselection() == (1, )
+
+    # end for
+
+    _interpreted.destroy()
+
+    _compiled.destroy()
+
+# end def
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.xml import rad_xml_widget as XW
+
+
+
+def test_cvar_values_round_trip (tk_root):
+    r"""
+        set_cvar_values() then get_cvar_values() give back converted
+        values, same as control variables get() methods;
+    """
+
+    # inits
+
+    _processor = XW.RADXMLWidget(tk_root)
+
+    _name = _processor.set_cvar("stringvar", "name")
+
+    _count = _processor.set_cvar("intvar", "count")
+
+    _ratio = _processor.set_cvar("doublevar", "ratio")
+
+    _shared = _processor.set_cvar("intvar", "shared")
+
+    _processor.set_cvar("stringvar", "shared")
+
+    _processor.set_cvar_values(
+
+        dict(name = "a b {c}", count = 42, ratio = 0.5, shared = 7,
+
+            unknown = "skipped")
+    )
+
+    assert (_name.get(), _count.get(), _ratio.get(), _shared.get()) == \
+                                                    ("a b {c}", 42, 0.5, 7)
+
+    # stringvar wins over intvar on same name
+
+    assert _processor.get_cvar_values() == dict(
+
+        name = "a b {c}", count = 42, ratio = 0.5, shared = "7"
+    )
+
+    # vartype filter
+
+    assert _processor.get_cvar_values("IntVar") == dict(
+
+        count = 42, shared = 7
+    )
+
+    _processor.set_cvar_values(dict(shared = 3), vartype = "intvar")
+
+    assert _processor.get_cvar_values("stringvar")["shared"] == "7"
+
+    assert _processor.get_cvar_values("intvar")["shared"] == 3
+
+# end def
+
+
+
+def test_cvar_pool (tk_root):
+    r"""
+        components with cvar_pool option share control variables;
+    """
+
+    # inits
+
+    _first = XW.RADXMLWidget(tk_root, cvar_pool = True)
+
+    _second = XW.RADXMLWidget(tk_root, cvar_pool = True)
+
+    _private = XW.RADXMLWidget(tk_root)
+
+    _cvar = _first.set_cvar("stringvar", "pooled")
+
+    assert _second.set_cvar("stringvar", "pooled") is _cvar
+
+    assert _private.set_cvar("stringvar", "pooled") is not _cvar
+
+    _second.set_cvar_values(dict(pooled = "shared"))
+
+    assert _first.get_cvar_values() == dict(pooled = "shared")
+
+# end def
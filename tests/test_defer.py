@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import pytest
+
+from tkRAD.core import defer
+
+
+
+def test_defer_priority_order ():
+    r"""
+        callbacks get called in descending priority order, then in
+        insertion order; callbacks deferred while flushing get
+        called too;
+    """
+
+    # inits
+
+    _queue = defer.DeferQueue()
+
+    _calls = list()
+
+    _call = lambda name, **kw: _calls.append((name, kw.get("extra")))
+
+    _queue.defer("widget", _call, "a")
+
+    _queue.defer_priority("widget", -1, _call, "last")
+
+    _queue.defer_priority("widget", 5, _call, "first")
+
+    _queue.defer_many("widget", [(_call, ("b", )), (_call, ("c", ))])
+
+    _queue.defer_priority(
+
+        "widget", 1, lambda **kw: _queue.defer("widget", _call, "later")
+    )
+
+    _queue.flush("widget", extra = 1)
+
+    assert _calls == [
+
+        ("first", 1), ("a", 1), ("b", 1), ("c", 1), ("last", 1),
+
+        ("later", 1),
+    ]
+
+    assert _queue.get_stats() == {
+
+        "widget": {"deferred": 7, "called": 7, "pending": 0},
+    }
+
+# end def
+
+
+
+def test_defer_flush_many ():
+    r"""
+        flush_many() flushes given sections in turn, leaving other
+        sections untouched;
+    """
+
+    # inits
+
+    _queue = defer.DeferQueue()
+
+    _calls = list()
+
+    for _section in ("menu", "widget", "image"):
+
+        _queue.defer(_section, _calls.append, _section)
+
+    # end for
+
+    _queue.flush_many(("widget", "menu"))
+
+    assert _calls == ["widget", "menu"]
+
+    assert list(_queue.get_queue().keys()) == ["image"]
+
+    _queue.flush_all()
+
+    assert _calls == ["widget", "menu", "image"]
+
+    assert not _queue.get_queue()
+
+# end def
+
+
+
+def test_defer_flush_failure_keeps_pending ():
+    r"""
+        callbacks after a failing one remain pending, in priority
+        order, along with the ones deferred meanwhile;
+    """
+
+    # inits
+
+    _queue = defer.DeferQueue()
+
+    _calls = list()
+
+    def _fail ():
+
+        _queue.defer_priority("widget", 2, _calls.append, "new")
+
+        raise ValueError("failed")
+
+    # end def
+
+    _queue.defer_priority("widget", 3, _calls.append, "done")
+
+    _queue.defer_priority("widget", 3, _fail)
+
+    _queue.defer_priority("widget", 1, _calls.append, "kept")
+
+    with pytest.raises(ValueError):
+
+        _queue.flush("widget")
+
+    # end with
+
+    assert _calls == ["done"]
+
+    assert _queue.get_stats()["widget"]["pending"] == 2
+
+    _queue.flush("widget")
+
+    assert _calls == ["done", "new", "kept"]
+
+# end def
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import xml.etree.ElementTree as ET
+
+from tkRAD.xml import rad_xml_widget as XW
+
+
+
+XML_SOURCE = """\
+<tkwidget>
+    <frame id="form">
+        <label text="anonymous"/>
+    </frame>
+</tkwidget>
+"""
+
+
+
+def get_processor ():
+    r"""
+        returns XML processor with XML_SOURCE loaded, not built;
+    """
+
+    _processor = XW.RADXMLWidget(None)
+
+    _processor.xml_load(XML_SOURCE)
+
+    return _processor
+
+# end def
+
+
+
+def test_element_index_after_element_get_id ():
+    r"""
+        ids set by element_get_id() get indexed right away;
+    """
+
+    # inits
+
+    _processor = get_processor()
+
+    _form = _processor.get_element_by_id("form")
+
+    assert _form.tag == "frame"
+
+    _label = _form.find("label")
+
+    assert _processor.get_element_by_id("object1") is None
+
+    assert _processor.element_get_id(_label) == "object1"
+
+    assert _processor.get_element_by_id("object1") is _label
+
+    # foreign XML trees get searched, not indexed
+
+    _tree = ET.ElementTree(ET.fromstring(XML_SOURCE))
+
+    assert _processor.get_element_by_id("form", _tree) is not _form
+
+    assert _processor.get_element_by_id("form", _tree).tag == "frame"
+
+# end def
+
+
+
+def test_element_index_after_reset ():
+    r"""
+        elements added by hand show up after reset_element_index();
+        changed ids never hand out stale elements;
+    """
+
+    # inits
+
+    _processor = get_processor()
+
+    _form = _processor.get_element_by_id("form")
+
+    _button = ET.SubElement(_form, "button", id = "added")
+
+    # stale index
+
+    assert _processor.get_element_by_id("added") is None
+
+    _processor.reset_element_index()
+
+    assert _processor.get_element_by_id("added") is _button
+
+    # id changed by hand
+
+    _button.set("id", "renamed")
+
+    assert _processor.get_element_by_id("added") is None
+
+    assert _processor.get_element_by_id("renamed") is _button
+
+    # new XML tree drops index
+
+    _processor.xml_load(XML_SOURCE)
+
+    assert _processor.get_element_by_id("form") is not _form
+
+    assert _processor.get_element_by_id("renamed") is None
+
+# end def
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import tkinter as TK
+
+from tkRAD.widgets import rad_image_cache as IC
+
+
+
+def write_image (path, width, height):
+    r"""
+        writes a @width x @height PPM image file to @path;
+
+        returns @path as str;
+    """
+
+    path.write_bytes(
+
+        "P6 {} {} 255\n".format(width, height).encode("ascii")
+
+        + bytes(3 * width * height)
+    )
+
+    return str(path)
+
+# end def
+
+
+
+def test_image_cache_budget_and_eviction (tk_root, tmp_path):
+    r"""
+        shared images get loaded once; least recently used ones
+        get evicted once byte budget is exceeded;
+    """
+
+    # inits - 10x10 RGBA images = 400 bytes each
+
+    _paths = [write_image(tmp_path / "{}.ppm".format(_i), 10, 10)
+
+                                                for _i in range(3)]
+
+    _cache = IC.RADImageCache(budget = 800)
+
+    _first = _cache.get_image(_paths[0], master = tk_root)
+
+    assert _cache.get_image(_paths[0], master = tk_root) is _first
+
+    _cache.get_image(_paths[1], master = tk_root)
+
+    assert _cache.get_stats()["bytes"] == 800
+
+    # most recently used: paths[0] then paths[1]
+
+    _cache.get_image(_paths[0], master = tk_root)
+
+    _cache.get_image(_paths[2], master = tk_root)
+
+    _stats = _cache.get_stats()
+
+    assert (_stats["hits"], _stats["misses"], _stats["evictions"]) \
+                                                            == (2, 3, 1)
+
+    assert (_stats["cached"], _stats["bytes"]) == (2, 800)
+
+    # images still in use stay shared, evicted or not
+
+    assert _cache.get_image(_paths[0], master = tk_root) is _first
+
+    # unused evicted images get dropped
+
+    assert _stats["images"] == 2
+
+    # smaller budget evicts right away
+
+    _cache.set_budget(400)
+
+    assert _cache.get_stats()["cached"] == 1
+
+# end def
+
+
+
+def test_image_cache_new_root (tk_root, tmp_path):
+    r"""
+        a root window created after another one has been destroyed
+        never gets images of the destroyed one's interpreter;
+
+        @tk_root only makes test skip when no display is available;
+    """
+
+    # inits
+
+    _path = write_image(tmp_path / "image.ppm", 4, 4)
+
+    _cache = IC.RADImageCache()
+
+    _images = list()
+
+    for _run in range(2):
+
+        _root = TK.Tk()
+
+        _root.withdraw()
+
+        _images.append(_cache.get_image(_path, master = _root))
+
+        # image must be usable in this interpreter
+
+        TK.Label(_root, image = _images[-1]).pack()
+
+        _root.destroy()
+
+    # end for
+
+    assert _images[0] is not _images[1]
+
+    assert _cache.get_stats()["misses"] == 2
+
+# end def
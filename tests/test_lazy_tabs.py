@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.xml import rad_xml_frame as XF
+
+
+
+XML_SOURCE = """\
+<tkwidget>
+    <ttknotebook id="book" layout="pack">
+        <ttktab id="first" text="First" lazy="yes">
+            <label id="one" text="One" layout="pack"/>
+        </ttktab>
+        <ttktab id="second" text="Second" lazy="yes">
+            <label id="two" text="Two" layout="pack"/>
+        </ttktab>
+    </ttknotebook>
+</tkwidget>
+"""
+
+
+
+def test_lazy_tab_build (tk_parent):
+    r"""
+        out-of-build lazy tab build marks component as building,
+        calls tab init() once children exist and unbinds notebook
+        once no lazy tab is left;
+    """
+
+    # inits
+
+    _frame = XF.RADXMLFrame(tk_parent)
+
+    assert _frame.xml_build(XML_SOURCE)
+
+    _book = _frame.get_object_by_id("book")
+
+    _first, _second = _frame.get_lazy_tabs()
+
+    assert _book.bind("<<NotebookTabChanged>>")
+
+    # tab init() hook
+
+    _calls = list()
+
+    def _init (widget, **kw):
+
+        _calls.append((
+
+            _frame.is_building(),
+
+            bool(widget.winfo_children()),
+
+            # must not build second tab on demand meanwhile
+
+            _frame.get_object_by_id("two"),
+        ))
+
+    # end def
+
+    _entry = _frame._RADXMLWidget__lazy_tabs[str(_first)]
+
+    _frame._RADXMLWidget__lazy_tabs[str(_first)] = \
+                            _entry[:3] + ((_init, dict(widget = _first)), )
+
+    assert _frame.build_lazy_tab(_first)
+
+    assert _calls == [(True, True, None)]
+
+    assert not _frame.is_building()
+
+    assert _frame.get_lazy_tabs() == [_second]
+
+    assert _book.bind("<<NotebookTabChanged>>")
+
+    # last lazy tab
+
+    assert _frame.get_object_by_id("two")
+
+    assert not _frame.get_lazy_tabs()
+
+    assert not _book.bind("<<NotebookTabChanged>>")
+
+    _frame.destroy()
+
+# end def
+
+
+
+def test_lazy_tab_destroy (tk_parent):
+    r"""
+        destroy_component() drops notebook bindings of pending
+        lazy tabs along with their tcl callbacks;
+    """
+
+    # inits
+
+    _frame = XF.RADXMLFrame(tk_parent)
+
+    assert _frame.xml_build(XML_SOURCE)
+
+    _book = _frame.get_object_by_id("book")
+
+    _notebook, _funcid = _frame._RADXMLWidget__lazy_binds[str(_book)]
+
+    assert _funcid in _book.bind("<<NotebookTabChanged>>")
+
+    assert _book.tk.call("info", "commands", _funcid)
+
+    _frame.destroy_component()
+
+    assert not _frame.get_lazy_tabs()
+
+    assert not _book.tk.call("info", "commands", _funcid)
+
+    _frame.destroy()
+
+# end def
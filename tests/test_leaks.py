@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.bench import runner as BR
+
+
+
+def test_build_destroy_memory_is_flat (tk_root):
+    r"""
+        1,000 build/destroy cycles of the same XML form keep
+        traced memory flat i.e. within LEAK_TOLERANCE bytes per
+        cycle;
+    """
+
+    _per_cycle, _growth = BR.check_leaks(tk_root, cycles = 1000)
+
+    assert _per_cycle <= BR.LEAK_TOLERANCE, \
+        "{:.0f} bytes leaked per cycle ({} bytes overall)".format(
+
+            _per_cycle, _growth
+        )
+
+    # nothing left behind in root window
+
+    assert not tk_root.winfo_children()
+
+# end def
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import pytest
+
+from tkRAD.xml import rad_xml_widget as XW
+
+
+
+class SmallMemoWidget (XW.RADXMLWidget):
+    r"""
+        XML processor with a tiny memo;
+    """
+
+    MEMO_SIZE = 2
+
+# end class SmallMemoWidget
+
+
+
+@pytest.fixture
+def processor ():
+    r"""
+        SmallMemoWidget processor with a clean process-wide memo;
+    """
+
+    _processor = SmallMemoWidget(None)
+
+    _processor.clear_memo()
+
+    yield _processor
+
+    _processor.clear_memo()
+
+# end def
+
+
+
+def test_memo_hits (processor):
+    r"""
+        same (kind, raw value) pairs get parsed once; mutable
+        parsed values never get shared;
+    """
+
+    # inits
+
+    _calls = list()
+
+    def _parser (value):
+
+        _calls.append(value)
+
+        return value.split()
+
+    # end def
+
+    _first = processor._get_parsed_value("font", "Sans 10", _parser)
+
+    _first.append("bold")
+
+    assert processor._get_parsed_value("font", "Sans 10", _parser) \
+                                                    == ["Sans", "10"]
+
+    # other kind, same raw value
+
+    processor._get_parsed_value("values", "Sans 10", _parser)
+
+    assert _calls == ["Sans 10", "Sans 10"]
+
+    _stats = processor.get_memo_stats()
+
+    assert (_stats["hits"], _stats["misses"], _stats["size"]) == (1, 2, 2)
+
+    assert _stats["hit_rate"] == pytest.approx(1 / 3)
+
+    # non-string raw values are never memoized
+
+    processor._get_parsed_value("font", ("Sans", 10), list)
+
+    assert processor.get_memo_stats()["misses"] == 2
+
+# end def
+
+
+
+def test_memo_eviction (processor):
+    r"""
+        least recently used values get evicted beyond MEMO_SIZE;
+    """
+
+    # inits
+
+    _calls = list()
+
+    def _parser (value):
+
+        _calls.append(value)
+
+        return value.upper()
+
+    # end def
+
+    for _value in ("a", "b", "a", "c", "a", "b"):
+
+        assert processor._get_parsed_value("anchor", _value, _parser) \
+                                                    == _value.upper()
+
+    # end for
+
+    # 'b' got evicted by 'c', then 'c' by 'b'
+
+    assert _calls == ["a", "b", "c", "b"]
+
+    assert processor.get_memo_stats()["size"] == 2
+
+# end def
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.xml import rad_xml_pool as XO
+
+from tkRAD.xml import rad_xml_frame as XF
+
+
+
+FRAGMENT_SOURCE = """\
+<tkwidget>
+    <frame layout="pack">
+        <label text="a" layout="pack"/>
+    </frame>
+    <button text="b" layout="pack"/>
+</tkwidget>
+"""
+
+
+
+def test_pool_dead_fragments_are_discarded ():
+    r"""
+        fragments failing liveness check get counted as discarded,
+        never as hits;
+    """
+
+    # inits
+
+    _pool = XO.RADXMLWidgetPool()
+
+    _alive = XO.RADXMLFragment("key")
+
+    _dead = [XO.RADXMLFragment("key") for _i in range(2)]
+
+    for _fragment in [_alive] + _dead:
+
+        assert not _pool.put(_fragment)
+
+    # end for
+
+    _check = lambda fragment: fragment is _alive
+
+    assert _pool.get("key", _check) is _alive
+
+    assert _pool.get("key", _check) is None
+
+    assert _pool.get_stats() == {
+
+        "hits": 1, "misses": 1, "released": 3, "discarded": 2,
+
+        "pooled": 0, "keys": 0,
+    }
+
+# end def
+
+
+
+def test_pool_clear_hands_out_fragments ():
+    r"""
+        clear() returns all pooled fragments to be destroyed by
+        caller;
+    """
+
+    # inits
+
+    _pool = XO.RADXMLWidgetPool()
+
+    _fragments = [XO.RADXMLFragment(_key) for _key in "aab"]
+
+    for _fragment in _fragments:
+
+        _pool.put(_fragment)
+
+    # end for
+
+    assert sorted(_pool.clear(), key = id) == sorted(_fragments, key = id)
+
+    assert _pool.get_stats()["pooled"] == 0
+
+# end def
+
+
+
+def test_fragment_ids_follow_document_order (tk_parent, tmp_path):
+    r"""
+        anonymous ids of a new fragment get allocated in bulk, in
+        document order, after the ones of previous fragments;
+    """
+
+    # inits
+
+    _src = tmp_path / "fragment.xml"
+
+    _src.write_text(FRAGMENT_SOURCE)
+
+    _frame = XF.RADXMLFrame(tk_parent)
+
+    for _i in range(2):
+
+        _frame.build_fragment(str(_src), _frame)
+
+    # end for
+
+    assert [
+
+        _frame.get_object_by_id("object{}".format(_i)).winfo_class()
+
+        for _i in range(1, 7)
+
+    ] == ["Frame", "Label", "Button"] * 2
+
+    _frame.destroy()
+
+# end def
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.xml import rad_xml_base as XB
+
+
+
+XML_SOURCE = """\
+<tkbase>
+    <box name="top"><box/></box>
+    <box/>
+    <event/>
+</tkbase>
+"""
+
+
+
+class Box:
+    r"""
+        tkinter-free widget stand-in;
+    """
+
+    def __init__ (self, master):
+
+        self.master = master
+
+        self.alive = True
+
+    # end def
+
+    def destroy (self):
+
+        self.alive = False
+
+    # end def
+
+    def winfo_exists (self):
+
+        return self.alive
+
+    # end def
+
+# end class Box
+
+
+
+class Owner:
+    r"""
+        tk_owner stand-in;
+    """
+
+# end class Owner
+
+
+
+class Builder (XB.RADXMLBase):
+    r"""
+        minimal XML builder of Box objects;
+    """
+
+    DOCTYPE = "tkbase"
+
+    TCL_BATCH_SIZE = 0
+
+    def is_tk_parent (self, widget):
+
+        return True
+
+    # end def
+
+    def is_tk_widget (self, widget):
+
+        return isinstance(widget, Box)
+
+    # end def
+
+    def _build_element_tkbase (self, xml_tag, xml_element, tk_parent):
+
+        return self._loop_on_children(xml_element, tk_parent)
+
+    # end def
+
+    def _build_element_box (self, xml_tag, xml_element, tk_parent):
+
+        _box = Box(tk_parent)
+
+        self._register_object_by_id(_box, self.element_get_id(xml_element))
+
+        self._set_class_member(xml_element.get("name"), _box)
+
+        return self._loop_on_children(xml_element, _box)
+
+    # end def
+
+    def _build_element_event (self, xml_tag, xml_element, tk_parent):
+
+        return self._connect_event("TestReloadSignal", slot)
+
+    # end def
+
+# end class Builder
+
+
+
+def slot (*args, **kw):
+    pass
+# end def
+
+
+
+def test_full_reload_is_deterministic (tmp_path):
+    r"""
+        full rebuilds keep same anonymous ids, one single event
+        connection and tk_owner members;
+    """
+
+    # inits
+
+    _path = tmp_path / "reload.xml"
+
+    _path.write_text(XML_SOURCE)
+
+    _owner = Owner()
+
+    _builder = Builder(_owner)
+
+    assert _builder.xml_build(str(_path))
+
+    _ids = sorted(_builder.get_objects())
+
+    _top = _owner.top
+
+    # full rebuilds
+
+    for _run in range(3):
+
+        assert _builder.xml_reload(diff = False)
+
+    # end for
+
+    assert sorted(_builder.get_objects()) == _ids
+
+    assert not _top.alive and _owner.top.alive
+
+    assert len(_builder.events.connections["TestReloadSignal"]) == 1
+
+    # no duplicate tracked connections
+
+    assert len(_builder._RADXMLBase__connections) == 1
+
+    _builder.destroy_component()
+
+    assert not _builder.events.connections["TestReloadSignal"]
+
+# end def
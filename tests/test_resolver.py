@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import tkinter as TK
+
+from tkinter import ttk
+
+from tkRAD.xml import rad_xml_resolver as XR
+
+
+
+def test_get_arguments_cache ():
+    r"""
+        args get parsed only once but evaluated in each namespace;
+    """
+
+    # inits
+
+    _resolver = XR.RADXMLResolver()
+
+    _args = "tk_parent, TK.VERTICAL, *rest, width=size, **extra"
+
+    _ns1 = dict(TK = TK, rest = (1, 2), size = 10, extra = dict(a = 1))
+
+    _ns2 = dict(TK = TK, rest = (), size = 20, extra = dict())
+
+    assert _resolver.get_arguments(_args, _ns1, tk_parent = "p1") == (
+
+        ("p1", TK.VERTICAL, 1, 2), dict(width = 10, a = 1)
+    )
+
+    assert _resolver.get_arguments(_args, _ns2, tk_parent = "p2") == (
+
+        ("p2", TK.VERTICAL), dict(width = 20)
+    )
+
+    assert (_resolver.misses, _resolver.hits) == (1, 1)
+
+    assert _resolver.get_stats()["calls"] == 1
+
+    # cache drop
+
+    _resolver.clear()
+
+    _resolver.get_arguments(_args, _ns1, tk_parent = "p1")
+
+    assert (_resolver.misses, _resolver.hits) == (1, 0)
+
+# end def
+
+
+
+def test_import_names_invalidates_classes ():
+    r"""
+        import_names() drops cached classes of its namespace only;
+    """
+
+    # inits
+
+    _resolver = XR.RADXMLResolver()
+
+    _ns = dict(__package__ = None)
+
+    _other = dict(TK = TK)
+
+    _resolver.import_names(_ns, import_ = "tkinter", as_ = "TK")
+
+    assert _resolver.get_class("TK", "Button", _ns) is TK.Button
+
+    assert _resolver.get_class("TK", "Button", _ns) is TK.Button
+
+    assert _resolver.get_class("TK", "Button", _other) is TK.Button
+
+    assert (_resolver.misses, _resolver.hits) == (2, 1)
+
+    # rebinding 'TK' name
+
+    _resolver.import_names(_ns, from_ = "tkinter", import_ = "ttk",
+
+        as_ = "TK"
+    )
+
+    assert _resolver.get_class("TK", "Button", _ns) is ttk.Button
+
+    assert _resolver.get_class("TK", "Button", _other) is TK.Button
+
+    assert (_resolver.misses, _resolver.hits) == (3, 2)
+
+# end def
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkinter import ttk
+
+from tkRAD.xml import rad_xml_frame as XF
+
+from tkRAD.xml import rad_xml_widget as XW
+
+
+
+STYLESHEET = """
+    /* comments get dropped */
+    Rules.TLabel, Rules.TButton:active:!disabled {
+        foreground: red;
+        padding : 2 4 ;
+    }
+    *  { background: white; }
+    Rules.TLabel, Rules.TButton:active:!disabled {
+        foreground: red;
+        padding : 2 4 ;
+    }
+"""
+
+
+
+XML_SOURCE = """\
+<tkwidget>
+    <ttkstyle apply="Applied.TLabel" foreground="navy">
+        Applied.TLabel {{ padding: {padding}; }}
+        Applied.TButton:pressed {{ foreground: green; }}
+    </ttkstyle>
+</tkwidget>
+"""
+
+
+
+def test_ttkstyle_rules ():
+    r"""
+        CSS-like stylesheets compile once into rules, in document
+        order and without duplicates;
+    """
+
+    # inits
+
+    _processor = XW.RADXMLWidget(None)
+
+    _rules = _processor._get_ttkstyle_rules(STYLESHEET)
+
+    assert _rules == (
+
+        (
+            (("Rules.TLabel", ()), ("Rules.TButton", ("active", "!disabled"))),
+
+            (("foreground", "red"), ("padding", "2 4")),
+        ),
+
+        ((((".", ()), ), (("background", "white"), ))),
+    )
+
+    # compiled only once, whatever processor is
+
+    assert XW.RADXMLWidget(None)._get_ttkstyle_rules(STYLESHEET) is _rules
+
+    assert _processor._get_ttkstyle_rules("") == ()
+
+# end def
+
+
+
+def test_ttkstyle_applied_once (tk_parent):
+    r"""
+        built stylesheet sets up ttk configure() and merged map()
+        options, only once per stylesheet contents;
+    """
+
+    # inits
+
+    _style = ttk.Style(tk_parent)
+
+    _style.map("Applied.TButton", foreground = [("active", "blue")])
+
+    _frame = XF.RADXMLFrame(tk_parent)
+
+    assert _frame.xml_build(XML_SOURCE.format(padding = 3))
+
+    assert _style.lookup("Applied.TLabel", "foreground") == "navy"
+
+    assert str(_style.lookup("Applied.TLabel", "padding")) == "3"
+
+    # state maps get merged, new specs first
+
+    assert [
+
+        (" ".join(map(str, _spec[:-1])), str(_spec[-1]))
+
+        for _spec in _style.map("Applied.TButton", "foreground")
+
+    ] == [("pressed", "green"), ("active", "blue")]
+
+    # same stylesheet again - skipped
+
+    _style.configure("Applied.TLabel", foreground = "black")
+
+    _other = XF.RADXMLFrame(tk_parent)
+
+    assert _other.xml_build(XML_SOURCE.format(padding = 3))
+
+    assert _style.lookup("Applied.TLabel", "foreground") == "black"
+
+    # changed stylesheet - applied
+
+    assert _other.xml_build(XML_SOURCE.format(padding = 5))
+
+    assert _style.lookup("Applied.TLabel", "foreground") == "navy"
+
+    assert str(_style.lookup("Applied.TLabel", "padding")) == "5"
+
+    _frame.destroy()
+
+    _other.destroy()
+
+# end def
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import pytest
+
+from tkRAD.xml import compile as XCC
+
+from tkRAD.xml import rad_xml_frame as XF
+
+
+
+ROW_SOURCE = """\
+<tkwidget>
+    <label textvariable="item" layout="pack"/>
+</tkwidget>
+"""
+
+
+
+XML_SOURCE = """\
+<tkwidget>
+    <virtuallist id="list" rowtemplate="{}" rows="5"
+        rowbind=".slot_rowbind" layout="pack"/>
+</tkwidget>
+"""
+
+
+
+class SlotOwner:
+    r"""
+        keeps track of rowbind() calls;
+    """
+
+    def __init__ (self):
+
+        self.calls = list()
+
+    # end def
+
+    def slot_rowbind (self, row, item, index, **kw):
+
+        self.calls.append((item, index, kw.get("widget")))
+
+    # end def
+
+# end class SlotOwner
+
+
+
+def test_virtuallist_build (tk_parent, tmp_path):
+    r"""
+        <virtuallist> gets built from XML, rows get bound to data
+        items along scrolling;
+    """
+
+    # inits
+
+    _row = tmp_path / "row.xml"
+
+    _row.write_text(ROW_SOURCE)
+
+    _owner = SlotOwner()
+
+    _frame = XF.RADXMLFrame(tk_parent, slot_owner = _owner)
+
+    assert _frame.xml_build(XML_SOURCE.format(_row))
+
+    _list = _frame.get_object_by_id("list")
+
+    # data items
+
+    _list.set_data(["item {}".format(_i) for _i in range(1000)])
+
+    assert _list.get_visible_range() == (0, 5)
+
+    assert _list.get_row(0).get_stringvar("item").get() == "item 0"
+
+    # rowbind() command gets deferred keywords of its own widget
+
+    assert _owner.calls[0] == ("item 0", 0, _list)
+
+    # row instances get recycled
+
+    _rows = _list.get_rows()
+
+    _list.scroll(100)
+
+    assert _list.get_visible_range() == (100, 105)
+
+    assert _list.get_rows() == _rows
+
+    assert _list.get_row(100).get_stringvar("item").get() == "item 100"
+
+    # row template ids get allocated once, for all rows
+
+    assert all(
+
+        _row.get_object_by_id("object1").winfo_class() == "Label"
+
+        for _row in _rows
+    )
+
+    _frame.destroy()
+
+# end def
+
+
+
+def test_virtuallist_compiled ():
+    r"""
+        <virtuallist> is unsupported in compiled mode;
+    """
+
+    with pytest.raises(TypeError, match = "virtuallist"):
+
+        XCC.compile_xml(XML_SOURCE.format("row.xml"))
+
+    # end with
+
+# end def
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+from tkRAD.widgets import rad_virtual_listbox as VL
+
+
+
+CHOICES = ["item {}".format(_i) for _i in range(10000)]
+
+
+
+def test_search_option_menu_popup (tk_parent, monkeypatch):
+    r"""
+        popup may be opened again and again, search entry filters
+        choices of current popup only;
+    """
+
+    # popup of a withdrawn root window is never viewable
+
+    monkeypatch.setattr(VL.TK.Toplevel, "grab_set", lambda self: None)
+
+    _menu = VL.RADSearchOptionMenu(tk_parent, data = CHOICES)
+
+    _menu.pack()
+
+    for _run in range(3):
+
+        _menu.popup()
+
+        _search, _list = _menu.winfo_children()[-1].winfo_children()
+
+        _search.insert(0, "item 999")
+
+        # 'item 999' and 'item 9990' .. 'item 9999'
+
+        assert _list.get_count() == 11
+
+        _menu._close_popup()
+
+    # end for
+
+    # search changes without any popup get ignored
+
+    _menu._slot_search()
+
+    _menu.destroy()
+
+# end def
+
+
+
+def test_search_option_menu_variable (tk_parent):
+    r"""
+        given control variable gets used as is;
+    """
+
+    _menu = VL.RADSearchOptionMenu(tk_parent, data = CHOICES)
+
+    _other = VL.RADSearchOptionMenu(
+
+        tk_parent, data = CHOICES, variable = _menu.variable
+    )
+
+    assert _other.variable is _menu.variable
+
+    _menu.destroy()
+
+    _other.destroy()
+
+# end def
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+
+# lib imports
+
+import os
+
+import collections
+
+import weakref
+
+import tkinter as TK
+
+from ..core import path as P
+
+from ..core import services as SM
+
+
+
+# app-wide service name
+
+SERVICE_NAME = "images"
+
+
+
+# service getter
+
+def get_image_cache ():
+    r"""
+        gets the application-wide image cache, registered as
+        'images' service in core.services (see SERVICE_NAME);
+
+        an application may register its own RADImageCache object
+        under this service name before any image gets loaded;
+
+        always return the image cache service object;
+    """
+
+    _cache = SM.ask_for(SERVICE_NAME, silent_mode = True)
+
+    if _cache is None:
+
+        _cache = RADImageCache()
+
+        SM.register_service(SERVICE_NAME, _cache)
+
+    # end if
+
+    return _cache
+
+# end def
+
+
+
+class RADImageCache:
+    r"""
+        process-wide cache of tkinter PhotoImage objects;
+
+        images are keyed by normalized file path, file mtime and
+        optional subsample/zoom factors, so that the same image
+        file gets loaded and decoded only once, whatever the
+        number of widgets showing it;
+
+        images in use are only weakly referenced: they live as
+        long as some widget keeps them; unused images are kept in
+        a least recently used (LRU) list, within a byte budget of
+        decoded pixels (see BUDGET);
+
+        images belong to the Tcl interpreter of their @master
+        (default: tkinter default root) and are keyed along with
+        it: a new root window never gets images of a destroyed
+        one;
+    """
+
+
+
+    # default byte budget of cached images (32 MiB)
+
+    BUDGET = 32 * 1024 * 1024
+
+
+
+    def __init__ (self, budget = None):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__images = weakref.WeakValueDictionary()  # key --> image
+
+        self.__lru = collections.OrderedDict()  # key --> (image, bytes)
+
+        self.__bytes = 0
+
+        self.budget = self.BUDGET if budget is None else budget
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self.evictions = 0
+
+    # end def
+
+
+
+    def _evict (self):
+        r"""
+            protected method def;
+
+            drops least recently used images until cached images
+            fit into byte budget;
+
+            dropped images still in use remain shared until their
+            last widget releases them;
+
+            no return value (void);
+        """
+
+        while self.__lru and self.__bytes > max(0, self.budget):
+
+            _key, (_image, _bytes) = self.__lru.popitem(last = False)
+
+            self.__bytes -= _bytes
+
+            self.evictions += 1
+
+        # end while
+
+    # end def
+
+
+
+    def _get_factors (self, value):
+        r"""
+            protected method def;
+
+            returns (x, y) tuple of integer factors from @value
+            integer or (x, y) pair;
+        """
+
+        if isinstance(value, (tuple, list)):
+
+            return (int(value[0]), int(value[-1]))
+
+        # end if
+
+        return (int(value), int(value))
+
+    # end def
+
+
+
+    def _get_key (self, path, subsample = None, zoom = None,
+    master = None):
+        r"""
+            protected method def;
+
+            Tcl interpreter gets identified by its python object id:
+            cached images keep their interpreter alive, so that its
+            id cannot be reused by another one meanwhile;
+
+            raises OSError if @path file does not exist;
+
+            returns (normalized path, mtime, subsample, zoom,
+            interpreter id) key;
+        """
+
+        # inits
+
+        path = P.normalize(path)
+
+        if master is None:
+
+            master = TK._default_root
+
+        # end if
+
+        return (
+
+            path, os.stat(path).st_mtime_ns, subsample, zoom,
+
+            id(getattr(master, "tk", None)),
+        )
+
+    # end def
+
+
+
+    def _load_image (self, key, master = None):
+        r"""
+            protected method def;
+
+            loads and decodes image file along @key;
+
+            returns new PhotoImage object;
+        """
+
+        # inits
+
+        _path, _mtime, _subsample, _zoom, _interp = key
+
+        _image = TK.PhotoImage(file = _path, master = master)
+
+        # optional resizing
+
+        if _zoom:
+
+            _image = _image.zoom(*self._get_factors(_zoom))
+
+        # end if
+
+        if _subsample:
+
+            _image = _image.subsample(*self._get_factors(_subsample))
+
+        # end if
+
+        return _image
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all cached images and resets statistics;
+
+            images still in use remain alive until their last
+            widget releases them;
+
+            no return value (void);
+        """
+
+        self.__images.clear()
+
+        self.__lru.clear()
+
+        self.__bytes = 0
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self.evictions = 0
+
+    # end def
+
+
+
+    def discard (self, path):
+        r"""
+            drops all cached images of @path file, if any;
+
+            no return value (void);
+        """
+
+        path = P.normalize(path)
+
+        for _key in [_k for _k in self.__images.keys() if _k[0] == path]:
+
+            self.__images.pop(_key, None)
+
+        # end for
+
+        for _key in [_k for _k in self.__lru if _k[0] == path]:
+
+            self.__bytes -= self.__lru.pop(_key)[1]
+
+        # end for
+
+    # end def
+
+
+
+    def get_image (self, path, subsample = None, zoom = None,
+    master = None):
+        r"""
+            retrieves shared image of @path file, resized along
+            optional @subsample and @zoom factors (integer or
+            (x, y) pair);
+
+            loads and decodes image file on cache miss or if file
+            has changed;
+
+            raises OSError if @path file does not exist and
+            TK.TclError if it is not a supported image;
+
+            returns PhotoImage object, to be kept by caller as long
+            as it is in use;
+        """
+
+        # inits
+
+        _key = self._get_key(path, subsample, zoom, master)
+
+        _image = self.__images.get(_key)
+
+        # cache hit?
+
+        if _image is not None:
+
+            self.hits += 1
+
+            # mark as most recently used
+
+            if _key in self.__lru:
+
+                self.__lru.move_to_end(_key)
+
+                return _image
+
+            # end if
+
+        # cache miss
+
+        else:
+
+            self.misses += 1
+
+            _image = self._load_image(_key, master)
+
+            self.__images[_key] = _image
+
+        # end if
+
+        # keep it cached - decoded RGBA pixels
+
+        _bytes = _image.width() * _image.height() * 4
+
+        self.__lru[_key] = (_image, _bytes)
+
+        self.__bytes += _bytes
+
+        # keep cache within budget
+
+        self._evict()
+
+        return _image
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns dict(hits, misses, evictions, images, cached,
+            bytes, budget) of cache statistics where 'images' is the
+            number of images alive (in use or cached), 'cached' the
+            number of images kept by cache itself and 'bytes' their
+            decoded size;
+        """
+
+        return {
+
+            "hits": self.hits,
+
+            "misses": self.misses,
+
+            "evictions": self.evictions,
+
+            "images": len(self.__images),
+
+            "cached": len(self.__lru),
+
+            "bytes": self.__bytes,
+
+            "budget": self.budget,
+        }
+
+    # end def
+
+
+
+    def set_budget (self, budget):
+        r"""
+            sets byte budget of cached images and evicts least
+            recently used images if needed;
+
+            no return value (void);
+        """
+
+        self.budget = int(budget)
+
+        self._evict()
+
+    # end def
+
+
+# end class RADImageCache
@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import copy
+
+import collections.abc
+
+import tkinter as TK
+
+from tkinter import ttk
+
+from ..core import tools
+
+from ..xml import rad_xml_frame as XF
+
+from . import rad_frame as RF
+
+from . import rad_virtual_listbox as VL
+
+
+
+class RADVirtualList (RF.RADFrame):
+    r"""
+        virtualized list of XML-built rows;
+
+        keeps its items in a python sequence or a data source (see
+        tkRAD.widgets.rad_virtual_listbox get_count() and
+        get_items() module functions) and only builds as many
+        @rowtemplate XML row instances as needed to fill its
+        viewport;
+
+        along scrolling, row instances get recycled i.e. rebound
+        to other data items, never rebuilt;
+
+        each row is a RADXMLFrame with its own control variables:
+        a row gets bound to its data item by writing item's
+        (key, value) pairs (mapping items) or 'item' name (any
+        other item) along with 'index' name into row's control
+        variables of the same names, in one single Tcl call;
+
+        optional @rowbind callable gets called as
+        rowbind(row, item, index) for any other specific binding;
+    """
+
+
+
+    # default number of rows
+
+    ROWS = 10
+
+
+
+    # max number of row instances
+
+    MAX_ROWS = 200
+
+
+
+    # number of rows scrolled by mouse wheel
+
+    WHEEL_ROWS = 3
+
+
+
+    def _bind_row (self, row, index, item):
+        r"""
+            protected method def;
+
+            binds @row row instance to @item data item of @index data
+            index;
+
+            no return value (void);
+        """
+
+        # control variables
+
+        _values = {"index": index, "item": item}
+
+        if isinstance(item, collections.abc.Mapping):
+
+            _values.update(item)
+
+        # end if
+
+        row.set_cvar_values(_values)
+
+        # specific binding
+
+        if callable(self.rowbind):
+
+            self.rowbind(row, item, index)
+
+        # end if
+
+    # end def
+
+
+
+    def _build_row (self):
+        r"""
+            protected method def;
+
+            builds a new row instance along row template and appends
+            it to row instances;
+
+            row template gets parsed and its anonymous XML ids get
+            allocated once, on first row instance: all row instances
+            share the same XML ids;
+
+            returns new row instance;
+        """
+
+        # inits
+
+        _row = XF.RADXMLFrame(
+
+            self.body, slot_owner = self.slot_owner, cvar_pool = False
+        )
+
+        # first row instance?
+
+        if self.__template is None:
+
+            _row.xml_load(self.rowtemplate)
+
+            _root = _row.get_xml_tree().getroot()
+
+            _row.element_set_ids(_root)
+
+            self.__template = copy.deepcopy(_root)
+
+        else:
+
+            _row.set_xml_tree(element = copy.deepcopy(self.__template))
+
+        # end if
+
+        _row.xml_build()
+
+        _row.grid(row = len(self.__rows), column = 0, sticky = TK.E + TK.W)
+
+        # mouse wheel scrolling on any row widget
+
+        _stack = [_row]
+
+        while _stack:
+
+            _widget = _stack.pop()
+
+            _widget.bindtags((self.__bindtag, ) + _widget.bindtags())
+
+            _stack.extend(_widget.winfo_children())
+
+        # end while
+
+        self.__rows.append(_row)
+
+        self.__bound.append(None)
+
+        self.__shown.append(True)
+
+        return _row
+
+    # end def
+
+
+
+    def _refresh (self, force = False):
+        r"""
+            protected method def;
+
+            binds visible row instances to their data items, hides
+            unused row instances and shows scrollbar position;
+
+            row instances already bound to the same data item get
+            skipped, unless @force is set;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _count = VL.get_count(self.__data)
+
+        self.__offset = max(0, min(self.__offset, _count - self.rows))
+
+        _items = VL.get_items(
+
+            self.__data, self.__offset, self.__offset + self.rows
+        )
+
+        # bind visible rows
+
+        for _row, _item in enumerate(_items):
+
+            _index = self.__offset + _row
+
+            _bound = self.__bound[_row]
+
+            if force or not _bound or _bound[0] != _index \
+                                            or _bound[1] is not _item:
+
+                self._bind_row(self.__rows[_row], _index, _item)
+
+                self.__bound[_row] = (_index, _item)
+
+            # end if
+
+            if not self.__shown[_row]:
+
+                self.__rows[_row].grid()
+
+                self.__shown[_row] = True
+
+            # end if
+
+        # end for
+
+        # hide unused rows
+
+        for _row in range(len(_items), len(self.__rows)):
+
+            if self.__shown[_row]:
+
+                self.__rows[_row].grid_remove()
+
+                self.__shown[_row] = False
+
+            # end if
+
+            self.__bound[_row] = None
+
+        # end for
+
+        # scrollbar position
+
+        if _count:
+
+            self.scrollbar.set(
+
+                self.__offset / _count,
+
+                min(1.0, (self.__offset + self.rows) / _count),
+            )
+
+        else:
+
+            self.scrollbar.set(0.0, 1.0)
+
+        # end if
+
+    # end def
+
+
+
+    def _slot_body_configure (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for viewport size changes;
+
+            builds or hides row instances so that they fill up
+            viewport;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _height = self.__rows[0].winfo_reqheight()
+
+        # natural size or not yet mapped
+
+        if _height < 2 or tk_event.height < 2 \
+                        or tk_event.height == self.body.winfo_reqheight():
+
+            return
+
+        # end if
+
+        _rows = max(1, min(self.MAX_ROWS, tk_event.height // _height))
+
+        # need to change?
+
+        if _rows != self.rows:
+
+            # build missing row instances, if any
+
+            while len(self.__rows) < _rows:
+
+                self._build_row()
+
+            # end while
+
+            self.rows = _rows
+
+            self._refresh()
+
+        # end if
+
+    # end def
+
+
+
+    def _slot_mouse_wheel (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for mouse wheel scrolling;
+
+            returns 'break' to stop tkinter default bindings;
+        """
+
+        # X11 buttons 4/5 or MS-Windows/MacOS delta
+
+        if tk_event.num == 4 or tk_event.delta > 0:
+
+            self.scroll(-self.WHEEL_ROWS)
+
+        else:
+
+            self.scroll(self.WHEEL_ROWS)
+
+        # end if
+
+        return "break"
+
+    # end def
+
+
+
+    def _slot_scrollbar (self, action, *args):
+        r"""
+            slot method for scrollbar commands;
+
+            no return value (void);
+        """
+
+        # dragged
+
+        if action == TK.MOVETO:
+
+            self.__offset = int(float(args[0]) * self.get_count())
+
+            self._refresh()
+
+        # arrows or trough clicks
+
+        elif action == TK.SCROLL:
+
+            _rows = tools.ensure_int(args[0])
+
+            if args[1] == TK.PAGES:
+
+                _rows *= self.rows
+
+            # end if
+
+            self.scroll(_rows)
+
+        # end if
+
+    # end def
+
+
+
+    def get_count (self):
+        r"""
+            returns number of data items;
+        """
+
+        return VL.get_count(self.__data)
+
+    # end def
+
+
+
+    def get_data (self):
+        r"""
+            returns current sequence or data source;
+        """
+
+        return self.__data
+
+    # end def
+
+
+
+    def get_row (self, index):
+        r"""
+            returns row instance currently bound to data @index,
+            None if not visible;
+        """
+
+        _row = index - self.__offset
+
+        if 0 <= _row < self.rows and self.__bound[_row] \
+                                        and self.__bound[_row][0] == index:
+
+            return self.__rows[_row]
+
+        # end if
+
+        return None
+
+    # end def
+
+
+
+    def get_rows (self):
+        r"""
+            returns list of visible row instances, in data order;
+        """
+
+        return [
+
+            _row for _row, _bound in zip(self.__rows, self.__bound)
+
+            if _bound
+        ]
+
+    # end def
+
+
+
+    def get_visible_range (self):
+        r"""
+            returns (start, stop) tuple of visible data indices,
+            stop excluded;
+        """
+
+        return (
+
+            self.__offset,
+
+            min(self.__offset + self.rows, self.get_count()),
+        )
+
+    # end def
+
+
+
+    def init_widget (self, **kw):
+        r"""
+            widget setup;
+
+            @kw keywords: rowtemplate (XML row template file path or
+            XML source string of chars), data (sequence or data
+            source), rows (initial number of row instances),
+            rowbind (optional rowbind(row, item, index) callable);
+
+            no return value (void);
+        """
+
+        # member inits
+
+        self.__data = None
+
+        self.__offset = 0
+
+        self.__rows = list()
+
+        self.__bound = list()
+
+        self.__shown = list()
+
+        self.__template = None
+
+        self.__bindtag = "RADVirtualList{}".format(id(self))
+
+        self.rowtemplate = kw.get("rowtemplate")
+
+        self.rowbind = kw.get("rowbind")
+
+        _rows = tools.ensure_int(kw.get("rows") or self.ROWS)
+
+        self.rows = max(1, min(self.MAX_ROWS, _rows))
+
+        if not tools.is_pstr(self.rowtemplate):
+
+            raise ValueError(
+
+                _("RADVirtualList needs a valid 'rowtemplate' keyword.")
+            )
+
+        # end if
+
+        # internal widgets
+
+        self.body = ttk.Frame(self)
+
+        self.scrollbar = ttk.Scrollbar(
+
+            self, orient = TK.VERTICAL, command = self._slot_scrollbar
+        )
+
+        self.body.grid(row = 0, column = 0, sticky = self.STICKY_ALL)
+
+        self.scrollbar.grid(row = 0, column = 1, sticky = TK.N + TK.S)
+
+        self.body.columnconfigure(0, weight = 1)
+
+        self.columnconfigure(0, weight = 1)
+
+        self.rowconfigure(0, weight = 1)
+
+        # row instances
+
+        for _row in range(self.rows):
+
+            self._build_row()
+
+        # end for
+
+        # bindings
+
+        self.body.bind("<Configure>", self._slot_body_configure)
+
+        for _sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+
+            self.bind_class(self.__bindtag, _sequence, self._slot_mouse_wheel)
+
+        # end for
+
+        # data inits
+
+        self.set_data(kw.get("data"))
+
+    # end def
+
+
+
+    def refresh (self):
+        r"""
+            shows data changes, if any, by rebinding all visible
+            rows;
+
+            no return value (void);
+        """
+
+        self._refresh(force = True)
+
+    # end def
+
+
+
+    def scroll (self, rows):
+        r"""
+            scrolls visible rows of @rows rows (negative values
+            scroll up);
+
+            no return value (void);
+        """
+
+        self.__offset += tools.ensure_int(rows)
+
+        self._refresh()
+
+    # end def
+
+
+
+    def see (self, index):
+        r"""
+            scrolls visible rows so that data @index becomes
+            visible;
+
+            no return value (void);
+        """
+
+        # need to scroll?
+
+        if index < self.__offset:
+
+            self.__offset = index
+
+        elif index >= self.__offset + self.rows:
+
+            self.__offset = index - self.rows + 1
+
+        # end if
+
+        self._refresh()
+
+    # end def
+
+
+
+    def set_data (self, data, start = 0):
+        r"""
+            sets up new sequence or data source @data and makes
+            @start index item visible;
+
+            no return value (void);
+        """
+
+        self.__data = data
+
+        self.__offset = 0
+
+        self.__bound = [None] * len(self.__rows)
+
+        self.see(max(0, tools.ensure_int(start)))
+
+    # end def
+
+
+# end class RADVirtualList
@@ -0,0 +1,1057 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import tkinter as TK
+
+from tkinter import ttk
+
+from ..core import tools
+
+from . import rad_frame as RF
+
+
+
+# data source protocol helpers
+# data may be either a python sequence or any object implementing
+# get_count() and get_items(start, stop) methods (e.g. paged
+# database queries)
+
+def get_count (data):
+    r"""
+        returns number of items in @data sequence or data source;
+    """
+
+    # no data
+
+    if data is None:
+
+        return 0
+
+    # data source
+
+    elif hasattr(data, "get_count"):
+
+        return data.get_count()
+
+    # end if
+
+    # sequence
+
+    return len(data)
+
+# end def
+
+
+
+def get_items (data, start, stop):
+    r"""
+        returns list() of @data items from @start index to @stop
+        index (excluded);
+    """
+
+    # no data
+
+    if data is None:
+
+        return list()
+
+    # data source
+
+    elif hasattr(data, "get_items"):
+
+        return list(data.get_items(start, stop))
+
+    # end if
+
+    # sequence
+
+    return list(data[start:stop])
+
+# end def
+
+
+
+class RADFilteredData:
+    r"""
+        read-only filtered view of a sequence or data source;
+
+        implements data source protocol (get_count(), get_items());
+
+        items are matched by case-insensitive substring search on
+        their str() value;
+
+        narrowing a filter (e.g. 'ab' --> 'abc') only searches
+        previously matching items;
+    """
+
+
+
+    def __init__ (self, data):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.data = data
+
+        self.__keys = None      # lowercased str() values
+
+        self.__indices = None   # matching indices (None: no filter)
+
+        self.__text = ""
+
+    # end def
+
+
+
+    def get_count (self):
+        r"""
+            returns number of matching items;
+        """
+
+        if self.__indices is None:
+
+            return get_count(self.data)
+
+        # end if
+
+        return len(self.__indices)
+
+    # end def
+
+
+
+    def get_index (self, position):
+        r"""
+            returns genuine data index of matching item at
+            @position;
+        """
+
+        if self.__indices is None:
+
+            return position
+
+        # end if
+
+        return self.__indices[position]
+
+    # end def
+
+
+
+    def get_items (self, start, stop):
+        r"""
+            returns list() of matching items from @start position
+            to @stop position (excluded);
+        """
+
+        # no filter
+
+        if self.__indices is None:
+
+            return get_items(self.data, start, stop)
+
+        # end if
+
+        return [
+
+            get_items(self.data, _index, _index + 1)[0]
+
+            for _index in self.__indices[start:stop]
+        ]
+
+    # end def
+
+
+
+    def set_filter (self, text):
+        r"""
+            keeps only items whose str() value contains @text,
+            whatever case is; empty @text drops filter;
+
+            no return value (void);
+        """
+
+        # inits
+
+        text = str(text or "").lower()
+
+        # no filter
+
+        if not text:
+
+            self.__indices = None
+
+        else:
+
+            # search keys computed only once
+
+            if self.__keys is None:
+
+                self.__keys = [
+
+                    str(_item).lower() for _item in
+
+                    get_items(self.data, 0, get_count(self.data))
+                ]
+
+            # end if
+
+            # narrowed filter: only search previous matches
+
+            if self.__indices is not None and text.startswith(self.__text):
+
+                _indices = self.__indices
+
+            else:
+
+                _indices = range(len(self.__keys))
+
+            # end if
+
+            self.__indices = [
+
+                _index for _index in _indices
+
+                if text in self.__keys[_index]
+            ]
+
+        # end if
+
+        self.__text = text
+
+    # end def
+
+
+# end class RADFilteredData
+
+
+
+class RADVirtualListbox (RF.RADFrame):
+    r"""
+        virtualized single-selection listbox;
+
+        keeps its items in a python sequence or a data source (see
+        get_count() and get_items() module functions) and only
+        shows @rows visible items in a fixed-height tkinter Listbox,
+        along scrolling;
+
+        generates '<<ListboxSelect>>' virtual event on user
+        selection changes;
+    """
+
+
+
+    # default number of visible rows
+
+    ROWS = 10
+
+
+
+    # number of rows scrolled by mouse wheel
+
+    WHEEL_ROWS = 3
+
+
+
+    def _refresh (self):
+        r"""
+            protected method def;
+
+            shows visible items in listbox, selection and scrollbar
+            position;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _count = get_count(self.__data)
+
+        self.__offset = max(0, min(self.__offset, _count - self.rows))
+
+        _items = get_items(
+
+            self.__data, self.__offset, self.__offset + self.rows
+        )
+
+        # reset visible rows
+
+        self.listbox.delete(0, TK.END)
+
+        if _items:
+
+            self.listbox.insert(0, *_items)
+
+        # end if
+
+        # selection is visible?
+
+        _row = self.__selected - self.__offset
+
+        if 0 <= _row < len(_items):
+
+            self.listbox.selection_set(_row)
+
+            self.listbox.activate(_row)
+
+        # end if
+
+        # scrollbar position
+
+        if _count:
+
+            self.scrollbar.set(
+
+                self.__offset / _count,
+
+                min(1.0, (self.__offset + self.rows) / _count),
+            )
+
+        else:
+
+            self.scrollbar.set(0.0, 1.0)
+
+        # end if
+
+    # end def
+
+
+
+    def _slot_key (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for keyboard navigation;
+
+            returns 'break' to stop tkinter default bindings;
+        """
+
+        # inits
+
+        _index = self.__selected
+
+        _index = {
+
+            "Up": _index - 1,
+
+            "Down": _index + 1,
+
+            "Prior": _index - self.rows,
+
+            "Next": _index + self.rows,
+
+            "Home": 0,
+
+            "End": self.get_count() - 1,
+
+        }.get(tk_event.keysym, _index)
+
+        self.select(max(0, _index), notify = True)
+
+        return "break"
+
+    # end def
+
+
+
+    def _slot_listbox_select (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for internal listbox selection changes;
+
+            no return value (void);
+        """
+
+        _rows = self.listbox.curselection()
+
+        if _rows:
+
+            self.__selected = self.__offset + int(_rows[0])
+
+            self.event_generate("<<ListboxSelect>>")
+
+        # end if
+
+    # end def
+
+
+
+    def _slot_mouse_wheel (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for mouse wheel scrolling;
+
+            returns 'break' to stop tkinter default bindings;
+        """
+
+        # X11 buttons 4/5 or MS-Windows/MacOS delta
+
+        if tk_event.num == 4 or tk_event.delta > 0:
+
+            self.scroll(-self.WHEEL_ROWS)
+
+        else:
+
+            self.scroll(self.WHEEL_ROWS)
+
+        # end if
+
+        return "break"
+
+    # end def
+
+
+
+    def _slot_scrollbar (self, action, *args):
+        r"""
+            slot method for scrollbar commands;
+
+            no return value (void);
+        """
+
+        # dragged
+
+        if action == TK.MOVETO:
+
+            self.__offset = int(float(args[0]) * self.get_count())
+
+            self._refresh()
+
+        # arrows or trough clicks
+
+        elif action == TK.SCROLL:
+
+            _rows = tools.ensure_int(args[0])
+
+            if args[1] == TK.PAGES:
+
+                _rows *= self.rows
+
+            # end if
+
+            self.scroll(_rows)
+
+        # end if
+
+    # end def
+
+
+
+    def get_count (self):
+        r"""
+            returns number of data items;
+        """
+
+        return get_count(self.__data)
+
+    # end def
+
+
+
+    def get_data (self):
+        r"""
+            returns current sequence or data source;
+        """
+
+        return self.__data
+
+    # end def
+
+
+
+    def get_selected (self):
+        r"""
+            returns data index of selected item, -1 if none;
+        """
+
+        return self.__selected
+
+    # end def
+
+
+
+    def get_selected_item (self):
+        r"""
+            returns selected data item, None if none;
+        """
+
+        if self.__selected < 0:
+
+            return None
+
+        # end if
+
+        return get_items(self.__data, self.__selected, self.__selected + 1)[0]
+
+    # end def
+
+
+
+    def get_visible_range (self):
+        r"""
+            returns (start, stop) tuple of visible data indices,
+            stop excluded;
+        """
+
+        return (
+
+            self.__offset,
+
+            min(self.__offset + self.rows, self.get_count()),
+        )
+
+    # end def
+
+
+
+    def init_widget (self, **kw):
+        r"""
+            widget setup;
+
+            @kw keywords: data (sequence or data source), rows
+            (number of visible rows), listbox tkinter options
+            (font, background, etc) are given as is to internal
+            listbox;
+
+            no return value (void);
+        """
+
+        # member inits
+
+        self.__data = None
+
+        self.__offset = 0
+
+        self.__selected = -1
+
+        self.rows = max(1, tools.ensure_int(kw.get("rows") or self.ROWS))
+
+        # internal widgets
+
+        self.listbox = TK.Listbox(
+
+            self,
+
+            height = self.rows,
+
+            selectmode = TK.BROWSE,
+
+            exportselection = 0,
+        )
+
+        self.listbox.configure(**self.__only_listbox(kw))
+
+        self.scrollbar = ttk.Scrollbar(
+
+            self, orient = TK.VERTICAL, command = self._slot_scrollbar
+        )
+
+        self.listbox.grid(row = 0, column = 0, sticky = self.STICKY_ALL)
+
+        self.scrollbar.grid(row = 0, column = 1, sticky = TK.N + TK.S)
+
+        self.columnconfigure(0, weight = 1)
+
+        self.rowconfigure(0, weight = 1)
+
+        # bindings
+
+        self.listbox.bind("<<ListboxSelect>>", self._slot_listbox_select)
+
+        for _sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+
+            self.listbox.bind(_sequence, self._slot_mouse_wheel)
+
+        # end for
+
+        for _key in ("Up", "Down", "Prior", "Next", "Home", "End"):
+
+            self.listbox.bind("<{}>".format(_key), self._slot_key)
+
+        # end for
+
+        # data inits
+
+        self.set_data(kw.get("data"))
+
+    # end def
+
+
+
+    def refresh (self):
+        r"""
+            shows data changes, if any;
+
+            no return value (void);
+        """
+
+        self._refresh()
+
+    # end def
+
+
+
+    def scroll (self, rows):
+        r"""
+            scrolls visible rows of @rows rows (negative values
+            scroll up);
+
+            no return value (void);
+        """
+
+        self.__offset += tools.ensure_int(rows)
+
+        self._refresh()
+
+    # end def
+
+
+
+    def see (self, index):
+        r"""
+            scrolls visible rows so that data @index becomes
+            visible;
+
+            no return value (void);
+        """
+
+        # need to scroll?
+
+        if index < self.__offset:
+
+            self.__offset = index
+
+        elif index >= self.__offset + self.rows:
+
+            self.__offset = index - self.rows + 1
+
+        # end if
+
+        self._refresh()
+
+    # end def
+
+
+
+    def select (self, index, notify = False):
+        r"""
+            selects data item of @index and makes it visible;
+
+            negative @index values drop selection;
+
+            generates '<<ListboxSelect>>' virtual event if @notify
+            is set;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _count = self.get_count()
+
+        self.listbox.selection_clear(0, TK.END)
+
+        # drop selection
+
+        if index < 0 or not _count:
+
+            self.__selected = -1
+
+            self._refresh()
+
+        else:
+
+            self.__selected = min(index, _count - 1)
+
+            self.see(self.__selected)
+
+        # end if
+
+        if notify:
+
+            self.event_generate("<<ListboxSelect>>")
+
+        # end if
+
+    # end def
+
+
+
+    def set_data (self, data, start = -1):
+        r"""
+            sets up new sequence or data source @data, selects
+            @start index item, if any;
+
+            no return value (void);
+        """
+
+        self.__data = data
+
+        self.__offset = 0
+
+        self.select(start)
+
+    # end def
+
+
+
+    def __only_listbox (self, kw):
+        r"""
+            private method def;
+
+            filters @kw keywords to suit internal listbox options;
+
+            returns filtered dict() of keywords;
+        """
+
+        # inits
+
+        _keys = set(self.listbox.configure().keys())
+
+        _keys.difference_update(("height", "selectmode", "exportselection"))
+
+        return {
+
+            _key: _value for _key, _value in kw.items() if _key in _keys
+        }
+
+    # end def
+
+
+# end class RADVirtualListbox
+
+
+
+class RADSearchOptionMenu (RF.RADFrame):
+    r"""
+        OptionMenu replacement for large lists of choices;
+
+        shows a button that pops up a search entry along with a
+        virtualized listbox of choices (see RADVirtualListbox);
+
+        typing in search entry filters choices;
+
+        @variable control variable gets str() value of selected
+        choice; optional @command gets called with this value;
+    """
+
+
+
+    # default number of visible rows in popup
+
+    ROWS = 12
+
+
+
+    def _close_popup (self, tk_event = None, *args, **kw):
+        r"""
+            protected method def;
+
+            destroys popup window, if any;
+
+            no return value (void);
+        """
+
+        if self.__popup:
+
+            self.__popup.destroy()
+
+            self.__popup = None
+
+        # end if
+
+        self.__list = None
+
+        self.__view = None
+
+    # end def
+
+
+
+    def _slot_browse (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for search entry <Down> key;
+
+            moves keyboard focus to choices;
+
+            returns 'break' to stop tkinter default bindings;
+        """
+
+        self.__list.listbox.focus_set()
+
+        self.__list.select(max(0, self.__list.get_selected()))
+
+        return "break"
+
+    # end def
+
+
+
+    def _slot_pick (self, tk_event = None, *args, **kw):
+        r"""
+            slot method for choice picking;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _item = self.__list.get_selected_item()
+
+        if _item is not None:
+
+            self.__selected = self.__view.get_index(self.__list.get_selected())
+
+            self.variable.set(str(_item))
+
+            if callable(self.command):
+
+                self.command(str(_item))
+
+            # end if
+
+        # end if
+
+        self._close_popup()
+
+    # end def
+
+
+
+    def _slot_search (self, *args, **kw):
+        r"""
+            slot method for search entry changes;
+
+            no return value (void);
+        """
+
+        # popup is up?
+
+        if self.__popup and self.__list:
+
+            self.__view.set_filter(self.__search.get())
+
+            self.__list.set_data(self.__view, start = 0)
+
+        # end if
+
+    # end def
+
+
+
+    def get_data (self):
+        r"""
+            returns current sequence or data source of choices;
+        """
+
+        return self.__data
+
+    # end def
+
+
+
+    def init_widget (self, **kw):
+        r"""
+            widget setup;
+
+            @kw keywords: data (sequence or data source of
+            choices), variable (tkinter control variable), command
+            (callback), rows (number of visible rows in popup);
+
+            no return value (void);
+        """
+
+        # member inits
+
+        self.__popup = None
+
+        self.__list = None
+
+        self.__view = None
+
+        self.__selected = -1
+
+        self.__search = TK.StringVar()
+
+        self.__search.trace_add("write", self._slot_search)
+
+        self.variable = kw.get("variable")
+
+        if self.variable is None:
+
+            self.variable = TK.StringVar()
+
+        # end if
+
+        self.command = kw.get("command")
+
+        self.rows = tools.ensure_int(kw.get("rows") or self.ROWS)
+
+        # internal widgets
+
+        self.button = ttk.Button(
+
+            self, textvariable = self.variable, command = self.popup
+        )
+
+        self.button.pack(fill = TK.X, expand = 1)
+
+        # data inits
+
+        self.set_data(kw.get("data"))
+
+    # end def
+
+
+
+    def popup (self):
+        r"""
+            shows popup window of choices just under button;
+
+            no return value (void);
+        """
+
+        # reset
+
+        self._close_popup()
+
+        # popup window
+
+        self.__popup = _popup = TK.Toplevel(self)
+
+        _popup.overrideredirect(True)
+
+        _popup.transient(self.winfo_toplevel())
+
+        _popup.geometry(
+
+            "+{}+{}".format(
+
+                self.winfo_rootx(),
+
+                self.winfo_rooty() + self.winfo_height(),
+            )
+        )
+
+        # search entry
+
+        _entry = ttk.Entry(_popup, textvariable = self.__search)
+
+        _entry.pack(fill = TK.X)
+
+        # choices
+
+        self.__view = RADFilteredData(self.__data)
+
+        self.__list = RADVirtualListbox(
+
+            _popup, data = self.__view, rows = self.rows
+        )
+
+        self.__list.pack(fill = TK.BOTH, expand = 1)
+
+        # reset search - Tcl write trace calls _slot_search() right now
+        # so view and list *MUST* exist by here /!\
+
+        self.__search.set("")
+
+        self.__list.select(self.__selected)
+
+        # bindings
+
+        self.__list.listbox.bind("<ButtonRelease-1>", self._slot_pick)
+
+        for _widget in (_entry, self.__list.listbox):
+
+            _widget.bind("<Return>", self._slot_pick)
+
+            _widget.bind("<Escape>", self._close_popup)
+
+        # end for
+
+        _entry.bind("<Down>", self._slot_browse)
+
+        _popup.bind("<FocusOut>", self.__focus_out)
+
+        _entry.focus_set()
+
+        _popup.grab_set()
+
+    # end def
+
+
+
+    def set_data (self, data, start = None):
+        r"""
+            sets up new sequence or data source @data of choices,
+            selects @start index choice, if any;
+
+            no return value (void);
+        """
+
+        # inits
+
+        self._close_popup()
+
+        self.__data = data
+
+        self.__selected = -1
+
+        if start is not None and 0 <= start < get_count(data):
+
+            self.__selected = start
+
+            self.variable.set(str(get_items(data, start, start + 1)[0]))
+
+        # end if
+
+    # end def
+
+
+
+    def __focus_out (self, tk_event = None, *args, **kw):
+        r"""
+            private slot method def;
+
+            closes popup once focus has left it;
+
+            no return value (void);
+        """
+
+        # focus still inside popup?
+
+        _focus = self.__popup and self.__popup.focus_get()
+
+        if not _focus:
+
+            self._close_popup()
+
+        # end if
+
+    # end def
+
+
+# end class RADSearchOptionMenu
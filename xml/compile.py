@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import sys
+
+import os.path as OP
+
+import argparse
+
+from . import rad_xml_compiler as XC
+
+
+
+def compile_file (xml_path, py_path = None, **kw):
+    r"""
+        compiles <tkwidget> XML file @xml_path into python module
+        @py_path (default: same path with '.py' file extension);
+
+        @kw keywords are passed to RADXMLCompiler constructor;
+
+        returns written python module path;
+    """
+
+    # param inits
+
+    if not py_path:
+
+        py_path = OP.splitext(xml_path)[0] + ".py"
+
+    # end if
+
+    # generate code
+
+    _source = compile_xml(xml_path, **kw)
+
+    # write module
+
+    with open(py_path, "w", encoding = "utf-8") as _file:
+
+        _file.write(_source)
+
+    # end with
+
+    return py_path
+
+# end def
+
+
+
+def compile_xml (xml, **kw):
+    r"""
+        compiles @xml (file path, filename radix or XML source
+        string) along RADXMLWidget.xml_build() conventions;
+
+        @kw keywords are passed to RADXMLCompiler constructor;
+
+        returns generated python module source code;
+    """
+
+    return XC.RADXMLCompiler(**kw).xml_compile(xml)
+
+# end def
+
+
+
+def main (argv = None):
+    r"""
+        command line entry point:
+
+        python3 -m tkRAD.xml.compile widget.xml [-o widget.py]
+
+        returns exit status code;
+    """
+
+    # command line parser
+
+    _parser = argparse.ArgumentParser(
+
+        prog = "python3 -m tkRAD.xml.compile",
+
+        description = _(
+
+            "compiles tkRAD <tkwidget> XML files into python modules."
+        ),
+    )
+
+    _parser.add_argument(
+
+        "xml_files", nargs = "+", metavar = "XML_FILE",
+    )
+
+    _parser.add_argument(
+
+        "-o", "--output", default = None,
+
+        help = _("output python module path (single XML file only)"),
+    )
+
+    _args = _parser.parse_args(argv)
+
+    # param controls
+
+    if _args.output and len(_args.xml_files) > 1:
+
+        _parser.error(_("--output is only allowed with one XML file."))
+
+    # end if
+
+    # compile files
+
+    for _path in _args.xml_files:
+
+        print(compile_file(_path, _args.output))
+
+    # end for
+
+    return 0
+
+# end def
+
+
+
+# command line
+
+if __name__ == "__main__":
+
+    sys.exit(main())
+
+# end if
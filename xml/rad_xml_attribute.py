@@ -79,20 +79,16 @@ def reset_attributes (xml_attributes, xml_element = None):
 
     if isinstance(xml_attributes, dict):
 
-        _attrs = xml_attributes.copy()
+        return {
 
-        for (_name, _value) in _attrs.items():
+            _name:
 
-            if not isinstance(_value, RADXMLAttribute):
+                _value if isinstance(_value, RADXMLAttribute)
 
-                _attrs[_name] = \
-                            RADXMLAttribute(xml_element, _name, _value)
+                else RADXMLAttribute(xml_element, _name, _value)
 
-            # end if
-
-        # end for
-
-        return _attrs
+            for (_name, _value) in xml_attributes.items()
+        }
 
     else:
 
@@ -119,29 +115,50 @@ class RADXMLAttribute:
 
         handles member @value: pointer to any value of XML attribute;
 
-        handles member @parsed: int counter of parsing notifications;
+        handles member @parsed: parsing flag (0 or 1);
+
+        members are plain __slots__ attributes: there may be
+        thousands of RADXMLAttribute objects for a single XML file;
     """
 
 
 
+    # compact instances: no per-instance __dict__
+
+    __slots__ = ("xml_element", "name", "value", "parsed")
+
+
+
     def __init__ (self, xml_element, attr_name, attr_value, parsed=0):
         r"""
             class constructor;
+
+            raises TypeError if @attr_name is not a PLAIN string of
+            chars;
         """
 
+        # attribute name - MUST be a plain string of chars
+
+        if not attr_name or not isinstance(attr_name, str):
+
+            raise TypeError(
+
+                "XML attribute name must be of PLAIN char string type."
+            )
+
+        # end if
+
         # parent XML element - SHOULD be an ET.Element object (optional)
 
         self.xml_element = xml_element
 
-        # attribute name - MUST be a plain string of chars
-
         self.name = attr_name
 
         # attribute value - can be anything
 
         self.value = attr_value
 
-        # nb of times this attribute has been parsed
+        # parsing flag
 
         self.parsed = parsed
 
@@ -164,105 +181,6 @@ class RADXMLAttribute:
 
 
 
-    @property
-    def name (self):
-        r"""
-            @property handler for 'name' class member;
-
-            raises TypeError if not set as a PLAIN string of chars;
-        """
-
-        return self.__attr_name
-
-    # end def
-
-
-
-    @name.setter
-    def name (self, value):
-
-        if value and isinstance(value, str):
-
-            self.__attr_name = value
-
-        else:
-
-            raise TypeError(
-
-                "XML attribute name must be of PLAIN char string type."
-            )
-
-        # end if
-
-    # end def
-
-
-
-    @name.deleter
-    def name (self):
-
-        del self.__attr_name
-
-    # end def
-
-
-
-    @property
-    def parsed (self):
-        r"""
-            @property handler for 'parsed' class member;
-
-            resets to 0 if set up with a False boolean expression;
-
-            sets up to integer value with a minimum of 1;
-
-            increments current internal counter index
-
-            if set up with any other non-integer value;
-        """
-
-        return self.__attr_parsed
-
-    # end def
-
-
-
-    @parsed.setter
-    def parsed (self, value):
-
-        # param controls
-
-        if not value:
-
-            self.__attr_parsed = 0
-
-        elif isinstance(value, int):
-
-            # reset to new value with minimum
-
-            self.__attr_parsed = min(1, value)
-
-        else:
-
-            # increment current counter
-
-            self.__attr_parsed += 1
-
-        # end if
-
-    # end def
-
-
-
-    @parsed.deleter
-    def parsed (self):
-
-        del self.__attr_parsed
-
-    # end def
-
-
-
     # callable setter for e.g. tkRAD.core.StructDict /!\
 
     def set_value (self, value):
@@ -37,10 +37,46 @@ class RADXMLAttributesDict (SD.StructDict):
         StructDict subclass for commodity;
 
         handles support for RADXMLAttribute items;
+
+        specialized for speed: item values are directly accessed
+        with no generic getter / setter lookup and item support
+        is defined once for all at class level;
     """
 
 
 
+    # class-wide item support - overrides StructDict properties
+
+    item_type = XA.RADXMLAttribute
+
+    item_value_getter = "get_value"
+
+    item_value_setter = "set_value"
+
+
+
+    def __getitem__ (self, key):
+        r"""
+            item value getter;
+
+            returns RADXMLAttribute item's value or dict[@key] for
+            any other item;
+        """
+
+        _item = dict.__getitem__(self, key)
+
+        if isinstance(_item, XA.RADXMLAttribute):
+
+            return _item.value
+
+        # end if
+
+        return _item
+
+    # end def
+
+
+
     def __init__ (self, *args, **kw):
         r"""
             class constructor;
@@ -48,17 +84,77 @@ class RADXMLAttributesDict (SD.StructDict):
             implements @item_type = RADXMLAttribute;
         """
 
-        # super class inits
+        # no per-instance member inits
+
+        dict.__init__(self, *args, **kw)
+
+    # end def
+
+
+
+    def __setitem__ (self, key, value):
+        r"""
+            item value setter;
+
+            sets RADXMLAttribute item's value if @key exists,
+            dict[@key] = @value otherwise;
+        """
+
+        _item = dict.get(self, key)
+
+        if isinstance(_item, XA.RADXMLAttribute):
+
+            _item.value = value
+
+        else:
+
+            dict.__setitem__(self, key, value)
+
+        # end if
+
+    # end def
+
+
+
+    def flatten (self):
+        r"""
+            returns a new dict() of item.value instead of item itself;
+
+            keeps current items() UNTOUCHED;
+        """
+
+        return {
+
+            _key:
+
+                _item.value if isinstance(_item, XA.RADXMLAttribute)
+
+                else _item
+
+            for (_key, _item) in self.items()
+        }
+
+    # end def
+
+
+
+    def get (self, key, default = None):
+        r"""
+            item value getter;
+
+            returns RADXMLAttribute item's value or
+            dict.get(@key, @default) for any other item;
+        """
 
-        super().__init__(*args, **kw)
+        _item = dict.get(self, key, default)
 
-        # member inits
+        if isinstance(_item, XA.RADXMLAttribute):
 
-        self.item_type = XA.RADXMLAttribute
+            return _item.value
 
-        self.item_value_getter = "get_value"
+        # end if
 
-        self.item_value_setter = "set_value"
+        return _item
 
     # end def
 
@@ -26,12 +26,24 @@
 
 # lib imports
 
+import os
+
 import re
 
+import copy
+
+import time
+
 import os.path as OP
 
 import traceback
 
+import types
+
+import weakref
+
+import contextlib
+
 import xml.etree.ElementTree as ET
 
 import tkinter as TK
@@ -46,10 +58,20 @@ from ..core import defer
 
 from ..widgets import rad_widget_base as RW
 
+from ..widgets import rad_image_cache as IC
+
 from . import rad_xml_attribute as XA
 
 from . import rad_xml_attributes_dict as XD
 
+from . import rad_xml_cache as XC
+
+from . import rad_xml_batch as XT
+
+from . import rad_xml_profiler as XR
+
+from . import rad_xml_ids as XI
+
 
 
 class RADXMLBase (RW.RADWidgetBase):
@@ -78,12 +100,65 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    # declarative XML attribute parsers
+    # attribute name --> (attribute type, parser keywords)
+    # looked up in class hierarchy when no ATTRIBUTE_PARSER method
+    # is defined for an attribute (see _set_handler())
+
+    ATTRIBUTE_TYPES = {}
+
+
+
+    # XML attribute type parser method pattern
+
+    ATTRIBUTE_TYPE_PARSER = "_tkRAD_{attribute_type}_support"
+
+
+
+    # default time slice for xml_build_incremental() (milliseconds)
+
+    BUILD_SLICE_MS = 50
+
+
+
+    # default XML file polling interval for xml_watch() (milliseconds)
+
+    WATCH_INTERVAL_MS = 1000
+
+
+
     # XML tree root element
 
     DOCTYPE = "tkbase"
 
 
 
+    # share tkinter control variables of same type and name between
+    # all components (see set_cvar())
+
+    CVAR_POOL = False
+
+
+
+    # max number of tkinter commands batched during XML building
+    # (0 disables batching)
+
+    TCL_BATCH_SIZE = 500
+
+
+
+    # Tcl procedures for get_cvar_values() and set_cvar_values()
+    # one Tcl call for any number of control variables
+
+    TCL_GET_VARS = (
+        "names {set _r {}; "
+        "foreach _v $names {lappend _r [set ::$_v]}; return $_r}"
+    )
+
+    TCL_SET_VARS = "pairs {foreach {_v _x} $pairs {set ::$_v $_x}}"
+
+
+
     # XML element builder method pattern
 
     ELEMENT_BUILDER = "_build_element_{xml_element}"
@@ -116,9 +191,19 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
-    # Object instance counter
+    # per-class handler dispatch table
+    # (class, pattern, tag, attribute) --> (function, method name)
+    # CAUTION: do *NOT* UPPERCASE this name - must be shared /!\
 
-    __OI_COUNT = 1
+    __dispatch = dict()
+
+
+
+    # process-wide pool of shared control variables
+    # (vartype, varname) --> control variable, while in use
+    # CAUTION: do *NOT* UPPERCASE this name - must be shared /!\
+
+    __cvar_pool = weakref.WeakValueDictionary()
 
 
 
@@ -131,13 +216,41 @@ class RADXMLBase (RW.RADWidgetBase):
 
         self._queue = defer.DeferQueue()     # private queue
 
+        self._batch = None      # batched tkinter commands
+
+        self._profiler = None   # opt-in build profiler
+
         # XML member inits
 
         self.__xml_tree = None
 
+        self.__xml_path = None      # loaded XML file path, if any
+
+        self.__xml_source = None    # pristine XML root, for xml_reload()
+
+        self.__watch = None         # xml_watch() state
+
         self.__objects = dict()
 
-        self.__images = dict()
+        self.__members = dict()     # tk_owner member name --> widget
+
+        self.__connections = list()     # (signal, slot) XML events
+
+        self.__elements = None      # XML id --> element index
+
+        self.__ids = XI.RADXMLIdAllocator()     # anonymous ids
+
+        self.__images = dict()      # images in use (shared, see IC)
+
+        # incremental build member inits
+
+        self.__build_stack = None
+
+        self.__build_state = None
+
+        self.__building = False     # synchronous build running
+
+        self.__use_cvar_pool = kw.get("cvar_pool", self.CVAR_POOL)
 
         self.set_xml_dir(kw.get("xml_dir"))
 
@@ -145,6 +258,8 @@ class RADXMLBase (RW.RADWidgetBase):
 
         self.set_xml_file_ext(kw.get("xml_file_ext"))
 
+        self.set_xml_profiler(kw.get("xml_profiler"))
+
         # XML_RC redefs
 
         _classname = self.classname().lower()
@@ -173,6 +288,79 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def __enter__ (self):
+        r"""
+            context manager entry e.g.
+
+                with RADXMLFrame(root) as frame:
+
+                    frame.xml_build("my_form")
+
+                    ...
+
+            returns self;
+        """
+
+        return self
+
+    # end def
+
+
+
+    def __exit__ (self, *args):
+        r"""
+            context manager exit: releases all component resources
+            (see destroy_component());
+
+            exceptions are *NOT* suppressed;
+        """
+
+        self.destroy_component()
+
+        return False
+
+    # end def
+
+
+
+    def _after_children (self, callback, *args, **kw):
+        r"""
+            calls @callback(*args, **kw) once all children of the
+            XML element currently being built have been built;
+
+            in synchronous build mode, children are already built
+            when an element builder calls this method, so @callback
+            gets called right away;
+
+            in incremental build mode, @callback is deferred until
+            children building is over;
+
+            no return value (void);
+        """
+
+        # incremental build mode?
+
+        if self.__build_stack:
+
+            # children frame has just been pushed by
+            # _loop_on_children()
+
+            self.__build_stack[-1][-1].append((callback, args, kw))
+
+        else:
+
+            # callback may query Tcl state
+
+            self._flush_batch()
+
+            callback(*args, **kw)
+
+        # end if
+
+    # end def
+
+
+
     def _before_building_element(self, **kw):
         r"""
             virtual method to be overridden in subclass;
@@ -203,6 +391,72 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _begin_batch (self):
+        r"""
+            starts batching tkinter commands for XML building, if
+            self.TCL_BATCH_SIZE allows it and self.tk_owner is a
+            real tkinter widget (i.e. owns a Tcl interpreter);
+
+            no return value (void);
+        """
+
+        # reset
+
+        self._batch = None
+
+        if self.TCL_BATCH_SIZE > 0 and isinstance(self.tk_owner, TK.Misc):
+
+            self._batch = XT.RADXMLBatch(
+
+                self.tk_owner.tk, self.TCL_BATCH_SIZE
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _build_child (self, xml_child, tk_parent, accept, parent_tag):
+        r"""
+            builds @xml_child XML element into @tk_parent, if its
+            tag is in @accept list of admitted XML tags;
+
+            raises TypeError on unwanted subelements;
+
+            returns True on build success, False otherwise;
+        """
+
+        # child tag inits
+
+        _ctag = self.normalize_tag(xml_child)
+
+        # is child element into 'accept' element list?
+
+        if not accept or _ctag in accept:
+
+            # build child elements into tk_parent object
+
+            return self._build_element(xml_child, tk_parent)
+
+        # end if
+
+        # unwanted child element
+
+        raise TypeError(
+
+            _(
+                "XML child element <{child_tag}> is *NOT* "
+
+                "accepted inside <{parent_tag}> element."
+
+            ).format(child_tag = _ctag, parent_tag = parent_tag)
+        )
+
+    # end def
+
+
+
     def _build_element (self, xml_element, tk_parent):
         r"""
             delegates the widget building of an XML element to  a
@@ -232,18 +486,11 @@ class RADXMLBase (RW.RADWidgetBase):
 
         _tag = self.normalize_tag(xml_element)
 
-        _elt_builder = tools.normalize_id(
-
-            str(self.ELEMENT_BUILDER).format(xml_element = _tag)
-        )
+        _elt_builder = self._get_handler(self.ELEMENT_BUILDER, _tag)
 
         # supported XML tag?
 
-        if hasattr(self, _elt_builder):
-
-            # real member inits
-
-            _elt_builder = getattr(self, _elt_builder)
+        if _elt_builder:
 
             # try to call builder
 
@@ -260,433 +507,409 @@ class RADXMLBase (RW.RADWidgetBase):
                     tk_parent = tk_parent,
                 )
 
-                # route element building
+                # label batched tkinter commands for error messages
 
-                return _elt_builder(_tag, xml_element, tk_parent)
+                _batch = self._batch
 
-            # end if
+                if _batch:
 
-        # unsupported tag
+                    _element, _batch.element = _batch.element, _tag
 
-        else:
+                # end if
 
-            raise TypeError(
+                # route element building
 
-                _("Unsupported XML tag <{xml_tag}>.")
+                if not self._profiler:
 
-                .format(xml_tag = _tag)
-            )
+                    _ok = _elt_builder(_tag, xml_element, tk_parent)
 
-        # end if
+                # profiled element building
 
-        # failure
+                else:
 
-        return False
+                    _start = self._profiler.start()
 
-    # end def
+                    _ok = _elt_builder(_tag, xml_element, tk_parent)
 
+                    self._profiler.stop("element", _tag, _start)
 
+                # end if
 
-    def _cast_root_element (self, xml_element):
-        r"""
-            casts root element along self.DOCTYPE type;
+                if _batch:
 
-            returns True on success, False otherwise;
-        """
+                    _batch.element = _element
 
-        if self.cast_element(xml_element):
+                # end if
 
-            # DOCTYPE
+                return _ok
 
-            if self.normalize_tag(xml_element) == self.DOCTYPE:
+            # end if
 
-                return True
+        # unsupported tag
 
-            else:
+        else:
 
-                raise TypeError(
-                    _(
-                        "XML root element *MUST* be "
+            raise TypeError(
 
-                        "of '{doctype}' type."
+                _("Unsupported XML tag <{xml_tag}>.")
 
-                    ).format(doctype = self.DOCTYPE)
-                )
+                .format(xml_tag = _tag)
+            )
 
         # end if
 
+        # failure
+
         return False
 
     # end def
 
 
 
-    def _get_object_id (self, built_object, attr_id = None):
+    def _build_slice (self):
         r"""
-            protected method def;
-        """
-
-        # param inits
+            incremental build mode: builds pending XML elements
+            until time slice is spent, then reschedules itself with
+            tkinter after_idle() so that Tk event loop keeps on
+            processing user and window manager events;
 
-        attr_id = tools.normalize_id(attr_id)
-
-        # no id?
+            raises 'XMLBuildProgress' event after each time slice
+            and 'XMLBuildDone' event once all is built;
 
-        if not tools.is_pstr(attr_id):
+            no return value (void);
+        """
 
-            # set default id along object's classname
+        # inits
 
-            attr_id = self._get_unique_id(
+        _state = self.__build_state
 
-                built_object.__class__.__name__
-            )
+        _stack = self.__build_stack
 
-        # end if
+        # build cancelled in the meantime?
 
-        # get built object id
+        if _stack is None:
 
-        return attr_id.lower()
+            return
 
-    # end def
+        # end if
 
+        _deadline = time.perf_counter() + _state["slice_ms"] / 1000.0
 
+        try:
 
-    def _get_oi_count_str (self):
-        r"""
-            gets object instance (oi) counter as a string of chars;
+            # loop on pending children frames
 
-            increments counter AFTER giving back its current value;
+            while _stack:
 
-            returns object instance count as a char string;
-        """
+                _children, _parent, _accept, _ptag, _callbacks = _stack[-1]
 
-        # inits
+                _xml_child = next(_children, None)
 
-        _str = str(self.__OI_COUNT)
+                # frame is over?
 
-        # update object instance counter
+                if _xml_child is None:
 
-        self.__OI_COUNT += 1
+                    _stack.pop()
 
-        # return string of __OI_COUNT
+                    # callbacks may query Tcl state
 
-        return _str
+                    self._flush_batch()
 
-    # end def
+                    # post-children element procedures
 
+                    for (_callback, _args, _kw) in _callbacks:
 
+                        _callback(*_args, **_kw)
 
-    def _get_unique_id (self, radix):
-        r"""
-            tries to find a new and unique indexed 'id' name along
-            @radix param name;
+                    # end for
 
-            returns new unique 'id' name on success, None otherwise;
-        """
+                    continue
 
-        # param controls
+                # end if
 
-        if tools.is_pstr(radix):
+                # build child element - may push new frame
 
-            # this prevents from counting overflow /!\
+                _state["ok"] = self._build_child(
 
-            while self.__OI_COUNT:
+                    _xml_child, _parent, _accept, _ptag
 
-                # set new indexed 'id' name
+                ) and _state["ok"]
 
-                _uid = radix + self._get_oi_count_str()
+                _state["done"] += 1
 
-                # got unique 'id' name?
+                # time slice is spent?
 
-                if _uid not in self.__objects:
+                if time.perf_counter() >= _deadline:
 
-                    return _uid
+                    break
 
                 # end if
 
             # end while
 
-        # end if
+            # still some work?
 
-        return None
+            if _stack:
 
-    # end def
+                # send tkinter commands of this time slice
 
+                self._flush_batch()
 
+                self.events.raise_event(
 
-    def _loop_on_children (self, xml_element, tk_parent, accept = None):
-        r"""
-            loops on @xml_element param XML subelements with
-            @tk_parent param as tkinter parent widget;
+                    "XMLBuildProgress",
 
-            @accept param sets up a list of admitted XML tags  as
-            subelements of @xml_element param;
+                    component = self,
 
-            tries to build all accepted subelements;
+                    done = _state["done"],
 
-            raises TypeError on unwanted subelements;
+                    total = max(_state["done"], _state["total"]),
+                )
 
-            returns True on overall success, False otherwise;
-        """
+                self.tk_owner.after_idle(self._build_slice)
 
-        # param controls
+            # all built
 
-        if self.cast_element(xml_element):
+            else:
 
-            # parent tag inits
+                self.__build_stack = None
 
-            _ptag = self.normalize_tag(xml_element)
+                # send all remaining tkinter commands
 
-            # return value inits
+                self._end_batch()
 
-            _ret = True
+                # flush all deferred actions in queue
 
-            # loop on child XML elements
+                self._queue.flush_all()
 
-            for _xml_child in xml_element:
+                self.events.raise_event(
 
-                # child tag inits
+                    "XMLBuildDone", component = self, success = _state["ok"]
+                )
 
-                _ctag = self.normalize_tag(_xml_child)
+            # end if
 
-                # is child element into 'accept' element list?
+        except Exception as _error:
 
-                if not accept or _ctag in accept:
+            # stop building
 
-                    # build child elements into tk_parent object
+            self.__build_stack = None
 
-                    _ret = self._build_element(_xml_child, tk_parent) \
-                                                                and _ret
+            self._end_batch(discard = True)
 
-                # unwanted child element
+            self._queue.clear()
 
-                else:
+            self._show_build_error(_state["silent_mode"])
 
-                    raise TypeError(
+            self.events.raise_event(
 
-                        _(
-                            "XML child element <{child_tag}> is *NOT* "
+                "XMLBuildDone",
 
-                            "accepted inside <{parent_tag}> element."
+                component = self,
 
-                        ).format(child_tag = _ctag, parent_tag = _ptag)
-                    )
+                success = False,
 
-                    return False
+                error = _error,
+            )
 
-                # end if
+            raise
 
-            # end for
+        # end try
 
-            # return final success/failure
+    # end def
 
-            return _ret
 
-        # end if
 
-        # failed (bad XML element)
+    @contextlib.contextmanager
+    def _building_state (self):
+        r"""
+            protected method def;
 
-        return False
+            context manager marking component as building (see
+            is_building()) for out-of-build partial builds, so that
+            nothing else gets built on demand in the meantime;
 
-    # end def
+            previous state gets restored on exit;
+        """
 
+        _previous = self.__building
 
+        self.__building = True
 
-    def _parse_xml_attributes (self, xml_element, tk_parent, **kw):
-        r"""
-            parses dict() attributes of an XML ET.Element and
-            dispatches to optional specific parsers;
+        try:
 
-            this method should not be modified for parsing attribute
-            methods naming as it suffices to reset
-            self.ATTRIBUTE_PARSER in subclass to the desired naming
-            rule;
+            yield self
 
-            if kw["xml_attrs"] filtered attributes exist, they
-            replace XML ET.Element.attrib dict() in parsing;
+        finally:
 
-            genuine dicts are kept UNTOUCHED thanks to shallow copying;
+            self.__building = _previous
 
-            returns new dict() of parsed attributes or None on failure;
-        """
+        # end try
 
-        # param controls
+    # end def
 
-        if self.cast_element(xml_element):
 
-            # XML tag inits
 
-            _tag = self.normalize_tag(xml_element)
+    def _cast_root_element (self, xml_element):
+        r"""
+            casts root element along self.DOCTYPE type;
 
-            # XML attribute inits
+            returns True on success, False otherwise;
+        """
 
-            _attrs = kw.get("xml_attrs", xml_element.attrib)
+        if self.cast_element(xml_element):
 
-            r"""
-                $ 2013-12-16 RS $
-                new support:
-                work with RADXMLAttribute objects by now;
+            # DOCTYPE
 
-                $ 2013-12-18 RS $
-                new support:
-                work with RADXMLAttributesDict by now;
+            if self.normalize_tag(xml_element) == self.DOCTYPE:
 
-                notice:
-                XA.reset_attributes() provides dict() shallow copy;
-            """
+                return True
 
-            _attrs = XD.RADXMLAttributesDict(
+            else:
 
-                XA.reset_attributes(_attrs, xml_element)
-            )
+                raise TypeError(
+                    _(
+                        "XML root element *MUST* be "
 
-            # loop on RADXMLAttribute attributes list
+                        "of '{doctype}' type."
 
-            for (_attr_name, _attr_object) in _attrs.items():
+                    ).format(doctype = self.DOCTYPE)
+                )
 
-                # normalize attribute
+        # end if
 
-                _attr_name = str(_attr_name).lower()
+        return False
 
-                # attribute specific parser
+    # end def
 
-                _parser = tools.normalize_id(
 
-                    str(self.ATTRIBUTE_PARSER)
 
-                    .format(
+    def _connect_event (self, signal, *slots):
+        r"""
+            connects @slots to @signal through app-wide event manager
+            and keeps track of connections for destroy_component();
 
-                        xml_element = _tag,
+            returns True on success, False otherwise;
+        """
 
-                        xml_attribute = _attr_name,
-                    )
-                )
+        _ok = self.events.connect(signal, *slots)
 
-                # optional parser
+        if _ok:
 
-                if hasattr(self, _parser):
+            self.__connections.extend((signal, _slot) for _slot in slots)
 
-                    # real member inits
+        # end if
 
-                    _parser = getattr(self, _parser)
+        return _ok
 
-                    # try to call specific parser
+    # end def
 
-                    if callable(_parser):
 
-                        # update keywords
 
-                        kw.update(
+    def _del_class_member (self, name):
+        r"""
+            protected method def;
 
-                            attribute = _attr_object,
+            removes @name tk_owner class member set by
+            _set_class_member(), if still untouched;
 
-                            attrs = _attrs,
+            no return value (void);
+        """
 
-                            tk_parent = tk_parent,
+        _widget = self.__members.pop(name, None)
 
-                            xml_element = xml_element,
+        if _widget is not None and \
+                        getattr(self.tk_owner, name, None) is _widget:
 
-                            xml_tag = _tag,
+            delattr(self.tk_owner, name)
 
-                            xml_attr = _attr_name,
-                        )
+        # end if
 
-                        # attribute parsing inits
+    # end def
 
-                        self._before_parsing_attribute(**kw)
 
-                        # call parser
 
-                        _parser(**kw)
+    def _destroy_element (self, xml_element):
+        r"""
+            protected method def;
 
-                        r"""
-                            $ 2013-12-16 RS $
-                            new support: using RADXMLAttribute by now;
+            destroys tkinter widget built along @xml_element, if any,
+            along with all its children;
 
-                            $ 2014-03-10 RS $
-                            since v1.4: deferred tasks
-                            do *NOT* flag on 'parsed' value(!)
-                        """
+            destroyed objects get unregistered;
 
-                        # update parsing counter
+            returns True if a widget has been destroyed, False
+            otherwise (nothing to destroy);
+        """
 
-                        #~ _attr_object.parsed = True
+        # inits
 
-                    # end if
+        _widget = self._get_element_object(xml_element)
 
-                # not implemented
+        if not self.is_tk_widget(_widget):
 
-                else:
+            return False
 
-                    print(
+        # end if
 
-                        _(
-                            "[WARNING] RADXMLBase::"
+        _widget.destroy()
 
-                            "_parse_xml_attributes: optional parser "
+        self._forget_destroyed_objects()
 
-                            "'{parser}()' is *NOT* implemented."
+        return True
 
-                        ).format(parser = _parser)
-                    )
+    # end def
 
-                # end if
 
-            # end for
 
-            r"""
-                $ 2013-12-18 RS $
-                new support: using RADXMLAttributesDict by now;
+    def _end_batch (self, discard = False):
+        r"""
+            stops batching tkinter commands and sends pending ones
+            to Tcl, unless @discard is True;
 
-                notice:
-                flatten() provides a 'flat' dict() object containing
-                simple (key, value) pairs;
-                all RADXMLAttribute extra data are lost at this point;
+            no return value (void);
+        """
 
-                $ 2014-03-10 RS $
-                since v1.4: deferred tasks
-                do *NOT* flatten() dict any more(!)
-            """
+        _batch, self._batch = self._batch, None
 
-            # return parsed attributes
+        if _batch and not discard:
 
-            return _attrs
+            self._flush_batch(_batch)
 
         # end if
 
-        # failure
-
-        return None
-
     # end def
 
 
 
-    def _register_object_by_id (self, built_object, attr_id):
+    def _flush_batch (self, batch = None):
         r"""
-            registers newly created or existing object with the  XML
-            attribute 'id' which defined it in XML data source;
+            sends pending batched tkinter commands of @batch
+            (default: self._batch), if any;
 
-            this is the counterpart of get_object_by_id() method;
+            must be called before querying any Tcl state during XML
+            building (e.g. w.cget());
 
             no return value (void);
         """
 
-        _id = self._get_object_id(built_object, attr_id)
+        batch = batch or self._batch
 
-        if _id not in self.__objects:
+        if batch and batch.get_size():
 
-            self.__objects[_id] = built_object
+            if self._profiler:
 
-        else:
+                _start = self._profiler.start()
 
-            raise KeyError(
+                batch.flush()
 
-                _(
-                    "cannot override existing object of id '{obj_id}'"
+                self._profiler.stop("tk", "batch", _start)
 
-                ).format(obj_id = _id)
-            )
+            else:
+
+                batch.flush()
+
+            # end if
 
         # end if
 
@@ -694,219 +917,288 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
-    def _reset_oi_count (self, value = 1):
+    def _forget_destroyed_objects (self):
         r"""
-            resets object instance (oi) counter to a given value;
+            protected method def;
 
-            default value (if not given) is one (1);
+            unregisters tkinter widgets that no longer exist;
+
+            object ids remain reserved;
 
             no return value (void);
         """
 
-        # inits
-
-        self.__OI_COUNT = max(1, tools.ensure_int(value))
-
-    # end def
+        for _id, _object in list(self.__objects.items()):
 
+            if self.is_tk_widget(_object):
 
+                try:
 
-    def _set_class_member (self, name, widget):
-        r"""
-            protected method def;
+                    _exists = _object.winfo_exists()
 
-            sets @widget as self.tk_owner class member along @name;
+                except TK.TclError:
 
-            no return value (void);
-        """
+                    _exists = False
 
-        # param controls
+                # end try
 
-        if tools.is_pstr(name):
+                if not _exists:
 
-            if hasattr(self.tk_owner, name):
+                    del self.__objects[_id]
 
-                raise AttributeError(
-                    _(
-                        "cannot set up class member "
+                # end if
 
-                        "'{attr_name}': already exists in "
+            # end if
 
-                        "tk_owner '{obj_type}'."
+        # end for
 
-                    ).format(
+        # drop tk_owner members of destroyed widgets
 
-                        attr_name = name,
+        _alive = set(id(_object) for _object in self.__objects.values())
 
-                        obj_type = repr(self.tk_owner),
-                    )
-                )
+        for _name, _widget in list(self.__members.items()):
 
-            else:
+            if id(_widget) not in _alive:
 
-                setattr(self.tk_owner, name, widget)
+                self._del_class_member(_name)
 
             # end if
 
-        # end if
+        # end for
 
     # end def
 
 
 
-    def cast_element (self, xml_element):
+    def _get_accepted_tags (self, xml_element):
         r"""
-            casts @xml_element param to see if it is a real
-            xml.etree.ElementTree.Element object;
+            protected method def;
 
-            raises TypeError on failure;
+            hook method to be reimplemented in subclass;
 
-            returns True on success, False otherwise;
+            returns list of XML tags admitted as children of
+            @xml_element or None if any tag is admitted;
         """
 
-        if self.is_element(xml_element):
+        # put your own code in subclass
 
-            return True
+        return None
 
-        else:
+    # end def
 
-            raise TypeError(
 
-                _(
-                    "XML element must be of type "
 
-                    "'{obj_type}' not '{cur_type}'."
+    def _get_cvar_items (self, vartype = None):
+        r"""
+            protected method def;
 
-                ).format(
+            raises TypeError on unsupported @vartype (see
+            get_cvar());
 
-                    obj_type = repr(ET.Element),
+            returns list of (vartype, varname, control variable)
+            tuples for @vartype or all types if None;
+        """
 
-                    cur_type = repr(xml_element)
-                )
-            )
+        # all types - ascending precedence for get_cvar_values()
 
-            return False
+        if vartype is None:
 
-        # end if
+            _types = ("doublevar", "intvar", "stringvar")
 
-    # end def
+        else:
 
+            _types = (str(vartype).lower(), )
 
+            if _types[0] not in self.__tk_variables:
 
-    def cast_tree (self, tree_object):
-        r"""
-            casts @tree_object param to see if it is a real
-            xml.etree.ElementTree object;
+                self.get_cvar(vartype, None)
 
-            raises TypeError on failure;
+            # end if
 
-            returns True on success, False otherwise;
-        """
+        # end if
 
-        if self.is_tree(tree_object):
+        return [
 
-            return True
+            (_type, _name, _cvar)
 
-        else:
+            for _type in _types
 
-            raise TypeError(
+            for _name, _cvar in self.__tk_variables[_type].items()
+        ]
 
-                _(
-                    "XML tree must be of type "
+    # end def
 
-                    "'{obj_type}' not '{cur_type}'."
 
-                ).format(
 
-                    obj_type = repr(ET.ElementTree),
+    def _get_cvar_tk (self, cvar):
+        r"""
+            protected method def;
 
-                    cur_type = repr(tree_object)
-                )
-            )
+            returns Tcl interpreter of control variables;
+        """
 
-            return False
+        if self.is_tk_parent(self.tk_owner):
+
+            return self.tk_owner.tk
 
         # end if
 
+        return cvar._tk
+
     # end def
 
 
 
-    def delete_dict_items (self, dict_object, *args):
+    def _get_element_object (self, xml_element):
         r"""
-            @DEPRECATED: use tools.dict_delete_items() instead;
+            protected method def;
 
-            strips all keys listed in args from a dict() object;
+            returns object registered along @xml_element's 'id'
+            attribute or None if not found;
+        """
 
-            shallow copy: keeps original dict() object UNTOUCHED /!\
+        _id = xml_element.get("id")
 
-            returns new modified dict() object;
+        if _id:
+
+            return self.__objects.get(tools.normalize_id(_id).lower())
+
+        # end if
+
+        return None
+
+    # end def
+
+
+
+    def _get_element_index (self):
+        r"""
+            builds internal XML tree id index, if not already done;
+
+            first element in document order wins on duplicate ids,
+            just like XPath find() does;
+
+            returns dict() of XML id --> XML element;
         """
 
-        # $ 2014-02-18 RS $
-        # @DEPRECATED
-        # kept for compatibility with tkRAD < v1.2
+        # index is up to date?
 
-        return tools.dict_delete_items(dict_object, *args)
+        if self.__elements is not None:
+
+            return self.__elements
+
+        # end if
+
+        # (re)build index
+
+        self.__elements = dict()
+
+        if self.is_tree(self.__xml_tree):
+
+            _root = self.__xml_tree.getroot()
+
+            for _element in _root.iter():
+
+                _id = _element.get("id")
+
+                # root element is *NOT* concerned as in './/*' XPath
+
+                if _id and _element is not _root:
+
+                    self.__elements.setdefault(_id, _element)
+
+                # end if
+
+            # end for
+
+        # end if
+
+        return self.__elements
 
     # end def
 
 
 
-    def element_get_id (self, xml_element):
+    def _get_handler (self, pattern, xml_tag, xml_attr = None):
         r"""
-            sets a correct 'id' value for a given XML element;
+            looks up element builder or attribute parser method
+            along @pattern naming rule e.g. self.ELEMENT_BUILDER or
+            self.ATTRIBUTE_PARSER;
 
-            resets its 'id' attribute to this correct value;
+            method name is computed only once for each (class,
+            @pattern, @xml_tag, @xml_attr) key and plain class
+            functions get cached in a per-class dispatch table, so
+            that further lookups cost a single dict() lookup;
 
-            returns 'id' value on success, None otherwise;
+            methods defined later on or at instance level are still
+            found by a regular attribute lookup;
+
+            returns bound method on success, None otherwise;
         """
 
-        # param controls
+        # inits
 
-        if self.cast_element(xml_element):
+        _key = (self.__class__, pattern, xml_tag, xml_attr)
 
-            # inits
+        try:
 
-            _id = self.get_correct_id(xml_element.get("id"))
+            _func, _name = self.__dispatch[_key]
 
-            # update XML element attr 'id'
+        except KeyError:
 
-            xml_element.set("id", _id)
+            _func, _name = self._set_handler(_key)
 
-            # succeeded
+        # end try
 
-            return _id
+        # cached plain function?
+
+        if _func:
+
+            return types.MethodType(_func, self)
 
         # end if
 
-        # failed
+        # dynamic lookup
 
-        return None
+        return getattr(self, _name, None)
 
     # end def
 
 
 
-    def get_bitmap_path (self, path):
+    def _get_handler_name (self, pattern, xml_tag, xml_attr = None):
         r"""
-            tries to retrieve a bitmap path along @path;
+            builds handler method name along @pattern naming rule
+            with @xml_tag and @xml_attr;
 
-            returns path on success, empty string otherwise;
+            returns method name string of chars;
         """
 
-        # $ 2014-02-07 RS $
-        # CAUTION:
-        # do *NOT* use TK.BitmapImage() /!\
-        # it is Tcl BUGGY and crashes tkinter/Tcl library /!\
+        return tools.normalize_id(
 
-        # param inits
+            str(pattern).format(
+
+                xml_element = xml_tag,
+
+                xml_attribute = xml_attr,
+            )
+        )
+
+    # end def
 
-        if tools.is_pstr(path) and path not in ("error", "gray75",
-        "gray50", "gray25", "gray12", "hourglass", "info",
-        "questhead", "question", "warning"):
 
-            path = "@" + P.normalize(path.lstrip("@"))
+
+    def _get_image_key (self, path, subsample = None, zoom = None):
+        r"""
+            protected method def;
+
+            returns key of self.__images dict() i.e. @path alone or
+            (@path, @subsample, @zoom) tuple for resized images;
+        """
+
+        if subsample or zoom:
+
+            return (path, subsample, zoom)
 
         # end if
 
@@ -916,780 +1208,2715 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
-    def get_correct_id(self, value):
+    def _get_object_id (self, built_object, attr_id = None):
         r"""
-            always provide a correct id name  whatever @value param
-            is at the beginning;
-
-            returns normalized (filtered) value if exists,
-
-            returns numbered unique 'objectxxx' otherwise;
+            protected method def;
         """
 
         # param inits
 
-        value = tools.normalize_id(value)
+        attr_id = tools.normalize_id(attr_id)
 
         # no id?
 
-        if not tools.is_pstr(value):
+        if not tools.is_pstr(attr_id):
 
-            # new value inits
+            # set default id along object's classname
 
-            value = self._get_unique_id("object")
+            attr_id = self._get_unique_id(
+
+                built_object.__class__.__name__
+            )
 
         # end if
 
-        # return filtered value
+        # get built object id
 
-        return value
+        return attr_id.lower()
 
     # end def
 
 
 
-    def get_cvar (self, vartype, varname):
+    def _get_parsed_value (self, kind, raw_value, parser):
         r"""
-            tries to retrieve a tkinter control variable @varname;
+            returns @parser(@raw_value) parsed value;
 
-            @vartype param must be one of 'StringVar', 'IntVar' or
-            'DoubleVar' (param is case-insensitive);
+            @parser param *MUST* be a side-effect-free callable i.e.
+            its return value depends only on @raw_value and @kind;
 
-            raises TypeError otherwise;
+            subclasses may override this to reuse already known
+            parsed values;
+        """
 
-            returns control variable on success, None otherwise;
+        return parser(raw_value)
+
+    # end def
+
+
+
+    def _get_reload_keys (self, xml_element):
+        r"""
+            protected method def;
+
+            XML children of @xml_element get matched between two
+            versions of an XML source along these keys;
+
+            returns list of (tag, id) tuples, one per XML child,
+            with anonymous children numbered by tag instead e.g.
+            ('label', '#2') for the second anonymous <label>;
         """
 
-        # param inits
+        # inits
 
-        vartype = str(vartype).lower()
+        _keys = list()
 
-        if vartype in self.__tk_variables:
+        _count = dict()
 
-            return self.__tk_variables[vartype].get(varname, None)
+        for _child in xml_element:
+
+            _tag = self.normalize_tag(_child)
+
+            _id = _child.get("id")
+
+            if not _id:
+
+                _count[_tag] = _count.get(_tag, 0) + 1
+
+                _id = "#{}".format(_count[_tag])
+
+            # end if
+
+            _keys.append((_tag, _id))
+
+        # end for
+
+        return _keys
+
+    # end def
+
+
+
+    def _get_typed_parser (self, class_, xml_attr):
+        r"""
+            looks up @xml_attr declarative parser in @class_ hierarchy
+            ATTRIBUTE_TYPES tables (see class members);
+
+            typed parser calls @class_ attribute type parser method
+            (e.g. _tkRAD_dimension_support()) with table entry
+            keywords;
+
+            returns plain function on success, None otherwise;
+        """
+
+        for _class in class_.__mro__:
+
+            # only tables defined by class itself
+
+            _entry = vars(_class).get("ATTRIBUTE_TYPES", {}).get(xml_attr)
+
+            if _entry:
+
+                break
+
+            # end if
+
+        # no declarative parser
 
         else:
 
+            return None
+
+        # end for
+
+        # inits
+
+        _type, _options = _entry
+
+        _support = getattr(
+
+            class_,
+
+            class_.ATTRIBUTE_TYPE_PARSER.format(attribute_type = _type),
+
+            None
+        )
+
+        # only plain functions may be safely bound to self /!\
+
+        if not isinstance(_support, types.FunctionType):
+
             raise TypeError(
 
                 _(
-                    "Tkinter control variable must be one of type "
+                    "unsupported XML attribute type '{type}' "
 
-                    "'DoubleVar', 'IntVar' or 'StringVar' "
+                    "for attribute '{attr}'."
 
-                    "(case insensitive)."
-                )
+                ).format(type = _type, attr = xml_attr)
             )
 
-            return None
+        # end if
+
+        # no extra keywords
+
+        if not _options:
+
+            return _support
 
         # end if
 
+        _options = dict(_options)
+
+        def _parser (self, **kw):
+
+            kw.update(_options)
+
+            _support(self, **kw)
+
+        # end def
+
+        return _parser
+
     # end def
 
 
 
-    def get_cvars (self):
+    def _get_unique_id (self, radix):
         r"""
-            returns dict() object of all created control vars;
+            tries to find a new and unique indexed 'id' name along
+            @radix param name;
 
-            may affect internal dict() object;
+            each @radix has its own counter and registered object
+            ids are never given away (see RADXMLIdAllocator);
+
+            returns new unique 'id' name on success, None otherwise;
         """
 
-        return self.__tk_variables
+        # param controls
+
+        if tools.is_pstr(radix):
+
+            return self.__ids.allocate(radix)
+
+        # end if
+
+        return None
 
     # end def
 
 
 
-    def get_doublevar (self, varname):
+    def _get_unique_ids (self, radix, count):
         r"""
-            tries to retrieve a tkinter.DoubleVar() named @varname;
+            bulk version of _get_unique_id() e.g. for repeated
+            templates;
 
-            returns control variable on success, None otherwise;
+            returns list of @count new unique 'id' names along
+            @radix param name, empty list on failure;
         """
 
-        return self.__tk_variables["doublevar"].get(varname, None)
+        # param controls
+
+        if tools.is_pstr(radix):
+
+            return self.__ids.allocate_many(radix, count)
+
+        # end if
+
+        return list()
 
     # end def
 
 
 
-    def get_doublevars (self):
+    def _get_xml_stamp (self):
         r"""
-            returns dict() object of all created DoubleVars;
+            protected method def;
 
-            may affect internal dict() object;
+            returns (mtime, size) stamp of loaded XML file or None
+            if not available;
+        """
+
+        try:
+
+            _stat = os.stat(self.__xml_path)
+
+            return (_stat.st_mtime_ns, _stat.st_size)
+
+        except (OSError, TypeError):
+
+            return None
+
+        # end try
+
+    # end def
+
+
+
+    def _loop_on_children (self, xml_element, tk_parent, accept = None):
+        r"""
+            loops on @xml_element param XML subelements with
+            @tk_parent param as tkinter parent widget;
+
+            @accept param sets up a list of admitted XML tags  as
+            subelements of @xml_element param;
+
+            tries to build all accepted subelements;
+
+            raises TypeError on unwanted subelements;
+
+            returns True on overall success, False otherwise;
         """
 
-        return self.__tk_variables["doublevar"]
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # parent tag inits
+
+            _ptag = self.normalize_tag(xml_element)
+
+            # incremental build mode?
+
+            if self.__build_stack is not None:
+
+                # children will be built in next time slices
+                # frame: children, parent, accept, tag, callbacks
+
+                self.__build_stack.append(
+
+                    (iter(xml_element), tk_parent, accept, _ptag, list())
+                )
+
+                return True
+
+            # end if
+
+            # return value inits
+
+            _ret = True
+
+            # loop on child XML elements
+
+            for _xml_child in xml_element:
+
+                _ret = self._build_child(
+
+                    _xml_child, tk_parent, accept, _ptag
+
+                ) and _ret
+
+            # end for
+
+            # return final success/failure
+
+            return _ret
+
+        # end if
+
+        # failed (bad XML element)
+
+        return False
+
+    # end def
+
+
+
+    def _parse_xml_attributes (self, xml_element, tk_parent, **kw):
+        r"""
+            parses dict() attributes of an XML ET.Element and
+            dispatches to optional specific parsers;
+
+            this method should not be modified for parsing attribute
+            methods naming as it suffices to reset
+            self.ATTRIBUTE_PARSER in subclass to the desired naming
+            rule;
+
+            if kw["xml_attrs"] filtered attributes exist, they
+            replace XML ET.Element.attrib dict() in parsing;
+
+            genuine dicts are kept UNTOUCHED thanks to shallow copying;
+
+            returns new dict() of parsed attributes or None on failure;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # XML tag inits
+
+            _tag = self.normalize_tag(xml_element)
+
+            # XML attribute inits
+
+            _attrs = kw.get("xml_attrs", xml_element.attrib)
+
+            r"""
+                $ 2013-12-16 RS $
+                new support:
+                work with RADXMLAttribute objects by now;
+
+                $ 2013-12-18 RS $
+                new support:
+                work with RADXMLAttributesDict by now;
+
+                notice:
+                XA.reset_attributes() provides dict() shallow copy;
+            """
+
+            _attrs = XD.RADXMLAttributesDict(
+
+                XA.reset_attributes(_attrs, xml_element)
+            )
+
+            # loop on RADXMLAttribute attributes list
+
+            for (_attr_name, _attr_object) in _attrs.items():
+
+                # normalize attribute
+
+                _attr_name = str(_attr_name).lower()
+
+                # attribute specific parser
+
+                _parser = self._get_handler(
+
+                    self.ATTRIBUTE_PARSER, _tag, _attr_name
+                )
+
+                # optional parser
+
+                if _parser:
+
+                    # try to call specific parser
+
+                    if callable(_parser):
+
+                        # update keywords
+
+                        kw.update(
+
+                            attribute = _attr_object,
+
+                            attrs = _attrs,
+
+                            tk_parent = tk_parent,
+
+                            xml_element = xml_element,
+
+                            xml_tag = _tag,
+
+                            xml_attr = _attr_name,
+                        )
+
+                        # attribute parsing inits
+
+                        self._before_parsing_attribute(**kw)
+
+                        # call parser
+
+                        if self._profiler:
+
+                            _start = self._profiler.start()
+
+                            _parser(**kw)
+
+                            self._profiler.stop(
+
+                                "attribute", _attr_name, _start
+                            )
+
+                        else:
+
+                            _parser(**kw)
+
+                        # end if
+
+                        r"""
+                            $ 2013-12-16 RS $
+                            new support: using RADXMLAttribute by now;
+
+                            $ 2014-03-10 RS $
+                            since v1.4: deferred tasks
+                            do *NOT* flag on 'parsed' value(!)
+                        """
+
+                        # update parsing counter
+
+                        #~ _attr_object.parsed = True
+
+                    # end if
+
+                # not implemented
+
+                else:
+
+                    print(
+
+                        _(
+                            "[WARNING] RADXMLBase::"
+
+                            "_parse_xml_attributes: optional parser "
+
+                            "'{parser}()' is *NOT* implemented."
+
+                        ).format(
+
+                            parser = self._get_handler_name(
+
+                                self.ATTRIBUTE_PARSER, _tag, _attr_name
+                            )
+                        )
+                    )
+
+                # end if
+
+            # end for
+
+            r"""
+                $ 2013-12-18 RS $
+                new support: using RADXMLAttributesDict by now;
+
+                notice:
+                flatten() provides a 'flat' dict() object containing
+                simple (key, value) pairs;
+                all RADXMLAttribute extra data are lost at this point;
+
+                $ 2014-03-10 RS $
+                since v1.4: deferred tasks
+                do *NOT* flatten() dict any more(!)
+            """
+
+            # return parsed attributes
+
+            return _attrs
+
+        # end if
+
+        # failure
+
+        return None
+
+    # end def
+
+
+
+    def _rebuild_children (self, xml_element, new_element, widget):
+        r"""
+            protected method def;
+
+            destroys all registered children of @widget built along
+            live @xml_element, then builds @new_element XML children
+            instead, in document order;
+
+            @widget must be the tkinter widget built along
+            @xml_element: self.tk_owner children never get rebuilt
+            here;
+
+            returns True on success, False otherwise;
+        """
+
+        # param controls
+
+        if widget is self.tk_owner or not self.is_tk_parent(widget):
+
+            return False
+
+        # end if
+
+        # destroy previously built children only
+
+        for _object in list(self.__objects.values()):
+
+            if self.is_tk_widget(_object) and _object.master is widget:
+
+                _object.destroy()
+
+            # end if
+
+        # end for
+
+        self._forget_destroyed_objects()
+
+        # replace live XML children
+
+        xml_element[:] = list(new_element)
+
+        return self._loop_on_children(
+
+            xml_element, widget,
+
+            accept = self._get_accepted_tags(xml_element),
+        )
+
+    # end def
+
+
+
+    def _reconfigure_element (self, widget, xml_element, attrs, tk_parent):
+        r"""
+            protected method def;
+
+            hook method to be reimplemented in subclass;
+
+            tries to update @widget in place along @attrs changed
+            XML attributes of live @xml_element;
+
+            returns True on success, False if @widget must be
+            rebuilt;
+        """
+
+        # put your own code in subclass
+
+        return False
+
+    # end def
+
+
+
+    def _register_object_by_id (self, built_object, attr_id):
+        r"""
+            registers newly created or existing object with the  XML
+            attribute 'id' which defined it in XML data source;
+
+            this is the counterpart of get_object_by_id() method;
+
+            no return value (void);
+        """
+
+        _id = self._get_object_id(built_object, attr_id)
+
+        if _id not in self.__objects:
+
+            self.__objects[_id] = built_object
+
+            # never give this id away
+
+            self.__ids.reserve(_id)
+
+        else:
+
+            raise KeyError(
+
+                _(
+                    "cannot override existing object of id '{obj_id}'"
+
+                ).format(obj_id = _id)
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _reload_children (self, old_element, new_element, xml_element,
+    fresh_element, tk_parent):
+        r"""
+            protected method def;
+
+            updates XML children of live @xml_element built into
+            @tk_parent along differences between @old_element and
+            @new_element pristine XML sources;
+
+            @fresh_element is a private copy of @new_element whose
+            children get built if new;
+
+            removed children get destroyed, kept children get
+            updated (see _reload_element()) and new children get
+            built if appended after kept ones; all children get
+            rebuilt otherwise (see _rebuild_children());
+
+            returns True on success, False if parent must be rebuilt;
+        """
+
+        # inits
+
+        _old_keys = self._get_reload_keys(old_element)
+
+        _new_keys = self._get_reload_keys(new_element)
+
+        _new_set = set(_new_keys)
+
+        _kept = [_key for _key in _old_keys if _key in _new_set]
+
+        _count = len(_kept)
+
+        # live XML tree must match old XML source
+        # kept children must come first, in same order
+
+        if len(xml_element) != len(old_element) or \
+                                        _new_keys[:_count] != _kept:
+
+            return self._rebuild_children(
+
+                xml_element, fresh_element, tk_parent
+            )
+
+        # end if
+
+        # removed children
+
+        _live = list()
+
+        _old = list()
+
+        for _key, _old_child, _child in \
+                            zip(_old_keys, old_element, xml_element):
+
+            if _key in _new_set:
+
+                _live.append(_child)
+
+                _old.append(_old_child)
+
+            elif not self._destroy_element(_child):
+
+                return self._rebuild_children(
+
+                    xml_element, fresh_element, tk_parent
+                )
+
+            # end if
+
+        # end for
+
+        # kept children
+
+        for _old_child, _new_child, _child, _fresh_child in \
+                                    zip(_old, new_element, _live,
+                                                        fresh_element):
+
+            if not self._reload_element(
+
+                    _old_child, _new_child, _child, _fresh_child,
+
+                    tk_parent):
+
+                return self._rebuild_children(
+
+                    xml_element, fresh_element, tk_parent
+                )
+
+            # end if
+
+        # end for
+
+        # update live XML tree
+
+        _added = list(fresh_element)[_count:]
+
+        xml_element[:] = _live + _added
+
+        # new children
+
+        _accept = self._get_accepted_tags(xml_element)
+
+        _ptag = self.normalize_tag(xml_element)
+
+        _ret = True
+
+        for _child in _added:
+
+            _ret = self._build_child(_child, tk_parent, _accept, _ptag) \
+                                                                and _ret
+
+        # end for
+
+        return _ret
+
+    # end def
+
+
+
+    def _reload_element (self, old_element, new_element, xml_element,
+    fresh_element, tk_parent):
+        r"""
+            protected method def;
+
+            updates live @xml_element built into @tk_parent along
+            differences between @old_element and @new_element
+            pristine XML sources (see _reload_children());
+
+            changed XML attributes get updated in place through
+            _reconfigure_element(), if possible;
+
+            returns True on success, False if parent must be rebuilt;
+        """
+
+        # changed XML element text or removed XML attributes?
+
+        if (old_element.text or "").strip() != \
+                            (new_element.text or "").strip() or \
+                    set(old_element.attrib) - set(new_element.attrib):
+
+            return False
+
+        # end if
+
+        # inits
+
+        _widget = self._get_element_object(xml_element)
+
+        _changed = {
+
+            _name: _value
+
+            for _name, _value in new_element.attrib.items()
+
+            if old_element.get(_name) != _value
+        }
+
+        # no tkinter widget?
+
+        if not self.is_tk_widget(_widget):
+
+            # nothing to update in place
+
+            return not (_changed or len(old_element) or len(new_element))
+
+        # end if
+
+        # update widget in place
+
+        if _changed:
+
+            xml_element.attrib.update(_changed)
+
+            if not self._reconfigure_element(
+
+                    _widget, xml_element, _changed, tk_parent):
+
+                return False
+
+            # end if
+
+        # end if
+
+        # update children
+
+        return self._reload_children(
+
+            old_element, new_element, xml_element, fresh_element, _widget
+        )
+
+    # end def
+
+
+
+    def _reset_oi_count (self, value = 1):
+        r"""
+            resets object instance (oi) counters to a given value;
+
+            default value (if not given) is one (1);
+
+            registered object ids remain reserved;
+
+            no return value (void);
+        """
+
+        # inits
+
+        self.__ids.reset(max(1, tools.ensure_int(value)))
+
+    # end def
+
+
+
+    def _set_class_member (self, name, widget):
+        r"""
+            protected method def;
+
+            sets @widget as self.tk_owner class member along @name;
+
+            no return value (void);
+        """
+
+        # param controls
+
+        if tools.is_pstr(name):
+
+            if hasattr(self.tk_owner, name):
+
+                raise AttributeError(
+                    _(
+                        "cannot set up class member "
+
+                        "'{attr_name}': already exists in "
+
+                        "tk_owner '{obj_type}'."
+
+                    ).format(
+
+                        attr_name = name,
+
+                        obj_type = repr(self.tk_owner),
+                    )
+                )
+
+            else:
+
+                setattr(self.tk_owner, name, widget)
+
+                self.__members[name] = widget
+
+            # end if
+
+        # end if
+
+    # end def
+
+
+
+    def _set_handler (self, key):
+        r"""
+            computes and registers (function, method name) dispatch
+            table entry along @key (class, pattern, tag, attribute)
+            tuple;
+
+            only plain functions defined in class hierarchy are
+            cached as is, any other callable will be looked up
+            dynamically;
+
+            returns (function, method name) tuple;
+        """
+
+        # inits
+
+        _class, _pattern, _tag, _attr = key
+
+        _name = self._get_handler_name(_pattern, _tag, _attr)
+
+        _func = getattr(_class, _name, None)
+
+        # only plain functions may be safely bound to self /!\
+
+        if not isinstance(_func, types.FunctionType):
+
+            _func = None
+
+        # end if
+
+        # no explicit attribute parser method?
+
+        if _attr is not None and _pattern == _class.ATTRIBUTE_PARSER \
+                                    and not hasattr(_class, _name):
+
+            _func = self._get_typed_parser(_class, _attr)
+
+        # end if
+
+        # register entry
+
+        self.__dispatch[key] = (_func, _name)
+
+        return (_func, _name)
+
+    # end def
+
+
+
+    def _show_build_error (self, silent_mode = False):
+        r"""
+            shows current exception in an error dialog box, unless
+            @silent_mode is set;
+
+            no return value (void);
+        """
+
+        if not silent_mode:
+
+            MB.showerror(
+
+                _("Caught exception"),
+
+                _(
+                    "An exception has occurred "
+
+                    "during XML widget building:"
+
+                    "\n\n{msg}\n"
+
+                    "Please, check your XML code before "
+
+                    "contacting tkRAD software maintainers for "
+
+                    "bug fixes.\nThank you."
+
+                ).format(msg = traceback.format_exc(limit = 0))
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _slot_xml_watch (self, *args, **kw):
+        r"""
+            slot method for xml_watch() polling;
+
+            reloads XML file if it has changed since last poll;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _watch = self.__watch
+
+        if not _watch:
+
+            return
+
+        # end if
+
+        _stamp = self._get_xml_stamp()
+
+        # changed and readable?
+
+        if _stamp and _stamp != _watch["stamp"] and \
+                                                not self.is_building():
+
+            _watch["stamp"] = _stamp
+
+            try:
+
+                self.xml_reload(diff = _watch["diff"], silent_mode = True)
+
+            except:
+
+                # keep on watching for next fixes
+
+                traceback.print_exc()
+
+            # end try
+
+        # end if
+
+        # poll again later
+
+        try:
+
+            _watch["after"] = self.tk_owner.after(
+
+                _watch["interval"], self._slot_xml_watch
+            )
+
+        except TK.TclError:
+
+            # tk_owner has been destroyed
+
+            self.__watch = None
+
+        # end try
+
+    # end def
+
+
+
+    def cast_element (self, xml_element):
+        r"""
+            casts @xml_element param to see if it is a real
+            xml.etree.ElementTree.Element object;
+
+            raises TypeError on failure;
+
+            returns True on success, False otherwise;
+        """
+
+        if self.is_element(xml_element):
+
+            return True
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "XML element must be of type "
+
+                    "'{obj_type}' not '{cur_type}'."
+
+                ).format(
+
+                    obj_type = repr(ET.Element),
+
+                    cur_type = repr(xml_element)
+                )
+            )
+
+            return False
+
+        # end if
+
+    # end def
+
+
+
+    def cast_tree (self, tree_object):
+        r"""
+            casts @tree_object param to see if it is a real
+            xml.etree.ElementTree object;
+
+            raises TypeError on failure;
+
+            returns True on success, False otherwise;
+        """
+
+        if self.is_tree(tree_object):
+
+            return True
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "XML tree must be of type "
+
+                    "'{obj_type}' not '{cur_type}'."
+
+                ).format(
+
+                    obj_type = repr(ET.ElementTree),
+
+                    cur_type = repr(tree_object)
+                )
+            )
+
+            return False
+
+        # end if
+
+    # end def
+
+
+
+    def connect_event (self, signal, *slots):
+        r"""
+            connects @slots to @signal, just like an XML <event>
+            element does, so that destroy_component() disconnects
+            them (see _connect_event());
+
+            runtime API for compiled XML modules (see xml.compile);
+
+            returns True on success, False otherwise;
+        """
+
+        return self._connect_event(signal, *slots)
+
+    # end def
+
+
+
+    def delete_dict_items (self, dict_object, *args):
+        r"""
+            @DEPRECATED: use tools.dict_delete_items() instead;
+
+            strips all keys listed in args from a dict() object;
+
+            shallow copy: keeps original dict() object UNTOUCHED /!\
+
+            returns new modified dict() object;
+        """
+
+        # $ 2014-02-18 RS $
+        # @DEPRECATED
+        # kept for compatibility with tkRAD < v1.2
+
+        return tools.dict_delete_items(dict_object, *args)
+
+    # end def
+
+
+
+    def destroy_component (self):
+        r"""
+            releases all resources created by this component:
+            pending incremental build, deferred actions, XML file
+            polling, events connected by XML <event> elements, built
+            widgets and their tk_owner class members, object ids,
+            images, tkinter control variables and XML tree;
+
+            tk_owner itself is *NOT* destroyed;
+
+            component may be built again afterwards;
+
+            no return value (void);
+        """
+
+        # stop pending processes
+
+        self.xml_unwatch()
+
+        self.__build_stack = None
+
+        self.__build_state = None
+
+        self.__building = False
+
+        self._end_batch(discard = True)
+
+        self._queue.clear()
+
+        self._queue.reset_stats()
+
+        # disconnect XML events
+
+        for _signal, _slot in self.__connections:
+
+            self.events.disconnect(_signal, _slot)
+
+        # end for
+
+        self.__connections.clear()
+
+        # destroy topmost built widgets - children follow
+
+        _widgets = [
+
+            _object for _object in self.__objects.values()
+
+            if self.is_tk_widget(_object)
+        ]
+
+        _ids = set(id(_widget) for _widget in _widgets)
+
+        for _widget in _widgets:
+
+            if id(_widget.master) not in _ids:
+
+                try:
+
+                    _widget.destroy()
+
+                except TK.TclError:
+
+                    pass
+
+                # end try
+
+            # end if
+
+        # end for
+
+        # tk_owner class members
+
+        for _name in list(self.__members):
+
+            self._del_class_member(_name)
+
+        # end for
+
+        # registries
+
+        self.__objects.clear()
+
+        self.__ids = XI.RADXMLIdAllocator()
+
+        self.__images.clear()
+
+        for _cvars in self.__tk_variables.values():
+
+            _cvars.clear()
+
+        # end for
+
+        # XML data
+
+        self.__xml_tree = None
+
+        self.__xml_path = None
+
+        self.__xml_source = None
+
+        self.__elements = None
+
+    # end def
+
+
+
+    def element_get_id (self, xml_element):
+        r"""
+            sets a correct 'id' value for a given XML element;
+
+            resets its 'id' attribute to this correct value;
+
+            returns 'id' value on success, None otherwise;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # inits
+
+            _id = self.get_correct_id(xml_element.get("id"))
+
+            # update XML element attr 'id'
+
+            xml_element.set("id", _id)
+
+            # keep XML id index up to date, if any
+
+            if self.__elements is not None:
+
+                self.__elements.setdefault(_id, xml_element)
+
+            # end if
+
+            # succeeded
+
+            return _id
+
+        # end if
+
+        # failed
+
+        return None
+
+    # end def
+
+
+
+    def get_bitmap_path (self, path):
+        r"""
+            tries to retrieve a bitmap path along @path;
+
+            returns path on success, empty string otherwise;
+        """
+
+        # $ 2014-02-07 RS $
+        # CAUTION:
+        # do *NOT* use TK.BitmapImage() /!\
+        # it is Tcl BUGGY and crashes tkinter/Tcl library /!\
+
+        # param inits
+
+        if tools.is_pstr(path) and path not in ("error", "gray75",
+        "gray50", "gray25", "gray12", "hourglass", "info",
+        "questhead", "question", "warning"):
+
+            path = "@" + P.normalize(path.lstrip("@"))
+
+        # end if
+
+        return path
+
+    # end def
+
+
+
+    def get_correct_id(self, value):
+        r"""
+            always provide a correct id name  whatever @value param
+            is at the beginning;
+
+            returns normalized (filtered) value if exists,
+
+            returns numbered unique 'objectxxx' otherwise;
+        """
+
+        # param inits
+
+        value = tools.normalize_id(value)
+
+        # no id?
+
+        if not tools.is_pstr(value):
+
+            # new value inits
+
+            value = self._get_unique_id("object")
+
+        # end if
+
+        # return filtered value
+
+        return value
+
+    # end def
+
+
+
+    def get_cvar (self, vartype, varname):
+        r"""
+            tries to retrieve a tkinter control variable @varname;
+
+            @vartype param must be one of 'StringVar', 'IntVar' or
+            'DoubleVar' (param is case-insensitive);
+
+            raises TypeError otherwise;
+
+            returns control variable on success, None otherwise;
+        """
+
+        # param inits
+
+        vartype = str(vartype).lower()
+
+        if vartype in self.__tk_variables:
+
+            return self.__tk_variables[vartype].get(varname, None)
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "Tkinter control variable must be one of type "
+
+                    "'DoubleVar', 'IntVar' or 'StringVar' "
+
+                    "(case insensitive)."
+                )
+            )
+
+            return None
+
+        # end if
+
+    # end def
+
+
+
+    def get_cvar_values (self, vartype = None):
+        r"""
+            reads values of all control variables created by
+            set_cvar() in one single Tcl call;
+
+            if @vartype is set (see get_cvar()), reads only control
+            variables of this type; if same @varname is used by
+            several types, 'stringvar' wins over 'intvar', which
+            wins over 'doublevar';
+
+            returns dict() of varname --> value;
+        """
+
+        # inits
+
+        _cvars = self._get_cvar_items(vartype)
+
+        if not _cvars:
+
+            return dict()
+
+        # end if
+
+        _tk = self._get_cvar_tk(_cvars[0][2])
+
+        _values = _tk.splitlist(
+
+            _tk.call(
+
+                "apply", self.TCL_GET_VARS,
+
+                tuple(str(_cvar) for _t, _n, _cvar in _cvars)
+            )
+        )
+
+        # convert values along control variable types
+
+        _result = dict()
+
+        for (_type, _name, _cvar), _value in zip(_cvars, _values):
+
+            if _type == "stringvar":
+
+                _result[_name] = str(_value)
+
+            elif _type == "intvar":
+
+                try:
+
+                    _result[_name] = _tk.getint(_value)
+
+                except (TypeError, TK.TclError):
+
+                    _result[_name] = int(_tk.getdouble(_value))
+
+                # end try
+
+            else:
+
+                _result[_name] = _tk.getdouble(_value)
+
+            # end if
+
+        # end for
+
+        return _result
+
+    # end def
+
+
+
+    def get_cvars (self):
+        r"""
+            returns dict() object of all created control vars;
+
+            may affect internal dict() object;
+        """
+
+        return self.__tk_variables
+
+    # end def
+
+
+
+    def get_defer_stats (self):
+        r"""
+            returns deferred actions counters of last XML build, by
+            queue section (see core.defer.DeferQueue.get_stats());
+        """
+
+        return self._queue.get_stats()
+
+    # end def
+
+
+
+    def get_doublevar (self, varname):
+        r"""
+            tries to retrieve a tkinter.DoubleVar() named @varname;
+
+            returns control variable on success, None otherwise;
+        """
+
+        return self.__tk_variables["doublevar"].get(varname, None)
+
+    # end def
+
+
+
+    def get_doublevars (self):
+        r"""
+            returns dict() object of all created DoubleVars;
+
+            may affect internal dict() object;
+        """
+
+        return self.__tk_variables["doublevar"]
+
+    # end def
+
+
+
+    def get_element_by_id (self, attr_id, xml_tree = None):
+        r"""
+            returns an xml.etree.ElementTree.Element from  an
+            xml.etree.ElementTree @xml_tree param along an  XML id
+            attribute @attr_id param or None in case of failure;
+
+            if @xml_tree param is not given, uses the internal  XML
+            tree data structure instead, through an XML id index;
+
+            CAUTION: call reset_element_index() after adding or
+            removing elements of internal XML tree by yourself;
+        """
+
+        # param inits
+
+        attr_id = tools.normalize_id(attr_id)
+
+        # param controls
+
+        if tools.is_pstr(attr_id):
+
+            # param controls
+
+            if self.is_tree(xml_tree) and xml_tree is not self.__xml_tree:
+
+                # foreign XML tree: no index
+
+                return xml_tree.find(
+
+                    ".//*[@id='{value}']".format(value = attr_id)
+                )
+
+            # end if
+
+            # internal XML tree index lookup
+
+            _element = self._get_element_index().get(attr_id)
+
+            # XML id changed in the meantime?
+
+            if _element is not None and _element.get("id") != attr_id:
+
+                self.reset_element_index()
+
+                _element = self._get_element_index().get(attr_id)
+
+            # end if
+
+            return _element
+
+        # end if
+
+        # failure
+
+        return None
+
+    # end def
+
+
+
+    def get_image (self, path, subsample = None, zoom = None):
+        r"""
+            tries to retrieve an image set up by set_image() along
+            @path, @subsample and @zoom;
+
+            returns image object if found, None otherwise;
+        """
+
+        return self.__images.get(
+
+            self._get_image_key(P.normalize(path), subsample, zoom)
+        )
+
+    # end def
+
+
+
+    def get_intvar (self, varname):
+        r"""
+            tries to retrieve a tkinter.IntVar() named @varname;
+
+            returns control variable on success, None otherwise;
+        """
+
+        return self.__tk_variables["intvar"].get(varname, None)
+
+    # end def
+
+
+
+    def get_intvars (self):
+        r"""
+            returns dict() object of all created IntVars;
+
+            may affect internal dict() object;
+        """
+
+        return self.__tk_variables["intvar"]
+
+    # end def
+
+
+
+    def get_object_by_id (self, attr_id, default = None):
+        r"""
+            this is the counterpart of _register_object_by_id() method;
+
+            returns object tagged by @attr_id param on success;
+
+            returns @default object on failure;
+        """
+
+        return self.__objects.get(
+
+            tools.normalize_id(attr_id).lower(),
+
+            default
+        )
+
+    # end def
+
+
+
+    def get_objects (self):
+        r"""
+            returns all the (id: object) pairs in a dict() object;
+
+            does not affect internal dict of objects as it returns
+            only a shallow copy of the original objects dict;
+        """
+
+        return self.__objects.copy()
+
+    # end def
+
+
+
+    def get_stringvar (self, varname):
+        r"""
+            tries to retrieve a tkinter.StringVar() named @varname;
+
+            returns control variable on success, None otherwise;
+        """
+
+        return self.__tk_variables["stringvar"].get(varname, None)
+
+    # end def
+
+
+
+    def get_stringvars (self):
+        r"""
+            returns dict() object of all created StringVars;
+
+            may affect internal dict() object;
+        """
+
+        return self.__tk_variables["stringvar"]
+
+    # end def
+
+
+
+    def get_xml_dir (self):
+        r"""
+            returns internal XML directory def;
+        """
+
+        return self.__xml_dir
+
+    # end def
+
+
+
+    def get_xml_file_ext (self):
+        r"""
+            returns internal XML file extension def;
+        """
+
+        return self.__xml_file_ext
+
+    # end def
+
+
+
+    def get_xml_filename (self):
+        r"""
+            returns internal XML filename radix def;
+        """
+
+        return self.__xml_filename
+
+    # end def
+
+
+
+    def get_xml_path (self, filename = None):
+        r"""
+            tries to retrieve a valid path from several cases;
+
+            @filename param can either be a filename radix to be
+            automagically rebuilt or a complete file path (path);
+
+            raises OSError if unable to build a correct path;
+
+            returns final path on success, None otherwise;
+        """
+
+        # param controls
+
+        if tools.is_pstr(filename):
+
+            # @filename param may be a path
+
+            _path = P.normalize(filename)
+
+            # $ 2013-12-31 RS $
+            # fixed ugly path construction on faulty paths
+
+            if OP.isfile(_path) or OP.sep in filename:
+
+                return _path
+
+            # end if
+
+        # end if
+
+        # param inits
+
+        filename = tools.choose_str(
+
+            filename,
+
+            self.get_xml_filename(),
+
+            self.options[self.RC_OPTIONS["section"]]
+                .get(self.RC_OPTIONS["filename"]),
+
+            self.XML_RC.get("filename"),
+
+            self.classname().lower(),
+
+            "component",
+        )
+
+        # strip eventual file exts
+
+        filename = re.sub(r"\..*$", r"", filename.strip("."))
+
+        # failed to retrieve a valid XML filename
+
+        if not filename:
+
+            raise OSError(
+
+                _("Unable to determine a valid XML filename.")
+            )
+
+            return None
+
+        # end if
+
+        # retrieve file ext
+
+        _ext = tools.choose_str(
+
+            self.get_xml_file_ext(),
+
+            self.options[self.RC_OPTIONS["section"]]
+                .get(self.RC_OPTIONS["file_ext"]),
+
+            self.XML_RC.get("file_ext"),
+
+            ".xml",
+
+        ).strip(".")
+
+        # got a file ext?
+
+        if _ext:
+
+            # filename completion
+
+            filename += "." + _ext
+
+        # end if
+
+        # retrieve XML directory
+
+        _dir = tools.choose_str(
+
+            self.get_xml_dir(),
+
+            self.options[self.RC_OPTIONS["section"]]
+                .get(self.RC_OPTIONS["dir"]),
+
+            self.XML_RC.get("dir"),
+
+            "^/xml",
+        )
+
+        # return rebuilt XML path
+
+        return OP.join(P.normalize(_dir), filename)
+
+    # end def
+
+
+
+    def get_xml_profiler (self):
+        r"""
+            returns current XML build profiler or None if profiling
+            is disabled;
+        """
+
+        return self._profiler
+
+    # end def
+
+
+
+    def get_xml_tree (self):
+        r"""
+            returns current internal XML tree data structure;
+        """
+
+        return self.__xml_tree
+
+    # end def
+
+
+
+    def is_building (self):
+        r"""
+            determines if an XML build (either synchronous or
+            incremental) is currently running;
+
+            returns True on success, False otherwise;
+        """
+
+        return self.__building or self.__build_stack is not None
+
+    # end def
+
+
+
+    def is_element (self, xml_element):
+        r"""
+            determines if @xml_element param is a real
+            xml.etree.ElementTree.Element object;
+
+            returns True on success, False otherwise;
+        """
+
+        return isinstance(xml_element, ET.Element)
+
+    # end def
+
+
+
+    def is_tree (self, tree_object):
+        r"""
+            determines if @tree_object param is a real
+            xml.etree.ElementTree object;
+
+            returns True on success, False otherwise;
+        """
+
+        return isinstance(tree_object, ET.ElementTree)
+
+    # end def
+
+
+
+    def is_xml (self, content):
+        r"""
+            tries to determine if content contains XML <markups>;
+
+            returns True on success, False otherwise;
+        """
+
+        return tools.is_pstr(content) and re.search(r"<.+?>", content)
+
+    # end def
+
+
+
+    def normalize_tag (self, xml_element):
+        r"""
+            returns a lowercased char string of @xml_element.tag;
+        """
+
+        return str(xml_element.tag).lower()
+
+    # end def
+
+
+
+    def register_object_by_id (self, built_object, attr_id):
+        r"""
+            registers @built_object along XML @attr_id, just like
+            XML building does (see _register_object_by_id());
+
+            runtime API for compiled XML modules (see xml.compile);
+
+            raises KeyError if @attr_id is already taken;
+
+            no return value (void);
+        """
+
+        self._register_object_by_id(built_object, attr_id)
+
+    # end def
+
+
+
+    def reset_element_index (self):
+        r"""
+            invalidates internal XML tree id index;
+
+            must be called after adding or removing elements of
+            internal XML tree without using tkRAD methods;
+
+            index gets rebuilt on next get_element_by_id() call;
+
+            no return value (void);
+        """
+
+        self.__elements = None
+
+    # end def
+
+
+
+    def set_class_member (self, name, widget):
+        r"""
+            sets @widget as self.tk_owner class member along @name,
+            just like XML 'name' attribute does (see
+            _set_class_member());
+
+            runtime API for compiled XML modules (see xml.compile);
+
+            raises AttributeError if member already exists;
+
+            no return value (void);
+        """
+
+        self._set_class_member(name, widget)
+
+    # end def
+
+
+
+    def set_cvar (self, vartype, varname):
+        r"""
+            creates (if not already exists) a tkinter control
+            variable  'DoubleVar', 'IntVar' or 'StringVar' for a
+            given @varname;
+
+            returns the already existing or the newly created object
+            for that given @varname param;
+
+            raises TypeError and returns None if type mismatch;
+        """
+
+        # param inits
+
+        vartype = str(vartype).lower()
+
+        if vartype in self.__tk_variables:
+
+            # efficient memory management - do *NOT* use .setdefault()
+
+            if varname not in self.__tk_variables[vartype]:
+
+                _cvar = {
+
+                    "doublevar": TK.DoubleVar,
+
+                    "intvar": TK.IntVar,
+
+                    "stringvar": TK.StringVar,
+
+                }.get(vartype)
+
+                # share pooled cvar, if any
+
+                if self.__use_cvar_pool:
+
+                    _key = (vartype, varname)
+
+                    _cvar = self.__cvar_pool.get(_key) or _cvar()
+
+                    self.__cvar_pool[_key] = _cvar
+
+                else:
+
+                    _cvar = _cvar()
+
+                # end if
+
+                self.__tk_variables[vartype][varname] = _cvar
+
+            # end if
+
+            # return already existing or newly created cvar
+
+            return self.__tk_variables[vartype].get(varname)
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "Tkinter control variable must be one of type "
+
+                    "'DoubleVar', 'IntVar' or 'StringVar' "
+
+                    "(case insensitive)."
+                )
+            )
+
+            return None
+
+        # end if
 
     # end def
 
 
 
-    def get_element_by_id (self, attr_id, xml_tree = None):
+    def set_cvar_values (self, values, vartype = None):
         r"""
-            returns an xml.etree.ElementTree.Element from  an
-            xml.etree.ElementTree @xml_tree param along an  XML id
-            attribute @attr_id param or None in case of failure;
+            writes @values dict() of varname --> value into control
+            variables created by set_cvar(), in one single Tcl call;
 
-            if @xml_tree param is not given, uses the internal  XML
-            tree data structure instead;
-        """
+            if @vartype is set (see get_cvar()), writes only control
+            variables of this type, otherwise each value gets written
+            into all control variables named after it;
 
-        # param inits
+            names without any control variable get skipped;
 
-        attr_id = tools.normalize_id(attr_id)
+            no return value (void);
+        """
 
-        # param controls
+        # inits
 
-        if tools.is_pstr(attr_id):
+        _pairs = list()
 
-            # param controls
+        _cvars = self._get_cvar_items(vartype)
 
-            if not self.is_tree(xml_tree):
+        for _type, _name, _cvar in _cvars:
 
-                xml_tree = self.__xml_tree
+            if _name in values:
+
+                _pairs.extend((str(_cvar), values[_name]))
 
             # end if
 
-            return xml_tree.find(
+        # end for
 
-                ".//*[@id='{value}']".format(value = attr_id)
-            )
+        if _pairs:
 
-        # end if
+            self._get_cvar_tk(_cvars[0][2]).call(
 
-        # failure
+                "apply", self.TCL_SET_VARS, tuple(_pairs)
+            )
 
-        return None
+        # end if
 
     # end def
 
 
 
-    def get_image (self, path):
+    def set_doublevar (self, varname):
         r"""
-            tries to retrieve an image from self.__images dict()
-            along @path;
-
-            returns image object if found, None otherwise;
-        """
-
-        return self.__images.get(P.normalize(path))
-
-    # end def
-
-
+            tries to create a tkinter.DoubleVar() named @varname;
 
-    def get_intvar (self, varname):
-        r"""
-            tries to retrieve a tkinter.IntVar() named @varname;
+            if @varname already exists, keeps the original untouched;
 
             returns control variable on success, None otherwise;
         """
 
-        return self.__tk_variables["intvar"].get(varname, None)
+        return self.set_cvar("doublevar", varname)
 
     # end def
 
 
 
-    def get_intvars (self):
+    def set_image (self, path, subsample = None, zoom = None):
         r"""
-            returns dict() object of all created IntVars;
+            tries to set up an image along @path, resized along
+            optional @subsample and @zoom factors (integer or
+            (x, y) pair);
 
-            may affect internal dict() object;
+            images are shared app-wide by the image cache service
+            (see widgets.rad_image_cache) and kept here as long as
+            this object lives;
+
+            if original image exists, keeps untouched;
+
+            returns image object, None on trouble;
         """
 
-        return self.__tk_variables["intvar"]
+        # param inits
 
-    # end def
+        path = P.normalize(path)
 
+        _key = self._get_image_key(path, subsample, zoom)
 
+        # new image to register?
 
-    def get_object_by_id (self, attr_id, default = None):
-        r"""
-            this is the counterpart of _register_object_by_id() method;
+        if path and _key not in self.__images:
 
-            returns object tagged by @attr_id param on success;
+            self.__images[_key] = IC.get_image_cache().get_image(
 
-            returns @default object on failure;
-        """
+                path, subsample = subsample, zoom = zoom,
 
-        return self.__objects.get(
+                master = self.tk_owner if self.is_tk_parent(self.tk_owner)
 
-            tools.normalize_id(attr_id).lower(),
+                                                                else None
+            )
 
-            default
-        )
+        # end if
+
+        return self.__images.get(_key)
 
     # end def
 
 
 
-    def get_objects (self):
+    def set_intvar (self, varname):
         r"""
-            returns all the (id: object) pairs in a dict() object;
+            tries to create a tkinter.IntVar() named @varname;
 
-            does not affect internal dict of objects as it returns
-            only a shallow copy of the original objects dict;
+            if @varname already exists, keeps the original untouched;
+
+            returns control variable on success, None otherwise;
         """
 
-        return self.__objects.copy()
+        return self.set_cvar("intvar", varname)
 
     # end def
 
 
 
-    def get_stringvar (self, varname):
+    def set_stringvar (self, varname):
         r"""
-            tries to retrieve a tkinter.StringVar() named @varname;
+            tries to create a tkinter.StringVar() named @varname;
+
+            if @varname already exists, keeps the original untouched;
 
             returns control variable on success, None otherwise;
         """
 
-        return self.__tk_variables["stringvar"].get(varname, None)
+        return self.set_cvar("stringvar", varname)
 
     # end def
 
 
 
-    def get_stringvars (self):
+    def set_xml_dir (self, value):
         r"""
-            returns dict() object of all created StringVars;
-
-            may affect internal dict() object;
+            sets internal XML directory def;
         """
 
-        return self.__tk_variables["stringvar"]
+        self.__xml_dir = value
 
     # end def
 
 
 
-    def get_xml_dir (self):
+    def set_xml_file_ext (self, value):
         r"""
-            returns internal XML directory def;
+            sets internal XML file extension def;
         """
 
-        return self.__xml_dir
+        self.__xml_file_ext = value
 
     # end def
 
 
 
-    def get_xml_file_ext (self):
+    def set_xml_filename (self, value):
         r"""
-            returns internal XML file extension def;
+            sets internal XML filename radix def;
         """
 
-        return self.__xml_file_ext
+        self.__xml_filename = value
 
     # end def
 
 
 
-    def get_xml_filename (self):
+    def set_xml_profiler (self, value):
         r"""
-            returns internal XML filename radix def;
+            enables XML build profiling with @value profiler
+            (RADXMLProfiler object or True for a new one);
+
+            set to None or False to disable profiling;
+
+            returns current profiler or None;
         """
 
-        return self.__xml_filename
+        # unwrap deferred actions queue
 
-    # end def
+        if isinstance(self._queue, XR.RADXMLProfiledQueue):
 
+            self._queue = self._queue.queue
 
+        # end if
 
-    def get_xml_path (self, filename = None):
-        r"""
-            tries to retrieve a valid path from several cases;
+        # new profiler?
 
-            @filename param can either be a filename radix to be
-            automagically rebuilt or a complete file path (path);
+        if value is True:
 
-            raises OSError if unable to build a correct path;
+            value = XR.RADXMLProfiler()
 
-            returns final path on success, None otherwise;
-        """
+        # end if
 
-        # param controls
+        self._profiler = value or None
 
-        if tools.is_pstr(filename):
+        # measure deferred actions
 
-            # @filename param may be a path
+        if self._profiler:
 
-            _path = P.normalize(filename)
+            self._queue = self._profiler.wrap_queue(self._queue)
 
-            # $ 2013-12-31 RS $
-            # fixed ugly path construction on faulty paths
+        # end if
 
-            if OP.isfile(_path) or OP.sep in filename:
+        return self._profiler
 
-                return _path
+    # end def
 
-            # end if
 
-        # end if
 
-        # param inits
+    def set_xml_tree (self, **kw):
+        r"""
+            sets internal XML tree along @kw param keywords;
 
-        filename = tools.choose_str(
+            keywords should be either 'element' or 'file' as in
+            xml.etree.ElementTree() constructor signature;
 
-            filename,
+            no return value (void);
+        """
 
-            self.get_xml_filename(),
+        # reset XML tree
 
-            self.options[self.RC_OPTIONS["section"]]
-                .get(self.RC_OPTIONS["filename"]),
+        self.__xml_tree = ET.ElementTree(**kw)
 
-            self.XML_RC.get("filename"),
+        # XML id index will be rebuilt on demand
 
-            self.classname().lower(),
+        self.__elements = None
 
-            "component",
-        )
+    # end def
 
-        # strip eventual file exts
 
-        filename = re.sub(r"\..*$", r"", filename.strip("."))
 
-        # failed to retrieve a valid XML filename
+    def xml_build (self, filename = None, silent_mode = False):
+        r"""
+            public entry point of XML widget building;
 
-        if not filename:
+            @filename param can either be a filename radix to be
+            automagically rebuilt, a complete file path (path) or
+            an XML source string of chars;
 
-            raise OSError(
+            returns True on overall success, False, otherwise;
+        """
 
-                _("Unable to determine a valid XML filename.")
-            )
+        # try to build widgets
 
-            return None
+        try:
 
-        # end if
+            # verify XML tree before processing
 
-        # retrieve file ext
+            if tools.is_pstr(filename) or \
+                                    not self.is_tree(self.__xml_tree):
 
-        _ext = tools.choose_str(
+                # try to load once
 
-            self.get_xml_file_ext(),
+                self.xml_load(filename)
 
-            self.options[self.RC_OPTIONS["section"]]
-                .get(self.RC_OPTIONS["file_ext"]),
+            # end if
 
-            self.XML_RC.get("file_ext"),
+            # cast root element
 
-            ".xml",
+            _root = self.__xml_tree.getroot()
 
-        ).strip(".")
+            if self._cast_root_element(_root):
 
-        # got a file ext?
+                # count deferred actions of this build only
 
-        if _ext:
+                self._queue.reset_stats()
 
-            # filename completion
+                # batch tkinter commands while building
 
-            filename += "." + _ext
+                self._begin_batch()
 
-        # end if
+                # start XML widget building
 
-        # retrieve XML directory
+                self.__building = True
 
-        _dir = tools.choose_str(
+                _build_ok = self._build_element(_root, self.tk_owner)
 
-            self.get_xml_dir(),
+                self.__building = False
 
-            self.options[self.RC_OPTIONS["section"]]
-                .get(self.RC_OPTIONS["dir"]),
+                # send all remaining tkinter commands
 
-            self.XML_RC.get("dir"),
+                self._end_batch()
 
-            "^/xml",
-        )
+                # flush all deferred actions in queue
 
-        # return rebuilt XML path
+                self._queue.flush_all()
 
-        return OP.join(P.normalize(_dir), filename)
+                # return building results
 
-    # end def
+                return _build_ok
 
+            else:
 
+                return False
 
-    def get_xml_tree (self):
-        r"""
-            returns current internal XML tree data structure;
-        """
+            # end if
 
-        return self.__xml_tree
+        except:
 
-    # end def
+            self.__building = False
 
+            self._end_batch(discard = True)
 
+            self._show_build_error(silent_mode)
 
-    def is_element (self, xml_element):
-        r"""
-            determines if @xml_element param is a real
-            xml.etree.ElementTree.Element object;
+            raise
 
-            returns True on success, False otherwise;
-        """
+            exit(1)
 
-        return isinstance(xml_element, ET.Element)
+        # end try
 
     # end def
 
 
 
-    def is_tree (self, tree_object):
+    def xml_build_incremental (self, filename = None, slice_ms = None,
+    silent_mode = False):
         r"""
-            determines if @tree_object param is a real
-            xml.etree.ElementTree object;
+            public entry point of cooperative XML widget building;
 
-            returns True on success, False otherwise;
-        """
+            same as xml_build() but XML elements get built in time
+            slices of @slice_ms milliseconds (default:
+            self.BUILD_SLICE_MS) scheduled with tkinter after_idle(),
+            so that large windows do not freeze the user interface;
 
-        return isinstance(tree_object, ET.ElementTree)
+            raises 'XMLBuildProgress' event (keywords: component,
+            done, total) after each time slice and 'XMLBuildDone'
+            event (keywords: component, success and error on
+            failure) once building is over;
 
-    # end def
+            falls back to synchronous xml_build() if self.tk_owner is
+            not a tkinter widget;
 
+            raises RuntimeError if an incremental build is already
+            running;
 
+            returns True if building has started, False otherwise;
+        """
 
-    def is_xml (self, content):
-        r"""
-            tries to determine if content contains XML <markups>;
+        # no tkinter event loop available?
 
-            returns True on success, False otherwise;
-        """
+        if not self.is_tk_parent(self.tk_owner):
 
-        return tools.is_pstr(content) and re.search(r"<.+?>", content)
+            return self.xml_build(filename, silent_mode)
 
-    # end def
+        # end if
 
+        # already running?
 
+        if self.__build_stack is not None:
 
-    def normalize_tag (self, xml_element):
-        r"""
-            returns a lowercased char string of @xml_element.tag;
-        """
+            raise RuntimeError(
+
+                _("An incremental XML build is already running.")
+            )
+
+        # end if
 
-        return str(xml_element.tag).lower()
+        # try to start building
 
-    # end def
+        try:
 
+            # verify XML tree before processing
 
+            if tools.is_pstr(filename) or \
+                                    not self.is_tree(self.__xml_tree):
 
-    def set_cvar (self, vartype, varname):
-        r"""
-            creates (if not already exists) a tkinter control
-            variable  'DoubleVar', 'IntVar' or 'StringVar' for a
-            given @varname;
+                # try to load once
 
-            returns the already existing or the newly created object
-            for that given @varname param;
+                self.xml_load(filename)
 
-            raises TypeError and returns None if type mismatch;
-        """
+            # end if
 
-        # param inits
+            # cast root element
 
-        vartype = str(vartype).lower()
+            _root = self.__xml_tree.getroot()
 
-        if vartype in self.__tk_variables:
+            if not self._cast_root_element(_root):
 
-            # efficient memory management - do *NOT* use .setdefault()
+                return False
 
-            if varname not in self.__tk_variables[vartype]:
+            # end if
 
-                _cvar = {
+            # build state inits
 
-                    "doublevar": TK.DoubleVar,
+            self.__build_state = {
 
-                    "intvar": TK.IntVar,
+                "ok": True,
 
-                    "stringvar": TK.StringVar,
+                "done": 0,
 
-                }.get(vartype)
+                "total": sum(1 for _e in _root.iter()) - 1,
 
-                self.__tk_variables[vartype][varname] = _cvar()
+                "slice_ms": max(
 
-            # end if
+                    1, tools.ensure_int(
 
-            # return already existing or newly created cvar
+                        tools.choose(slice_ms, self.BUILD_SLICE_MS)
+                    )
+                ),
 
-            return self.__tk_variables[vartype].get(varname)
+                "silent_mode": silent_mode,
+            }
 
-        else:
+            self.__build_stack = list()
 
-            raise TypeError(
+            # count deferred actions of this build only
 
-                _(
-                    "Tkinter control variable must be one of type "
+            self._queue.reset_stats()
 
-                    "'DoubleVar', 'IntVar' or 'StringVar' "
+            # batch tkinter commands while building
 
-                    "(case insensitive)."
-                )
-            )
+            self._begin_batch()
 
-            return None
+            # build root element - children get deferred
 
-        # end if
+            self.__build_state["ok"] = \
+                            self._build_element(_root, self.tk_owner)
 
-    # end def
+        except:
 
+            self.__build_stack = None
 
+            self._end_batch(discard = True)
 
-    def set_doublevar (self, varname):
-        r"""
-            tries to create a tkinter.DoubleVar() named @varname;
+            self._show_build_error(silent_mode)
 
-            if @varname already exists, keeps the original untouched;
+            raise
 
-            returns control variable on success, None otherwise;
-        """
+        # end try
 
-        return self.set_cvar("doublevar", varname)
+        # schedule first time slice
+
+        self.tk_owner.after_idle(self._build_slice)
+
+        return True
 
     # end def
 
 
 
-    def set_image (self, path):
+    def xml_load (self, arg = None):
         r"""
-            tries to set up an image along @path;
+            loads and parses XML data;
 
-            if original image exists, keeps untouched;
+            @arg param can either be a filename radix to be
+            automagically rebuilt, a complete file path (path) or an
+            XML source string of chars;
 
-            returns image object, None on trouble;
+            no return value (void);
         """
 
-        # param inits
+        try:
 
-        path = P.normalize(path)
+            # XML markup detected?
 
-        # new image to register?
+            if self.is_xml(arg):
 
-        if path and path not in self.__images:
+                # parse XML char string source
 
-            self.__images[path] = TK.PhotoImage(file=path)
+                self.set_xml_tree(element = ET.fromstring(arg))
 
-        # end if
+                # no file to reload from
 
-        return self.__images.get(path)
+                self.__xml_path = None
 
-    # end def
+                self.__xml_source = None
 
+            # should be a filename or path
 
+            else:
 
-    def set_intvar (self, varname):
-        r"""
-            tries to create a tkinter.IntVar() named @varname;
+                # inits
 
-            if @varname already exists, keeps the original untouched;
+                _path = self.get_xml_path(arg)
 
-            returns control variable on success, None otherwise;
-        """
+                # parsed XML files are shared process-wide
+                # cache gives away private deep copies only
 
-        return self.set_cvar("intvar", varname)
+                if self._profiler:
 
-    # end def
+                    with self._profiler.measure("xml", "load"):
 
+                        _root = XC.get_xml_cache().get_root(_path)
 
+                    # end with
 
-    def set_stringvar (self, varname):
-        r"""
-            tries to create a tkinter.StringVar() named @varname;
+                else:
 
-            if @varname already exists, keeps the original untouched;
+                    _root = XC.get_xml_cache().get_root(_path)
 
-            returns control variable on success, None otherwise;
-        """
+                # end if
 
-        return self.set_cvar("stringvar", varname)
+                self.set_xml_tree(element = _root)
 
-    # end def
+                # keep pristine XML source for xml_reload()
 
+                self.__xml_path = _path
 
+                self.__xml_source = XC.get_xml_cache().get_source(_path)
 
-    def set_xml_dir (self, value):
-        r"""
-            sets internal XML directory def;
-        """
+            # end if
 
-        self.__xml_dir = value
+        except ET.ParseError:
 
-    # end def
+            raise RuntimeError(
 
+                _("XML source code may contain some errors.")
 
+            ) from None
 
-    def set_xml_file_ext (self, value):
-        r"""
-            sets internal XML file extension def;
-        """
+            exit(1)
 
-        self.__xml_file_ext = value
+        # end try
 
     # end def
 
 
 
-    def set_xml_filename (self, value):
+    @contextlib.contextmanager
+    def xml_profiling (self, profiler = None):
         r"""
-            sets internal XML filename radix def;
-        """
+            context manager enabling XML build profiling in its
+            inner block, with @profiler (default: new
+            RADXMLProfiler object) e.g.
 
-        self.__xml_filename = value
+                with widget.xml_profiling() as profiler:
 
-    # end def
+                    widget.xml_build()
 
+                print(profiler.get_report())
 
+            previous profiling state is restored on exit;
+        """
 
-    def set_xml_tree (self, **kw):
-        r"""
-            sets internal XML tree along @kw param keywords;
+        _previous = self._profiler
 
-            keywords should be either 'element' or 'file' as in
-            xml.etree.ElementTree() constructor signature;
+        try:
 
-            no return value (void);
-        """
+            yield self.set_xml_profiler(profiler or True)
 
-        # reset XML tree
+        finally:
 
-        self.__xml_tree = ET.ElementTree(**kw)
+            self.set_xml_profiler(_previous)
+
+        # end try
 
     # end def
 
 
 
-    def xml_build (self, filename = None, silent_mode = False):
+    def xml_reload (self, filename = None, diff = True,
+    silent_mode = False):
         r"""
-            public entry point of XML widget building;
+            reloads XML file and updates already built widgets;
 
             @filename param can either be a filename radix to be
-            automagically rebuilt, a complete file path (path) or
-            an XML source string of chars;
+            automagically rebuilt or a complete file path (path);
+            defaults to last loaded XML file;
 
-            returns True on overall success, False, otherwise;
-        """
+            if @diff is True and widgets have been built from the
+            same XML file, only XML elements which differ from
+            previous XML source get updated: changed XML attributes
+            get reconfigured in place, if possible, removed subtrees
+            get destroyed and new subtrees get built, while other
+            widgets, object ids and tkinter control variables are
+            kept as is;
 
-        # try to build widgets
+            otherwise, component gets released by
+            destroy_component() - except xml_watch() polling - and
+            built again from scratch;
 
-        try:
+            XML files included by <include> elements are *NOT*
+            watched for changes;
 
-            # verify XML tree before processing
+            raises RuntimeError if no XML file is available;
 
-            if tools.is_pstr(filename) or \
-                                    not self.is_tree(self.__xml_tree):
+            returns True on overall success, False, otherwise;
+        """
 
-                # try to load once
+        # inits
 
-                self.xml_load(filename)
+        _path = self.__xml_path
 
-            # end if
+        if tools.is_pstr(filename):
 
-            # cast root element
+            _path = self.get_xml_path(filename)
 
-            _root = self.__xml_tree.getroot()
+        # end if
 
-            if self._cast_root_element(_root):
+        if not _path:
 
-                # start XML widget building
+            raise RuntimeError(_("No XML file to reload."))
 
-                _build_ok = self._build_element(_root, self.tk_owner)
+        # end if
 
-                # flush all deferred actions in queue
+        try:
 
-                self._queue.flush_all()
+            # previous XML source and live XML tree
 
-                # return building results
+            _old = self.__xml_source
 
-                return _build_ok
+            _live = None
 
-            else:
+            if self.is_tree(self.__xml_tree):
 
-                return False
+                _live = self.__xml_tree.getroot()
 
             # end if
 
-        except:
-
-            if not silent_mode:
+            # diff-based update is possible?
 
-                MB.showerror(
+            if diff and _path == self.__xml_path and \
+                    self.is_tk_parent(self.tk_owner) and \
+                    self.is_element(_old) and self.is_element(_live) and \
+                    not self.is_building():
 
-                    _("Caught exception"),
+                # new XML source - fetched once, so that pristine
+                # and buildable copies match even if file changes
 
-                    _(
-                        "An exception has occurred "
-
-                        "during XML widget building:"
+                _new = XC.get_xml_cache().get_source(_path)
 
-                        "\n\n{msg}\n"
+                _fresh = copy.deepcopy(_new)
 
-                        "Please, check your XML code before "
+                # root element must not have changed
 
-                        "contacting tkRAD software maintainers for "
+                if _old.tag == _new.tag and _old.attrib == _new.attrib:
 
-                        "bug fixes.\nThank you."
+                    self.__building = True
 
-                    ).format(msg = traceback.format_exc(limit = 0))
-                )
+                    try:
 
-            # end if
+                        _ok = self._reload_children(
 
-            raise
+                            _old, _new, _live, _fresh, self.tk_owner
+                        )
 
-            exit(1)
+                    finally:
 
-        # end try
+                        self.__building = False
 
-    # end def
+                        # XML children may have been swapped, even
+                        # on failure
 
+                        self.reset_element_index()
 
+                    # end try
 
-    def xml_load (self, arg = None):
-        r"""
-            loads and parses XML data;
+                    if _ok:
 
-            @arg param can either be a filename radix to be
-            automagically rebuilt, a complete file path (path) or an
-            XML source string of chars;
+                        self.__xml_source = _new
 
-            no return value (void);
-        """
+                        # flush all deferred actions in queue
 
-        try:
+                        self._queue.flush_all()
 
-            # XML markup detected?
+                        return True
 
-            if self.is_xml(arg):
+                    # end if
 
-                # parse XML char string source
+                # end if
 
-                self.set_xml_tree(element = ET.fromstring(arg))
+            # end if
 
-            # should be a filename or path
+        except:
 
-            else:
+            self.__building = False
 
-                # XML parse file path
+            self._show_build_error(silent_mode)
 
-                self.__xml_tree = ET.parse(self.get_xml_path(arg))
+            raise
 
-            # end if
+        # end try
 
-        except ET.ParseError:
+        # full rebuild - same teardown as destroy_component() i.e.
+        # events, ids, class members, etc, but keep on polling
 
-            raise RuntimeError(
+        _watch = self.__watch
 
-                _("XML source code may contain some errors.")
+        self.__watch = None
 
-            ) from None
+        self.destroy_component()
 
-            exit(1)
+        self.__watch = _watch
 
-        # end try
+        return self.xml_build(_path, silent_mode)
 
     # end def
 
@@ -1725,4 +3952,88 @@ class RADXMLBase (RW.RADWidgetBase):
     # end def
 
 
+
+    def xml_unwatch (self):
+        r"""
+            stops XML file polling started by xml_watch(), if any;
+
+            no return value (void);
+        """
+
+        _watch = self.__watch
+
+        self.__watch = None
+
+        if _watch and _watch["after"]:
+
+            try:
+
+                self.tk_owner.after_cancel(_watch["after"])
+
+            except TK.TclError:
+
+                pass
+
+            # end try
+
+        # end if
+
+    # end def
+
+
+
+    def xml_watch (self, interval_ms = None, diff = True):
+        r"""
+            polls loaded XML file every @interval_ms milliseconds
+            (default: self.WATCH_INTERVAL_MS) with tkinter after()
+            and calls xml_reload(diff = @diff) each time file's
+            mtime or size changes, until xml_unwatch() gets called;
+
+            reload errors get printed out, polling goes on;
+
+            returns True if polling has started, False otherwise (no
+            XML file loaded or no tkinter event loop available);
+        """
+
+        # stop previous polling, if any
+
+        self.xml_unwatch()
+
+        # param controls
+
+        if not self.__xml_path or not self.is_tk_parent(self.tk_owner):
+
+            return False
+
+        # end if
+
+        # polling state inits
+
+        self.__watch = {
+
+            "after": None,
+
+            "diff": diff,
+
+            "interval": max(
+
+                10, tools.ensure_int(
+
+                    tools.choose(interval_ms, self.WATCH_INTERVAL_MS)
+                )
+            ),
+
+            "stamp": self._get_xml_stamp(),
+        }
+
+        self.__watch["after"] = self.tk_owner.after(
+
+            self.__watch["interval"], self._slot_xml_watch
+        )
+
+        return True
+
+    # end def
+
+
 # end class RADXMLBase
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import tkinter as TK
+
+
+
+# Tcl command runner lambda: evaluates a list of commands
+# commands are Tcl lists: no script parsing, no quoting at all
+# returns {index error} of faulty command, if any
+
+TCL_RUNNER = """\
+{commands} {
+    set index 0
+    foreach command $commands {
+        if {[catch {{*}$command} error]} {
+            return [list $index $error]
+        }
+        incr index
+    }
+}"""
+
+
+
+class RADXMLBatch:
+    r"""
+        collects tkinter commands which do not need an immediate
+        answer from Tcl (e.g. configure(), pack(), grid(), place())
+        and sends them to Tcl interpreter all at once;
+
+        XML building processors use this to spare one python to
+        Tcl round trip per command;
+
+        CAUTION: pending commands *MUST* be flushed before querying
+        any Tcl state they might change (e.g. w.cget());
+    """
+
+
+
+    # default max number of pending commands before auto-flush
+
+    MAX_SIZE = 500
+
+
+
+    def __init__ (self, interp, max_size = None):
+        r"""
+            class constructor;
+
+            @interp is a tkinter Tcl interpreter e.g. widget.tk;
+        """
+
+        # member inits
+
+        self.__commands = list()
+
+        self.__elements = list()
+
+        self.interp = interp
+
+        # XML element name of next commands, for error messages
+
+        self.element = None
+
+        self.max_size = self.MAX_SIZE if max_size is None else max_size
+
+        # stats
+
+        self.commands = 0
+
+        self.flushes = 0
+
+    # end def
+
+
+
+    def add (self, *words):
+        r"""
+            appends a Tcl command made of @words;
+
+            command is labelled with current self.element XML
+            element name;
+
+            words are given as is to tkinter i.e. strings, numbers,
+            tuples (Tcl lists) or any object with Tcl name as str()
+            value (widgets, control variables, images, etc);
+
+            automatically flushes pending commands once max size
+            is reached;
+
+            no return value (void);
+        """
+
+        self.__commands.append(words)
+
+        self.__elements.append(self.element)
+
+        self.commands += 1
+
+        if len(self.__commands) >= max(1, self.max_size):
+
+            self.flush()
+
+        # end if
+
+    # end def
+
+
+
+    def add_command (self, *args, **options):
+        r"""
+            appends a Tcl command made of @args words and
+            tkinter-like keyword @options, just like
+            tkinter.Misc._options() does: None values are skipped
+            and trailing '_' chars are removed from option names
+            (e.g. in_ --> -in);
+
+            returns True if command has been batched, False
+            otherwise (e.g. python callbacks in @options);
+        """
+
+        # inits
+
+        _words = list(args)
+
+        for _key, _value in options.items():
+
+            # skip unset options
+
+            if _value is None:
+
+                continue
+
+            # python callbacks must be registered by tkinter
+
+            elif callable(_value):
+
+                return False
+
+            # end if
+
+            _words.append("-" + _key.rstrip("_"))
+
+            _words.append(_value)
+
+        # end for
+
+        self.add(*_words)
+
+        return True
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all pending commands;
+
+            no return value (void);
+        """
+
+        self.__commands.clear()
+
+        self.__elements.clear()
+
+    # end def
+
+
+
+    def flush (self):
+        r"""
+            sends all pending commands to Tcl interpreter in one
+            single call;
+
+            raises tkinter.TclError on Tcl errors, with faulty
+            command and its XML element name in error message -
+            commands after faulty one do *NOT* get evaluated;
+
+            no return value (void);
+        """
+
+        # nothing to do?
+
+        if not self.__commands:
+
+            return
+
+        # end if
+
+        _commands = tuple(self.__commands)
+
+        _elements = tuple(self.__elements)
+
+        self.clear()
+
+        self.flushes += 1
+
+        _failure = self.interp.splitlist(
+
+            self.interp.call("apply", TCL_RUNNER, _commands)
+        )
+
+        # faulty command?
+
+        if _failure:
+
+            _index, _error = _failure
+
+            _index = int(_index)
+
+            raise TK.TclError(
+
+                _(
+                    "{error}\n    while executing: {command}"
+
+                    "\n    in XML element: <{element}>"
+
+                ).format(
+
+                    error = _error,
+
+                    command = " ".join(map(str, _commands[_index])),
+
+                    element = _elements[_index],
+                )
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def get_size (self):
+        r"""
+            returns current number of pending commands;
+        """
+
+        return len(self.__commands)
+
+    # end def
+
+
+# end class RADXMLBatch
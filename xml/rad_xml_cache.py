@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import os
+
+import copy
+
+import hashlib
+
+import collections
+
+import xml.etree.ElementTree as ET
+
+from ..core import path as P
+
+
+
+def get_digest (xml_source):
+    r"""
+        computes @xml_source contents digest;
+
+        @xml_source param must be of bytes type;
+
+        returns hexadecimal digest string of chars;
+    """
+
+    return hashlib.sha1(xml_source).hexdigest()
+
+# end def
+
+
+
+# unique instance pointer
+
+# module private var init
+
+__cache = None
+
+
+
+# service getter
+
+def get_xml_cache ():
+    r"""
+        gets a unique application-wide instance of the parsed XML
+        tree cache;
+
+        always return the cache unique instance pointer;
+    """
+
+    global __cache
+
+    if not isinstance(__cache, RADXMLCache):
+
+        __cache = RADXMLCache()
+
+    # end if
+
+    return __cache
+
+# end def
+
+
+
+class RADXMLCache:
+    r"""
+        process-wide, size-bounded LRU cache of parsed XML files;
+
+        entries are keyed by normalized file path and get
+        invalidated as soon as file's mtime or size changes;
+
+        cached XML trees are *NEVER* given away: callers always get
+        a deep copy, as XML building processors may modify XML
+        elements on-the-fly;
+    """
+
+
+
+    # default max number of cached XML files
+
+    MAX_SIZE = 128
+
+
+
+    def __init__ (self, max_size = None):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__entries = collections.OrderedDict()
+
+        self.max_size = self.MAX_SIZE if max_size is None else max_size
+
+        self.hits = 0
+
+        self.misses = 0
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all cached XML trees;
+
+            no return value (void);
+        """
+
+        self.__entries.clear()
+
+        self.hits = 0
+
+        self.misses = 0
+
+    # end def
+
+
+
+    def discard (self, path):
+        r"""
+            drops cached XML tree of @path, if any;
+
+            no return value (void);
+        """
+
+        self.__entries.pop(P.normalize(path), None)
+
+    # end def
+
+
+
+    def _get_entry (self, path):
+        r"""
+            protected method def;
+
+            retrieves cache entry of @path file;
+
+            parses file on cache miss or if file has changed;
+
+            raises OSError on file errors and ET.ParseError on XML
+            syntax errors;
+
+            returns (stamp, root element) tuple;
+        """
+
+        # inits
+
+        path = P.normalize(path)
+
+        _stat = os.stat(path)
+
+        _stamp = (_stat.st_mtime_ns, _stat.st_size)
+
+        _entry = self.__entries.get(path)
+
+        # cache hit?
+
+        if _entry and _entry[0] == _stamp:
+
+            # mark as most recently used
+
+            self.__entries.move_to_end(path)
+
+            self.hits += 1
+
+        # cache miss
+
+        else:
+
+            with open(path, "rb") as _file:
+
+                _source = _file.read()
+
+            # end with
+
+            _entry = (_stamp, ET.fromstring(_source))
+
+            self.__entries[path] = _entry
+
+            self.__entries.move_to_end(path)
+
+            self.misses += 1
+
+            # keep cache bounded
+
+            while len(self.__entries) > max(1, self.max_size):
+
+                self.__entries.popitem(last = False)
+
+            # end while
+
+        # end if
+
+        return _entry
+
+    # end def
+
+
+
+    def get_root (self, path):
+        r"""
+            retrieves parsed XML root element of @path file;
+
+            parses file on cache miss or if file has changed;
+
+            raises OSError on file errors and ET.ParseError on XML
+            syntax errors;
+
+            returns root element deep copy;
+        """
+
+        _entry = self._get_entry(path)
+
+        # do *NOT* share cached XML trees /!\
+
+        return copy.deepcopy(_entry[1])
+
+    # end def
+
+
+
+    def get_source (self, path):
+        r"""
+            retrieves pristine parsed XML root element of @path file
+            i.e. as written in XML file, before any XML building
+            processor has modified it (see RADXMLBase.xml_reload());
+
+            parses file on cache miss or if file has changed;
+
+            CAUTION: returned element is *SHARED* - it must be kept
+            READ-ONLY /!\
+
+            raises OSError on file errors and ET.ParseError on XML
+            syntax errors;
+
+            returns root element;
+        """
+
+        return self._get_entry(path)[1]
+
+    # end def
+
+
+
+    def get_size (self):
+        r"""
+            returns current number of cached XML files;
+        """
+
+        return len(self.__entries)
+
+    # end def
+
+
+# end class RADXMLCache
@@ -0,0 +1,1429 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import re
+
+import keyword
+
+import tkinter as TK
+
+from tkinter import ttk
+
+from ..core import tools
+
+from . import rad_xml_widget as XW
+
+from . import rad_xml_resolver as XV
+
+
+
+# generated python module template
+
+MODULE_TEMPLATE = '''\
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# generated by tkRAD.xml.compile from: {source}
+# do *NOT* edit - regenerate from XML source instead
+
+import tkinter as TK
+
+from tkinter import ttk
+{imports}
+
+
+def build (owner, tk_owner = None):
+    r"""
+        builds tkinter widgets into @tk_owner (default:
+        owner.tk_owner) exactly as owner.xml_build() would do with
+        the original XML source;
+
+        @owner must be a RADXMLWidget subclass instance e.g. a
+        RADXMLFrame object;
+
+        returns True on success;
+    """
+
+    if tk_owner is None:
+
+        tk_owner = owner.tk_owner
+
+    # end if
+
+{body}
+    return True
+
+# end def
+'''
+
+
+
+def get_source (value):
+    r"""
+        converts @value param to its python source code expression;
+
+        raises TypeError if @value cannot be expressed as source;
+
+        returns string of chars;
+    """
+
+    # compile-time stand-in
+
+    if isinstance(value, RADXMLCode):
+
+        return value.get_expr()
+
+    # plain literals
+
+    elif value is None or isinstance(value, (bool, int, float, str)):
+
+        return repr(value)
+
+    # containers
+
+    elif isinstance(value, tuple):
+
+        _items = ", ".join(map(get_source, value))
+
+        return "(" + _items + ("," if len(value) == 1 else "") + ")"
+
+    elif isinstance(value, list):
+
+        return "[" + ", ".join(map(get_source, value)) + "]"
+
+    elif isinstance(value, dict):
+
+        return "{" + ", ".join(
+
+            "{}: {}".format(get_source(_k), get_source(_v))
+
+            for (_k, _v) in value.items()
+
+        ) + "}"
+
+    # end if
+
+    raise TypeError(
+
+        _(
+            "cannot compile value {value} of type {vtype} "
+
+            "into python source code."
+
+        ).format(value = repr(value), vtype = type(value))
+    )
+
+# end def
+
+
+
+def get_call_source (*args, **kw):
+    r"""
+        converts @args and @kw params to python source code
+        function call arguments;
+
+        returns string of chars;
+    """
+
+    # positional arguments
+
+    _args = list(map(get_source, args))
+
+    # keyword arguments - sorted for reproducible output
+
+    _extra = dict()
+
+    for (_key, _value) in sorted(kw.items()):
+
+        if _key.isidentifier() and not keyword.iskeyword(_key):
+
+            _args.append("{}={}".format(_key, get_source(_value)))
+
+        else:
+
+            _extra[_key] = _value
+
+        # end if
+
+    # end for
+
+    # non-identifier keywords e.g. 'from', 'class'
+
+    if _extra:
+
+        _args.append("**" + get_source(_extra))
+
+    # end if
+
+    return ", ".join(_args)
+
+# end def
+
+
+
+class RADXMLCode:
+    r"""
+        compile-time stand-in for any runtime object e.g. widgets,
+        control variables, images or callbacks;
+
+        holds the python source expression giving that object at
+        runtime;
+
+        if @cls is set, stand-in poses as an instance of @cls so
+        that isinstance() checks in XML building processors keep
+        working as with real objects;
+
+        method calls on stand-in get written down as statements in
+        generated code, if a compiler is set;
+    """
+
+
+
+    def __init__ (self, expr, cls = None, compiler = None):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self._tkRAD_expr = expr
+
+        self._tkRAD_cls = cls
+
+        self._tkRAD_compiler = compiler
+
+    # end def
+
+
+
+    @property
+    def __class__ (self):
+        r"""
+            poses as an instance of @cls, if any;
+        """
+
+        return self._tkRAD_cls or RADXMLCode
+
+    # end def
+
+
+
+    def __getattr__ (self, name):
+        r"""
+            records method calls as generated code statements;
+
+            raises AttributeError if @cls does not support method;
+
+            returns callable;
+        """
+
+        # unsupported
+
+        if name.startswith("__") or not self._tkRAD_compiler or \
+                (self._tkRAD_cls and not hasattr(self._tkRAD_cls, name)):
+
+            raise AttributeError(name)
+
+        # end if
+
+        # method call recorder
+
+        def _method (*args, **kw):
+
+            self._tkRAD_compiler.emit(
+
+                "{expr}.{method}({args})".format(
+
+                    expr = self._tkRAD_expr,
+
+                    method = name,
+
+                    args = get_call_source(*args, **kw),
+                )
+            )
+
+        # end def
+
+        return _method
+
+    # end def
+
+
+
+    def __repr__ (self):
+        r"""
+            returns python source expression;
+        """
+
+        return self._tkRAD_expr
+
+    # end def
+
+
+
+    def get_expr (self):
+        r"""
+            returns python source expression;
+        """
+
+        return self._tkRAD_expr
+
+    # end def
+
+
+# end class RADXMLCode
+
+
+
+class RADXMLCompiler (XW.RADXMLWidget):
+    r"""
+        ahead-of-time XML to python code generator;
+
+        runs the RADXMLWidget building process on compile-time
+        stand-in objects and writes down tkinter constructor,
+        configure(), layout and binding calls as a plain python
+        module with a build(owner) function;
+
+        generated code does *NOT* eval() nor exec() any XML
+        attribute at runtime;
+
+        XML elements whose behaviour can only be resolved at
+        runtime are *NOT* supported: <include>, <menu>, <tkmenu>,
+        <ttkstyle> and <ttktheme> - keep on using the XML
+        interpreter for them;
+
+        notice: translated labels are resolved at compile time
+        i.e. generate one module per locale;
+    """
+
+
+
+    # no tkinter commands to batch at compile time
+    # overrides RADXMLBase.TCL_BATCH_SIZE
+
+    TCL_BATCH_SIZE = 0
+
+
+
+    def __init__ (self, **kw):
+        r"""
+            class constructor;
+        """
+
+        # super class inits - no tkinter owner at compile time
+
+        XW.RADXMLWidget.__init__(self, tk_owner = None, **kw)
+
+        # member inits
+
+        self.__imports = list()
+
+        self.__lines = list()
+
+        self.__count = 0
+
+    # end def
+
+
+
+    def _build_element_event (self, xml_tag, xml_element, tk_parent):
+        r"""
+            writes down owner.connect_event(signal, slot) so that
+            destroy_component() disconnects compiled connections as
+            well;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # attribute inits
+
+            _attributes = self._init_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            # connecting people at runtime
+
+            self.emit(
+
+                "owner.connect_event({args})".format(
+
+                    args = get_call_source(
+
+                        _attributes.get("signal"),
+
+                        _attributes.get("slot"),
+                    )
+                )
+            )
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_include (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_listbox (self, xml_tag, xml_element, tk_parent):
+        r"""
+            writes down tkinter Listbox widget building;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.is_tk_parent(tk_parent):
+
+            # widget attribute inits
+
+            _attributes = self._init_deferred_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            # class constructor args
+
+            _args = str(_attributes.get("args", ""))
+
+            if not _args.startswith("tk_parent"):
+
+                _args = "tk_parent, " + _args
+
+            # end if
+
+            # widget inits
+
+            _widget = self._new_object(
+
+                TK.Listbox, "TK.Listbox", _args, tk_parent
+            )
+
+            # flush widget section
+
+            self._queue.flush("widget", widget = _widget)
+
+            # ensure neutrality
+
+            _attributes = _attributes.flatten()
+
+            # keep a copy aboard
+
+            self._register_object_by_id(_widget, _attributes.get("id"))
+
+            # set widget as class member
+
+            self._set_class_member(_attributes.get("name"), _widget)
+
+            # prepare list of choices
+
+            _widget.delete(0, TK.END)
+
+            # choices inits
+
+            _choices = _attributes.get("choices")
+
+            if _choices:
+
+                # fill up widget's list of choices
+
+                _widget.insert(0, *_choices)
+
+                # startup inits
+
+                _start = _attributes.get("start")
+
+                if tools.is_num(_start):
+
+                    if _start > 0:
+
+                        _start = min(_start, len(_choices) - 1)
+
+                    elif _start < 0:
+
+                        _start = max(0, len(_choices) + _start)
+
+                    # end if
+
+                elif _start in _choices:
+
+                    _start = _choices.index(_start)
+
+                else:
+
+                    _start = -1
+
+                # end if
+
+                # set selected line
+
+                _widget.selection_anchor(_start)
+
+                _widget.selection_set(_start)
+
+                _widget.activate(_start)
+
+                _widget.see(_start)
+
+            # end if
+
+            # tk configure()
+
+            self._set_widget_config(_widget, self.TK_CONFIG)
+
+            # set layout
+
+            self._set_layout(_widget, _attributes, tk_parent)
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_menu (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_module (self, xml_tag, xml_element, tk_parent):
+        r"""
+            imports python libs at compile time, as XML interpreter
+            does, and writes down import statement for runtime;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # attribute inits
+
+            _attributes = self._init_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            _statement = "{}{}{}".format(
+
+                tools.str_complete("from {} ", _attributes.get("from")),
+
+                tools.str_complete("import {}", _attributes.get("import")),
+
+                tools.str_complete(" as {}", _attributes.get("as")),
+            )
+
+            # compile-time import - needed for class resolution
+
+            XV.get_resolver().import_names(
+
+                vars(XW),
+
+                from_ = _attributes.get("from"),
+
+                import_ = _attributes.get("import"),
+
+                as_ = _attributes.get("as"),
+            )
+
+            # runtime import
+
+            if _statement not in self.__imports:
+
+                self.__imports.append(_statement)
+
+            # end if
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_optionmenu (self, xml_tag, xml_element, tk_parent):
+        r"""
+            writes down tkinter OptionMenu widget building;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.is_tk_parent(tk_parent):
+
+            # widget attribute inits
+
+            _attributes = self._init_deferred_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            # control variable inits
+
+            _cvar = tools.choose(
+
+                _attributes.get("listvariable"),
+
+                _attributes.get("variable"),
+            )
+
+            if not _cvar:
+
+                _cvar = self._new_object(
+
+                    TK.StringVar, "TK.StringVar", "", tk_parent
+                )
+
+            # end if
+
+            # choices inits
+
+            _choices = tools.choose(
+
+                _attributes.get("choices"),
+
+                [_("<empty>")],
+
+                ["<empty>"],
+            )
+
+            # widget inits
+
+            _widget = self._new_object(
+
+                TK.OptionMenu, "TK.OptionMenu",
+
+                "tk_parent, {}, *{}".format(
+
+                    get_source(_cvar), get_source(_choices)
+                ),
+
+                tk_parent
+            )
+
+            # flush widget section
+
+            self._queue.flush("widget", widget = _widget)
+
+            # ensure neutrality
+
+            _attributes = _attributes.flatten()
+
+            # keep a copy aboard
+
+            self._register_object_by_id(_widget, _attributes.get("id"))
+
+            # set widget as class member
+
+            self._set_class_member(_attributes.get("name"), _widget)
+
+            # startup inits
+
+            _start = _attributes.get("start")
+
+            if tools.is_num(_start):
+
+                if _start > 0:
+
+                    _start = min(_start, len(_choices) - 1)
+
+                elif _start < 0:
+
+                    _start = max(0, len(_choices) + _start)
+
+                # end if
+
+                _start = _choices[_start]
+
+            elif _start not in _choices:
+
+                _start = _choices[0]
+
+            # end if
+
+            _cvar.set(str(_start))
+
+            # set layout
+
+            self._set_layout(_widget, _attributes, tk_parent)
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_scrollbar (self, xml_tag, xml_element, tk_parent):
+        r"""
+            writes down scrollbar widget building and connection;
+
+            returns True on build success, False otherwise;
+        """
+
+        _ok = self._build_tk_native(xml_tag, xml_element, tk_parent)
+
+        # make connections
+
+        _scrollbar = self.WIDGET
+
+        _target = self.TK_CHILD_CONFIG.get("connect")
+
+        if _target and _scrollbar:
+
+            # 'orient' value is only known at runtime
+
+            self.emit(
+
+                "if str({s}.cget('orient')) == 'vertical':\n"
+                "    {t}.configure(yscrollcommand={s}.set)\n"
+                "    {s}.configure(command={t}.yview)\n"
+                "else:\n"
+                "    {t}.configure(xscrollcommand={s}.set)\n"
+                "    {s}.configure(command={t}.xview)"
+
+                .format(s = get_source(_scrollbar), t = get_source(_target))
+            )
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _build_element_tkmenu (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_ttkstyle (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_ttktheme (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_virtuallist (self, xml_tag, xml_element, tk_parent):
+        r"""
+            unsupported in compiled mode;
+        """
+
+        self._unsupported(xml_tag)
+
+    # end def
+
+
+
+    def _build_element_widget (self, xml_tag, xml_element, tk_parent,
+    **kw):
+        r"""
+            writes down generic widget building;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.is_tk_parent(tk_parent):
+
+            # widget attribute inits
+
+            kw.update(addon_attrs = self.ATTRS.get("widget"))
+
+            _attributes = self._init_deferred_attributes(
+
+                xml_tag, xml_element, tk_parent, **kw
+            )
+
+            # widget class inits - compile-time resolution
+
+            _cname = "{}{}".format(
+
+                _attributes.get("module"), _attributes.get("class")
+            )
+
+            _class = XV.get_resolver().get_class(
+
+                _attributes.get("module"), _attributes.get("class"),
+
+                vars(XW)
+            )
+
+            _args = _attributes.get("args", "")
+
+            # tk widget parent autocompletion
+
+            if issubclass(_class, (TK.Widget, TK.Tk)) \
+                                and not _args.startswith("tk_parent"):
+
+                _args = "tk_parent, " + _args
+
+            # end if
+
+            # widget inits
+
+            _widget = self._new_object(_class, _cname, _args, tk_parent)
+
+            # flush widget section
+
+            self._queue.flush("widget", widget = _widget)
+
+            # ensure neutrality
+
+            _attributes = _attributes.flatten()
+
+            # keep a copy aboard
+
+            self._register_object_by_id(_widget, _attributes.get("id"))
+
+            # keep a copy for specific post-implementations
+
+            self.WIDGET = _widget
+
+            # set widget as class member
+
+            self._set_class_member(_attributes.get("name"), _widget)
+
+            # configure widget
+
+            self._set_widget_config(_widget, self.TK_CONFIG)
+
+            # set layout
+
+            self._set_layout(_widget, _attributes, tk_parent)
+
+            # free useless memory right now /!\
+
+            del _class, _args, self.TK_CONFIG
+
+            # loop on XML element children - build tk child widgets
+
+            _build_ok = self._loop_on_children(
+
+                xml_element, _widget,
+
+                accept = tools.choose(
+
+                    self.DTD.get(xml_tag),
+
+                    self.DTD.get("widget"),
+                )
+            )
+
+            # widget init() procedure
+
+            _init = _attributes.get("init")
+
+            if isinstance(_init, RADXMLCode):
+
+                kw.update(
+
+                    widget = _widget,
+
+                    parent = tk_parent,
+
+                    xml_attributes = _attributes,
+                )
+
+                self.emit(
+
+                    "{init}({args})".format(
+
+                        init = get_source(_init),
+
+                        args = get_call_source(**kw),
+                    )
+                )
+
+            # end if
+
+            # succeeded
+
+            return _build_ok
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _new_object (self, cls, cls_expr, args, tk_parent):
+        r"""
+            writes down @cls_expr(@args) object creation with
+            'tk_parent' local name set to @tk_parent;
+
+            returns RADXMLCode stand-in for new object;
+        """
+
+        # new variable name
+
+        self.__count += 1
+
+        _name = "w{}".format(self.__count)
+
+        # write down object creation
+
+        self.emit("tk_parent = " + get_source(tk_parent))
+
+        self.emit(
+
+            "{name} = {cls}({args})".format(
+
+                name = _name,
+
+                cls = cls_expr,
+
+                args = args.strip().rstrip(",").rstrip(),
+            )
+        )
+
+        return RADXMLCode(_name, cls, self)
+
+    # end def
+
+
+
+    def _register_object_by_id (self, built_object, attr_id):
+        r"""
+            registers stand-in at compile time and writes down
+            runtime object registration;
+
+            no return value (void);
+        """
+
+        # compile-time registration
+
+        XW.RADXMLWidget._register_object_by_id(self, built_object, attr_id)
+
+        # runtime registration
+
+        self.emit(
+
+            "owner.register_object_by_id({args})".format(
+
+                args = get_call_source(built_object, attr_id)
+            )
+        )
+
+    # end def
+
+
+
+    def _set_class_member (self, name, widget):
+        r"""
+            writes down runtime class member setting;
+
+            no return value (void);
+        """
+
+        # param controls
+
+        if tools.is_pstr(name):
+
+            self.emit(
+
+                "owner.set_class_member({args})".format(
+
+                    args = get_call_source(name, widget)
+                )
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _set_widget_config (self, widget, config):
+        r"""
+            writes down runtime widget configuration;
+
+            configure() keys filtering is done at runtime as only
+            real tkinter widgets know their own keys;
+
+            returns True on success, False otherwise;
+        """
+
+        # param controls
+
+        if hasattr(widget, "configure") and isinstance(config, dict):
+
+            self.emit(
+
+                "owner.set_widget_config({args})".format(
+
+                    args = get_call_source(widget, config)
+                )
+            )
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _tkRAD_deferred_command_support (self, attribute, *args, **kw):
+        r"""
+            writes down command callbacks along XML interpreter
+            conventions;
+
+            callbacks get widget, tk_parent, xml_tag and xml_attr
+            keywords as there is no XML data at runtime;
+
+            no return value (void);
+        """
+
+        # param controls
+
+        if self._is_new(attribute):
+
+            # strip erroneous parenthesis
+
+            _cmd = re.sub(r"\(.*\)", r"", attribute.value)
+
+            # callback keywords
+
+            _kw = get_source(
+
+                dict(
+
+                    (_key, kw[_key])
+
+                    for _key in ("widget", "tk_parent", "xml_tag", "xml_attr")
+
+                    if _key in kw
+                )
+            )
+
+            # events mechanism support
+
+            if _cmd.startswith("@"):
+
+                _cmd = (
+
+                    "lambda *args, _e={e}, _s=owner.events, kw={kw}: "
+
+                    "_s.raise_event(_e, *args, **kw)"
+
+                ).format(e = repr(_cmd[1:]), kw = _kw)
+
+            else:
+
+                # self.app methods support
+
+                if _cmd.startswith("^"):
+
+                    _cb = "owner.app." + _cmd.lstrip("^.@")
+
+                # self.slot_owner methods support
+
+                elif _cmd.startswith("."):
+
+                    _cb = "owner.slot_owner." + _cmd.lstrip(".^@")
+
+                # global methods support
+
+                else:
+
+                    _cb = _cmd
+
+                # end if
+
+                _cmd = (
+
+                    "lambda *args, _cb={cb}, kw={kw}: _cb(*args, **kw)"
+
+                ).format(cb = _cb, kw = _kw)
+
+            # end if
+
+            # parsed attribute inits
+
+            attribute.value = RADXMLCode("(" + _cmd + ")")
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_widget_support (self, attribute, **kw):
+        r"""
+            resolves widget aliases to runtime expressions;
+
+            no return value (void);
+        """
+
+        # param controls
+
+        if self._is_new(attribute) and attribute.value.startswith("@"):
+
+            # get widget along alias
+
+            _widget = {
+
+                "top": RADXMLCode("tk_owner.winfo_toplevel()"),
+
+                "parent": kw.get("tk_parent"),
+
+            }.get(attribute.value.strip("@").lower())
+
+            if _widget:
+
+                # parsed attribute inits
+
+                attribute.value = _widget
+
+                self._tk_config(attribute, **kw)
+
+            # not found
+
+            else:
+
+                raise KeyError(
+                    _(
+                        "Widget of id '{w_id}' does not exist or "
+                        "has not been registered yet."
+
+                    ).format(w_id = attribute.value)
+                )
+
+            # end if
+
+        else:
+
+            # look for already compiled widget along attr 'id'
+
+            XW.RADXMLWidget._tkRAD_widget_support(self, attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _unsupported (self, xml_tag):
+        r"""
+            raises TypeError for XML elements unsupported in
+            compiled mode;
+        """
+
+        raise TypeError(
+
+            _(
+                "XML element <{xml_tag}> is *NOT* supported in "
+
+                "compiled mode. Please, use XML interpreter instead."
+
+            ).format(xml_tag = xml_tag)
+        )
+
+    # end def
+
+
+
+    def emit (self, source):
+        r"""
+            appends @source python statement(s) to generated code;
+
+            no return value (void);
+        """
+
+        self.__lines.extend(source.split("\n"))
+
+    # end def
+
+
+
+    def get_bitmap_path (self, path):
+        r"""
+            bitmap paths are resolved at runtime;
+
+            returns RADXMLCode stand-in;
+        """
+
+        return RADXMLCode(
+
+            "owner.get_bitmap_path({})".format(get_source(path))
+        )
+
+    # end def
+
+
+
+    def get_python_source (self, source_name = ""):
+        r"""
+            assembles generated python module source code;
+
+            returns string of chars;
+        """
+
+        # imports inits
+
+        _imports = "".join("\n" + _s + "\n" for _s in self.__imports)
+
+        # build() body inits
+
+        _body = "".join(
+
+            ("    " + _line).rstrip() + "\n" for _line in self.__lines
+        )
+
+        return MODULE_TEMPLATE.format(
+
+            source = tools.choose_str(source_name, "<string>"),
+
+            imports = _imports,
+
+            body = _body,
+        )
+
+    # end def
+
+
+
+    def set_cvar (self, vartype, varname):
+        r"""
+            control variables are created at runtime;
+
+            returns RADXMLCode stand-in;
+        """
+
+        # param inits
+
+        vartype = str(vartype).lower()
+
+        _cls = {
+
+            "doublevar": TK.DoubleVar,
+
+            "intvar": TK.IntVar,
+
+            "stringvar": TK.StringVar,
+
+        }.get(vartype)
+
+        # param controls
+
+        if not _cls:
+
+            raise TypeError(
+
+                _(
+                    "Tkinter control variable must be one of type "
+
+                    "'DoubleVar', 'IntVar' or 'StringVar' "
+
+                    "(case insensitive)."
+                )
+            )
+
+        # end if
+
+        return RADXMLCode(
+
+            "owner.set_cvar({})".format(get_call_source(vartype, varname)),
+
+            _cls,
+
+            self,
+        )
+
+    # end def
+
+
+
+    def set_image (self, path, subsample = None, zoom = None):
+        r"""
+            images are loaded at runtime, resized along optional
+            @subsample and @zoom factors (see RADXMLBase.set_image());
+
+            returns RADXMLCode stand-in;
+        """
+
+        # only non-default resizing factors
+
+        _kw = {
+
+            _key: _value
+
+            for _key, _value in (("subsample", subsample), ("zoom", zoom))
+
+            if _value is not None
+        }
+
+        return RADXMLCode(
+
+            "owner.set_image({})".format(get_call_source(path, **_kw)),
+
+            TK.PhotoImage,
+        )
+
+    # end def
+
+
+
+    def xml_compile (self, filename = None):
+        r"""
+            public entry point of XML to python code generation;
+
+            @filename param follows xml_build() conventions;
+
+            raises exceptions on compile errors;
+
+            returns generated python module source code;
+        """
+
+        # member inits
+
+        self.__imports = list()
+
+        self.__lines = list()
+
+        self.__count = 0
+
+        # runtime tk_owner stand-in
+
+        self.tk_owner = RADXMLCode("tk_owner", TK.Widget, self)
+
+        # run XML building process on stand-ins
+
+        if not self.xml_build(filename, silent_mode = True):
+
+            raise ValueError(
+
+                _("could not compile XML source '{}'.").format(filename)
+            )
+
+        # end if
+
+        # source name for generated header
+
+        _name = filename
+
+        if not tools.is_pstr(_name) or self.is_xml(_name):
+
+            _name = ""
+
+        # end if
+
+        return self.get_python_source(_name)
+
+    # end def
+
+
+# end class RADXMLCompiler
@@ -85,4 +85,20 @@ class RADXMLFrame (XW.RADXMLWidget, ttk.Frame):
     # end def
 
 
+
+    def destroy (self):
+        r"""
+            releases all XML component resources (see
+            destroy_component()) before destroying frame itself;
+
+            no return value (void);
+        """
+
+        self.destroy_component()
+
+        ttk.Frame.destroy(self)
+
+    # end def
+
+
 # end class RADXMLFrame
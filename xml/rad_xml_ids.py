@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+class RADXMLIdAllocator:
+    r"""
+        anonymous XML id allocator;
+
+        each id radix (e.g. widget class name) gets its own counter,
+        so that generated ids only depend on the number of objects
+        of the same kind built before, whatever the building order
+        of other kinds is;
+
+        reserved names (e.g. user-defined XML ids) are never given
+        away; names are compared case-insensitively;
+    """
+
+
+
+    def __init__ (self, start = 1):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__counters = dict()
+
+        self.__reserved = set()
+
+        self.start = max(1, start)
+
+    # end def
+
+
+
+    def allocate (self, radix):
+        r"""
+            returns new unique id made of @radix and its own counter
+            value e.g. 'Button12';
+
+            newly allocated id gets reserved;
+        """
+
+        # inits
+
+        _key = radix.lower()
+
+        _count = self.__counters.get(_key, self.start)
+
+        # skip reserved names - each one only once
+
+        while (_key + str(_count)) in self.__reserved:
+
+            _count += 1
+
+        # end while
+
+        self.__counters[_key] = _count + 1
+
+        self.__reserved.add(_key + str(_count))
+
+        return radix + str(_count)
+
+    # end def
+
+
+
+    def allocate_many (self, radix, count):
+        r"""
+            bulk allocation e.g. for repeated templates;
+
+            returns list of @count new unique ids along @radix;
+        """
+
+        return [self.allocate(radix) for _i in range(max(0, count))]
+
+    # end def
+
+
+
+    def is_reserved (self, name):
+        r"""
+            returns True if @name is already taken, False otherwise;
+        """
+
+        return str(name).lower() in self.__reserved
+
+    # end def
+
+
+
+    def reserve (self, *names):
+        r"""
+            marks @names as taken;
+
+            no return value (void);
+        """
+
+        self.__reserved.update(str(_name).lower() for _name in names)
+
+    # end def
+
+
+
+    def reset (self, start = 1):
+        r"""
+            resets all counters to @start value;
+
+            reserved names are kept;
+
+            no return value (void);
+        """
+
+        self.__counters.clear()
+
+        self.start = max(1, start)
+
+    # end def
+
+
+# end class RADXMLIdAllocator
@@ -58,6 +58,31 @@ class RADXMLMenu (XW.RADXMLWidgetBase):
 
 
 
+    # declarative XML attribute parsers
+    # extends RADXMLWidgetBase.ATTRIBUTE_TYPES
+
+    ATTRIBUTE_TYPES = {
+
+        "activeborderwidth": ("dimension", None),
+
+        "columnbreak": ("boolean", None),
+
+        "hidemargin": ("boolean", None),
+
+        "label": ("label", None),
+
+        "postcommand": ("command", None),
+
+        "tearoff": ("boolean", None),
+
+        "tearoffcommand": ("command", None),
+
+        "title": ("label", None),
+
+    } # end of ATTRIBUTE_TYPES
+
+
+
     # default XML attribute values
     # overrides RADXMLWidgetBase.ATTRS
 
@@ -151,8 +176,8 @@ class RADXMLMenu (XW.RADXMLWidgetBase):
 
     SYMBOLS = (
 
-        (re.compile(r"\^+|C-|(?i)co?n?tro?l"), r"Control-"),
-        (re.compile(r"M-|(?i)meta|(?i)alt"), r"Alt-"),
+        (re.compile(r"(?i)\^+|C-|co?n?tro?l"), r"Control-"),
+        (re.compile(r"(?i)M-|meta|alt"), r"Alt-"),
         (re.compile(r"(?i)shi?ft"), r"Shift-"),
         (re.compile(r"\+$"), r"plus"),
         (re.compile(r"\-$"), r"minus"),
@@ -170,12 +195,12 @@ class RADXMLMenu (XW.RADXMLWidgetBase):
         (re.compile(r"\&$"), r"ampersand"),
         (re.compile(r"\#$"), r"numbersign"),
         (re.compile(r"\_$"), r"underscore"),
-        (re.compile(r"(?i)less|(?i)\blt\b"), r"less"),
-        (re.compile(r"(?i)greater|(?i)\bgt\b"), r"greater"),
+        (re.compile(r"(?i)less|\blt\b"), r"less"),
+        (re.compile(r"(?i)greater|\bgt\b"), r"greater"),
         (re.compile(r"(?i)spa?ce?"), r"space"),
         (re.compile(r"(?i)ba?ckspa?ce?"), r"BackSpace"),
         (re.compile(r"(?i)del(?:ete)?\b"), r"Delete"),
-        (re.compile(r"(?i)bre?a?k|(?i)ca?nce?l"), r"Cancel"),
+        (re.compile(r"(?i)bre?a?k|ca?nce?l"), r"Cancel"),
         (re.compile(r"(?i)esc(?:ape)?\b"), r"Escape"),
         (re.compile(r"(?i)tab(?:ulate)?"), r"Tab"),
         (re.compile(r"(?i)ho?me?"), r"Home"),
@@ -705,47 +730,10 @@ class RADXMLMenu (XW.RADXMLWidgetBase):
 
             # sequence inits
 
-            _acc = attribute.value
-
-            # change symbols
-
-            for (_search, _replace) in self.SYMBOLS:
-
-                _acc = _search.sub(_replace, _acc)
-
-            # end for
-
-            # <shift> modifier special case in Tk
-
-            _chunks = _acc.split("-")
-
-            _detail = _chunks[-1]
-
-            # got just one character?
-
-            if len(_detail) == 1:
+            _acc = self._get_parsed_value(
 
-                if "shift" in _acc.lower():
-
-                    # letter must be uppercased /!\
-
-                    _detail = _detail.upper()
-
-                else:
-
-                    # letter must be lowercased /!\
-
-                    _detail = _detail.lower()
-
-                # end if
-
-                # recompose
-
-                _chunks[-1] = _detail
-
-                _acc = "-".join(_chunks)
-
-            # end if
+                "accelerator", attribute.value, self._tkRAD_accelerator_value
+            )
 
             # set for keyboard event binding
 
@@ -765,111 +753,61 @@ class RADXMLMenu (XW.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_activeborderwidth (self, attribute, **kw):
-        r"""
-            width attribute;
-
-            no return value (void);
-        """
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_columnbreak (self, attribute, **kw):
+    def _tkRAD_accelerator_value (self, value):
         r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_hidemargin (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
+            protected method def;
 
-    def _parse_attr_label (self, attribute, **kw):
-        r"""
-            label attribute;
+            side-effect-free 'accelerator' value parser;
 
-            no return value (void);
+            returns tkinter event sequence detail e.g. 'Control-s'
+            without surrounding '<' and '>' chars;
         """
 
-        self._tkRAD_label_support(attribute, **kw)
+        # sequence inits
 
-    # end def
+        _acc = value
 
+        # change symbols
 
+        for (_search, _replace) in self.SYMBOLS:
 
-    def _parse_attr_postcommand (self, attribute, **kw):
-        r"""
-            command attribute;
+            _acc = _search.sub(_replace, _acc)
 
-            no return value (void);
-        """
+        # end for
 
-        self._tkRAD_command_support(attribute, **kw)
+        # <shift> modifier special case in Tk
 
-    # end def
+        _chunks = _acc.split("-")
 
+        _detail = _chunks[-1]
 
+        # got just one character?
 
-    def _parse_attr_tearoff (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
+        if len(_detail) == 1:
 
-    # end def
+            if "shift" in _acc.lower():
 
+                # letter must be uppercased /!\
 
+                _detail = _detail.upper()
 
-    def _parse_attr_tearoffcommand (self, attribute, **kw):
-        r"""
-            command attribute;
+            else:
 
-            no return value (void);
-        """
+                # letter must be lowercased /!\
 
-        self._tkRAD_command_support(attribute, **kw)
+                _detail = _detail.lower()
 
-    # end def
+            # end if
 
+            # recompose
 
+            _chunks[-1] = _detail
 
-    def _parse_attr_title (self, attribute, **kw):
-        r"""
-            label attribute;
+            _acc = "-".join(_chunks)
 
-            no return value (void);
-        """
+        # end if
 
-        self._tkRAD_label_support(attribute, **kw)
+        return _acc
 
     # end def
 
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+
+# lib imports
+
+import collections
+
+
+
+class RADXMLFragment:
+    r"""
+        built XML fragment record (see RADXMLWidget.build_fragment());
+
+        key: (XML file path, tk parent widget path) pool key;
+
+        widgets: built tkinter widgets, topmost ones first;
+
+        layouts: (widget, layout manager, layout options) tuples
+        of topmost widgets, as laid out once built;
+
+        defaults: widget --> configure() options as built;
+
+        cvars: (control variable, value as built) tuples;
+    """
+
+    # lightweight instances
+
+    __slots__ = ("key", "widgets", "layouts", "defaults", "cvars")
+
+
+
+    def __init__ (self, key):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.key = key
+
+        self.widgets = list()
+
+        self.layouts = list()
+
+        self.defaults = dict()
+
+        self.cvars = list()
+
+    # end def
+
+
+# end class RADXMLFragment
+
+
+
+class RADXMLWidgetPool:
+    r"""
+        size-bounded pool of released XML fragments, ready to be
+        handed out again instead of being rebuilt from scratch;
+
+        fragments are pooled by key, at most @size fragments per
+        key and @max_size fragments overall; least recently
+        released fragments get discarded first;
+    """
+
+
+
+    # default max number of pooled fragments per key
+
+    SIZE = 4
+
+
+
+    # default max number of pooled fragments overall
+
+    MAX_SIZE = 32
+
+
+
+    def __init__ (self, size = None, max_size = None):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__fragments = collections.OrderedDict()  # key --> list
+
+        self.__count = 0
+
+        self.size = self.SIZE if size is None else size
+
+        self.max_size = self.MAX_SIZE if max_size is None else max_size
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self.released = 0
+
+        self.discarded = 0
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all pooled fragments and resets statistics;
+
+            returns list of dropped fragments;
+        """
+
+        _dropped = [
+
+            _fragment for _list in self.__fragments.values()
+
+            for _fragment in _list
+        ]
+
+        self.__fragments.clear()
+
+        self.__count = 0
+
+        self.hits = 0
+
+        self.misses = 0
+
+        self.released = 0
+
+        self.discarded = 0
+
+        return _dropped
+
+    # end def
+
+
+
+    def get (self, key, check = None):
+        r"""
+            pops a pooled fragment along @key;
+
+            if @check callable is set, pooled fragments for which
+            check(fragment) is false get dropped and counted as
+            discarded;
+
+            returns fragment on hit, None on miss;
+        """
+
+        _list = self.__fragments.get(key)
+
+        while _list:
+
+            _fragment = _list.pop()
+
+            self.__count -= 1
+
+            if not _list:
+
+                del self.__fragments[key]
+
+            # end if
+
+            if check is None or check(_fragment):
+
+                self.hits += 1
+
+                return _fragment
+
+            # end if
+
+            self.discarded += 1
+
+        # end while
+
+        self.misses += 1
+
+        return None
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns dict(hits, misses, released, discarded, pooled,
+            keys) of pool statistics;
+        """
+
+        return {
+
+            "hits": self.hits,
+
+            "misses": self.misses,
+
+            "released": self.released,
+
+            "discarded": self.discarded,
+
+            "pooled": self.__count,
+
+            "keys": len(self.__fragments),
+        }
+
+    # end def
+
+
+
+    def put (self, fragment):
+        r"""
+            pools @fragment along its key, within size limits;
+
+            returns list of fragments which could not be kept (to be
+            destroyed by caller), possibly including @fragment;
+        """
+
+        # inits
+
+        _dropped = list()
+
+        _list = self.__fragments.setdefault(fragment.key, list())
+
+        self.__fragments.move_to_end(fragment.key)
+
+        self.released += 1
+
+        # per key limit
+
+        if len(_list) >= max(0, self.size):
+
+            _dropped.append(fragment)
+
+        else:
+
+            _list.append(fragment)
+
+            self.__count += 1
+
+        # end if
+
+        # overall limit - least recently released keys first
+
+        while self.__count > max(0, self.max_size):
+
+            _key, _oldest = next(iter(self.__fragments.items()))
+
+            _dropped.append(_oldest.pop(0))
+
+            self.__count -= 1
+
+            if not _oldest:
+
+                del self.__fragments[_key]
+
+            # end if
+
+        # end while
+
+        if not _list:
+
+            self.__fragments.pop(fragment.key, None)
+
+        # end if
+
+        self.discarded += len(_dropped)
+
+        return _dropped
+
+    # end def
+
+
+# end class RADXMLWidgetPool
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import time
+
+import json
+
+import contextlib
+
+
+
+class RADXMLProfiler:
+    r"""
+        opt-in timing collector for XML building processors;
+
+        measures are aggregated by (category, name) e.g.
+        ('element', 'button'), ('attribute', 'layout'),
+        ('queue', 'widget'), ('tk', 'configure'), ('xml', 'load');
+
+        measures may nest: 'total' time of a measure includes its
+        nested measures while 'self' time does not e.g. 'self' time
+        of an XML element excludes its attribute parsing;
+    """
+
+
+
+    # report columns
+
+    COLUMNS = (
+
+        "category", "name", "count", "self_ms", "total_ms", "mean_ms",
+
+        "max_ms",
+    )
+
+
+
+    def __init__ (self):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__stats = dict()
+
+        self.__stack = list()
+
+    # end def
+
+
+
+    def get_json (self, sort = "self_ms", **kw):
+        r"""
+            @kw keywords are passed to json.dumps();
+
+            returns JSON report string of chars;
+        """
+
+        _stats = self.get_stats(sort)
+
+        return json.dumps(
+
+            {
+                "total_ms": self.get_total_ms(),
+
+                "stats": _stats,
+            },
+
+            **kw
+        )
+
+    # end def
+
+
+
+    def get_report (self, limit = None, sort = "self_ms"):
+        r"""
+            @limit sets max number of report lines (default: all);
+
+            @sort sets column for descending sort (default:
+            'self_ms');
+
+            returns text table report string of chars;
+        """
+
+        # inits
+
+        _stats = self.get_stats(sort)[:limit]
+
+        _rows = [self.COLUMNS] + [
+
+            (
+                _stat["category"], _stat["name"], str(_stat["count"]),
+
+                "{:.3f}".format(_stat["self_ms"]),
+
+                "{:.3f}".format(_stat["total_ms"]),
+
+                "{:.3f}".format(_stat["mean_ms"]),
+
+                "{:.3f}".format(_stat["max_ms"]),
+            )
+
+            for _stat in _stats
+        ]
+
+        _widths = [max(len(_row[_i]) for _row in _rows)
+
+                                    for _i in range(len(self.COLUMNS))]
+
+        _lines = list()
+
+        for _row in _rows:
+
+            # text columns on left, numbers on right
+
+            _lines.append(
+
+                "  ".join(
+
+                    _cell.ljust(_width) if _i < 2 else _cell.rjust(_width)
+
+                    for _i, (_cell, _width) in enumerate(zip(_row, _widths))
+                )
+            )
+
+        # end for
+
+        # header separator
+
+        _lines.insert(1, "-" * len(_lines[0]))
+
+        _lines.append(
+
+            _("total: {:.3f} ms").format(self.get_total_ms())
+        )
+
+        return "\n".join(_lines)
+
+    # end def
+
+
+
+    def get_stats (self, sort = "self_ms"):
+        r"""
+            returns list of stats dicts with self.COLUMNS keys,
+            sorted along @sort column, in descending order;
+        """
+
+        _stats = list()
+
+        for (_category, _name), _stat in self.__stats.items():
+
+            _stats.append(
+
+                {
+                    "category": _category,
+
+                    "name": _name,
+
+                    "count": _stat[0],
+
+                    "self_ms": _stat[2] * 1000.0,
+
+                    "total_ms": _stat[1] * 1000.0,
+
+                    "mean_ms": _stat[1] * 1000.0 / _stat[0],
+
+                    "max_ms": _stat[3] * 1000.0,
+                }
+            )
+
+        # end for
+
+        _stats.sort(key = lambda s: s[sort], reverse = True)
+
+        return _stats
+
+    # end def
+
+
+
+    def get_total_ms (self):
+        r"""
+            returns sum of all 'self' times in milliseconds i.e.
+            overall measured time;
+        """
+
+        return sum(_stat[2] for _stat in self.__stats.values()) * 1000.0
+
+    # end def
+
+
+
+    @contextlib.contextmanager
+    def measure (self, category, name):
+        r"""
+            context manager measuring its inner block as a
+            (@category, @name) measure;
+        """
+
+        _start = self.start()
+
+        try:
+
+            yield self
+
+        finally:
+
+            self.stop(category, name, _start)
+
+        # end try
+
+    # end def
+
+
+
+    def reset (self):
+        r"""
+            drops all measures;
+
+            no return value (void);
+        """
+
+        self.__stats.clear()
+
+        self.__stack.clear()
+
+    # end def
+
+
+
+    def start (self):
+        r"""
+            starts a new measure;
+
+            returns measure start token to be given to stop();
+        """
+
+        # nested measures time accumulator
+
+        self.__stack.append(0.0)
+
+        return (time.perf_counter(), len(self.__stack))
+
+    # end def
+
+
+
+    def stop (self, category, name, start):
+        r"""
+            stops measure of @start token (see start()) and
+            aggregates it as a (@category, @name) measure;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _elapsed = time.perf_counter() - start[0]
+
+        # drop measures left over by exceptions, if any
+
+        del self.__stack[start[1]:]
+
+        _nested = self.__stack.pop()
+
+        # nested into parent measure
+
+        if self.__stack:
+
+            self.__stack[-1] += _elapsed
+
+        # end if
+
+        # count, total, self, max
+
+        _stat = self.__stats.setdefault(
+
+            (category, name), [0, 0.0, 0.0, 0.0]
+        )
+
+        _stat[0] += 1
+
+        _stat[1] += _elapsed
+
+        _stat[2] += _elapsed - _nested
+
+        _stat[3] = max(_stat[3], _elapsed)
+
+    # end def
+
+
+
+    def wrap_queue (self, queue):
+        r"""
+            returns @queue (core.defer.DeferQueue) wrapped so that
+            its flush() calls get measured as ('queue', section);
+        """
+
+        return RADXMLProfiledQueue(queue, self)
+
+    # end def
+
+
+# end class RADXMLProfiler
+
+
+
+class RADXMLProfiledQueue:
+    r"""
+        measuring proxy of a core.defer.DeferQueue object;
+    """
+
+
+
+    def __init__ (self, queue, profiler):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.queue = queue
+
+        self.profiler = profiler
+
+    # end def
+
+
+
+    def __getattr__ (self, name):
+        r"""
+            delegates any other member to wrapped queue;
+        """
+
+        return getattr(self.queue, name)
+
+    # end def
+
+
+
+    def flush (self, section, *args, **kw):
+        r"""
+            measured DeferQueue.flush();
+
+            no return value (void);
+        """
+
+        _start = self.profiler.start()
+
+        try:
+
+            self.queue.flush(section, *args, **kw)
+
+        finally:
+
+            self.profiler.stop("queue", section, _start)
+
+        # end try
+
+    # end def
+
+
+
+    def flush_all (self, *args, **kw):
+        r"""
+            measured DeferQueue.flush_all();
+
+            no return value (void);
+        """
+
+        self.flush_many(list(self.queue.get_queue().keys()), *args, **kw)
+
+        self.queue.clear()
+
+    # end def
+
+
+
+    def flush_many (self, sections, *args, **kw):
+        r"""
+            measured DeferQueue.flush_many();
+
+            no return value (void);
+        """
+
+        for _section in sections:
+
+            self.flush(_section, *args, **kw)
+
+        # end for
+
+    # end def
+
+
+# end class RADXMLProfiledQueue
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import ast
+
+import builtins
+
+import importlib
+
+
+
+# unique instance pointer
+
+# module private var init
+
+__resolver = None
+
+
+
+# service getter
+
+def get_resolver ():
+    r"""
+        gets a unique application-wide instance of the XML python
+        names resolver;
+
+        always return the resolver unique instance pointer;
+    """
+
+    global __resolver
+
+    if not isinstance(__resolver, RADXMLResolver):
+
+        __resolver = RADXMLResolver()
+
+    # end if
+
+    return __resolver
+
+# end def
+
+
+
+class RADXMLResolver:
+    r"""
+        process-wide, eval()-free resolution of python names used
+        in XML sources i.e. <module> imports, <widget> classes
+        along their 'module' and 'class' attributes and 'args'
+        class constructor arguments;
+
+        modules get imported through importlib only once, classes
+        get resolved only once per (namespace, module, class) key
+        and 'args' strings of chars get parsed only once into
+        reusable call specs;
+
+        in call specs, literal constants and dotted names (e.g.
+        'TK.VERTICAL') are evaluated without any eval() at all,
+        other python expressions get compiled only once;
+    """
+
+
+
+    def __init__ (self):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__modules = dict()     # (name, package) --> module
+
+        self.__classes = dict()     # (namespace, module, class) --> class
+
+        self.__calls = dict()       # args --> call spec
+
+        self.hits = 0
+
+        self.misses = 0
+
+    # end def
+
+
+
+    def _get_call_spec (self, args):
+        r"""
+            protected method def;
+
+            parses @args class constructor arguments string of chars
+            into a call spec i.e. (positional, keywords) tuple of
+            (flag, kind, value) items where flag is either
+            '*' / None for positional args or keyword name / None
+            (for '**' args) for keyword args and (kind, value) are
+            given by _get_value_spec();
+
+            raises SyntaxError on malformed @args;
+
+            returns call spec;
+        """
+
+        # inits
+
+        _call = ast.parse("_({})".format(args), mode = "eval").body
+
+        _positional = list()
+
+        for _arg in _call.args:
+
+            if isinstance(_arg, ast.Starred):
+
+                _positional.append(
+
+                    ("*",) + self._get_value_spec(_arg.value)
+                )
+
+            else:
+
+                _positional.append((None,) + self._get_value_spec(_arg))
+
+            # end if
+
+        # end for
+
+        _keywords = [
+
+            (_kw.arg,) + self._get_value_spec(_kw.value)
+
+            for _kw in _call.keywords
+        ]
+
+        return (tuple(_positional), tuple(_keywords))
+
+    # end def
+
+
+
+    def _get_value (self, kind, value, namespace, names):
+        r"""
+            protected method def;
+
+            evaluates (@kind, @value) value spec (see
+            _get_value_spec()) in @namespace with @names local
+            names;
+
+            returns evaluated value;
+        """
+
+        # literal constant
+
+        if kind == "const":
+
+            return value
+
+        # dotted name
+
+        elif kind == "name":
+
+            _value = self._get_name(value[0], namespace, names)
+
+            for _attr in value[1:]:
+
+                _value = getattr(_value, _attr)
+
+            # end for
+
+            return _value
+
+        # end if
+
+        # compiled expression
+
+        return eval(value, namespace, names)
+
+    # end def
+
+
+
+    def _get_name (self, name, namespace, names = None):
+        r"""
+            protected method def;
+
+            looks up @name in @names local names, then in
+            @namespace and finally in python builtins;
+
+            raises NameError if not found;
+
+            returns value;
+        """
+
+        if names and name in names:
+
+            return names[name]
+
+        elif name in namespace:
+
+            return namespace[name]
+
+        elif hasattr(builtins, name):
+
+            return getattr(builtins, name)
+
+        # end if
+
+        raise NameError(
+
+            _("name '{name}' is not defined.").format(name = name)
+        )
+
+    # end def
+
+
+
+    def _get_value_spec (self, node):
+        r"""
+            protected method def;
+
+            returns (kind, value) spec of @node python expression
+            where kind is either 'const' (immutable literal value),
+            'name' (tuple of dotted name parts) or 'code' (compiled
+            expression);
+        """
+
+        # dotted name?
+
+        _parts = list()
+
+        _node = node
+
+        while isinstance(_node, ast.Attribute):
+
+            _parts.insert(0, _node.attr)
+
+            _node = _node.value
+
+        # end while
+
+        if isinstance(_node, ast.Name):
+
+            return ("name", (_node.id,) + tuple(_parts))
+
+        # end if
+
+        # immutable literal?
+
+        try:
+
+            _value = ast.literal_eval(node)
+
+            hash(_value)
+
+            return ("const", _value)
+
+        except (ValueError, TypeError, SyntaxError):
+
+            pass
+
+        # end try
+
+        # any other expression - compiled only once
+
+        return (
+
+            "code",
+
+            compile(ast.Expression(body = node), "<args>", "eval"),
+        )
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all cached modules, classes and call specs;
+
+            no return value (void);
+        """
+
+        self.__modules.clear()
+
+        self.__classes.clear()
+
+        self.__calls.clear()
+
+        self.hits = 0
+
+        self.misses = 0
+
+    # end def
+
+
+
+    def get_arguments (self, args, namespace, **names):
+        r"""
+            evaluates @args class constructor arguments string of
+            chars in @namespace dict() with @names extra local names
+            (e.g. tk_parent=widget);
+
+            @args gets parsed only once, whatever namespace is;
+
+            raises SyntaxError on malformed @args;
+
+            returns (positional args tuple, keyword args dict)
+            tuple;
+        """
+
+        # inits
+
+        args = str(args or "").strip()
+
+        try:
+
+            _positional, _keywords = self.__calls[args]
+
+            self.hits += 1
+
+        except KeyError:
+
+            _positional, _keywords = self.__calls.setdefault(
+
+                args, self._get_call_spec(args)
+            )
+
+            self.misses += 1
+
+        # end try
+
+        # positional args
+
+        _args = list()
+
+        for _flag, _kind, _value in _positional:
+
+            _value = self._get_value(_kind, _value, namespace, names)
+
+            if _flag:
+
+                _args.extend(_value)
+
+            else:
+
+                _args.append(_value)
+
+            # end if
+
+        # end for
+
+        # keyword args
+
+        _kw = dict()
+
+        for _flag, _kind, _value in _keywords:
+
+            _value = self._get_value(_kind, _value, namespace, names)
+
+            if _flag:
+
+                _kw[_flag] = _value
+
+            else:
+
+                _kw.update(_value)
+
+            # end if
+
+        # end for
+
+        return (tuple(_args), _kw)
+
+    # end def
+
+
+
+    def get_class (self, module, classname, namespace):
+        r"""
+            resolves @classname class of @module dotted module name
+            (may be empty or end with a dot e.g. 'TK.') in
+            @namespace dict() e.g. globals();
+
+            falls back to importing @module if its first part is
+            not defined in @namespace;
+
+            raises NameError, AttributeError or ImportError on
+            failure;
+
+            returns class object;
+        """
+
+        # inits
+
+        _key = (id(namespace), module, classname)
+
+        try:
+
+            _class = self.__classes[_key]
+
+            self.hits += 1
+
+            return _class
+
+        except KeyError:
+
+            self.misses += 1
+
+        # end try
+
+        # dotted name parts
+
+        _parts = [
+
+            _part for _part in
+
+            "{}.{}".format(module or "", classname).split(".")
+
+            if _part
+        ]
+
+        # defined in namespace?
+
+        try:
+
+            _value = self._get_name(_parts[0], namespace)
+
+            _parts = _parts[1:]
+
+        except NameError:
+
+            # fall back to module import
+
+            if len(_parts) < 2:
+
+                raise
+
+            # end if
+
+            _value = self.import_module(".".join(_parts[:-1]))
+
+            _parts = _parts[-1:]
+
+        # end try
+
+        for _attr in _parts:
+
+            _value = getattr(_value, _attr)
+
+        # end for
+
+        self.__classes[_key] = _value
+
+        return _value
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns dict(hits, misses, modules, classes, calls) of
+            cache stats;
+        """
+
+        return {
+
+            "hits": self.hits,
+
+            "misses": self.misses,
+
+            "modules": len(self.__modules),
+
+            "classes": len(self.__classes),
+
+            "calls": len(self.__calls),
+        }
+
+    # end def
+
+
+
+    def import_module (self, name, package = None):
+        r"""
+            imports @name module (relative to @package if @name
+            starts with a dot) through importlib, only once;
+
+            raises ImportError on failure;
+
+            returns module object;
+        """
+
+        # inits
+
+        _key = (name, package if name.startswith(".") else None)
+
+        try:
+
+            return self.__modules[_key]
+
+        except KeyError:
+
+            return self.__modules.setdefault(
+
+                _key, importlib.import_module(name, _key[1])
+            )
+
+        # end try
+
+    # end def
+
+
+
+    def import_names (self, namespace, from_ = None, import_ = None,
+    as_ = None):
+        r"""
+            same as exec("[from @from_ ]import @import_[ as @as_]",
+            @namespace) but without any exec();
+
+            relative @from_ module names are relative to
+            @namespace['__package__'];
+
+            drops cached classes of @namespace as names may have
+            been rebound;
+
+            raises ImportError on failure;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _package = namespace.get("__package__")
+
+        # from ... import ...
+
+        if from_:
+
+            _module = self.import_module(from_, _package)
+
+            # from ... import *
+
+            if import_ == "*":
+
+                _names = getattr(_module, "__all__", None) or [
+
+                    _name for _name in vars(_module)
+
+                    if not _name.startswith("_")
+                ]
+
+                for _name in _names:
+
+                    namespace[_name] = getattr(_module, _name)
+
+                # end for
+
+            else:
+
+                # module member or submodule
+
+                try:
+
+                    _value = getattr(_module, import_)
+
+                except AttributeError:
+
+                    _value = self.import_module(
+
+                        "{}.{}".format(_module.__name__, import_)
+                    )
+
+                # end try
+
+                namespace[as_ or import_] = _value
+
+            # end if
+
+        # import ... as ...
+
+        elif as_:
+
+            namespace[as_] = self.import_module(import_, _package)
+
+        # import ...
+
+        elif import_ and import_ != "*":
+
+            self.import_module(import_, _package)
+
+            _name = import_.split(".")[0]
+
+            namespace[_name] = self.import_module(_name)
+
+        else:
+
+            raise ImportError(
+
+                _("invalid import statement: '{}'.").format(import_)
+            )
+
+        # end if
+
+        # names may have been rebound
+
+        _id = id(namespace)
+
+        for _key in [_k for _k in self.__classes if _k[0] == _id]:
+
+            del self.__classes[_key]
+
+        # end for
+
+    # end def
+
+
+# end class RADXMLResolver
@@ -28,6 +28,10 @@
 
 import re
 
+import os.path as OP
+
+import xml.etree.ElementTree as ET
+
 import tkinter as TK
 
 from tkinter import ttk
@@ -36,8 +40,16 @@ from ..core import tools
 
 from ..core import path
 
+from ..widgets import rad_virtual_listbox as VL
+
 from . import rad_xml_widget_base as RB
 
+from . import rad_xml_cache as XC
+
+from . import rad_xml_pool as XO
+
+from . import rad_xml_resolver as XV
+
 
 
 class RADXMLWidget (RB.RADXMLWidgetBase):
@@ -82,6 +94,303 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    # declarative XML attribute parsers
+    # extends RADXMLWidgetBase.ATTRIBUTE_TYPES
+
+    ATTRIBUTE_TYPES = {
+
+        "_after": ("widget", dict(tk_child_config = True)),
+
+        "_before": ("widget", dict(tk_child_config = True)),
+
+        "_height": ("dimension", dict(tk_child_config = True)),
+
+        "_minsize": ("dimension", dict(tk_child_config = True)),
+
+        "_padx": ("dimension", dict(tk_child_config = True)),
+
+        "_pady": ("dimension", dict(tk_child_config = True)),
+
+        "_width": ("dimension", dict(tk_child_config = True)),
+
+        "activerelief": ("relief", None),
+
+        "activestyle": (
+
+            "values",
+
+            dict(
+                default = "dotbox",
+                values = ("underline", "none"),
+            ),
+        ),
+
+        "after": ("widget", dict(tk_child_config = True)),
+
+        "aspect": ("integer", None),
+
+        "autoseparators": ("boolean", None),
+
+        "before": ("widget", dict(tk_child_config = True)),
+
+        "bind": (
+
+            "values",
+
+            dict(
+                default = "bind",
+                values = ("bind_class", "bind_all"),
+                no_tk_config = True,
+            ),
+        ),
+
+        "buttonbackground": ("color", None),
+
+        "buttoncursor": ("cursor", None),
+
+        "buttondownrelief": ("relief", None),
+
+        "buttonup": ("relief", None),
+
+        "class_": ("any_value", None),
+
+        "closeenough": ("float", None),
+
+        "confine": ("boolean", None),
+
+        "connect": ("widget", dict(tk_child_config = True)),
+
+        "default": ("state", None),
+
+        "digits": ("integer", None),
+
+        "direction": (
+
+            "values",
+
+            dict(
+                default = "below",
+                values = ("above", "flush", "left", "right"),
+            ),
+        ),
+
+        "disabledbackground": ("color", None),
+
+        "elementborderwidth": ("dimension", None),
+
+        "exportselection": ("boolean", None),
+
+        "from_": ("float", None),
+
+        "handlepad": ("dimension", None),
+
+        "handlesize": ("dimension", None),
+
+        "highlightbackground": ("color", None),
+
+        "highlightcolor": ("color", None),
+
+        "highlightthickness": ("dimension", None),
+
+        "increment": ("float", None),
+
+        "indicatorcolor": ("color", None),
+
+        "indicatoron": ("boolean", None),
+
+        "init": ("command", dict(no_tk_config = True)),
+
+        "insertbackground": ("color", None),
+
+        "insertborderwidth": ("dimension", None),
+
+        "insertofftime": ("integer", None),
+
+        "insertontime": ("integer", None),
+
+        "insertwidth": ("dimension", None),
+
+        "invalidcommand": ("command", None),
+
+        "jump": ("boolean", None),
+
+        "justify": (
+
+            "values",
+
+            dict(
+                default = "center",
+                values = ("left", "right"),
+            ),
+        ),
+
+        "label": ("label", None),
+
+        "labelwidget": ("widget", None),
+
+        "layout": (
+
+            "values",
+
+            dict(
+                default = "none",
+                values = ("pack", "grid", "place"),
+                no_tk_config = True,
+            ),
+        ),
+
+        "lazy": ("boolean", dict(no_tk_config = True)),
+
+        "length": ("dimension", None),
+
+        "listvariable": ("cvar", None),
+
+        "maxheight": ("integer", dict(no_tk_config = True)),
+
+        "maximum": ("integer", None),
+
+        "maxundo": ("integer", None),
+
+        "maxwidth": ("integer", dict(no_tk_config = True)),
+
+        "minheight": ("integer", dict(no_tk_config = True)),
+
+        "minsize": ("dimension", dict(tk_child_config = True)),
+
+        "minwidth": ("integer", dict(no_tk_config = True)),
+
+        "mode": (
+
+            "values",
+
+            dict(
+                default = "determinate",
+                values = ("indeterminate", ),
+            ),
+        ),
+
+        "offrelief": ("relief", None),
+
+        "opaqueresize": ("boolean", None),
+
+        "overrelief": ("relief", None),
+
+        "padding": ("dimension", None),
+
+        "padx": ("dimension", None),
+
+        "pady": ("dimension", None),
+
+        "readonlybackground": ("color", None),
+
+        "repeatdelay": ("integer", None),
+
+        "repeatinterval": ("integer", None),
+
+        "resizable": (
+
+            "values",
+
+            dict(
+                default = "no",
+                values = ("yes", "width", "height"),
+                no_tk_config = True,
+            ),
+        ),
+
+        "resolution": ("float", None),
+
+        "rowbind": ("command", dict(no_tk_config = True)),
+
+        "rows": ("integer", dict(no_tk_config = True)),
+
+        "sashpad": ("dimension", None),
+
+        "sashrelief": ("relief", None),
+
+        "sashwidth": ("dimension", None),
+
+        "selectbackground": ("color", None),
+
+        "selectborderwidth": ("dimension", None),
+
+        "selectforeground": ("color", None),
+
+        "showhandle": ("boolean", None),
+
+        "showvalue": ("boolean", None),
+
+        "sliderlength": ("dimension", None),
+
+        "sliderrelief": ("relief", None),
+
+        "slot": ("command", None),
+
+        "spacing1": ("dimension", None),
+
+        "spacing2": ("dimension", None),
+
+        "spacing3": ("dimension", None),
+
+        "takefocus": ("boolean", None),
+
+        "text": ("label", None),
+
+        "textvariable": ("cvar", None),
+
+        "tickinterval": ("float", None),
+
+        "title": ("label", dict(no_tk_config = True)),
+
+        "to": ("float", None),
+
+        "transient": ("widget", dict(no_tk_config = True)),
+
+        "troughcolor": ("color", None),
+
+        "undo": ("boolean", None),
+
+        "validate": (
+
+            "values",
+
+            dict(
+                default = "none",
+                values = ("focus", "focusin", "focusout", "key", "all"),
+            ),
+        ),
+
+        "validatecommand": ("command", None),
+
+        "virtual": ("boolean", dict(no_tk_config = True)),
+
+        "visibility": (
+
+            "values",
+
+            dict(
+                no_tk_config = True,
+                default = "normal",
+                values = ("maximized", "minimized", "hidden"),
+            ),
+        ),
+
+        "weight": ("integer", dict(tk_child_config = True)),
+
+        "wraplength": ("dimension", None),
+
+        "xscrollcommand": ("command", None),
+
+        "xscrollincrement": ("dimension", None),
+
+        "yscrollcommand": ("command", None),
+
+        "yscrollincrement": ("dimension", None),
+
+    } # end of ATTRIBUTE_TYPES
+
+
+
     # default XML attribute values
     # overrides RADXMLWidgetBase.ATTRS
 
@@ -137,6 +446,16 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
         "tkwidget": {
         },
 
+        "virtuallist": {
+            #~ "name": None,
+            "rowtemplate": None,
+            "rows": None,
+            "rowbind": None,
+            "layout": None,         # can be: None or pack|grid|place
+            "layout_options": None, # pack_opts|grid_opts|place_opts
+            "resizable": "no",      # can be: no|yes|width|height
+        },
+
         "ttkbutton": {
             "underline": None,
         },
@@ -288,12 +607,61 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
         "widget": (
             "configure", "event", "include", "layout", "module",
             "style", "tkevent", "tkmenu", "ttkstyle", "ttktheme",
-            "widget",
+            "virtuallist", "widget",
         ) + tuple(CLASSES.keys()),
 
     } # end of DTD
 
 
+    # tkinter default layout methods
+    # used to detect overridden layout methods in subclasses
+
+    LAYOUT_METHODS = {
+
+        "grid": TK.Grid.grid_configure,
+
+        "pack": TK.Pack.pack_configure,
+
+        "place": TK.Place.place_configure,
+
+    } # end of LAYOUT_METHODS
+
+
+
+    # per-class tkinter configure() option names
+    # (widget class, Tk widget command) --> frozenset or None
+    # CAUTION: do *NOT* UPPERCASE this name - must be shared /!\
+
+    __config_keys = dict()
+
+
+
+    # Tcl procedure applying a compiled <ttkstyle> stylesheet in one
+    # single Tcl call, only once per Tcl interpreter and ttk theme
+    # args: stylesheet key, {element {-option value ...} ...},
+    # {element option {statespec value ...} ...}
+
+    TCL_TTKSTYLE = """{key confs maps} {
+        set key "$key/$ttk::currentTheme"
+        if {[info exists ::tkRAD_ttkstyles($key)]} {return 0}
+        foreach {e opts} $confs {ttk::style configure $e {*}$opts}
+        foreach {e k specs} $maps {
+            ttk::style map $e -$k [concat $specs [ttk::style map $e -$k]]
+        }
+        set ::tkRAD_ttkstyles($key) 1
+        return 1
+    }"""
+
+
+
+    # compiled <ttkstyle> stylesheets
+    # CSS-like text contents digest --> rules tuple
+    # CAUTION: do *NOT* UPPERCASE this name - must be shared /!\
+
+    __ttkstyles = dict()
+
+
+
     # XML file path parts for xml_build() automatic mode
     # overrides RADXMLBase.XML_RC
 
@@ -307,10 +675,96 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def __init__ (self, tk_owner = None, **kw):
+        r"""
+            class constructor;
+        """
+
+        # lazy <ttktab> member inits
+
+        self.__lazy_tabs = dict()   # tab path --> (tab, element, accept,
+                                    # init)
+
+        self.__lazy_ids = None      # XML id --> tab path index
+
+        self.__lazy_binds = dict()  # notebook path --> (notebook, funcid)
+
+        # recycled XML fragments (see build_fragment())
+
+        self.__pool = XO.RADXMLWidgetPool(
+
+            kw.get("pool_size"), kw.get("pool_max_size")
+        )
+
+        # super class inits
+
+        RB.RADXMLWidgetBase.__init__(self, tk_owner, **kw)
+
+    # end def
+
+
+
     # ------------------  XML elements building  -----------------------
 
 
 
+    def _batch_command (self, widget, method_name, default_method,
+    *args, **options):
+        r"""
+            protected method def;
+
+            tries to batch Tcl command made of @args words and
+            @options keywords instead of calling
+            @widget.@method_name(**options) right now;
+
+            batching is only possible while building, for plain
+            tkinter @default_method methods (i.e. not overridden in
+            @widget's class) and with no python callbacks in
+            @options;
+
+            pending commands get flushed if batching is *NOT*
+            possible, so that caller's direct call keeps commands
+            in order;
+
+            returns True if command has been batched, False
+            otherwise;
+        """
+
+        # not building?
+
+        if not self._batch:
+
+            return False
+
+        # end if
+
+        # plain tkinter method?
+
+        if default_method is not None \
+                and getattr(widget, "tk", None) is self._batch.interp \
+                and getattr(type(widget), method_name, None) \
+                                                    is default_method:
+
+            if self._batch.add_command(*args, **options):
+
+                return True
+
+            # end if
+
+        # end if
+
+        # keep commands in order
+
+        self._flush_batch()
+
+        # caller must do it by itself
+
+        return False
+
+    # end def
+
+
+
     def _build_element_button (self, xml_tag, xml_element, tk_parent):
         r"""
             Tkinter native widget building;
@@ -444,8 +898,9 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
             )
 
             # connecting people :-)
+            # connections get released by destroy_component()
 
-            return self.events.connect(
+            return self._connect_event(
 
                 _attributes.get("signal"), _attributes.get("slot")
             )
@@ -493,37 +948,34 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                 xml_tag, xml_element, tk_parent
             )
 
-            # set inclusion widget
-
-            _widget = RADXMLWidget(
-
-                tk_owner = tk_parent,
+            # $ 2014-02-09 RS $
+            # CAUTION:
+            # removed self-inclusion security;
+            # let Python handle this trap!
 
-                slot_owner = self.slot_owner,
+            # get XML tree from shared cache
+            # no more temporary RADXMLWidget object
 
-                **_attributes
-            )
+            try:
 
-            # ensure there won't be any unexpected inclusion /!\
+                xml_element = XC.get_xml_cache().get_root(
 
-            _widget.XML_RC.clear()
+                    self._get_include_path(_attributes)
+                )
 
-            # $ 2014-02-09 RS $
-            # CAUTION:
-            # removed self-inclusion security;
-            # let Python handle this trap!
+            except ET.ParseError:
 
-            # get XML tree
+                raise RuntimeError(
 
-            _widget.xml_load(_attributes.get("src"))
+                    _("XML source code may contain some errors.")
 
-            # include new XML tree to current one
+                ) from None
 
-            xml_element = _widget.get_xml_tree().getroot()
+            # end try
 
             # free useless memory right now /!\
 
-            del _attributes, _widget
+            del _attributes
 
             # build inclusion
 
@@ -628,19 +1080,39 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                 xml_tag, xml_element, tk_parent
             )
 
-            # class constructor args
+            # virtualized list mode
 
-            _args = str(_attributes.get("args", ""))
+            _virtual = _attributes.get("virtual")
 
-            if not _args.startswith("tk_parent"):
+            if _virtual:
 
-                _args = "tk_parent, " + _args
+                _widget = VL.RADVirtualListbox(
 
-            # end if
+                    tk_parent, rows = self.TK_CONFIG.get("height")
+                )
 
-            # widget class inits
+            else:
+
+                # class constructor args
+
+                _args = str(_attributes.get("args", ""))
+
+                if not _args.startswith("tk_parent"):
+
+                    _args = "tk_parent, " + _args
+
+                # end if
+
+                # widget class inits
+
+                _args, _kw = XV.get_resolver().get_arguments(
 
-            _widget = eval("TK.Listbox({args})".format(args = _args))
+                    _args, globals(), tk_parent = tk_parent
+                )
+
+                _widget = TK.Listbox(*_args, **_kw)
+
+            # end if
 
             # $ 2014-03-10 RS $
             # since v1.4: deferred tasks
@@ -660,20 +1132,12 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             self._set_class_member(_attributes.get("name"), _widget)
 
-            # prepare list of choices
-
-            _widget.delete(0, TK.END)
-
             # choices inits
 
             _choices = _attributes.get("choices")
 
             if _choices:
 
-                # fill up widget's list of choices
-
-                _widget.insert(0, *_choices)
-
                 # startup inits
 
                 _start = _attributes.get("start")
@@ -700,29 +1164,53 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
                 # end if
 
-                # set selected line
+                # virtual list: only visible lines get filled up
 
-                _widget.selection_anchor(_start)
+                if _virtual:
 
-                _widget.selection_set(_start)
+                    _widget.set_data(_choices, _start)
 
-                _widget.activate(_start)
+                else:
 
-                _widget.see(_start)
+                    # fill up widget's list of choices
 
-            # end if
+                    _widget.delete(0, TK.END)
 
-            # tk configure()
+                    _widget.insert(0, *_choices)
 
-            self._set_widget_config(_widget, self.TK_CONFIG)
+                    # set selected line
 
-            # set layout
+                    _widget.selection_anchor(_start)
 
-            self._set_layout(_widget, _attributes, tk_parent)
+                    _widget.selection_set(_start)
 
-            # succeeded
+                    _widget.activate(_start)
 
-            return True
+                    _widget.see(_start)
+
+                # end if
+
+            # end if
+
+            # tk configure()
+
+            if _virtual:
+
+                self._set_widget_config(_widget.listbox, self.TK_CONFIG)
+
+            else:
+
+                self._set_widget_config(_widget, self.TK_CONFIG)
+
+            # end if
+
+            # set layout
+
+            self._set_layout(_widget, _attributes, tk_parent)
+
+            # succeeded
+
+            return True
 
         # unsupported
 
@@ -812,27 +1300,18 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                 xml_tag, xml_element, tk_parent
             )
 
-            _attrs = {
-
-                "from": tools.str_complete(
-
-                    "from {} ", _attributes.get("from")
-                ),
-
-                "import": tools.str_complete(
+            # try to import python libs with global scope
 
-                    "import {}", _attributes.get("import")
-                ),
+            XV.get_resolver().import_names(
 
-                "as": tools.str_complete(
+                globals(),
 
-                    " as {}", _attributes.get("as")
-                ),
-            }
+                from_ = _attributes.get("from"),
 
-            # try to import python libs with global scope
+                import_ = _attributes.get("import"),
 
-            exec("{from}{import}{as}".format(**_attrs), globals())
+                as_ = _attributes.get("as"),
+            )
 
             # succeeded
 
@@ -893,7 +1372,20 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             # widget class inits
 
-            _widget = TK.OptionMenu(tk_parent, _cvar, *_choices)
+            if _attributes.get("virtual"):
+
+                # searchable popup instead of one menu entry per choice
+
+                _widget = VL.RADSearchOptionMenu(
+
+                    tk_parent, variable = _cvar, data = _choices
+                )
+
+            else:
+
+                _widget = TK.OptionMenu(tk_parent, _cvar, *_choices)
+
+            # end if
 
             # $ 2014-03-10 RS $
             # since v1.4: deferred tasks
@@ -1044,6 +1536,10 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
         if _target and _scrollbar:
 
+            # about to query Tcl state
+
+            self._flush_batch()
+
             try:
 
                 # connect vertically
@@ -1636,132 +2132,104 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             _apply = _attributes.pop("apply", ".")
 
-            # update ttk style defs
+            # stylesheet key - along raw XML contents
 
-            _style = ttk.Style()    # see below /!\
+            _sheet = XC.get_digest(
 
-            _style.configure(_apply, **_attributes)
+                repr(
 
-            # CSS-like syntax
+                    (
+                        sorted(
 
-            if tools.is_pstr(xml_element.text):
+                            _item for _item in xml_element.attrib.items()
 
-                # CDATA inits
-
-                _cdata = (
-                    xml_element.text
-                        # strip unwanted chars
-                        .strip("\n\t ;")
-                        # remove line ends
-                        .replace("\n", "")
-                        # convert double quotes to single quotes
-                        .replace('"', "'")
-                )
+                            if _item[0] != "id"
+                        ),
 
-                # remove /* ... */ comments
+                        xml_element.text,
+                    )
 
-                _cdata = re.sub(r"/\*.*?\*/", "", _cdata)
+                ).encode("utf-8")
+            )
 
-                # ttk root style is '.', CSS is '*'
+            # ttk style defs - configure() and map() options
 
-                _cdata = _cdata.replace("*", ".")
+            _confs = [_apply, self._get_ttkstyle_options(_attributes)]
 
-                # get def chunks
-                # i.e. elements {**attrs} elements {**attrs} ...
+            _maps = list()
 
-                _cdata = list(
-                    filter(
-                        None,
-                        set(
-                            re.split(r"(.*?\{.*?\})", _cdata)
-                        )
-                    )
-                )
+            # CSS-like syntax - compiled only once
 
-                for _def in _cdata:
+            for _elements, _attrs in \
+                            self._get_ttkstyle_rules(xml_element.text):
 
-                    # def chunks init i.e. elements { **attrs }
+                # parse XML attrs
 
-                    _elements, _attrs = _def.split("{")
+                _attrs = self._parse_xml_attributes(
 
-                    # filter elements
-                    # i.e. element:state:!state, element, ...
-                    # element:state, new.old:state, ...
+                    xml_element, tk_parent, xml_attrs = dict(_attrs)
+                )
 
-                    _elements = \
-                        re.sub(r"[^\w,.!:]+", "", _elements).split(",")
+                # got attrs?
 
-                    # filter and parse XML attrs
-                    # i.e. attr_key: value; ...
-                    # --> {"attr_key": "value", ...}
+                if not tools.is_pdict(_attrs):
 
-                    _attrs = self._parse_xml_attributes(
-                        xml_element,
-                        tk_parent,
-                        xml_attrs = eval(
-                            "{{{}}}"
-                            .format(
-                                re.sub(
-                                    r"\s*(\w+)\s*:\s*(.*?)\s*;",
-                                    r'"\1":"\2",',
-                                    _attrs.strip("{ };") + ";"
-                                ).strip(";")
-                            )
-                        ),
-                    )
+                    continue
 
-                    # got attrs?
+                # end if
 
-                    if tools.is_pdict(_attrs):
+                _attrs = _attrs.flatten()
 
-                        for _element in _elements:
+                for _element, _states in _elements:
 
-                            # pseudo-format support
-                            # i.e. element:state:!state:...
+                    # got mapping?
+                    # i.e. element:state:!state:...
 
-                            _element = _element.split(":")
+                    if _states:
 
-                            # got mapping?
+                        for _key, _value in _attrs.items():
 
-                            if len(_element) > 1:
+                            _maps.append(
 
-                                # inits
+                                (_element, _key, (" ".join(_states), _value))
+                            )
 
-                                _states = _element[1:]
+                        # end for
 
-                                _element = _element[0]
+                    # got configuring
 
-                                _mattrs = _attrs.copy()
+                    else:
 
-                                for (_key, _value) in _mattrs.items():
+                        _confs.extend(
 
-                                    _map = _style.map(_element, _key)
+                            (_element, self._get_ttkstyle_options(_attrs))
+                        )
 
-                                    _map.insert(
-                                        0, tuple(_states + [_value])
-                                    )
+                    # end if
 
-                                    _mattrs[_key] = _map
+                # end for - elements
 
-                                # end for
+            # end for - rules
 
-                                _style.map(_element, **_mattrs)
+            # update ttk style defs - one single Tcl call
+            # state maps get merged as in ttk.Style.map()
 
-                            # got configuring
+            if self.is_tk_parent(tk_parent):
 
-                            else:
+                _tk = tk_parent.tk
 
-                                _style.configure(_element[0], **_attrs)
+            else:
 
-                            # end if - mapping
+                _tk = ttk.Style().tk
 
-                        # end for - elements
+            # end if
 
-                    # end if - attrs
+            _tk.call(
 
-                # end for - cdata
+                "apply", self.TCL_TTKSTYLE, _sheet, tuple(_confs),
 
-            # end if - CSS-like syntax
+                tuple(_item for _map in _maps for _item in _map)
+            )
 
             # succeeded
 
@@ -1781,6 +2249,9 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
         r"""
             <ttktab> XML element is child of <ttknotebook>;
 
+            <ttktab lazy="yes"> children get built only once tab is
+            displayed for the first time (see build_lazy_tab());
+
             returns True on build success, False otherwise;
         """
 
@@ -1835,6 +2306,107 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def _build_element_virtuallist (self, xml_tag, xml_element, tk_parent):
+        r"""
+            XML element <virtuallist rowtemplate="..."/> builds a
+            virtualized list of XML-built rows (see
+            tkRAD.widgets.rad_virtual_list.RADVirtualList);
+
+            data items are given later on through widget's
+            set_data() method;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.is_tk_parent(tk_parent):
+
+            # lib imports
+
+            from ..widgets import rad_virtual_list as VR
+
+            # widget attribute inits
+
+            _attributes = self._init_deferred_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            # widget inits
+
+            _widget = VR.RADVirtualList(
+
+                tk_parent,
+
+                slot_owner = self.slot_owner,
+
+                rowtemplate = _attributes.get("rowtemplate"),
+
+                rows = _attributes.get("rows"),
+            )
+
+            # $ 2014-03-10 RS $
+            # since v1.4: deferred tasks
+            # flush widget section
+
+            self._queue.flush("widget", widget = _widget)
+
+            # ensure neutrality
+
+            _attributes = _attributes.flatten()
+
+            # deferred 'rowbind' command is only parsed now
+
+            _widget.rowbind = _attributes.get("rowbind")
+
+            # keep a copy aboard
+
+            self._register_object_by_id(_widget, _attributes.get("id"))
+
+            # set widget as class member
+
+            self._set_class_member(_attributes.get("name"), _widget)
+
+            # tk configure()
+
+            self._set_widget_config(_widget, self.TK_CONFIG)
+
+            # set layout
+
+            self._set_layout(_widget, _attributes, tk_parent)
+
+            # succeeded
+
+            return True
+
+        # unsupported
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "Tkinter '{classname}' object is *NOT* "
+
+                    "insertable into {obj_type} object."
+
+                ).format(
+
+                    classname = "RADVirtualList",
+
+                    obj_type = repr(tk_parent)
+                )
+            )
+
+            return False
+
+        # end if
+
+    # end def
+
+
+
     def _build_element_widget (self, xml_tag, xml_element, tk_parent,
     **kw):
         r"""
@@ -1868,9 +2440,16 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                 xml_tag, xml_element, tk_parent, **kw
             )
 
-            # widget class inits
+            # widget class inits - resolved once, then cached
+
+            _resolver = XV.get_resolver()
 
-            _class = eval("{module}{class}".format(**_attributes))
+            _class = _resolver.get_class(
+
+                _attributes.get("module"), _attributes.get("class"),
+
+                globals()
+            )
 
             _args = _attributes.get("args", "")
 
@@ -1885,7 +2464,24 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             # create tkinter widget
 
-            _widget = eval("_class({args})".format(args = _args))
+            if self._profiler:
+
+                _start = self._profiler.start()
+
+            # end if
+
+            _args, _kw = _resolver.get_arguments(
+
+                _args, globals(), tk_parent = tk_parent
+            )
+
+            _widget = _class(*_args, **_kw)
+
+            if self._profiler:
+
+                self._profiler.stop("tk", _class.__name__, _start)
+
+            # end if
 
             # $ 2014-03-10 RS $
             # since v1.4: deferred tasks
@@ -1919,23 +2515,19 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             # free useless memory right now /!\
 
-            del _class, _args, self.TK_CONFIG
-
-            # loop on XML element children - build tk child widgets
-
-            _build_ok = self._loop_on_children(
+            del _class, _args, _kw, self.TK_CONFIG
 
-                xml_element, _widget,
+            # accepted XML children
 
-                accept = tools.choose(
+            _accept = tools.choose(
 
-                    self.DTD.get(xml_tag),
+                self.DTD.get(xml_tag),
 
-                    self.DTD.get("widget"),
-                )
+                self.DTD.get("widget"),
             )
 
             # widget init() procedure
+            # once all children have been built
 
             _init = _attributes.get("init")
 
@@ -1950,7 +2542,41 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                     xml_attributes = _attributes,
                 )
 
-                _init(**kw)
+                _init = (_init, kw)
+
+            else:
+
+                _init = None
+
+            # end if
+
+            # lazy notebook tab - build children on first display
+            # init() procedure gets called once tab has been built
+
+            if _attributes.get("lazy") and \
+                                    isinstance(tk_parent, ttk.Notebook):
+
+                self._set_lazy_tab(
+
+                    _widget, xml_element, tk_parent, _accept, _init
+                )
+
+                _build_ok = True
+
+            else:
+
+                # loop on XML element children - build tk child widgets
+
+                _build_ok = self._loop_on_children(
+
+                    xml_element, _widget, accept = _accept
+                )
+
+                if _init:
+
+                    self._after_children(_init[0], **_init[1])
+
+                # end if
 
             # end if
 
@@ -1987,6 +2613,38 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def _build_lazy_selection (self, notebook):
+        r"""
+            protected method def;
+
+            builds currently selected tab of @notebook, if lazy and
+            not already built;
+
+            no return value (void);
+        """
+
+        # notebook may have been destroyed in the meantime
+
+        try:
+
+            _path = notebook.select()
+
+        except TK.TclError:
+
+            return
+
+        # end try
+
+        if _path in self.__lazy_tabs:
+
+            self.build_lazy_tab(_path)
+
+        # end if
+
+    # end def
+
+
+
     def _build_tk_native (self, xml_tag, xml_element, tk_parent):
         r"""
             protected method def;
@@ -2050,6 +2708,39 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def _destroy_fragment (self, fragment):
+        r"""
+            protected method def;
+
+            destroys topmost widgets of @fragment, along with their
+            children;
+
+            no return value (void);
+        """
+
+        for _widget in fragment.widgets:
+
+            if _widget.master is not None and \
+                                    _widget.master not in fragment.defaults:
+
+                try:
+
+                    _widget.destroy()
+
+                except TK.TclError:
+
+                    pass
+
+                # end try
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
     def _ensure_string_value (self, attribute, **kw):
         r"""
             will set attr value at least an empty string of chars;
@@ -2078,449 +2769,686 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _init_attributes (self, xml_tag, xml_element, tk_parent, **kw):
+    def _get_accepted_tags (self, xml_element):
         r"""
-            parses @xml_element param XML attributes along @xml_tag
+            protected method def;
 
-            param constraints and possible @kw["addon_attrs"];
+            overrides RADXMLBase._get_accepted_tags();
 
-            returns parsed XML attributes in a dict() object;
+            returns list of XML tags admitted as children of
+            @xml_element;
         """
 
-        # $ 2014-03-10 RS $
-        # modified in v1.4
-        # support: deferred tasks
-
-        # $ 2014-03-12 RS $
-        # modified again:
-        # support: rollback to *immediate*
-        # XML attrs parsing as in tkRAD <= v1.4
+        return tools.choose(
 
-        # inits
-
-        _attributes = self._init_deferred_attributes(
+            self.DTD.get(self.normalize_tag(xml_element)),
 
-            xml_tag, xml_element, tk_parent, **kw
+            self.DTD.get("widget"),
         )
 
-        # flush widget section
-        # for *immediate* attrs parsing
+    # end def
 
-        self._queue.flush("widget", **kw)
 
-        # ensure neutrality
 
-        return _attributes.flatten()
+    def _get_config_keys (self, widget):
+        r"""
+            protected method def;
 
-    # end def
+            retrieves @widget's valid tkinter configure() option
+            names;
 
+            option names are queried once per widget class and Tk
+            widget command, then shared by all subsequent widgets
+            of same kind;
 
+            returns frozenset of option names or None if @widget's
+            configure() does not give a dict;
+        """
 
-    def _init_attributes_flat (self, xml_tag, xml_element, tk_parent, **kw):
-        r"""
-            parses @xml_element param XML attributes along @xml_tag
+        # inits
 
-            param constraints and possible @kw["addon_attrs"];
+        _key = (type(widget), getattr(widget, "widgetName", None))
 
-            returns parsed XML attributes in a dict() object;
-        """
+        try:
 
-        # $ 2014-03-10 RS $
-        # new: created in v1.4
-        # support: *immediate* XML attrs parsing
+            return self.__config_keys[_key]
 
-        # $ 2014-03-12 RS $
-        # modified:
-        # kept for compatibility reasons
-        # with tkRAD v1.4
+        except KeyError:
 
-        return self._init_attributes(xml_tag, xml_element, tk_parent, **kw)
+            # query tkinter only once
 
-    # end def
+            _options = widget.configure()
 
+            if tools.is_pdict(_options):
 
+                _options = frozenset(_options.keys())
 
-    def _init_deferred_attributes (self, xml_tag, xml_element, tk_parent, **kw):
-        r"""
-            parses @xml_element param XML attributes along @xml_tag
+            else:
 
-            param constraints and possible @kw["addon_attrs"];
+                _options = None
 
-            returns parsed XML attributes in a dict() object;
-        """
+            # end if
 
-        # $ 2014-03-12 RS $
-        # new: created in v1.4.1
-        # support: deferred tasks
+            self.__config_keys[_key] = _options
 
-        # deferred XML attrs parsing
+            return _options
 
-        # inits
+        # end try
 
-        _dicts = (
+    # end def
 
-            # 'common' XML attrs
 
-            self.ATTRS.get("common"),
 
-            # XML element's mandatory default attrs
+    def _get_include_path (self, attrs):
+        r"""
+            protected method def;
 
-            self.ATTRS.get(xml_tag),
+            retrieves <include> XML file path along @attrs XML
+            attributes 'src', 'xml_dir', 'xml_filename' and
+            'xml_file_ext';
 
-            # additional external XML attrs
+            no default XML_RC nor rc options are used there, so
+            that there won't be any unexpected inclusion /!\
 
-            kw.get("addon_attrs"),
+            raises OSError if unable to build a correct path;
 
-            # override with real XML attributes
-            # (key/value) pairs
+            returns final path;
+        """
 
-            xml_element.attrib,
-        )
+        # inits
 
-        _attributes = dict()
+        _src = attrs.get("src")
 
-        # loop on dicts
+        # @src param may be a path
 
-        for _dict in _dicts:
+        if tools.is_pstr(_src) and (OP.isfile(_src) or OP.sep in _src):
 
-            if tools.is_pdict(_dict):
+            return path.normalize(_src)
 
-                _attributes.update(_dict)
+        # end if
 
-            # end if
+        # filename radix
 
-        # end for
+        _filename = re.sub(
 
-        # update keywords (filtered attributes)
+            r"\..*$", r"",
 
-        kw["xml_attrs"] = _attributes
+            tools.choose_str(_src, attrs.get("xml_filename")).strip(".")
+        )
 
-        # return parsed XML attributes
+        if not _filename:
 
-        return self._parse_xml_attributes(xml_element, tk_parent, **kw)
+            raise OSError(
 
-    # end def
+                _("Unable to determine a valid XML filename.")
+            )
 
+        # end if
 
+        # file ext
 
-    def _layout_toplevel (self, widget, attrs, tk_parent):
-        r"""
-            sets Toplevel main window inits and layouts;
+        _ext = tools.choose_str(attrs.get("xml_file_ext"), ".xml")
 
-            no return value (void);
-        """
+        _ext = _ext.strip(".")
 
-        # window state inits
+        if _ext:
 
-        _wstate = tools.choose_str(attrs.get("visibility"))
+            _filename += "." + _ext
 
-        _resizable = tools.choose_str(attrs.get("resizable"))
+        # end if
 
-        # set transient window
+        # rebuilt XML path
 
-        widget.transient(attrs.get("transient"))
+        return OP.join(
 
-        # set window's title
+            path.normalize(tools.choose_str(attrs.get("xml_dir"), "^/xml")),
 
-        widget.title(attrs.get("title"))
+            _filename
+        )
 
-        # set window's min size
+    # end def
 
-        widget.minsize(
 
-            width = attrs.get("minwidth"),
 
-            height = attrs.get("minheight"),
-        )
+    def _get_lazy_tab (self, attr_id):
+        r"""
+            protected method def;
 
-        # set window's max size
+            looks for a lazy <ttktab> whose unbuilt XML subtree
+            holds an XML element of @attr_id XML id;
 
-        _maxwidth = attrs.get("maxwidth")
+            returns tab path string of chars on success, None
+            otherwise;
+        """
 
-        _maxheight = attrs.get("maxheight")
+        # nothing to look for?
 
-        widget.maxsize(width = _maxwidth, height = _maxheight)
+        if not self.__lazy_tabs:
 
-        # set resizable window
+            return None
 
-        widget.resizable(
+        # end if
 
-            width = (_resizable in ("yes", "width")),
+        # (re)build XML id index of unbuilt XML subtrees
 
-            height = (_resizable in ("yes", "height")),
-        )
+        if self.__lazy_ids is None:
 
-        # set window state
+            self.__lazy_ids = dict()
 
-        if _wstate == "maximized" and _resizable == "yes" \
-                                    and not (_maxwidth or _maxheight):
+            for _path, _entry in self.__lazy_tabs.items():
 
-            widget.deiconify()
+                _element = _entry[1]
 
-            widget.attributes("-zoomed", "1")
+                for _child in _element.iter():
 
-        elif _wstate == "minimized":
+                    _id = _child.get("id")
 
-            widget.iconify()
+                    if _id and _child is not _element:
 
-        elif _wstate == "hidden":
+                        self.__lazy_ids.setdefault(
 
-            widget.withdraw()
+                            tools.normalize_id(_id).lower(), _path
+                        )
 
-        else:
+                    # end if
 
-            # 'normal' window state (default)
+                # end for
 
-            widget.deiconify()
+            # end for
 
         # end if
 
-    # end def
-
-
+        return self.__lazy_ids.get(tools.normalize_id(attr_id).lower())
 
-    # -----------------------  XML attributes parsing  -----------------
+    # end def
 
 
 
-    def _parse_attr__after (self, attribute, **kw):
+    def _get_ttkstyle_options (self, attrs):
         r"""
-            PanedWindow child configuration attr;
+            protected method def;
 
-            no return value (void);
+            returns ('-option', value, ...) tuple of @attrs dict()
+            for ttk::style configure;
         """
 
-        # parsed attribute inits
+        return tuple(
 
-        kw.update(tk_child_config = True)
+            _item for _key, _value in attrs.items()
 
-        self._tkRAD_widget_support(attribute, **kw)
+            for _item in ("-" + _key, _value)
+        )
 
     # end def
 
 
 
-    def _parse_attr__before (self, attribute, **kw):
+    def _get_ttkstyle_rules (self, text):
         r"""
-            PanedWindow child configuration attr;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(tk_child_config = True)
-
-        self._tkRAD_widget_support(attribute, **kw)
-
-    # end def
+            protected method def;
 
+            compiles <ttkstyle> CSS-like @text contents into rules,
+            only once for same contents:
 
+                element:state:!state, element, ... {
+                    attr_key: value;
+                    ...
+                }
 
-    def _parse_attr__height (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+            duplicate rules are dropped;
 
-            no return value (void);
+            returns tuple of (elements, attrs) rules in document
+            order, where elements is a tuple of (element, states)
+            and attrs a tuple of raw (attr_key, value) XML attrs;
         """
 
-        # parsed attribute inits
+        # param controls
 
-        kw.update(tk_child_config = True)
+        if not tools.is_pstr(text):
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            return ()
 
-    # end def
+        # end if
 
+        # already compiled?
 
+        _digest = XC.get_digest(text.encode("utf-8"))
 
-    def _parse_attr__minsize (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+        _rules = self.__ttkstyles.get(_digest)
 
-            no return value (void);
-        """
+        if _rules is not None:
 
-        # parsed attribute inits
+            return _rules
 
-        kw.update(tk_child_config = True)
+        # end if
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        # CDATA inits
 
-    # end def
+        _cdata = (
+            text
+                # strip unwanted chars
+                .strip("\n\t ;")
+                # remove line ends
+                .replace("\n", "")
+                # convert double quotes to single quotes
+                .replace('"', "'")
+        )
 
+        # remove /* ... */ comments
 
+        _cdata = re.sub(r"/\*.*?\*/", "", _cdata)
 
-    def _parse_attr__padx (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+        # ttk root style is '.', CSS is '*'
 
-            no return value (void);
-        """
+        _cdata = _cdata.replace("*", ".")
 
-        # parsed attribute inits
+        # get def chunks - no duplicates, document order kept
+        # i.e. elements {**attrs} elements {**attrs} ...
 
-        kw.update(tk_child_config = True)
+        _chunks = list()
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        for _def in re.split(r"(.*?\{.*?\})", _cdata):
 
-    # end def
+            _def = _def.strip()
 
+            if _def and _def not in _chunks:
 
+                _chunks.append(_def)
 
-    def _parse_attr__pady (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+            # end if
 
-            no return value (void);
-        """
+        # end for
 
-        # parsed attribute inits
+        _rules = list()
 
-        kw.update(tk_child_config = True)
+        for _def in _chunks:
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            # def chunks init i.e. elements { **attrs }
 
-    # end def
+            _elements, _attrs = _def.split("{")
 
+            # filter elements
+            # i.e. element:state:!state, element, ...
+            # element:state, new.old:state, ...
 
+            _elements = tuple(
 
-    def _parse_attr__sticky (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+                (_element[0], tuple(_element[1:]))
 
-            no return value (void);
-        """
+                for _element in (
 
-        # param controls
+                    _element.split(":") for _element in
 
-        if self._is_new(attribute):
+                    re.sub(r"[^\w,.!:]+", "", _elements).split(",")
+                )
+            )
 
-            # inits
+            # filter XML attrs
+            # i.e. attr_key: value; ...
+            # --> (("attr_key", "value"), ...)
 
-            _sticky = attribute.value.lower()
+            _attrs = tuple(
 
-            if not set(_sticky).issubset(set(self.STICKY_ALL)):
+                re.findall(
 
-                _sticky = self.STICKY_ALL
+                    r"\s*(\w+)\s*:\s*(.*?)\s*;",
 
-            # end if
+                    _attrs.strip("{ };") + ";"
+                )
+            )
 
-            # parsed attribute inits
+            _rules.append((_elements, _attrs))
 
-            attribute.value = _sticky
+        # end for
 
-            kw.update(tk_child_config = True)
+        _rules = tuple(_rules)
 
-            self._tk_config(attribute, **kw)
+        self.__ttkstyles[_digest] = _rules
 
-        # end if
+        return _rules
 
     # end def
 
 
 
-    def _parse_attr__width (self, attribute, **kw):
+    def _get_widget_options (self, widget):
         r"""
-            PanedWindow child configuration attr;
+            protected method def;
 
-            no return value (void);
+            returns dict() of @widget's current configure() option
+            values, option aliases excluded;
         """
 
-        # parsed attribute inits
+        return {
+
+            _key: _value[-1]
 
-        kw.update(tk_child_config = True)
+            for _key, _value in widget.configure().items()
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            if len(_value) == 5
+        }
 
     # end def
 
 
 
-    def _parse_attr_activerelief (self, attribute, **kw):
+    def _grid_configure (self, tk_parent, method_name, index):
         r"""
-            relief attribute;
+            protected method def;
+
+            makes @tk_parent's grid row or column @index resizable
+            along @method_name i.e. 'rowconfigure' or
+            'columnconfigure';
+
+            batched while building, if possible;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        _default = getattr(TK.Misc, "grid_" + method_name)
 
-        self._tkRAD_relief_support(attribute, **kw)
+        if not self._batch_command(
+
+                tk_parent, method_name, _default,
+
+                "grid", method_name, tk_parent, index, weight = 1):
+
+            getattr(tk_parent, method_name)(index, weight = 1)
+
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_activestyle (self, attribute, **kw):
+    def _init_attributes (self, xml_tag, xml_element, tk_parent, **kw):
         r"""
-            must be one of 'underline', 'dotbox', 'none';
+            parses @xml_element param XML attributes along @xml_tag
 
-            default value is 'underline';
+            param constraints and possible @kw["addon_attrs"];
 
-            no return value (void);
+            returns parsed XML attributes in a dict() object;
         """
 
-        # parsed attribute inits
+        # $ 2014-03-10 RS $
+        # modified in v1.4
+        # support: deferred tasks
 
-        kw.update(
+        # $ 2014-03-12 RS $
+        # modified again:
+        # support: rollback to *immediate*
+        # XML attrs parsing as in tkRAD <= v1.4
+
+        # inits
 
-            default = "dotbox",
+        _attributes = self._init_deferred_attributes(
 
-            values = ("underline", "none"),
+            xml_tag, xml_element, tk_parent, **kw
         )
 
-        self._fix_values(attribute, **kw)
+        # flush widget section
+        # for *immediate* attrs parsing
+
+        self._queue.flush("widget", **kw)
+
+        # ensure neutrality
+
+        return _attributes.flatten()
 
     # end def
 
 
 
-    def _parse_attr_add (self, attribute, **kw):
+    def _init_attributes_flat (self, xml_tag, xml_element, tk_parent, **kw):
         r"""
-            filters XML attr 'add' along authorized values;
+            parses @xml_element param XML attributes along @xml_tag
 
-            must be at least an empty string of chars;
+            param constraints and possible @kw["addon_attrs"];
 
-            no return value (void);
+            returns parsed XML attributes in a dict() object;
         """
 
-        # param controls
+        # $ 2014-03-10 RS $
+        # new: created in v1.4
+        # support: *immediate* XML attrs parsing
 
-        if tools.is_pstr(attribute.value):
+        # $ 2014-03-12 RS $
+        # modified:
+        # kept for compatibility reasons
+        # with tkRAD v1.4
 
-            # force value
+        return self._init_attributes(xml_tag, xml_element, tk_parent, **kw)
 
-            _add = "+"
+    # end def
 
-        else:
 
-            # at least empty string
 
-            _add = ""
+    def _init_deferred_attributes (self, xml_tag, xml_element, tk_parent, **kw):
+        r"""
+            parses @xml_element param XML attributes along @xml_tag
 
-        # end if
+            param constraints and possible @kw["addon_attrs"];
 
-        # parsed attribute inits
+            returns parsed XML attributes in a dict() object;
+        """
 
-        attribute.value = _add
+        # $ 2014-03-12 RS $
+        # new: created in v1.4.1
+        # support: deferred tasks
 
-        # caution: *NO* self._tk_config() by here /!\
+        # deferred XML attrs parsing
+
+        # inits
+
+        _dicts = (
+
+            # 'common' XML attrs
+
+            self.ATTRS.get("common"),
+
+            # XML element's mandatory default attrs
+
+            self.ATTRS.get(xml_tag),
+
+            # additional external XML attrs
+
+            kw.get("addon_attrs"),
+
+            # override with real XML attributes
+            # (key/value) pairs
+
+            xml_element.attrib,
+        )
+
+        _attributes = dict()
+
+        # loop on dicts
+
+        for _dict in _dicts:
+
+            if tools.is_pdict(_dict):
+
+                _attributes.update(_dict)
+
+            # end if
+
+        # end for
+
+        # update keywords (filtered attributes)
+
+        kw["xml_attrs"] = _attributes
+
+        # return parsed XML attributes
+
+        return self._parse_xml_attributes(xml_element, tk_parent, **kw)
+
+    # end def
+
+
+
+    def _is_alive_fragment (self, fragment):
+        r"""
+            protected method def;
+
+            returns True if @fragment widgets still exist, False
+            otherwise;
+        """
+
+        try:
+
+            return all(
+
+                _widget.winfo_exists() for _widget in fragment.widgets[:1]
+            )
+
+        except TK.TclError:
+
+            return False
+
+        # end try
+
+    # end def
+
+
+
+    def _layout_toplevel (self, widget, attrs, tk_parent):
+        r"""
+            sets Toplevel main window inits and layouts;
+
+            no return value (void);
+        """
+
+        # window state inits
+
+        _wstate = tools.choose_str(attrs.get("visibility"))
+
+        _resizable = tools.choose_str(attrs.get("resizable"))
+
+        # set transient window
+
+        widget.transient(attrs.get("transient"))
+
+        # set window's title
+
+        widget.title(attrs.get("title"))
+
+        # set window's min size
+
+        widget.minsize(
+
+            width = attrs.get("minwidth"),
+
+            height = attrs.get("minheight"),
+        )
+
+        # set window's max size
+
+        _maxwidth = attrs.get("maxwidth")
+
+        _maxheight = attrs.get("maxheight")
+
+        widget.maxsize(width = _maxwidth, height = _maxheight)
+
+        # set resizable window
+
+        widget.resizable(
+
+            width = (_resizable in ("yes", "width")),
+
+            height = (_resizable in ("yes", "height")),
+        )
+
+        # set window state
+
+        if _wstate == "maximized" and _resizable == "yes" \
+                                    and not (_maxwidth or _maxheight):
+
+            widget.deiconify()
+
+            widget.attributes("-zoomed", "1")
+
+        elif _wstate == "minimized":
+
+            widget.iconify()
+
+        elif _wstate == "hidden":
+
+            widget.withdraw()
+
+        else:
+
+            # 'normal' window state (default)
+
+            widget.deiconify()
+
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_after (self, attribute, **kw):
+    # -----------------------  XML attributes parsing  -----------------
+
+
+
+    def _parse_attr__sticky (self, attribute, **kw):
         r"""
             PanedWindow child configuration attr;
 
             no return value (void);
         """
 
+        # param controls
+
+        if self._is_new(attribute):
+
+            # parsed attribute inits
+
+            attribute.value = self._get_parsed_value(
+
+                "sticky", attribute.value, self._tkRAD_sticky_value
+            )
+
+            kw.update(tk_child_config = True)
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _parse_attr_add (self, attribute, **kw):
+        r"""
+            filters XML attr 'add' along authorized values;
+
+            must be at least an empty string of chars;
+
+            no return value (void);
+        """
+
+        # param controls
+
+        if tools.is_pstr(attribute.value):
+
+            # force value
+
+            _add = "+"
+
+        else:
+
+            # at least empty string
+
+            _add = ""
+
+        # end if
+
         # parsed attribute inits
 
-        self._parse_attr__after(attribute, **kw)
+        attribute.value = _add
+
+        # caution: *NO* self._tk_config() by here /!\
 
     # end def
 
@@ -2545,30 +3473,12 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
         if self._is_new(attribute):
 
-            # inits
-
-            _anchor = attribute.value
-
-            # loop on regexps
-
-            for (_search, _replace) in self.ANCHORS:
-
-                _anchor = _search.sub(_replace, _anchor)
-
-            # end for
-
-            # set inconsistencies to default value: 'center'
-
-            if _anchor not in (TK.N, TK.S, TK.E, TK.W,
-                                            TK.NW, TK.NE, TK.SW, TK.SE):
-
-                _anchor = TK.CENTER
-
-            # end if
-
             # parsed attribute inits
 
-            attribute.value = _anchor
+            attribute.value = self._get_parsed_value(
+
+                "anchor", attribute.value, self._tkRAD_anchor_value
+            )
 
             self._tk_config(attribute, **kw)
 
@@ -2676,181 +3586,148 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_aspect (self, attribute, **kw):
+    def _parse_attr_choices (self, attribute, **kw):
         r"""
-            attr 'aspect' ratio (integer);
-
-            no return value (void);
-        """
+            changes string list of compound values to a well-formed
+            list() of string values;
 
-        # parsed attribute inits
+            string values *MUST* be quoted;
 
-        self._tkRAD_integer_support(attribute, **kw)
+            list of values *MUST* be comma-separated;
 
-    # end def
+            example:
 
+                choices="'hello', 'good people', 123, 456.78"
 
+            will become
 
-    def _parse_attr_autoseparators (self, attribute, **kw):
-        r"""
-            boolean attribute;
+                choices = ['hello', 'good people', '123', '456.78']
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
+        # param controls
 
-    # end def
+        if self._is_new(attribute):
 
+            # parsed attribute inits
 
+            # CAUTION: eval()-based parsing *MUST NOT* get memoized /!\
 
-    def _parse_attr_before (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+            attribute.value = self._tkRAD_choices_value(attribute.value)
 
-            no return value (void);
-        """
+            # caution: *NO* self._tk_config() by here /!\
 
-        # parsed attribute inits
+            attribute.parsed = True
 
-        self._parse_attr__before(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_bind (self, attribute, **kw):
+    def _parse_attr_class (self, attribute, **kw):
         r"""
-            must be one of 'bind', 'bind_class' or 'bind_all';
+            forces XML attr 'class' name to conform to __identifier__
 
-            default value is 'bind';
+            language semantics def i.e. accept only regexp("\w+");
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        kw.update(
+        # param controls - forces value clean-ups
 
-            default = "bind",
+        if self._is_unparsed(attribute):
 
-            values = ("bind_class", "bind_all"),
+            # param inits
 
-            # caution: *NO* self._tk_config() by here /!\
+            _class = tools.choose_str(
 
-            no_tk_config = True,
-        )
+                tools.normalize_id(attribute.value),
 
-        self._fix_values(attribute, **kw)
-
-    # end def
+                self.WIDGET_CLASS,
 
+                "Frame",
+            )
 
+            # parsed attribute inits
 
-    def _parse_attr_buttonbackground (self, attribute, **kw):
-        r"""
-            color attribute;
+            attribute.value = _class
 
-            no return value (void);
-        """
+            # caution: *NO* self._tk_config() by here /!\
 
-        # parsed attribute inits
+            attribute.parsed = True
 
-        self._tkRAD_color_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_buttoncursor (self, attribute, **kw):
+    def _parse_attr_columns (self, attribute, **kw):
         r"""
-            cursor attribute;
+            values attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_cursor_support(attribute, **kw)
+        self._parse_attr_values(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_buttondownrelief (self, attribute, **kw):
+    def _parse_attr_displaycolumns (self, attribute, **kw):
         r"""
-            relief attribute;
+            values attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_relief_support(attribute, **kw)
+        self._parse_attr_values(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_buttonup (self, attribute, **kw):
+    def _parse_attr_format (self, attribute, **kw):
         r"""
-            relief attribute;
+            sprintf() format e.g. '%02.3f';
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_relief_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_choices (self, attribute, **kw):
-        r"""
-            changes string list of compound values to a well-formed
-            list() of string values;
+        # param controls
 
-            string values *MUST* be quoted;
+        if self._is_new(attribute):
 
-            list of values *MUST* be comma-separated;
+            # inits
 
-            example:
+            _fmt = re.search(
 
-                choices="'hello', 'good people', 123, 456.78"
+                r"\D*(\d*\.\d+)|\D*(\d*)", attribute.value
+            )
 
-            will become
+            if _fmt:
 
-                choices = ['hello', 'good people', '123', '456.78']
+                _fmt = tools.str_complete(
 
-            no return value (void);
-        """
+                    "%{}f",
 
-        # param controls
+                    "".join(filter(None, _fmt.groups()))
+                )
 
-        if self._is_new(attribute):
+            # end if
 
             # parsed attribute inits
 
-            attribute.value = list(
-
-                map(
-
-                    str,
-
-                    eval(
-
-                        "[{}]".format(attribute.value.strip("()[]{}"))
-                    )
-                )
-            )
-
-            # caution: *NO* self._tk_config() by here /!\
+            attribute.value = _fmt
 
-            attribute.parsed = True
+            self._tk_config(attribute, **kw)
 
         # end if
 
@@ -2858,11 +3735,11 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_class (self, attribute, **kw):
+    def _parse_attr_from (self, attribute, **kw):
         r"""
-            forces XML attr 'class' name to conform to __identifier__
+            from relative.module import ...;
 
-            language semantics def i.e. accept only regexp("\w+");
+            parse relative.module string value;
 
             no return value (void);
         """
@@ -2871,20 +3748,10 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
         if self._is_unparsed(attribute):
 
-            # param inits
-
-            _class = tools.choose_str(
-
-                tools.normalize_id(attribute.value),
-
-                self.WIDGET_CLASS,
-
-                "Frame",
-            )
-
             # parsed attribute inits
 
-            attribute.value = _class
+            attribute.value = \
+                tools.normalize_relative_module(attribute.value)
 
             # caution: *NO* self._tk_config() by here /!\
 
@@ -2896,232 +3763,205 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_class_ (self, attribute, **kw):
+    def _parse_attr_height (self, attribute, xml_tag, **kw):
         r"""
-            fake classname for tkinter options database;
+            integer/dimension attribute along widget type;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_any_value_support(attribute, **kw)
+        # param controls
 
-    # end def
+        if xml_tag in ("button", "checkbutton", "label", "listbox",
+        "menubutton", "radiobutton", "text"):
 
+            # parsed attribute inits
 
+            self._tkRAD_integer_support(attribute, **kw)
 
-    def _parse_attr_closeenough (self, attribute, **kw):
-        r"""
-            float attribute;
+        else:
 
-            no return value (void);
-        """
+            # parsed attribute inits
 
-        # parsed attribute inits
+            self._tkRAD_dimension_support(attribute, **kw)
 
-        self._tkRAD_float_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_columns (self, attribute, **kw):
+    def _parse_attr_import (self, attribute, **kw):
         r"""
-            values attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._parse_attr_values(attribute, **kw)
-
-    # end def
-
-
+            from ... import module;
 
-    def _parse_attr_confine (self, attribute, **kw):
-        r"""
-            boolean attribute;
+            parses module string value;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
+        # param controls - forces value clean-ups
 
+        if self._is_unparsed(attribute):
 
-    def _parse_attr_connect (self, attribute, **kw):
-        r"""
-            scrollbar attribute;
+            # parsed attribute inits
 
-            no return value (void);
-        """
+            attribute.value = tools.normalize_import(attribute.value)
 
-        # parsed attribute inits
+            # caution: *NO* self._tk_config() by here /!\
 
-        kw.update(tk_child_config = True)
+            attribute.parsed = True
 
-        self._tkRAD_widget_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_default (self, attribute, **kw):
+    def _parse_attr_labelanchor (self, attribute, **kw):
         r"""
-            state attribute;
+            anchor attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_state_support(attribute, **kw)
+        self._parse_attr_anchor(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_digits (self, attribute, **kw):
+    def _parse_attr_layout_options (self, attribute, **kw):
         r"""
-            integer attribute;
+            'pack', 'grid' or 'place' layout options;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_integer_support(attribute, **kw)
-
-    # end def
+        # param controls
 
+        if self._is_unparsed(attribute):
 
+            _lopts = attribute.value
 
-    def _parse_attr_direction (self, attribute, **kw):
-        r"""
-            sets Menubutton pop-up menu showing up direction;
+            if tools.is_pstr(_lopts):
 
-            must be one of 'above', 'below', 'flush', 'left' or
-            'right';
+                # replace "@" alias by a ref to widget's module
 
-            no return value (void);
-        """
+                _lopts = self._replace_alias(_lopts, **kw)
 
-        # parsed attribute inits
+                # layout options must be a dict() of options
 
-        kw.update(
+                # for self._set_layout() and self._set_resizable()
 
-            default = "below",
+                _lopts = eval("dict({})".format(_lopts.strip("()[]{}")))
 
-            values = ("above", "flush", "left", "right"),
-        )
+            elif not tools.is_pdict(_lopts):
 
-        self._fix_values(attribute, **kw)
+                # minimal default value
 
-    # end def
+                _lopts = dict()
 
+            # end if
 
+            # parsed attribute inits
 
-    def _parse_attr_disabledbackground (self, attribute, **kw):
-        r"""
-            color attribute;
+            attribute.value = _lopts
 
-            no return value (void);
-        """
+            # caution: *NO* self._tk_config() by here /!\
 
-        # parsed attribute inits
+            attribute.parsed = True
 
-        self._tkRAD_color_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_displaycolumns (self, attribute, **kw):
+    def _parse_attr_module (self, attribute, **kw):
         r"""
-            values attribute;
+            tries to determine module's correct alias name;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # $ 2014-01-09 RS $
+        # bug fix:
+        # @attribute may be None sometimes;
 
-        self._parse_attr_values(attribute, **kw)
+        if self._is_new(attribute):
 
-    # end def
+            # module id inits
 
+            _module = attribute.value.lstrip(".")
 
+            # predefined module name?
 
-    def _parse_attr_elementborderwidth (self, attribute, **kw):
-        r"""
-            dimension attribute;
+            if _module.endswith("."):
 
-            no return value (void);
-        """
+                # init module name
 
-        # parsed attribute inits
+                _name = _module
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            # XML source module id
 
-    # end def
+            else:
 
+                # init module name
 
+                _name = ""
 
-    def _parse_attr_exportselection (self, attribute, **kw):
-        r"""
-            boolean attribute;
+                # try to get <module> element for more info
 
-            no return value (void);
-        """
+                _module = self.get_element_by_id(_module)
 
-        # parsed attribute inits
+                # found corresponding <module> element?
 
-        self._tkRAD_boolean_support(attribute, **kw)
+                if self.is_element(_module):
 
-    # end def
+                    # attribute inits
 
+                    _import = \
+                        tools.normalize_import(_module.get("import"))
 
+                    # choose between attrs
 
-    def _parse_attr_format (self, attribute, **kw):
-        r"""
-            sprintf() format e.g. '%02.3f';
+                    if _import != "*":
 
-            no return value (void);
-        """
+                        _name = tools.choose_str(
 
-        # param controls
+                            tools.normalize_id(_module.get("as")),
 
-        if self._is_new(attribute):
+                            _import,
 
-            # inits
+                        ) + "."
 
-            _fmt = re.search(
+                    # end if
 
-                r"\D*(\d*\.\d+)|\D*(\d*)", attribute.value
-            )
+                # module not found
 
-            if _fmt:
+                else:
 
-                _fmt = tools.str_complete(
+                    raise KeyError(
+                        _(
+                            "module of id '{mid}' has *NOT* been found."
 
-                    "%{}f",
+                        ).format(mid = attribute.value)
+                    )
 
-                    "".join(filter(None, _fmt.groups()))
-                )
+                # end if
 
             # end if
 
             # parsed attribute inits
 
-            attribute.value = _fmt
+            attribute.value = _name.lstrip(".")
 
-            self._tk_config(attribute, **kw)
+            # caution: *NO* self._tk_config() by here /!\
+
+            attribute.parsed = True
 
         # end if
 
@@ -3129,100 +3969,112 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_from (self, attribute, **kw):
+    def _parse_attr_orient (self, attribute, attrs, xml_tag, **kw):
         r"""
-            from relative.module import ...;
+            must be one of 'vertical', 'horizontal';
 
-            parse relative.module string value;
+            default value is 'vertical';
 
             no return value (void);
         """
 
-        # param controls - forces value clean-ups
-
-        if self._is_unparsed(attribute):
+        # parsed attribute inits
 
-            # parsed attribute inits
+        kw.update(
 
-            attribute.value = \
-                tools.normalize_relative_module(attribute.value)
+            default = "vertical",
 
-            # caution: *NO* self._tk_config() by here /!\
+            values = ("horizontal", ),
+        )
 
-            attribute.parsed = True
+        self._fix_values(attribute, **kw)
 
-        # end if
+        # $ 2014-02-27 RS $
+        # special case for ttk.PanedWindow
 
-    # end def
+        if xml_tag == "ttkpanedwindow" and "args" in attrs:
 
+            # in a ttk.PanedWindow object:
+            # must init 'orient' attr in class constructor's 'args'
+            # because 'orient' is *READ-ONLY* in configure()
 
+            _args = tools.choose_str(attrs["args"]).split(",")
 
-    def _parse_attr_from_ (self, attribute, **kw):
-        r"""
-            starting point float attribute;
+            _args.append("orient='{}'".format(attribute.value))
 
-            no return value (void);
-        """
+            attrs["args"] = ",".join(filter(None, _args))
 
-        # parsed attribute inits
+            self.TK_CONFIG.pop("orient", None)
 
-        self._tkRAD_float_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_handlepad (self, attribute, **kw):
+    def _parse_attr_rowtemplate (self, attribute, **kw):
         r"""
-            dimension attribute;
+            <virtuallist> row template may be either an XML source
+            string of chars or an XML file path, rebuilt the same
+            way as <include> 'src' XML attribute;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # param controls
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        if self._is_new(attribute):
 
-    # end def
+            # parsed attribute inits
 
+            if not self.is_xml(attribute.value):
 
+                attribute.value = self._get_include_path(
 
-    def _parse_attr_handlesize (self, attribute, **kw):
-        r"""
-            dimension attribute;
+                    {"src": attribute.value}
+                )
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            # caution: *NO* self._tk_config() by here /!\
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            attribute.parsed = True
+
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_height (self, attribute, xml_tag, **kw):
+    def _parse_attr_scrollregion (self, attribute, **kw):
         r"""
-            integer/dimension attribute along widget type;
+            must be a 4-tuple of integers;
+
+            values are (left, top, right, bottom);
 
             no return value (void);
         """
 
         # param controls
 
-        if xml_tag in ("button", "checkbutton", "label", "listbox",
-        "menubutton", "radiobutton", "text"):
+        if self._is_new(attribute):
 
             # parsed attribute inits
 
-            self._tkRAD_integer_support(attribute, **kw)
+            attribute.value = tuple(
 
-        else:
+                map(
 
-            # parsed attribute inits
+                    tools.ensure_int,
 
-            self._tkRAD_dimension_support(attribute, **kw)
+                    eval(
+
+                        "[{}]".format(attribute.value.strip("(){}[]"))
+                    )
+                )
+            )
+
+            self._tk_config(attribute, **kw)
 
         # end if
 
@@ -3230,69 +4082,72 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_highlightbackground (self, attribute, **kw):
+    def _parse_attr_selectmode (self, attribute, xml_tag, **kw):
         r"""
-            color attribute;
+            must be one of 'browse', 'single', 'multiple', 'extended';
+
+            default value is 'browse';
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_highlightcolor (self, attribute, **kw):
-        r"""
-            color attribute;
+        # $ 2014-02-27 RS $
+        # new support:
+        # ttk.Treeview hasn't
+        # the same point of view!
 
-            no return value (void);
-        """
+        if xml_tag == "ttktreeview":
 
-        # parsed attribute inits
+            kw.update(
 
-        self._tkRAD_color_support(attribute, **kw)
+                default = "extended",
 
-    # end def
+                values = ("none", "browse"),
+            )
 
+        else:
 
+            kw.update(
 
-    def _parse_attr_highlightthickness (self, attribute, **kw):
-        r"""
-            dimension attribute;
+                default = "browse",
 
-            no return value (void);
-        """
+                values = ("single", "multiple", "extended"),
+            )
 
-        # parsed attribute inits
+        # end if
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        self._fix_values(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_import (self, attribute, **kw):
+    def _parse_attr_seq (self, attribute, **kw):
         r"""
-            from ... import module;
+            admits simplified tkinter.Event sequence (no <>);
 
-            parses module string value;
+            e.g. seq="Control-s" instead of seq="&lt;Control-s&gt;";
 
             no return value (void);
         """
 
-        # param controls - forces value clean-ups
+        # param controls
 
-        if self._is_unparsed(attribute):
+        if self._is_new(attribute):
+
+            # inits - stri
+
+            _seq = attribute.value.replace("<", "", 1)
+
+            _seq = _seq.replace(">", "", 1)
 
             # parsed attribute inits
 
-            attribute.value = tools.normalize_import(attribute.value)
+            attribute.value = "<" + _seq + ">"
 
-            # caution: *NO* self._tk_config() by here /!\
+            # CAUTION: *NO* self.tk_config() by here /!\
 
             attribute.parsed = True
 
@@ -3302,178 +4157,228 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_increment (self, attribute, **kw):
+    def _parse_attr_show (self, attribute, xml_tag, **kw):
         r"""
-            float attribute;
+            password echo character to show in entry box;
+
+            headings/tree ttk.Treeview display off mode;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_float_support(attribute, **kw)
+        # $ 2014-02-27 RS $
+        # new support:
+        # ttk.Treeview hasn't
+        # the same point of view!
 
-    # end def
+        if xml_tag == "ttktreeview":
 
+            kw.update(
 
+                default = "headings",
 
-    def _parse_attr_indicatorcolor (self, attribute, **kw):
-        r"""
-            color attribute;
+                values = ("tree", ),
+            )
 
-            no return value (void);
-        """
+            self._fix_values(attribute, **kw)
 
-        # parsed attribute inits
+        else:
+
+            self._tkRAD_any_value_support(attribute, **kw)
 
-        self._tkRAD_color_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_indicatoron (self, attribute, **kw):
+    def _parse_attr_signal (self, attribute, **kw):
         r"""
-            boolean attribute;
+            must be at least an empty string of chars;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_boolean_support(attribute, **kw)
+        kw.update(no_tk_config = True)
+
+        self._ensure_string_value(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_init (self, attribute, **kw):
+    def _parse_attr_src (self, attribute, **kw):
         r"""
-            command attribute;
+            normalizes path in XML attr 'src';
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # param controls
 
-        kw.update(no_tk_config = True)
+        if self._is_new(attribute):
+
+            # parsed attribute inits
+
+            attribute.value = path.normalize(attribute.value)
 
-        self._tkRAD_command_support(attribute, **kw)
+            # caution: *NO* self._tk_config() by here /!\
+
+            attribute.parsed = True
+
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_insertbackground (self, attribute, **kw):
+    def _parse_attr_start (self, attribute, **kw):
         r"""
-            color attribute;
+            defines starting point for attr 'choices' items list;
+
+            can be either litteral value or '@integer' list index
+            position;
+
+            admits negative index values;
+
+            example: start="@0" will indicate choices[0];
+
+            example: start="@-1" will indicate choices[-1];
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
+        # param controls
 
-    # end def
+        if self._is_new(attribute):
 
+            # parsed attribute inits
 
+            attribute.value = self._get_parsed_value(
 
-    def _parse_attr_insertborderwidth (self, attribute, **kw):
-        r"""
-            dimension attribute;
+                "start", attribute.value, self._tkRAD_start_value
+            )
 
-            no return value (void);
-        """
+            # caution: *NO* self._tk_config() by here /!\
 
-        # parsed attribute inits
+            attribute.parsed = True
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_insertofftime (self, attribute, **kw):
+    def _parse_attr_state (self, attribute, xml_tag, **kw):
         r"""
-            integer attribute;
+            must be one of 'normal' or 'disabled';
+
+            must be one of 'normal', 'disabled' or 'readonly' when
+            XML element is one of 'entry', 'spinbox';
+
+            default value is 'normal';
 
             no return value (void);
         """
 
+        # $ 2014-01-16 RS $
+        # new support:
+        # special case for '<entry>' and '<spinbox>':
+
+        if xml_tag in ("entry", "spinbox"):
+
+            _values = ("disabled", "readonly", )
+
+        else:
+
+            _values = ("disabled", )
+
+        # end if
+
         # parsed attribute inits
 
-        self._tkRAD_integer_support(attribute, **kw)
+        kw.update(default = "normal", values = _values)
+
+        self._fix_values(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_insertontime (self, attribute, **kw):
+    def _parse_attr_sticky (self, attribute, **kw):
         r"""
-            integer attribute;
+            PanedWindow child configuration attr;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_integer_support(attribute, **kw)
+        self._parse_attr__sticky(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_insertwidth (self, attribute, **kw):
+    def _parse_attr_style (self, attribute, **kw):
         r"""
-            dimension attribute;
+            tkinter/ttk XML attr style def;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # param controls
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        if self._is_new(attribute):
 
-    # end def
+            # style id inits
 
+            _style = attribute.value
 
+            if "." not in _style:
 
-    def _parse_attr_invalidcommand (self, attribute, **kw):
-        r"""
-            command attribute;
+                _style = self.get_object_by_id(_style, _style)
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            # parsed attribute inits
+
+            attribute.value = _style
+
+            self._tk_config(attribute)
 
-        self._tkRAD_command_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_jump (self, attribute, **kw):
+    def _parse_attr_tabs (self, attribute, **kw):
         r"""
-            boolean attribute;
+            choices attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_boolean_support(attribute, **kw)
+        self._parse_attr_choices(attribute, **kw)
+
+        self._tk_config(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_justify (self, attribute, **kw):
+    def _parse_attr_use (self, attribute, **kw):
         r"""
-            must be one of 'left', 'right', 'center';
+            must be one of ttk.Style().theme_use() list;
 
-            default value is 'center';
+            default value is 'default';
 
             no return value (void);
         """
@@ -3482,9 +4387,9 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
         kw.update(
 
-            default = "center",
+            default = "default",
 
-            values = ("left", "right"),
+            values = ttk.Style().theme_names(),
         )
 
         self._fix_values(attribute, **kw)
@@ -3493,119 +4398,99 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_label (self, attribute, **kw):
+    def _parse_attr_value (self, attribute, xml_tag, **kw):
         r"""
-            label attribute;
+            any/float attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_label_support(attribute, **kw)
-
-    # end def
-
-
+        if xml_tag == "ttkscale":
 
-    def _parse_attr_labelanchor (self, attribute, **kw):
-        r"""
-            anchor attribute;
+            self._tkRAD_float_support(attribute, **kw)
 
-            no return value (void);
-        """
+        else:
 
-        # parsed attribute inits
+            self._tkRAD_any_value_support(attribute, **kw)
 
-        self._parse_attr_anchor(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_labelwidget (self, attribute, **kw):
+    def _parse_attr_values (self, attribute, **kw):
         r"""
-            widget attribute;
+            choices attribute;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_widget_support(attribute, **kw)
+        self._parse_attr_choices(attribute, **kw)
+
+        self._tk_config(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_layout (self, attribute, **kw):
+    def _parse_attr_width (self, attribute, xml_tag, **kw):
         r"""
-            must be one of 'pack', 'grid', 'place' or 'none';
-
-            default value is 'none' (no layout);
+            integer/dimension attribute along widget type;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # param controls
 
-        kw.update(
+        if xml_tag in ("button", "checkbutton", "entry", "label",
+        "listbox", "menubutton", "radiobutton", "spinbox", "text"):
 
-            default = "none",
+            # parsed attribute inits
 
-            values = ("pack", "grid", "place"),
+            self._tkRAD_integer_support(attribute, **kw)
 
-            # caution: *NO* self._tk_config() by here /!\
+        else:
 
-            no_tk_config = True,
-        )
+            # parsed attribute inits
 
-        self._fix_values(attribute, **kw)
+            self._tkRAD_dimension_support(attribute, **kw)
+
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_layout_options (self, attribute, **kw):
+    def _parse_attr_wrap (self, attribute, xml_tag, **kw):
         r"""
-            'pack', 'grid' or 'place' layout options;
+            boolean attribute;
+
+            must be 'char', 'word' or 'none' if XML element is 'text';
 
             no return value (void);
         """
 
-        # param controls
-
-        if self._is_unparsed(attribute):
-
-            _lopts = attribute.value
-
-            if tools.is_pstr(_lopts):
-
-                # replace "@" alias by a ref to widget's module
-
-                _lopts = self._replace_alias(_lopts, **kw)
-
-                # layout options must be a dict() of options
-
-                # for self._set_layout() and self._set_resizable()
-
-                _lopts = eval("dict({})".format(_lopts.strip("()[]{}")))
-
-            elif not tools.is_pdict(_lopts):
+        # parsed attribute inits
 
-                # minimal default value
+        if xml_tag == "text":
 
-                _lopts = dict()
+            kw.update(
 
-            # end if
+                default = "none",
 
-            # parsed attribute inits
+                values = ("char", "word"),
+            )
 
-            attribute.value = _lopts
+            self._fix_values(attribute, **kw)
 
-            # caution: *NO* self._tk_config() by here /!\
+        else:
 
-            attribute.parsed = True
+            self._tkRAD_boolean_support(attribute, **kw)
 
         # end if
 
@@ -3613,39 +4498,53 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_length (self, attribute, **kw):
+    def _parse_attr_xml_dir (self, attribute, **kw):
         r"""
-            dimension attribute;
+            must be at least an empty string of chars;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        kw.update(
+
+            no_tk_config = True,
+
+            default = self.XML_RC.get("dir")
+        )
+
+        self._ensure_string_value(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_listvariable (self, attribute, **kw):
+    def _parse_attr_xml_file_ext (self, attribute, **kw):
         r"""
-            control variable attribute;
+            must be at least an empty string of chars;
 
             no return value (void);
         """
 
         # parsed attribute inits
 
-        self._tkRAD_cvar_support(attribute, **kw)
+        kw.update(
+
+            no_tk_config = True,
+
+            default = self.XML_RC.get("file_ext")
+        )
+
+        self._ensure_string_value(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_maxheight (self, attribute, **kw):
+    def _parse_attr_xml_filename (self, attribute, **kw):
         r"""
-            integer attribute;
+            must be at least an empty string of chars;
 
             no return value (void);
         """
@@ -3654,287 +4553,227 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
         kw.update(no_tk_config = True)
 
-        self._tkRAD_integer_support(attribute, **kw)
+        self._ensure_string_value(attribute, **kw)
 
     # end def
 
 
 
-    def _parse_attr_maximum (self, attribute, **kw):
+    def _reconfigure_element (self, widget, xml_element, attrs, tk_parent):
         r"""
-            integer attribute;
+            protected method def;
 
-            no return value (void);
-        """
+            overrides RADXMLBase._reconfigure_element();
 
-        # parsed attribute inits
+            reparses @attrs changed XML attributes of @xml_element
+            and reconfigures @widget in place, if all of them are
+            tkinter configure() options of @widget;
 
-        self._tkRAD_integer_support(attribute, **kw)
+            returns True on success, False if @widget must be
+            rebuilt;
+        """
 
-    # end def
+        # only tkinter configure() options may be updated in place
 
+        _keys = self._get_config_keys(widget)
 
+        if _keys is None or not set(attrs).issubset(_keys):
 
-    def _parse_attr_maxundo (self, attribute, **kw):
-        r"""
-            integer attribute;
+            return False
 
-            no return value (void);
-        """
+        # end if
 
-        # parsed attribute inits
+        # element inits
 
-        self._tkRAD_integer_support(attribute, **kw)
+        self._before_building_element(
 
-    # end def
+            xml_tag = self.normalize_tag(xml_element),
 
+            xml_element = xml_element,
 
+            tk_parent = tk_parent,
+        )
 
-    def _parse_attr_maxwidth (self, attribute, **kw):
-        r"""
-            integer attribute;
+        # parse changed XML attributes only
 
-            no return value (void);
-        """
+        self._parse_xml_attributes(
 
-        # parsed attribute inits
+            xml_element, tk_parent, xml_attrs = attrs
+        )
 
-        kw.update(no_tk_config = True)
+        self._queue.flush("widget", widget = widget)
 
-        self._tkRAD_integer_support(attribute, **kw)
+        # reconfigure widget
 
-    # end def
+        self._set_widget_config(widget, self.TK_CONFIG)
 
+        # free useless memory right now /!\
 
+        del self.TK_CONFIG
 
-    def _parse_attr_minheight (self, attribute, **kw):
-        r"""
-            integer attribute;
+        # succeeded
 
-            no return value (void);
-        """
+        return True
 
-        # parsed attribute inits
+    # end def
 
-        kw.update(no_tk_config = True)
 
-        self._tkRAD_integer_support(attribute, **kw)
 
-    # end def
+    def _replace_alias (self, str_value, attrs, **kw):
+        r"""
+            protected method def;
 
+            tries to retrieve widget's module alias name and
 
+            replaces '@' module alias in XML attribute's value;
 
-    def _parse_attr_minsize (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
+            returns parsed string of chars on success,
 
-            no return value (void);
+            empty string otherwise;
         """
 
-        # parsed attribute inits
-
-        self._parse_attr__minsize(attribute, **kw)
+        # param controls
 
-    # end def
+        if tools.is_pstr(str_value):
+            r"""
+                $ 2013-12-18 RS $
+                new support: attrs = RADXMLAttributesDict by now;
+            """
 
+            # try to get widget's module
 
+            self._parse_attr_module(attrs.get_item("module"), **kw)
 
-    def _parse_attr_minwidth (self, attribute, **kw):
-        r"""
-            integer attribute;
+            # replace "@" alias in string of chars
+            # by a ref to widget's module
 
-            no return value (void);
-        """
+            return str_value.replace("@", attrs.get("module", ""))
 
-        # parsed attribute inits
+        # end if
 
-        kw.update(no_tk_config = True)
+        # unsupported - empty string
 
-        self._tkRAD_integer_support(attribute, **kw)
+        return ""
 
     # end def
 
 
 
-    def _parse_attr_mode (self, attribute, **kw):
+    def _set_layout (self, widget, attrs, tk_parent):
         r"""
-            must be one of 'indeterminate', 'determinate';
+            protected method def;
+
+            pack(), grid() or place() tkinter widget;
+
+            supports XML attribute 'resizable' horizontally, vertically
 
-            default value is 'determinate';
+            or both axis;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        # $ 2014-01-17 RS $
+        # special case of Toplevel window
 
-        kw.update(
+        if isinstance(widget, TK.Toplevel):
 
-            default = "determinate",
+            # Toplevel window layout inits
 
-            values = ("indeterminate", ),
-        )
+            self._layout_toplevel(widget, attrs, tk_parent)
 
-        self._fix_values(attribute, **kw)
+        # $ 2014-02-27 RS $
+        # special case of ttk.Notebook children
 
-    # end def
+        elif isinstance(tk_parent, ttk.Notebook):
 
+            # add child instead of laying it out
 
+            tk_parent.add(
 
-    def _parse_attr_module (self, attribute, **kw):
-        r"""
-            tries to determine module's correct alias name;
+                widget,
 
-            no return value (void);
-        """
+                **tools.dict_only_keys(
+                    attrs, "compound", "image", "padding", "sticky",
+                    "text", "underline",
+                )
+            )
 
-        # $ 2014-01-09 RS $
-        # bug fix:
-        # @attribute may be None sometimes;
+        # $ 2014-02-27 RS $
+        # special case of ttk.PanedWindow children
 
-        if self._is_new(attribute):
+        elif isinstance(tk_parent, ttk.PanedWindow):
 
-            # module id inits
+            # add child instead of laying it out
 
-            _module = attribute.value.lstrip(".")
+            tk_parent.add(
 
-            # predefined module name?
+                widget, weight=self.TK_CHILD_CONFIG.get("weight")
+            )
 
-            if _module.endswith("."):
+        # $ 2014-01-15 RS $
+        # special case of PanedWindow children
 
-                # init module name
+        elif isinstance(tk_parent, TK.PanedWindow):
 
-                _name = _module
+            # got to lay out?
 
-            # XML source module id
+            if attrs.get("layout") in ("pack", "grid", "place"):
 
-            else:
+                # init resizable
 
-                # init module name
+                _sticky = {
 
-                _name = ""
+                    "width": TK.E + TK.W,
 
-                # try to get <module> element for more info
+                    "height": TK.N + TK.S,
 
-                _module = self.get_element_by_id(_module)
+                    "yes": TK.N + TK.S + TK.E + TK.W,
 
-                # found corresponding <module> element?
+                }.get(attrs.get("resizable"))
 
-                if self.is_element(_module):
+                self.TK_CHILD_CONFIG.setdefault("sticky", _sticky)
 
-                    # attribute inits
+                # add child instead of laying it out
 
-                    _import = \
-                        tools.normalize_import(_module.get("import"))
+                tk_parent.add(widget, **self.TK_CHILD_CONFIG)
 
-                    # choose between attrs
+            # end if
 
-                    if _import != "*":
+        # widget exists and layout is asked?
 
-                        _name = tools.choose_str(
+        elif hasattr(widget, str(attrs.get("layout"))):
 
-                            tools.normalize_id(_module.get("as")),
+            # try to make widget resizable along params
 
-                            _import,
+            self._set_resizable(widget, attrs, tk_parent)
 
-                        ) + "."
+            # lay widget out - batched while building, if possible
 
-                    # end if
+            _layout = attrs.get("layout")
 
-                # module not found
+            _lopts = attrs.get("layout_options") or dict()
 
-                else:
+            if self._profiler:
 
-                    raise KeyError(
-                        _(
-                            "module of id '{mid}' has *NOT* been found."
-
-                        ).format(mid = attribute.value)
-                    )
-
-                # end if
+                _start = self._profiler.start()
 
             # end if
 
-            # parsed attribute inits
-
-            attribute.value = _name.lstrip(".")
-
-            # caution: *NO* self._tk_config() by here /!\
-
-            attribute.parsed = True
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_offrelief (self, attribute, **kw):
-        r"""
-            relief attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_relief_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_opaqueresize (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_orient (self, attribute, attrs, xml_tag, **kw):
-        r"""
-            must be one of 'vertical', 'horizontal';
-
-            default value is 'vertical';
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(
-
-            default = "vertical",
-
-            values = ("horizontal", ),
-        )
-
-        self._fix_values(attribute, **kw)
+            if not self._batch_command(
 
-        # $ 2014-02-27 RS $
-        # special case for ttk.PanedWindow
+                    widget, _layout, self.LAYOUT_METHODS.get(_layout),
 
-        if xml_tag == "ttkpanedwindow" and "args" in attrs:
+                    _layout, "configure", widget, **_lopts):
 
-            # in a ttk.PanedWindow object:
-            # must init 'orient' attr in class constructor's 'args'
-            # because 'orient' is *READ-ONLY* in configure()
+                getattr(widget, _layout)(**_lopts)
 
-            _args = tools.choose_str(attrs["args"]).split(",")
+            # end if
 
-            _args.append("orient='{}'".format(attribute.value))
+            if self._profiler:
 
-            attrs["args"] = ",".join(filter(None, _args))
+                self._profiler.stop("tk", _layout, _start)
 
-            self.TK_CONFIG.pop("orient", None)
+            # end if
 
         # end if
 
@@ -3942,1513 +4781,1008 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _parse_attr_overrelief (self, attribute, **kw):
-        r"""
-            relief attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_relief_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_padding (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_padx (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_pady (self, attribute, **kw):
+    def _set_lazy_tab (self, widget, xml_element, tk_parent, accept,
+    init = None):
         r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
+            protected method def;
 
+            registers notebook tab @widget as lazy: @xml_element
+            children get built into @widget with @accept XML tags
+            once tab gets selected in @tk_parent notebook for the
+            first time;
 
-    def _parse_attr_readonlybackground (self, attribute, **kw):
-        r"""
-            color attribute;
+            optional @init (callback, keywords) pair gets called
+            once these children have been built;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
+        # first lazy tab of this notebook?
 
+        if str(tk_parent) not in self.__lazy_binds:
 
+            self.__lazy_binds[str(tk_parent)] = (
 
-    def _parse_attr_repeatdelay (self, attribute, **kw):
-        r"""
-            integer attribute;
+                tk_parent,
 
-            no return value (void);
-        """
+                tk_parent.bind(
 
-        # parsed attribute inits
+                    "<<NotebookTabChanged>>",
 
-        self._tkRAD_integer_support(attribute, **kw)
+                    self._slot_lazy_tab_changed,
 
-    # end def
+                    add = "+",
+                ),
+            )
 
+            # build current tab as soon as event loop is idle
 
+            tk_parent.after_idle(self._build_lazy_selection, tk_parent)
 
-    def _parse_attr_repeatinterval (self, attribute, **kw):
-        r"""
-            integer attribute;
+        # end if
 
-            no return value (void);
-        """
+        # register tab
 
-        # parsed attribute inits
+        self.__lazy_tabs[str(widget)] = (widget, xml_element, accept, init)
 
-        self._tkRAD_integer_support(attribute, **kw)
+        self.__lazy_ids = None
 
     # end def
 
 
 
-    def _parse_attr_resizable (self, attribute, **kw):
+    def _set_resizable (self, widget, attrs, tk_parent):
         r"""
-            must be one of 'yes', 'no', 'width', 'height';
-
-            default value is 'no';
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(
-
-            default = "no",
-
-            values = ("yes", "width", "height"),
-
-            # caution: *NO* self._tk_config() by here /!\
-
-            no_tk_config = True,
-        )
-
-        self._fix_values(attribute, **kw)
-
-    # end def
+            protected method def;
 
+            tries to set up tkinter widget's layout resizable along
 
+            XML attribute 'resizable' either horizontally, vertically
 
-    def _parse_attr_resolution (self, attribute, **kw):
-        r"""
-            float attribute;
+            or both axis;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_float_support(attribute, **kw)
-
-    # end def
-
-
+        # param inits
 
-    def _parse_attr_sashpad (self, attribute, **kw):
-        r"""
-            dimension attribute;
+        _resizable = tools.choose_str(
 
-            no return value (void);
-        """
+            attrs.get("resizable"),
 
-        # parsed attribute inits
+            "no",
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        ).lower()
 
-    # end def
+        # layout method init
 
+        _layout = attrs.get("layout")
 
+        # layout options init
 
-    def _parse_attr_sashrelief (self, attribute, **kw):
-        r"""
-            relief attribute;
+        _lopts = attrs.get("layout_options", dict())
 
-            no return value (void);
-        """
+        # param controls
 
-        # parsed attribute inits
+        if _layout and _resizable in ("yes", "width", "height"):
 
-        self._tkRAD_relief_support(attribute, **kw)
+            # pack() method
 
-    # end def
+            if _layout == "pack":
 
+                # option inits
 
+                _lopts.update(
 
-    def _parse_attr_sashwidth (self, attribute, **kw):
-        r"""
-            dimension attribute
+                    {
 
-            no return value (void);
-        """
+                        "yes": dict(expand=1, fill=TK.BOTH),
 
-        # parsed attribute inits
+                        "width": dict(expand=0, fill=TK.X),
 
-        self._tkRAD_dimension_support(attribute, **kw)
+                        "height": dict(expand=1, fill=TK.Y),
 
-    # end def
+                    }.get(_resizable)
+                )
 
+            # grid() method
 
+            elif _layout == "grid":
 
-    def _parse_attr_scrollregion (self, attribute, **kw):
-        r"""
-            must be a 4-tuple of integers;
+                # option inits
 
-            values are (left, top, right, bottom);
+                _lopts["sticky"] = {
 
-            no return value (void);
-        """
+                    "width": TK.W + TK.E,
 
-        # param controls
+                    "height": TK.N + TK.S,
 
-        if self._is_new(attribute):
+                }.get(_resizable, self.STICKY_ALL)
 
-            # parsed attribute inits
+                # column configure
 
-            attribute.value = tuple(
+                if _resizable in ("yes", "width"):
 
-                map(
+                    # make parent's column resizable
 
-                    tools.ensure_int,
+                    self._grid_configure(
 
-                    eval(
+                        tk_parent, "columnconfigure",
 
-                        "[{}]".format(attribute.value.strip("(){}[]"))
+                        tools.ensure_int(_lopts.get("column", 0)),
                     )
-                )
-            )
-
-            self._tk_config(attribute, **kw)
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_selectbackground (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
 
+                # end if
 
-    def _parse_attr_selectborderwidth (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_selectforeground (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_selectmode (self, attribute, xml_tag, **kw):
-        r"""
-            must be one of 'browse', 'single', 'multiple', 'extended';
-
-            default value is 'browse';
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        # $ 2014-02-27 RS $
-        # new support:
-        # ttk.Treeview hasn't
-        # the same point of view!
-
-        if xml_tag == "ttktreeview":
-
-            kw.update(
-
-                default = "extended",
-
-                values = ("none", "browse"),
-            )
-
-        else:
-
-            kw.update(
-
-                default = "browse",
-
-                values = ("single", "multiple", "extended"),
-            )
-
-        # end if
-
-        self._fix_values(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_seq (self, attribute, **kw):
-        r"""
-            admits simplified tkinter.Event sequence (no <>);
-
-            e.g. seq="Control-s" instead of seq="&lt;Control-s&gt;";
-
-            no return value (void);
-        """
-
-        # param controls
-
-        if self._is_new(attribute):
-
-            # inits - stri
-
-            _seq = attribute.value.replace("<", "", 1)
-
-            _seq = _seq.replace(">", "", 1)
-
-            # parsed attribute inits
-
-            attribute.value = "<" + _seq + ">"
-
-            # CAUTION: *NO* self.tk_config() by here /!\
-
-            attribute.parsed = True
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_show (self, attribute, xml_tag, **kw):
-        r"""
-            password echo character to show in entry box;
-
-            headings/tree ttk.Treeview display off mode;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        # $ 2014-02-27 RS $
-        # new support:
-        # ttk.Treeview hasn't
-        # the same point of view!
-
-        if xml_tag == "ttktreeview":
-
-            kw.update(
-
-                default = "headings",
-
-                values = ("tree", ),
-            )
-
-            self._fix_values(attribute, **kw)
-
-        else:
-
-            self._tkRAD_any_value_support(attribute, **kw)
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_showhandle (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_showvalue (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_signal (self, attribute, **kw):
-        r"""
-            must be at least an empty string of chars;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(no_tk_config = True)
-
-        self._ensure_string_value(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_sliderlength (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_sliderrelief (self, attribute, **kw):
-        r"""
-            relief attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_relief_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_slot (self, attribute, **kw):
-        r"""
-            command attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_command_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_spacing1 (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_spacing2 (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_spacing3 (self, attribute, **kw):
-        r"""
-            dimension attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_src (self, attribute, **kw):
-        r"""
-            normalizes path in XML attr 'src';
-
-            no return value (void);
-        """
-
-        # param controls
-
-        if self._is_new(attribute):
-
-            # parsed attribute inits
-
-            attribute.value = path.normalize(attribute.value)
-
-            # caution: *NO* self._tk_config() by here /!\
-
-            attribute.parsed = True
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_start (self, attribute, **kw):
-        r"""
-            defines starting point for attr 'choices' items list;
-
-            can be either litteral value or '@integer' list index
-            position;
-
-            admits negative index values;
-
-            example: start="@0" will indicate choices[0];
-
-            example: start="@-1" will indicate choices[-1];
-
-            no return value (void);
-        """
-
-        # param controls
-
-        if self._is_new(attribute):
-
-            # starting point inits
-
-            _start = attribute.value
-
-            # got indexed integer value?
-
-            if _start.startswith("@"):
-
-                _start = tools.ensure_int(_start.lstrip("@"))
-
-            else:
-
-                # make some string clean-ups
-
-                _start = re.sub(r"\\([@'])", r"\1", _start)
-
-            # end if
-
-            # parsed attribute inits
-
-            attribute.value = _start
-
-            # caution: *NO* self._tk_config() by here /!\
-
-            attribute.parsed = True
-
-        # end if
-
-    # end def
-
-
-
-    def _parse_attr_state (self, attribute, xml_tag, **kw):
-        r"""
-            must be one of 'normal' or 'disabled';
-
-            must be one of 'normal', 'disabled' or 'readonly' when
-            XML element is one of 'entry', 'spinbox';
-
-            default value is 'normal';
-
-            no return value (void);
-        """
-
-        # $ 2014-01-16 RS $
-        # new support:
-        # special case for '<entry>' and '<spinbox>':
-
-        if xml_tag in ("entry", "spinbox"):
-
-            _values = ("disabled", "readonly", )
-
-        else:
-
-            _values = ("disabled", )
-
-        # end if
-
-        # parsed attribute inits
-
-        kw.update(default = "normal", values = _values)
-
-        self._fix_values(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_sticky (self, attribute, **kw):
-        r"""
-            PanedWindow child configuration attr;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._parse_attr__sticky(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_style (self, attribute, **kw):
-        r"""
-            tkinter/ttk XML attr style def;
-
-            no return value (void);
-        """
-
-        # param controls
-
-        if self._is_new(attribute):
-
-            # style id inits
-
-            _style = attribute.value
-
-            if "." not in _style:
-
-                _style = self.get_object_by_id(_style, _style)
-
-            # end if
+                # row configure
 
-            # parsed attribute inits
+                if _resizable in ("yes", "height"):
 
-            attribute.value = _style
+                    # make parent's row resizable
 
-            self._tk_config(attribute)
+                    self._grid_configure(
 
-        # end if
+                        tk_parent, "rowconfigure",
 
-    # end def
+                        tools.ensure_int(_lopts.get("row", 0)),
+                    )
 
+                # end if
 
+            # place() method
 
-    def _parse_attr_tabs (self, attribute, **kw):
-        r"""
-            choices attribute;
+            elif _layout == "place":
 
-            no return value (void);
-        """
+                # option inits
 
-        # parsed attribute inits
+                _lopts.update(
 
-        self._parse_attr_choices(attribute, **kw)
+                    {
 
-        self._tk_config(attribute, **kw)
+                        "yes": dict(relwidth=1, relheight=1),
 
-    # end def
+                        "width": dict(relwidth=1, relheight=None),
 
+                        "height": dict(relwidth=None, relheight=1),
 
+                    }.get(_resizable)
+                )
 
-    def _parse_attr_takefocus (self, attribute, **kw):
-        r"""
-            boolean attribute;
+            # end if
 
-            no return value (void);
-        """
+        # end if
 
-        # parsed attribute inits
+        # update layout options
 
-        self._tkRAD_boolean_support(attribute, **kw)
+        attrs["layout_options"] = _lopts
 
     # end def
 
 
 
-    def _parse_attr_text (self, attribute, **kw):
+    def _set_widget_config (self, widget, config):
         r"""
-            label attribute;
+            protected method def;
 
-            no return value (void);
+            tries to set up tkinter @widget's attributes along with
+            @config param;
+
+            returns True on success, False otherwise;
         """
 
-        # parsed attribute inits
+        # param controls
 
-        self._tkRAD_label_support(attribute, **kw)
+        if hasattr(widget, "configure") and isinstance(config, dict):
 
-    # end def
+            # $ 2014-02-25 RS $
+            # New support:
+            # style profile default inits
 
+            _attrs = config.get("style")
 
+            if not tools.is_pdict(_attrs):
 
-    def _parse_attr_textvariable (self, attribute, **kw):
-        r"""
-            control variable attribute;
+                _attrs = dict()
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            # override with XML element specific XML attr defs
 
-        self._tkRAD_cvar_support(attribute, **kw)
+            _attrs.update(config)
 
-    # end def
+            # got tk configure() attrs?
 
+            _keys = self._get_config_keys(widget)
 
+            if _keys is not None:
 
-    def _parse_attr_tickinterval (self, attribute, **kw):
-        r"""
-            float attribute;
+                # filter TK attrs along with configure() keys
 
-            no return value (void);
-        """
+                _attrs = {
 
-        # parsed attribute inits
+                    _key: _value for _key, _value in _attrs.items()
 
-        self._tkRAD_float_support(attribute, **kw)
+                    if _key in _keys
+                }
 
-    # end def
+            # end if
 
+            # configure widget - batched while building, if possible
 
+            if self._profiler:
 
-    def _parse_attr_title (self, attribute, **kw):
-        r"""
-            label attribute;
+                _start = self._profiler.start()
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            if not self._batch_command(
 
-        kw.update(no_tk_config = True)
+                    widget, "configure", TK.Misc.configure,
 
-        self._tkRAD_label_support(attribute, **kw)
+                    widget, "configure", **_attrs):
 
-    # end def
+                widget.configure(**_attrs)
 
+            # end if
 
+            if self._profiler:
 
-    def _parse_attr_to (self, attribute, **kw):
-        r"""
-            float attribute;
+                self._profiler.stop("tk", "configure", _start)
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
 
-        self._tkRAD_float_support(attribute, **kw)
+        return False
 
     # end def
 
 
 
-    def _parse_attr_transient (self, attribute, **kw):
+    def _slot_lazy_tab_changed (self, tk_event = None, *args, **kw):
         r"""
-            widget attribute;
+            slot method for '<<NotebookTabChanged>>' tkinter event;
+
+            builds newly selected lazy tab, if any;
 
             no return value (void);
         """
 
-        # parsed attribute inits
+        if tk_event:
 
-        kw.update(no_tk_config = True)
+            self._build_lazy_selection(tk_event.widget)
 
-        self._tkRAD_widget_support(attribute, **kw)
+        # end if
 
     # end def
 
 
 
-    def _parse_attr_troughcolor (self, attribute, **kw):
+    def _tkRAD_anchor_value (self, value):
         r"""
-            color attribute;
+            protected method def;
 
-            no return value (void);
+            side-effect-free 'anchor' value parser;
+
+            returns one of TK.N, TK.S, TK.E, TK.W, TK.NW, TK.NE,
+            TK.SW, TK.SE or TK.CENTER by default;
         """
 
-        # parsed attribute inits
+        # loop on regexps
 
-        self._tkRAD_color_support(attribute, **kw)
+        for (_search, _replace) in self.ANCHORS:
 
-    # end def
+            value = _search.sub(_replace, value)
 
+        # end for
 
+        # set inconsistencies to default value: 'center'
 
-    def _parse_attr_undo (self, attribute, **kw):
-        r"""
-            boolean attribute;
+        if value not in (TK.N, TK.S, TK.E, TK.W,
+                                        TK.NW, TK.NE, TK.SW, TK.SE):
 
-            no return value (void);
-        """
+            value = TK.CENTER
 
-        # parsed attribute inits
+        # end if
 
-        self._tkRAD_boolean_support(attribute, **kw)
+        return value
 
     # end def
 
 
 
-    def _parse_attr_use (self, attribute, **kw):
+    def _tkRAD_choices_value (self, value):
         r"""
-            must be one of ttk.Style().theme_use() list;
+            protected method def;
 
-            default value is 'default';
+            'choices' value parser - eval() based, never cached;
 
-            no return value (void);
+            returns list() of string values;
         """
 
-        # parsed attribute inits
-
-        kw.update(
-
-            default = "default",
+        return list(
 
-            values = ttk.Style().theme_names(),
+            map(str, eval("[{}]".format(value.strip("()[]{}"))))
         )
 
-        self._fix_values(attribute, **kw)
-
     # end def
 
 
 
-    def _parse_attr_validate (self, attribute, **kw):
+    def _tkRAD_start_value (self, value):
         r"""
-            must be one of 'focus', 'focusin', 'focusout', 'key',
-            'all' or 'none';
+            protected method def;
 
-            default value is 'none';
+            side-effect-free 'start' value parser;
 
-            no return value (void);
+            returns integer index for '@integer' values, unescaped
+            litteral string of chars otherwise;
         """
 
-        # parsed attribute inits
-
-        kw.update(
-
-            default = "none",
-
-            values = ("focus", "focusin", "focusout", "key", "all"),
-        )
-
-        self._fix_values(attribute, **kw)
-
-    # end def
-
+        # got indexed integer value?
 
+        if value.startswith("@"):
 
-    def _parse_attr_validatecommand (self, attribute, **kw):
-        r"""
-            command attribute;
+            return tools.ensure_int(value.lstrip("@"))
 
-            no return value (void);
-        """
+        # end if
 
-        # parsed attribute inits
+        # make some string clean-ups
 
-        self._tkRAD_command_support(attribute, **kw)
+        return re.sub(r"\\([@'])", r"\1", value)
 
     # end def
 
 
 
-    def _parse_attr_value (self, attribute, xml_tag, **kw):
+    def _tkRAD_sticky_value (self, value):
         r"""
-            any/float attribute;
+            protected method def;
 
-            no return value (void);
-        """
+            side-effect-free 'sticky' value parser;
 
-        # parsed attribute inits
+            returns lowercased value if it is a combination of 'n',
+            's', 'e', 'w' chars, self.STICKY_ALL otherwise;
+        """
 
-        if xml_tag == "ttkscale":
+        # inits
 
-            self._tkRAD_float_support(attribute, **kw)
+        value = value.lower()
 
-        else:
+        if not set(value).issubset(set(self.STICKY_ALL)):
 
-            self._tkRAD_any_value_support(attribute, **kw)
+            value = self.STICKY_ALL
 
         # end if
 
+        return value
+
     # end def
 
 
 
-    def _parse_attr_values (self, attribute, **kw):
+    def _unbind_lazy_notebook (self, notebook):
         r"""
-            choices attribute;
+            protected method def;
+
+            removes '<<NotebookTabChanged>>' binding set on
+            @notebook by _set_lazy_tab(), if any, leaving any other
+            binding untouched;
 
             no return value (void);
         """
 
-        # parsed attribute inits
-
-        self._parse_attr_choices(attribute, **kw)
-
-        self._tk_config(attribute, **kw)
+        # inits
 
-    # end def
+        _bind = self.__lazy_binds.pop(str(notebook), None)
 
+        if not _bind:
 
+            return
 
-    def _parse_attr_visibility (self, attribute, **kw):
-        r"""
-            must be one of 'normal', 'maximized', 'minimized' or
-            'hidden';
+        # end if
 
-            default value is 'normal';
+        _notebook, _funcid = _bind
 
-            no return value (void);
-        """
+        # tkinter unbind() would drop *ALL* bindings of sequence /!\
 
-        # parsed attribute inits
+        try:
 
-        kw.update(
+            _script = "\n".join(
 
-            no_tk_config = True,
+                _line for _line in
 
-            default = "normal",
+                _notebook.bind("<<NotebookTabChanged>>").split("\n")
 
-            values = ("maximized", "minimized", "hidden"),
-        )
+                if _funcid not in _line
+            )
 
-        self._fix_values(attribute, **kw)
+            _notebook.bind("<<NotebookTabChanged>>", _script)
 
-    # end def
+            _notebook.deletecommand(_funcid)
 
+        except TK.TclError:
 
+            # notebook has already been destroyed
 
-    def _parse_attr_weight (self, attribute, **kw):
-        r"""
-            ttk.PanedWindow child configuration attr;
+            pass
 
-            no return value (void);
-        """
+        # end try
 
-        # parsed attribute inits
+    # end def
 
-        kw.update(tk_child_config = True)
 
-        self._tkRAD_integer_support(attribute, **kw)
 
-    # end def
+    # --------------------- public method defs ----------------------
 
 
 
-    def _parse_attr_width (self, attribute, xml_tag, **kw):
+    def build_fragment (self, src, tk_parent, silent_mode = False):
         r"""
-            integer/dimension attribute along widget type;
+            builds XML file @src (see <include> element 'src'
+            attribute) into @tk_parent, just like an <include>
+            element would do, or hands out a released fragment of
+            the same XML file and @tk_parent from recycling pool
+            (see release_fragment());
 
-            no return value (void);
+            raises RuntimeError during an XML build;
+
+            returns RADXMLFragment object to be given back to
+            release_fragment() once no longer displayed;
         """
 
         # param controls
 
-        if xml_tag in ("button", "checkbutton", "entry", "label",
-        "listbox", "menubutton", "radiobutton", "spinbox", "text"):
+        if self.is_building():
 
-            # parsed attribute inits
+            raise RuntimeError(
 
-            self._tkRAD_integer_support(attribute, **kw)
+                _("Cannot build an XML fragment during an XML build.")
+            )
 
-        else:
+        # end if
 
-            # parsed attribute inits
+        # inits
 
-            self._tkRAD_dimension_support(attribute, **kw)
+        _path = self._get_include_path({"src": src})
 
-        # end if
+        _key = (_path, str(tk_parent))
 
-    # end def
+        # recycled fragment?
 
+        _fragment = self.__pool.get(_key, self._is_alive_fragment)
 
+        if _fragment:
 
-    def _parse_attr_wrap (self, attribute, xml_tag, **kw):
-        r"""
-            boolean attribute;
+            # show it again
 
-            must be 'char', 'word' or 'none' if XML element is 'text';
+            for _widget, _manager, _options in _fragment.layouts:
 
-            no return value (void);
-        """
+                getattr(_widget, _manager)(**_options)
 
-        # parsed attribute inits
+            # end for
 
-        if xml_tag == "text":
+            return _fragment
 
-            kw.update(
+        # end if
 
-                default = "none",
+        # new fragment - object and cvar snapshots
 
-                values = ("char", "word"),
-            )
+        _objects = set(map(id, self.get_objects().values()))
 
-            self._fix_values(attribute, **kw)
+        _cvars = {
 
-        else:
+            _type: set(_vars) for _type, _vars in self.get_cvars().items()
+        }
 
-            self._tkRAD_boolean_support(attribute, **kw)
+        # try to build
 
-        # end if
+        try:
 
-    # end def
+            _root = XC.get_xml_cache().get_root(_path)
 
+            self.element_set_ids(_root)
 
+            self._begin_batch()
 
-    def _parse_attr_wraplength (self, attribute, **kw):
-        r"""
-            dimension attribute;
+            self._loop_on_children(
 
-            no return value (void);
-        """
+                _root, tk_parent, accept = self.DTD.get("widget")
+            )
 
-        # parsed attribute inits
+            self._end_batch()
 
-        self._tkRAD_dimension_support(attribute, **kw)
+            self._queue.flush_all()
 
-    # end def
+        except:
 
+            self._end_batch(discard = True)
 
+            self._show_build_error(silent_mode)
 
-    def _parse_attr_xml_dir (self, attribute, **kw):
-        r"""
-            must be at least an empty string of chars;
+            raise
 
-            no return value (void);
-        """
+        # end try
 
-        # parsed attribute inits
+        # fragment record
 
-        kw.update(
+        _fragment = XO.RADXMLFragment(_key)
 
-            no_tk_config = True,
+        for _object in self.get_objects().values():
 
-            default = self.XML_RC.get("dir")
-        )
+            if id(_object) not in _objects and self.is_tk_widget(_object):
 
-        self._ensure_string_value(attribute, **kw)
+                _fragment.widgets.append(_object)
 
-    # end def
+                _fragment.defaults[_object] = \
+                                    self._get_widget_options(_object)
 
+                # topmost widget layout
 
+                _manager = _object.winfo_manager()
 
-    def _parse_attr_xml_file_ext (self, attribute, **kw):
-        r"""
-            must be at least an empty string of chars;
+                if _object.master is tk_parent and _manager:
 
-            no return value (void);
-        """
+                    _options = getattr(_object, _manager + "_info")()
 
-        # parsed attribute inits
+                    _options.pop("in", None)
 
-        kw.update(
+                    _fragment.layouts.append((_object, _manager, _options))
 
-            no_tk_config = True,
+                # end if
 
-            default = self.XML_RC.get("file_ext")
-        )
+            # end if
 
-        self._ensure_string_value(attribute, **kw)
+        # end for
 
-    # end def
+        for _type, _vars in self.get_cvars().items():
 
+            for _name, _cvar in _vars.items():
 
+                if _name not in _cvars.get(_type, ()):
 
-    def _parse_attr_xml_filename (self, attribute, **kw):
-        r"""
-            must be at least an empty string of chars;
+                    _fragment.cvars.append((_cvar, _cvar.get()))
 
-            no return value (void);
-        """
+                # end if
 
-        # parsed attribute inits
+            # end for
 
-        kw.update(no_tk_config = True)
+        # end for
 
-        self._ensure_string_value(attribute, **kw)
+        return _fragment
 
     # end def
 
 
 
-    def _parse_attr_xscrollcommand (self, attribute, **kw):
+    def build_lazy_tab (self, tab, silent_mode = False):
         r"""
-            command attribute;
+            builds children of lazy <ttktab> @tab (either tab widget
+            or tab path), if not already built;
 
-            no return value (void);
+            during an XML build, children get built along with it;
+
+            otherwise, component is marked as building (see
+            is_building()) until tab is built, so that nothing else
+            (e.g. other lazy tabs) gets built on demand meanwhile;
+
+            tab's init() procedure, if any, gets called once its
+            children have been built;
+
+            returns True on build success, False otherwise (e.g. not
+            a lazy tab or already built);
         """
 
-        # parsed attribute inits
+        # inits
 
-        self._tkRAD_command_support(attribute, **kw)
+        _entry = self.__lazy_tabs.pop(str(tab), None)
 
-    # end def
+        # not lazy or already built?
 
+        if not _entry:
 
+            return False
 
-    def _parse_attr_xscrollincrement (self, attribute, **kw):
-        r"""
-            dimension attribute;
+        # end if
 
-            no return value (void);
-        """
+        self.__lazy_ids = None
 
-        # parsed attribute inits
+        _tab, _element, _accept, _init = _entry
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        # last lazy tab of its notebook?
 
-    # end def
+        if not any(
 
+                _other[0].master is _tab.master
 
+                for _other in self.__lazy_tabs.values()):
 
-    def _parse_attr_yscrollcommand (self, attribute, **kw):
-        r"""
-            command attribute;
+            self._unbind_lazy_notebook(_tab.master)
 
-            no return value (void);
-        """
+        # end if
 
-        # parsed attribute inits
+        # running XML build takes care of everything
 
-        self._tkRAD_command_support(attribute, **kw)
+        if self.is_building():
 
-    # end def
+            _build_ok = self._loop_on_children(
 
+                _element, _tab, accept = _accept
+            )
 
+            if _init:
 
-    def _parse_attr_yscrollincrement (self, attribute, **kw):
-        r"""
-            dimension attribute;
+                self._after_children(_init[0], **_init[1])
 
-            no return value (void);
-        """
+            # end if
 
-        # parsed attribute inits
+            return _build_ok
 
-        self._tkRAD_dimension_support(attribute, **kw)
+        # end if
 
-    # end def
+        # try to build children
 
+        try:
 
+            with self._building_state():
 
-    def _replace_alias (self, str_value, attrs, **kw):
-        r"""
-            protected method def;
+                # batch tkinter commands while building
 
-            tries to retrieve widget's module alias name and
+                self._begin_batch()
 
-            replaces '@' module alias in XML attribute's value;
+                _build_ok = self._loop_on_children(
 
-            returns parsed string of chars on success,
+                    _element, _tab, accept = _accept
+                )
 
-            empty string otherwise;
-        """
+                # send all remaining tkinter commands
 
-        # param controls
+                self._end_batch()
 
-        if tools.is_pstr(str_value):
-            r"""
-                $ 2013-12-18 RS $
-                new support: attrs = RADXMLAttributesDict by now;
-            """
+                # flush all deferred actions in queue
 
-            # try to get widget's module
+                self._queue.flush_all()
 
-            self._parse_attr_module(attrs.get_item("module"), **kw)
+                # tab init() procedure
 
-            # replace "@" alias in string of chars
-            # by a ref to widget's module
+                if _init:
 
-            return str_value.replace("@", attrs.get("module", ""))
+                    _init[0](**_init[1])
 
-        # end if
+                # end if
 
-        # unsupported - empty string
+            # end with
 
-        return ""
+            return _build_ok
 
-    # end def
+        except:
 
+            self._end_batch(discard = True)
 
+            self._show_build_error(silent_mode)
 
-    def _set_layout (self, widget, attrs, tk_parent):
-        r"""
-            protected method def;
+            raise
 
-            pack(), grid() or place() tkinter widget;
+        # end try
 
-            supports XML attribute 'resizable' horizontally, vertically
+    # end def
 
-            or both axis;
 
-            no return value (void);
-        """
 
-        # $ 2014-01-17 RS $
-        # special case of Toplevel window
+    def build_lazy_tabs (self, idle = False):
+        r"""
+            builds all lazy <ttktab> tabs not already built;
 
-        if isinstance(widget, TK.Toplevel):
+            if @idle is set, tabs get built one at a time, each one
+            whenever tkinter event loop is idle, so that application
+            may prebuild its tabs without freezing user interface;
 
-            # Toplevel window layout inits
+            returns number of tabs to be built;
+        """
 
-            self._layout_toplevel(widget, attrs, tk_parent)
+        # inits
 
-        # $ 2014-02-27 RS $
-        # special case of ttk.Notebook children
+        _paths = list(self.__lazy_tabs.keys())
 
-        elif isinstance(tk_parent, ttk.Notebook):
+        # idle prebuild: one tab per idle callback
 
-            # add child instead of laying it out
+        if idle and _paths and self.is_tk_parent(self.tk_owner):
 
-            tk_parent.add(
+            def _prebuild (paths):
 
-                widget,
+                # still got tabs to build?
 
-                **tools.dict_only_keys(
-                    attrs, "compound", "image", "padding", "sticky",
-                    "text", "underline",
-                )
-            )
+                if paths:
 
-        # $ 2014-02-27 RS $
-        # special case of ttk.PanedWindow children
+                    self.build_lazy_tab(paths.pop(0))
 
-        elif isinstance(tk_parent, ttk.PanedWindow):
+                    self.tk_owner.after_idle(_prebuild, paths)
 
-            # add child instead of laying it out
+                # end if
 
-            tk_parent.add(
+            # end def
 
-                widget, weight=self.TK_CHILD_CONFIG.get("weight")
-            )
+            self.tk_owner.after_idle(_prebuild, _paths)
 
-        # $ 2014-01-15 RS $
-        # special case of PanedWindow children
+        else:
 
-        elif isinstance(tk_parent, TK.PanedWindow):
+            for _path in _paths:
 
-            # got to lay out?
+                self.build_lazy_tab(_path)
 
-            if attrs.get("layout") in ("pack", "grid", "place"):
+            # end for
 
-                # init resizable
+        # end if
 
-                _sticky = {
+        return len(_paths)
 
-                    "width": TK.E + TK.W,
+    # end def
 
-                    "height": TK.N + TK.S,
 
-                    "yes": TK.N + TK.S + TK.E + TK.W,
 
-                }.get(attrs.get("resizable"))
+    def destroy_component (self):
+        r"""
+            overrides RADXMLBase.destroy_component();
 
-                self.TK_CHILD_CONFIG.setdefault("sticky", _sticky)
+            also drops pending lazy <ttktab> elements and recycled
+            XML fragments;
 
-                # add child instead of laying it out
+            no return value (void);
+        """
 
-                tk_parent.add(widget, **self.TK_CHILD_CONFIG)
+        self.__lazy_tabs.clear()
 
-            # end if
+        self.__lazy_ids = None
 
-        # widget exists and layout is asked?
+        for _notebook, _funcid in list(self.__lazy_binds.values()):
 
-        elif hasattr(widget, str(attrs.get("layout"))):
+            self._unbind_lazy_notebook(_notebook)
 
-            # try to make widget resizable along params
+        # end for
 
-            self._set_resizable(widget, attrs, tk_parent)
+        # pooled fragments
 
-            # lay widget out
+        for _fragment in self.__pool.clear():
 
-            exec("widget.{layout}(**{layout_options})".format(**attrs))
+            self._destroy_fragment(_fragment)
 
-        # end if
+        # end for
+
+        RB.RADXMLWidgetBase.destroy_component(self)
 
     # end def
 
 
 
-    def _set_resizable (self, widget, attrs, tk_parent):
+    def element_set_ids (self, xml_element):
         r"""
-            protected method def;
+            sets new unique 'id' values to all anonymous XML
+            subelements of @xml_element this processor builds, in
+            document order, with one single bulk id allocation
+            (see element_get_id());
 
-            tries to set up tkinter widget's layout resizable along
+            meant for repeated templates e.g. XML fragments and
+            <virtuallist> rows;
 
-            XML attribute 'resizable' either horizontally, vertically
+            returns number of ids set;
+        """
 
-            or both axis;
+        # inits
 
-            no return value (void);
-        """
+        _accept = set()
 
-        # param inits
+        for _tags in self.DTD.values():
 
-        _resizable = tools.choose_str(
+            _accept.update(_tags)
 
-            attrs.get("resizable"),
+        # end for
 
-            "no",
+        _anonymous = list()
 
-        ).lower()
+        _stack = list(reversed(xml_element))
 
-        # layout method init
+        # depth-first, document order
 
-        _layout = attrs.get("layout")
+        while _stack:
 
-        # layout options init
+            _element = _stack.pop()
 
-        _lopts = attrs.get("layout_options", dict())
+            if self.normalize_tag(_element) in _accept:
 
-        # param controls
+                if not tools.normalize_id(_element.get("id")):
 
-        if _layout and _resizable in ("yes", "width", "height"):
+                    _anonymous.append(_element)
 
-            # pack() method
+                # end if
 
-            if _layout == "pack":
+                _stack.extend(reversed(_element))
 
-                # option inits
+            # end if
 
-                _lopts.update(
+        # end while
 
-                    {
+        _ids = self._get_unique_ids("object", len(_anonymous))
 
-                        "yes": dict(expand=1, fill=TK.BOTH),
+        for _element, _id in zip(_anonymous, _ids):
 
-                        "width": dict(expand=0, fill=TK.X),
+            _element.set("id", _id)
 
-                        "height": dict(expand=1, fill=TK.Y),
+        # end for
 
-                    }.get(_resizable)
-                )
+        return len(_anonymous)
 
-            # grid() method
+    # end def
 
-            elif _layout == "grid":
 
-                # option inits
 
-                _lopts["sticky"] = {
+    def get_lazy_tabs (self):
+        r"""
+            returns list of lazy <ttktab> widgets not built yet;
+        """
 
-                    "width": TK.W + TK.E,
+        return [_entry[0] for _entry in self.__lazy_tabs.values()]
 
-                    "height": TK.N + TK.S,
+    # end def
 
-                }.get(_resizable, self.STICKY_ALL)
 
-                # column configure
 
-                if _resizable in ("yes", "width"):
+    def get_object_by_id (self, attr_id, default = None):
+        r"""
+            overrides RADXMLBase.get_object_by_id();
 
-                    # make parent's column resizable
+            builds lazy <ttktab> tab holding @attr_id XML element on
+            demand, if needed and no XML build is running;
 
-                    tk_parent.columnconfigure(
+            returns object tagged by @attr_id param on success;
 
-                        tools.ensure_int(_lopts.get("column", 0)),
+            returns @default object on failure;
+        """
 
-                        weight = 1
-                    )
+        # inits
 
-                # end if
+        _object = RB.RADXMLWidgetBase.get_object_by_id(self, attr_id)
 
-                # row configure
+        # not built yet?
 
-                if _resizable in ("yes", "height"):
+        if _object is None and not self.is_building():
 
-                    # make parent's row resizable
+            _path = self._get_lazy_tab(attr_id)
 
-                    tk_parent.rowconfigure(
+            if _path:
 
-                        tools.ensure_int(_lopts.get("row", 0)),
+                self.build_lazy_tab(_path)
 
-                        weight = 1
-                    )
+                _object = RB.RADXMLWidgetBase.get_object_by_id(
 
-                # end if
+                    self, attr_id
+                )
 
-            # place() method
+            # end if
 
-            elif _layout == "place":
+        # end if
 
-                # option inits
+        # failure
 
-                _lopts.update(
+        if _object is None:
 
-                    {
+            return default
 
-                        "yes": dict(relwidth=1, relheight=1),
+        # end if
 
-                        "width": dict(relwidth=1, relheight=None),
+        return _object
 
-                        "height": dict(relwidth=None, relheight=1),
+    # end def
 
-                    }.get(_resizable)
-                )
 
-            # end if
 
-        # end if
 
-        # update layout options
+    def get_pool_stats (self):
+        r"""
+            returns dict() of XML fragments recycling pool
+            statistics (see build_fragment());
+        """
 
-        attrs["layout_options"] = _lopts
+        return self.__pool.get_stats()
 
     # end def
 
 
 
-    def _set_widget_config (self, widget, config):
+    def release_fragment (self, fragment):
         r"""
-            protected method def;
+            hides @fragment built by build_fragment() and resets its
+            widgets options and control variables to their values
+            as built, then keeps it into recycling pool for next
+            build_fragment() of same XML file and tk parent;
 
-            tries to set up tkinter @widget's attributes along with
-            @config param;
+            fragments beyond pool size limits get destroyed;
 
-            returns True on success, False otherwise;
+            no return value (void);
         """
 
         # param controls
 
-        if hasattr(widget, "configure") and isinstance(config, dict):
+        if not self._is_alive_fragment(fragment):
 
-            # $ 2014-02-25 RS $
-            # New support:
-            # style profile default inits
+            return
 
-            _attrs = config.get("style")
+        # end if
 
-            if not tools.is_pdict(_attrs):
+        # unmap topmost widgets
 
-                _attrs = dict()
+        for _widget, _manager, _options in fragment.layouts:
 
-            # end if
+            getattr(_widget, _manager + "_forget")()
 
-            # override with XML element specific XML attr defs
+        # end for
 
-            _attrs.update(config)
+        # reset widget options
 
-            # got tk configure() attrs?
+        for _widget, _defaults in fragment.defaults.items():
 
-            if tools.is_pdict(widget.configure()):
+            _options = self._get_widget_options(_widget)
 
-                # filter TK attrs along with configure() keys
+            _changed = {
 
-                _attrs = tools.dict_only_keys(
+                _key: _value for _key, _value in _defaults.items()
 
-                    _attrs, *widget.configure().keys()
-                )
+                if _options.get(_key) != _value
+            }
+
+            if _changed:
+
+                _widget.configure(**_changed)
 
             # end if
 
-            # configure widget
+        # end for
 
-            widget.configure(**_attrs)
+        # reset control variables
 
-            # succeeded
+        for _cvar, _value in fragment.cvars:
 
-            return True
+            _cvar.set(_value)
+
+        # end for
+
+        # recycle fragment
+
+        _dropped = self.__pool.put(fragment)
+
+        for _fragment in _dropped:
+
+            self._destroy_fragment(_fragment)
+
+        # end for
+
+        if _dropped:
+
+            self._forget_destroyed_objects()
 
         # end if
 
-        # failed
+    # end def
 
-        return False
+
+
+    def set_widget_config (self, widget, config):
+        r"""
+            configures tkinter @widget along @config dict of XML
+            attribute values, keeping only its own configure() keys
+            (see _set_widget_config());
+
+            runtime API for compiled XML modules (see xml.compile);
+
+            returns True on success, False otherwise;
+        """
+
+        return self._set_widget_config(widget, config)
 
     # end def
 
@@ -28,6 +28,8 @@
 
 import re
 
+import collections
+
 import tkinter as TK
 
 from ..core import tools
@@ -59,6 +61,67 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
+    # declarative XML attribute parsers
+    # extends RADXMLBase.ATTRIBUTE_TYPES
+
+    ATTRIBUTE_TYPES = {
+
+        "activebackground": ("color", None),
+
+        "activeforeground": ("color", None),
+
+        "background": ("color", None),
+
+        "bd": ("dimension", None),
+
+        "bg": ("color", None),
+
+        "bitmap": ("bitmap", None),
+
+        "borderwidth": ("dimension", None),
+
+        "checked": ("boolean", dict(no_tk_config = True)),
+
+        "command": ("command", None),
+
+        "cursor": ("cursor", None),
+
+        "disabledforeground": ("color", None),
+
+        "fg": ("color", None),
+
+        "font": ("font", None),
+
+        "foreground": ("color", None),
+
+        "image": ("image", None),
+
+        "offvalue": ("any_value", None),
+
+        "onvalue": ("any_value", None),
+
+        "relief": ("relief", None),
+
+        "selectcolor": ("color", None),
+
+        "selected": ("boolean", dict(no_tk_config = True)),
+
+        "selectimage": ("image", None),
+
+        "state": ("state", None),
+
+        "underline": ("integer", None),
+
+        "value": ("any_value", None),
+
+        "variable": ("cvar", None),
+
+        "widget": ("widget", dict(no_tk_config = True)),
+
+    } # end of ATTRIBUTE_TYPES
+
+
+
     ATTRS = {
 
         "common": {
@@ -75,6 +138,22 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
+    # max number of memoized parsed attribute values (process-wide)
+
+    MEMO_SIZE = 4096
+
+
+
+    # process-wide memo of parsed attribute values
+    # (class, kind, raw value) --> parsed value
+    # CAUTION: do *NOT* UPPERCASE these names - must be shared /!\
+
+    __memo = collections.OrderedDict()
+
+    __memo_stats = {"hits": 0, "misses": 0}
+
+
+
     # ------------------  XML elements building  -----------------------
 
 
@@ -119,17 +198,18 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             # inits
 
-            _value = attribute.value.lower()
+            values = tuple(values)
 
-            if _value not in values:
+            # parsed attribute inits
 
-                _value = default
+            attribute.value = self._get_parsed_value(
 
-            # end if
+                ("values", default, values),
 
-            # parsed attribute inits
+                attribute.value,
 
-            attribute.value = _value
+                lambda v: v.lower() if v.lower() in values else default
+            )
 
             # XML element must have the same attr value
 
@@ -143,175 +223,127 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
-    def _is_new (self, attribute):
+    def _get_parsed_value (self, kind, raw_value, parser):
         r"""
-            protected method def;
+            overrides RADXMLBase._get_parsed_value();
 
-            determines if @attribute has never been parsed and if its
+            same raw strings repeat all over XML documents (fonts,
+            anchors, reliefs, etc): parsed values are memoized
+            process-wide along (class, @kind, @raw_value) key in a
+            bounded LRU cache of self.MEMO_SIZE items;
 
-            value is of plain char string type, which is the typical
+            @parser param *MUST* be a side-effect-free callable;
 
-            case of a newly unparsed true XML attribute;
+            returns parsed value;
         """
 
-        return attribute and not attribute.parsed and \
-                                        tools.is_pstr(attribute.value)
-
-    # end def
+        # unhashable or non-string raw value?
 
+        if not isinstance(raw_value, str):
 
+            return RX.RADXMLBase._get_parsed_value(
 
-    def _is_unparsed (self, attribute):
-        r"""
-            protected method def;
+                self, kind, raw_value, parser
+            )
 
-            determines if @attribute has never been parsed;
-        """
+        # end if
 
-        return attribute and not attribute.parsed
+        return self._get_memo_value(kind, raw_value, parser)
 
     # end def
 
 
 
-    # -----------------------  XML attributes parsing  -----------------
-
-
-
-    def _parse_attr_activebackground (self, attribute, **kw):
+    def _get_memo_value (self, kind, raw_value, parser):
         r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
+            protected method def;
 
+            looks up memo for (class, @kind, @raw_value) key and
+            calls @parser(@raw_value) on cache miss;
 
-    def _parse_attr_activeforeground (self, attribute, **kw):
-        r"""
-            color attribute;
+            mutable results (list, dict) are always shallow copied;
 
-            no return value (void);
+            returns parsed value;
         """
 
-        # parsed attribute inits
+        # inits
 
-        self._tkRAD_color_support(attribute, **kw)
+        _memo = self.__memo
 
-    # end def
+        _key = (self.__class__, kind, raw_value)
 
+        try:
 
+            _value = _memo[_key]
 
-    def _parse_attr_background (self, attribute, **kw):
-        r"""
-            color attribute;
+            _memo.move_to_end(_key)
 
-            no return value (void);
-        """
+            self.__memo_stats["hits"] += 1
 
-        # parsed attribute inits
+        except KeyError:
 
-        self._tkRAD_color_support(attribute, **kw)
+            _value = parser(raw_value)
 
-    # end def
+            _memo[_key] = _value
 
+            self.__memo_stats["misses"] += 1
 
+            # keep memo bounded
 
-    def _parse_attr_bd (self, attribute, **kw):
-        r"""
-            width attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
+            while len(_memo) > max(1, self.MEMO_SIZE):
 
-        self._tkRAD_dimension_support(attribute, **kw)
+                _memo.popitem(last = False)
 
-    # end def
+            # end while
 
+        # end try
 
+        # do *NOT* share mutable values /!\
 
-    def _parse_attr_bg (self, attribute, **kw):
-        r"""
-            color attribute;
+        if isinstance(_value, (list, dict)):
 
-            no return value (void);
-        """
+            _value = _value.copy()
 
-        # parsed attribute inits
+        # end if
 
-        self._tkRAD_color_support(attribute, **kw)
+        return _value
 
     # end def
 
 
 
-    def _parse_attr_bitmap (self, attribute, **kw):
+    def _is_new (self, attribute):
         r"""
-            bitmap attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_bitmap_support(attribute, **kw)
-
-    # end def
-
+            protected method def;
 
+            determines if @attribute has never been parsed and if its
 
-    def _parse_attr_borderwidth (self, attribute, **kw):
-        r"""
-            width attribute;
+            value is of plain char string type, which is the typical
 
-            no return value (void);
+            case of a newly unparsed true XML attribute;
         """
 
-        # parsed attribute inits
-
-        self._tkRAD_dimension_support(attribute, **kw)
+        return attribute and not attribute.parsed and \
+                                        tools.is_pstr(attribute.value)
 
     # end def
 
 
 
-    def _parse_attr_checked (self, attribute, **kw):
+    def _is_unparsed (self, attribute):
         r"""
-            boolean attribute;
+            protected method def;
 
-            no return value (void);
+            determines if @attribute has never been parsed;
         """
 
-        # parsed attribute inits
-
-        kw.update(no_tk_config = True)
-
-        self._tkRAD_boolean_support(attribute, **kw)
+        return attribute and not attribute.parsed
 
     # end def
 
 
 
-    def _parse_attr_command (self, attribute, **kw):
-        r"""
-            command attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_command_support(attribute, **kw)
-
-    # end def
+    # -----------------------  XML attributes parsing  -----------------
 
 
 
@@ -348,81 +380,6 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
-    def _parse_attr_cursor (self, attribute, **kw):
-        r"""
-            cursor attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_cursor_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_disabledforeground (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_fg (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_font (self, attribute, **kw):
-        r"""
-            font attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_font_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_foreground (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
     def _parse_attr_id (self, attribute, **kw):
         r"""
             id - generic XML attribute;
@@ -456,21 +413,6 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
-    def _parse_attr_image (self, attribute, **kw):
-        r"""
-            image attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_image_support(attribute, **kw)
-
-    # end def
-
-
-
     def _parse_attr_menu (self, attribute, **kw):
         r"""
             this should always be None as tkRAD manages it on its own;
@@ -530,175 +472,6 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
-    def _parse_attr_offvalue (self, attribute, **kw):
-        r"""
-            value attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_any_value_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_onvalue (self, attribute, **kw):
-        r"""
-            value attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_any_value_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_relief (self, attribute, **kw):
-        r"""
-            relief attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_relief_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_selectcolor (self, attribute, **kw):
-        r"""
-            color attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_color_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_selected (self, attribute, **kw):
-        r"""
-            boolean attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(no_tk_config = True)
-
-        self._tkRAD_boolean_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_selectimage (self, attribute, **kw):
-        r"""
-            image attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_image_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_state (self, attribute, **kw):
-        r"""
-            state attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_state_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_underline (self, attribute, **kw):
-        r"""
-            resets underline value to 0 if not an integer value;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_integer_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_value (self, attribute, **kw):
-        r"""
-            value attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_any_value_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_variable (self, attribute, **kw):
-        r"""
-            control variable attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        self._tkRAD_cvar_support(attribute, **kw)
-
-    # end def
-
-
-
-    def _parse_attr_widget (self, attribute, **kw):
-        r"""
-            widget attribute;
-
-            no return value (void);
-        """
-
-        # parsed attribute inits
-
-        kw.update(no_tk_config = True)
-
-        self._tkRAD_widget_support(attribute, **kw)
-
-    # end def
-
-
-
     def _tkRAD_any_value_support (self, attribute, **kw):
         r"""
             protected method def;
@@ -762,11 +535,15 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             # parsed attribute inits
 
-            attribute.value = bool(
+            attribute.value = self._get_parsed_value(
+
+                ("boolean", attribute.name),
+
+                attribute.value,
 
-                attribute.value.lower()
+                lambda v, n=attribute.name:
 
-                in ("1", "yes", "true", attribute.name)
+                    v.lower() in ("1", "yes", "true", n)
             )
 
             # XML element must have the same attr value
@@ -1057,7 +834,10 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             # parsed attribute inits
 
-            attribute.value = tools.ensure_float(attribute.value)
+            attribute.value = self._get_parsed_value(
+
+                "float", attribute.value, tools.ensure_float
+            )
 
             self._tk_config(attribute, **kw)
 
@@ -1092,39 +872,54 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
         if self._is_new(attribute):
 
-            # inits
+            # parsed attribute inits
 
-            _font = attribute.value
+            attribute.value = self._get_parsed_value(
 
-            # catches 'quoted long names'
+                "font", attribute.value, self._tkRAD_font_value
+            )
 
-            _sch = re.compile(r"'(.*?)'")
+            self._tk_config(attribute, **kw)
 
-            _family = _sch.search(_font)
+        # end if
 
-            # resets font family name to tkinter-compliant font name
+    # end def
 
-            # e.g. "'Times New Roman'" ---> "timesnewroman"
 
-            if _family:
 
-                _font = _sch.sub(
+    def _tkRAD_font_value (self, value):
+        r"""
+            protected method def;
 
-                    tools.normalize_id(_family.group(1)).lower(),
+            side-effect-free font value parser;
 
-                    _font
-                )
+            e.g. "'Times New Roman' 12 bold" becomes
+            "timesnewroman 12 bold";
 
-            # end if
+            returns parsed font string of chars;
+        """
 
-            # parsed attribute inits
+        # catches 'quoted long names'
 
-            attribute.value = _font
+        _sch = re.compile(r"'(.*?)'")
 
-            self._tk_config(attribute, **kw)
+        _family = _sch.search(value)
+
+        # resets font family name to tkinter-compliant font name
+
+        if _family:
+
+            value = _sch.sub(
+
+                tools.normalize_id(_family.group(1)).lower(),
+
+                value
+            )
 
         # end if
 
+        return value
+
     # end def
 
 
@@ -1169,7 +964,10 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             # parsed attribute inits
 
-            attribute.value = tools.ensure_int(attribute.value)
+            attribute.value = self._get_parsed_value(
+
+                "integer", attribute.value, tools.ensure_int
+            )
 
             self._tk_config(attribute, **kw)
 
@@ -1292,6 +1090,23 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
+    def _tkRAD_values_support (self, attribute, **kw):
+        r"""
+            must be one of kw['values'];
+
+            default value is kw['default'];
+
+            no return value (void);
+        """
+
+        # parsed attribute inits
+
+        self._fix_values(attribute, **kw)
+
+    # end def
+
+
+
     def _tkRAD_widget_support (self, attribute, **kw):
         r"""
             tries to retrieve a widget along given 'id' value;
@@ -1406,4 +1221,51 @@ class RADXMLWidgetBase (RX.RADXMLBase):
     # end def
 
 
+
+    # --------------------- public method defs ----------------------
+
+
+
+    def clear_memo (self):
+        r"""
+            drops all memoized parsed attribute values and resets
+            memo stats (process-wide);
+
+            no return value (void);
+        """
+
+        self.__memo.clear()
+
+        self.__memo_stats.update(hits = 0, misses = 0)
+
+    # end def
+
+
+
+    def get_memo_stats (self):
+        r"""
+            returns process-wide parsed attribute values memo stats
+            as dict(hits, misses, hit_rate, size, max_size);
+        """
+
+        _hits = self.__memo_stats["hits"]
+
+        _total = _hits + self.__memo_stats["misses"]
+
+        return {
+
+            "hits": _hits,
+
+            "misses": self.__memo_stats["misses"],
+
+            "hit_rate": (_hits / _total) if _total else 0.0,
+
+            "size": len(self.__memo),
+
+            "max_size": self.MEMO_SIZE,
+        }
+
+    # end def
+
+
 # end class RADXMLWidgetBase